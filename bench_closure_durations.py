@@ -0,0 +1,145 @@
+"""Benchmark the searchsorted closure-duration engine against the previous per-threshold loop.
+
+Usage examples (from repo root):
+  python bench_closure_durations.py
+  python bench_closure_durations.py --locations 2000 --timesteps 300 --thresholds 250 --repeats 3
+
+Synthetic PO flow data is generated for several AEP/duration/TP combinations; both implementations
+are checked for identical output before timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def first_value(series: pd.Series) -> str:
+    for value in series:
+        if pd.notna(value):
+            text: str = str(value).strip()
+            if text:
+                return text
+    return ""
+
+
+def timestep_from_series(time_values: pd.Series) -> float | None:
+    numeric = pd.to_numeric(time_values, errors="coerce").dropna().unique()
+    if len(numeric) < 2:
+        return None
+    sorted_times: pd.Series = pd.Series(numeric).sort_values(ignore_index=True)
+    return float(sorted_times.iloc[1] - sorted_times.iloc[0])
+
+
+def legacy_calculate_threshold_durations(po_df: pd.DataFrame, thresholds: list[float]) -> pd.DataFrame:
+    """Per-group, per-threshold loop used by calculate_threshold_durations before the rewrite."""
+    filtered: pd.DataFrame = po_df.copy()
+    filtered["Type"] = filtered["Type"].astype(str).str.strip()
+    filtered = filtered[filtered["Type"].str.lower() == "flow"]
+    filtered["Time"] = pd.to_numeric(filtered["Time"], errors="coerce")
+    filtered["Value"] = pd.to_numeric(filtered["Value"], errors="coerce")
+    filtered = filtered.dropna(subset=["Time", "Value", "Location"])
+    keys: list[str] = ["directory_path", "trim_runcode", "Location", "aep_text", "duration_text", "tp_text"]
+    records: list[dict[str, object]] = []
+    for _, group in filtered.groupby(keys, dropna=False, observed=True):
+        timestep: float | None = timestep_from_series(time_values=group["Time"])
+        if timestep is None:
+            continue
+        labels: dict[str, str] = {key: first_value(series=group[key]) for key in keys}
+        for threshold in thresholds:
+            exceed_count: int = int((group["Value"] > threshold).sum())
+            if exceed_count == 0:
+                continue
+            records.append(
+                {
+                    "AEP": labels["aep_text"],
+                    "Duration": labels["duration_text"],
+                    "TP": labels["tp_text"],
+                    "Location": labels["Location"],
+                    "ThresholdFlow": float(threshold),
+                    "Duration_Exceeding": float(exceed_count) * timestep,
+                    "out_path": labels["directory_path"],
+                    "trim_runcode": labels["trim_runcode"],
+                }
+            )
+    return pd.DataFrame(data=records)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark closure-duration threshold engines.")
+    parser.add_argument("--locations", type=int, default=500, help="PO locations per run.")
+    parser.add_argument("--runs", type=int, default=6, help="AEP/duration/TP combinations.")
+    parser.add_argument("--timesteps", type=int, default=200, help="Timesteps per hydrograph.")
+    parser.add_argument("--thresholds", type=int, default=250, help="Number of thresholds.")
+    parser.add_argument("--repeats", type=int, default=1, help="Benchmark repetitions.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    return parser.parse_args()
+
+
+def build_po_frame(args: argparse.Namespace) -> pd.DataFrame:
+    rng = np.random.default_rng(args.seed)
+    time_axis: np.ndarray = np.arange(args.timesteps) * 0.05
+    frames: list[pd.DataFrame] = []
+    for run in range(args.runs):
+        peaks: np.ndarray = rng.gamma(2.0, 5.0, size=args.locations)
+        shape: np.ndarray = np.sin(np.linspace(0, np.pi, args.timesteps)) ** 2
+        values: np.ndarray = peaks[:, None] * shape[None, :] + rng.normal(0, 0.1, (args.locations, args.timesteps))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Time": np.tile(time_axis, args.locations),
+                    "Location": np.repeat([f"PO_{i:05d}" for i in range(args.locations)], args.timesteps),
+                    "Type": "Flow",
+                    "Value": values.ravel(),
+                    "directory_path": "results",
+                    "trim_runcode": "EG01",
+                    "aep_text": f"{[1, 2, 5][run % 3]}p",
+                    "duration_text": f"{[60, 120][run % 2] :05d}m",
+                    "tp_text": f"TP{run:02d}",
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def timed(func, repeats: int) -> tuple[pd.DataFrame, float]:
+    durations: list[float] = []
+    result: pd.DataFrame | None = None
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    assert result is not None
+    return result, statistics.median(durations)
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    logger.remove()
+    from ryan_library.functions.tuflow.closure_durations_functions import calculate_threshold_durations
+
+    po_df: pd.DataFrame = build_po_frame(args)
+    thresholds: list[float] = [float(value) for value in np.linspace(0.0, 50.0, args.thresholds)]
+    print(f"{len(po_df):,} PO rows, {args.locations * args.runs:,} hydrographs, {len(thresholds)} thresholds")
+
+    legacy, legacy_seconds = timed(lambda: legacy_calculate_threshold_durations(po_df, thresholds), args.repeats)
+    current, current_seconds = timed(
+        lambda: calculate_threshold_durations(po_df=po_df, thresholds=thresholds, measurement_type="Flow"),
+        args.repeats,
+    )
+    pd.testing.assert_frame_equal(current, legacy)
+    print(f"legacy      {legacy_seconds:7.2f} s")
+    print(f"searchsorted {current_seconds:6.2f} s  ({legacy_seconds / current_seconds:.0f}x, outputs match)")
+
+
+if __name__ == "__main__":
+    main()
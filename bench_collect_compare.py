@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import inspect
 import statistics
 import sys
 import time
 from pathlib import Path
 from typing import Iterable, Tuple
 
-
 PATTERNS: str = "*.tlf"
 EXCLUDES: list[str] = ["*.hpc.tlf", "*.gpu.tlf"]
 INCLUDE_DATA_TYPES: tuple[str, ...] = ("Nmx", "Cmx", "Chan", "ccA", "RLL_Qmx", "EOF")
@@ -46,12 +46,25 @@ def load_apis(mode: str, repo_root: Path):
     return find_files_parallel, collect_files, SuffixesConfig.get_instance(), logger
 
 
-def benchmark_find(find_files_parallel, root: Path, runs: int) -> tuple[list[float], list[int]]:
+def supports_directory_index(func) -> bool:
+    """Return True when ``func`` accepts the ``directory_index`` option (older releases do not)."""
+    return "directory_index" in inspect.signature(func).parameters
+
+
+def index_kwargs(index_path: Path | None) -> dict[str, Path]:
+    return {} if index_path is None else {"directory_index": index_path}
+
+
+def benchmark_find(
+    find_files_parallel, root: Path, runs: int, index_path: Path | None = None
+) -> tuple[list[float], list[int]]:
     durations: list[float] = []
     counts: list[int] = []
     for _ in range(runs):
         start = time.perf_counter()
-        files = list(find_files_parallel(root_dirs=[root], patterns=PATTERNS, excludes=EXCLUDES))
+        files = list(
+            find_files_parallel(root_dirs=[root], patterns=PATTERNS, excludes=EXCLUDES, **index_kwargs(index_path))
+        )
         durations.append(time.perf_counter() - start)
         counts.append(len(files))
     return durations, counts
@@ -62,6 +75,7 @@ def benchmark_collect(
     suffixes_config,
     root: Path,
     runs: int,
+    index_path: Path | None = None,
 ) -> tuple[list[float], list[int]]:
     durations: list[float] = []
     counts: list[int] = []
@@ -71,6 +85,7 @@ def benchmark_collect(
             paths_to_process=[root],
             include_data_types=list(INCLUDE_DATA_TYPES),
             suffixes_config=suffixes_config,
+            **index_kwargs(index_path),
         )
         durations.append(time.perf_counter() - start)
         counts.append(len(files))
@@ -96,7 +111,35 @@ def summarize(name: str, root: Path, durations: Iterable[float], counts: Iterabl
     )
 
 
-def run_for_root(label: str, root: Path, runs: int) -> None:
+def run_indexed(
+    label: str, mode: str, find_files_parallel, collect_files, suffixes_config, root: Path, runs: int, index_dir: Path
+) -> None:
+    """Benchmark both searches with a directory index: one cold run that builds it, then warm runs."""
+    if not supports_directory_index(find_files_parallel):
+        print(f"\n{mode}: find_files_parallel has no directory_index option; skipping indexed runs.")
+        return
+
+    index_dir.mkdir(parents=True, exist_ok=True)
+    find_index: Path = index_dir / f"{label}_{mode}_find.jsonl"
+    find_index.unlink(missing_ok=True)
+    cold_durs, cold_counts = benchmark_find(find_files_parallel, root=root, runs=1, index_path=find_index)
+    summarize("find_files_parallel [index, cold]", root, cold_durs, cold_counts)
+    warm_durs, warm_counts = benchmark_find(find_files_parallel, root=root, runs=runs, index_path=find_index)
+    summarize("find_files_parallel [index, warm]", root, warm_durs, warm_counts)
+
+    collect_index: Path = index_dir / f"{label}_{mode}_collect.jsonl"
+    collect_index.unlink(missing_ok=True)
+    cold_durs, cold_counts = benchmark_collect(
+        collect_files, suffixes_config=suffixes_config, root=root, runs=1, index_path=collect_index
+    )
+    summarize("collect_files [index, cold]", root, cold_durs, cold_counts)
+    warm_durs, warm_counts = benchmark_collect(
+        collect_files, suffixes_config=suffixes_config, root=root, runs=runs, index_path=collect_index
+    )
+    summarize("collect_files [index, warm]", root, warm_durs, warm_counts)
+
+
+def run_for_root(label: str, root: Path, runs: int, index_dir: Path | None = None) -> None:
     repo_root: Path = Path(__file__).resolve().parent
     modes: Tuple[str, ...] = ("installed", "local")
 
@@ -119,6 +162,8 @@ def run_for_root(label: str, root: Path, runs: int) -> None:
             collect_files, suffixes_config=suffixes_config, root=root, runs=runs
         )
         summarize("collect_files", root, collect_durs, collect_counts)
+        if index_dir is not None:
+            run_indexed(label, mode, find_files_parallel, collect_files, suffixes_config, root, runs, index_dir)
 
 
 def main() -> None:
@@ -134,10 +179,16 @@ def main() -> None:
         help="Network data root to benchmark.",
     )
     parser.add_argument("--runs", type=int, default=5, help="Number of iterations per mode.")
+    parser.add_argument(
+        "--index-dir",
+        type=Path,
+        default=None,
+        help="Also benchmark cold and warm searches using directory index files stored in this folder.",
+    )
     args = parser.parse_args()
 
-    run_for_root("local", Path(args.local_root), runs=args.runs)
-    run_for_root("network", Path(args.network_root), runs=args.runs)
+    run_for_root("local", Path(args.local_root), runs=args.runs, index_dir=args.index_dir)
+    run_for_root("network", Path(args.network_root), runs=args.runs, index_dir=args.index_dir)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+"""Benchmark the grouped culvert mean/median statistics of tuflow_culverts_mean.
+
+Usage examples (from repo root):
+  python bench_culvert_statistics.py
+  python bench_culvert_statistics.py --rows 250000 --legacy-rows 50000 --repeats 3
+
+A synthetic 1D maximums frame (default 1M rows) is summarised with ``find_culvert_aep_dur_mean`` and
+``find_culvert_aep_dur_median``. A smaller frame (``--legacy-rows``) is also run through the previous
+per-group loops and checked for matching statistics and adopted records; Q is continuous, so there
+are no ties between candidate records.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+VALUE_COLUMNS: tuple[str, ...] = ("Q", "V", "DS_h", "US_h")
+CONTEXT_COLUMNS: tuple[str, ...] = ("tp_text", "internalName")
+
+
+def legacy_statistics(df: pd.DataFrame, group_columns: list[str], statistic: str) -> pd.DataFrame:
+    """Per-group loop used by _find_culvert_aep_dur_statistic before the rewrite (statistic and adoption only)."""
+    from ryan_library.functions.pandas.median_calc import upper_middle_row, upper_middle_value
+
+    rows: list[dict[str, object]] = []
+    for key, group in df.groupby(group_columns, observed=True):
+        entry: dict[str, object] = dict(zip(group_columns, key, strict=True))
+        for column in VALUE_COLUMNS:
+            entry[f"{statistic}_{column}"] = (
+                group[column].mean() if statistic == "mean" else upper_middle_value(group=group, value_column=column)
+            )
+        q_series: pd.Series = pd.to_numeric(group["Q"], errors="coerce")
+        if q_series.notna().any():
+            if statistic == "mean":
+                closest_row = group.loc[(q_series - float(q_series.mean())).abs().idxmin()]
+            else:
+                closest_row = upper_middle_row(group=group, value_column="Q")
+            for column in VALUE_COLUMNS + CONTEXT_COLUMNS:
+                entry[f"adopted_{column}"] = closest_row[column]
+        rows.append(entry)
+    return pd.DataFrame(data=rows)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark grouped culvert mean/median statistics.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows in the synthetic maximums frame.")
+    parser.add_argument("--legacy-rows", type=int, default=20_000, help="Rows compared against the legacy loops.")
+    parser.add_argument("--repeats", type=int, default=1, help="Benchmark repetitions.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    return parser.parse_args()
+
+
+def build_maximums_frame(rows: int, seed: int) -> pd.DataFrame:
+    """Return a 1D maximums frame with ~10 TPs per AEP/duration/run/culvert group and some missing Q."""
+    rng = np.random.default_rng(seed)
+    culverts: int = max(1, rows // 400)
+    df = pd.DataFrame(
+        {
+            "aep_text": pd.Categorical(rng.choice(["1p", "2p", "5p", "10p"], rows)),
+            "duration_text": pd.Categorical(rng.choice([f"{d:05d}m" for d in (30, 60, 120, 180, 360)], rows)),
+            "tp_text": pd.Categorical(rng.choice([f"TP{i:02d}" for i in range(1, 11)], rows)),
+            "trim_runcode": pd.Categorical(rng.choice(["EG00", "EG01"], rows)),
+            "Chan ID": pd.Categorical(rng.choice([f"CULV_{i:05d}" for i in range(culverts)], rows)),
+            "internalName": pd.Categorical([f"run_{i // 50:06d}" for i in range(rows)]),
+            "Q": rng.gamma(2.0, 5.0, rows),
+            "V": rng.random(rows) * 3.0,
+            "DS_h": rng.random(rows) + 10.0,
+            "US_h": rng.random(rows) + 11.0,
+        }
+    )
+    df.loc[rng.random(rows) < 0.02, "Q"] = np.nan
+    return df
+
+
+def timed(func, repeats: int) -> tuple[pd.DataFrame, float]:
+    durations: list[float] = []
+    result: pd.DataFrame | None = None
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    assert result is not None
+    return result, statistics.median(durations)
+
+
+def check_against_legacy(rows: int, seed: int, repeats: int) -> None:
+    from ryan_library.orchestrators.tuflow import tuflow_culverts_mean
+
+    df: pd.DataFrame = build_maximums_frame(rows=rows, seed=seed)
+    group_columns: list[str] = ["aep_text", "duration_text", "trim_runcode", "Chan ID"]
+    print(f"legacy check on {rows:,} rows")
+    for statistic in ("mean", "median"):
+        legacy, legacy_seconds = timed(lambda: legacy_statistics(df, group_columns, statistic), repeats)
+        current, current_seconds = timed(
+            lambda: tuflow_culverts_mean._find_culvert_aep_dur_statistic(aggregated_df=df, statistic=statistic),
+            repeats,
+        )
+        columns: list[str] = [column for column in legacy.columns if column not in group_columns]
+        expected: pd.DataFrame = legacy.sort_values(group_columns, ignore_index=True).loc[:, columns]
+        actual: pd.DataFrame = current.loc[:, columns]
+        pd.testing.assert_frame_equal(actual.astype(object), expected.astype(object), check_dtype=False)
+        print(
+            f"  {statistic:6s} legacy={legacy_seconds:7.2f} s  grouped={current_seconds:6.2f} s"
+            f"  ({legacy_seconds / current_seconds:.0f}x, outputs match)"
+        )
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    logger.remove()
+    from ryan_library.orchestrators.tuflow import tuflow_culverts_mean
+
+    if args.legacy_rows > 0:
+        check_against_legacy(rows=args.legacy_rows, seed=args.seed, repeats=args.repeats)
+
+    df: pd.DataFrame = build_maximums_frame(rows=args.rows, seed=args.seed)
+    print(f"{len(df):,} maximums rows")
+    for statistic in ("mean", "median"):
+        aep_dur, dur_seconds = timed(
+            lambda: getattr(tuflow_culverts_mean, f"find_culvert_aep_dur_{statistic}")(df), args.repeats
+        )
+        aep, max_seconds = timed(
+            lambda: getattr(tuflow_culverts_mean, f"find_culvert_aep_{statistic}_max")(aep_dur), args.repeats
+        )
+        print(
+            f"  {statistic:6s} aep_dur={dur_seconds:6.2f} s ({len(aep_dur):,} groups)"
+            f"  aep_max={max_seconds:6.2f} s ({len(aep):,} rows)"
+        )
+
+
+if __name__ == "__main__":
+    main()
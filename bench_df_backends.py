@@ -5,6 +5,11 @@ from __future__ import annotations
 Usage examples (from repo root):
   python bench_df_backends.py --num-frames 200 --rows-per-frame 1000
   python bench_df_backends.py --num-frames 4000 --rows-per-frame 3000 --num-columns 20 --repeats 3
+  python bench_df_backends.py --timeseries --num-frames 60 --rows-per-frame 200000
+
+--timeseries compares ProcessorCollection.combine_1d_timeseries with and without the per-run
+aligned path (and engine="polars" when enabled) on synthetic Q/V/H processors
+(rows-per-frame = channels x timesteps per processor).
 
 By default only pandas runs. Polars/pyarrow are attempted if installed; force tries with
 --try-polars/--try-pyarrow or disable with --no-polars/--no-pyarrow.
@@ -165,6 +170,70 @@ def bench_pyarrow(frames: list[pd.DataFrame]) -> list[BenchmarkResult]:
     return results
 
 
+def make_timeseries_collection(num_frames: int, rows: int, seed: int = 42):
+    """Build a ProcessorCollection of synthetic Q/V/H results plus one EOF per run.
+
+    ``num_frames`` timeseries processors are spread over ``num_frames // 3`` runs; each holds roughly
+    ``rows`` rows (channels x timesteps)."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
+    from ryan_library.processors.tuflow.processor_transport import rehydrate_processor
+
+    logger.remove()
+    rng = np.random.default_rng(seed)
+    channels: int = max(1, int(math.sqrt(rows)))
+    timesteps: int = max(1, rows // channels)
+    chan_ids = np.array([f"CULV_{idx:04d}" for idx in range(channels)], dtype=object)
+    times = np.arange(timesteps, dtype="float64") / 60.0
+    measures: dict[str, list[str]] = {"Q": ["Q"], "V": ["V"], "H": ["US_H", "DS_H"]}
+
+    def metadata(run_code: str, file_name: str, size: int) -> dict[str, pd.Categorical]:
+        values = {"internalName": run_code, "trim_runcode": run_code, "file": file_name}
+        return {col: pd.Categorical([value] * size, categories=[value], ordered=True) for col, value in values.items()}
+
+    collection = ProcessorCollection()
+    for run_idx in range(max(1, num_frames // 3)):
+        run_code = f"BENCH_{run_idx:04d}"
+        for data_type, columns in measures.items():
+            file_name = f"{run_code}_1d_{data_type}.csv"
+            data: dict[str, object] = {"Time": np.tile(times, channels), "Chan ID": np.repeat(chan_ids, timesteps)}
+            for col in columns:
+                data[col] = rng.normal(10.0, 2.0, size=channels * timesteps)
+            data.update(metadata(run_code, file_name, channels * timesteps))
+            collection.add_processor(rehydrate_processor(file_path=Path(file_name), df=pd.DataFrame(data)))
+        eof = pd.DataFrame(
+            {
+                "Chan ID": chan_ids,
+                "US Invert": rng.uniform(5.0, 10.0, size=channels),
+                "Height": rng.uniform(0.5, 2.0, size=channels),
+                "Type": rng.choice(["R", "C"], size=channels),
+            }
+        )
+        eof = eof.assign(**metadata(run_code, f"{run_code}.eof", channels))
+        collection.add_processor(rehydrate_processor(file_path=Path(f"{run_code}.eof"), df=eof))
+    return collection
+
+
+def run_timeseries_once(collection, include_polars: bool = False) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    outputs: list[pd.DataFrame] = []
+    variants: list[tuple[str, bool, str]] = [("ts_groupby", False, "pandas"), ("ts_per_run", True, "pandas")]
+    if include_polars:
+        variants.append(("ts_polars", False, "polars"))
+    for action, reduce_per_run, engine in variants:
+        work = collection.copy()
+        start = _now()
+        combined = work.combine_1d_timeseries(reduce_per_run=reduce_per_run, engine=engine)  # type: ignore[arg-type]
+        elapsed = _now() - start
+        outputs.append(combined)
+        results.append(BenchmarkResult(engine, action, elapsed, len(combined), combined.shape[1]))
+    for output in outputs[1:]:
+        pd.testing.assert_frame_equal(outputs[0], output)
+    return results
+
+
 def run_once(frames: list[pd.DataFrame], include_polars: bool, include_pyarrow: bool) -> list[BenchmarkResult]:
     results: list[BenchmarkResult] = []
     results.append(bench_pandas_concat(frames))
@@ -191,6 +260,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--try-pyarrow", action="store_true", help="Attempt pyarrow benchmarks if installed.")
     parser.add_argument("--no-polars", action="store_true", help="Disable polars even if installed.")
     parser.add_argument("--no-pyarrow", action="store_true", help="Disable pyarrow even if installed.")
+    parser.add_argument(
+        "--timeseries",
+        action="store_true",
+        help="Benchmark combine_1d_timeseries (grouped vs per-run aligned) on synthetic Q/V/H processors.",
+    )
     parser.add_argument(
         "--input-glob",
         action="append",
@@ -237,6 +311,23 @@ def main() -> None:
             except Exception:
                 include_pyarrow = False
 
+    if args.timeseries:
+        collection = make_timeseries_collection(num_frames=args.num_frames, rows=args.rows_per_frame, seed=args.seed)
+        print(
+            f"Synthetic timeseries: {len(collection.processors)} processors, ~{args.rows_per_frame:,} rows each. "
+            f"Repeats: {args.repeats}"
+        )
+        ts_results: list[BenchmarkResult] = []
+        for i in range(args.repeats):
+            print(f"\nRun {i+1}:")
+            for result in run_timeseries_once(collection, include_polars=include_polars):
+                print(f"  {result.format()}")
+                ts_results.append(result)
+        for action in dict.fromkeys(r.action for r in ts_results):
+            items = [r for r in ts_results if r.action == action]
+            print(f"  mean {action:12s} {1000 * sum(r.seconds for r in items) / len(items):8.1f} ms")
+        return
+
     frames: list[pd.DataFrame]
     if args.input_glob:
         path_strings: list[str] = []
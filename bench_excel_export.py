@@ -0,0 +1,106 @@
+"""Benchmark ExcelExporter backends and the column-width estimator on a large raw_data-style sheet.
+
+Usage examples (from repo root):
+  python bench_excel_export.py
+  python bench_excel_export.py --rows 500000 --engines xlsxwriter
+
+A synthetic sheet shaped like the combined 1D maximums/timeseries exports (categorical metadata,
+float results, path columns) is written with each engine into a temporary directory. The previous
+per-cell width estimator is timed against the current one on the same frame.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def legacy_max_cell_length(series: pd.Series) -> int:
+    """Per-cell loop used by ExcelExporter._calculate_max_cell_length before the rewrite."""
+    max_length: int = 0
+    for value in series.to_numpy(dtype=object, copy=False):
+        value_length: int = len("" if pd.isna(value) else str(value))
+        if value_length > max_length:
+            max_length = value_length
+    return max_length
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark ExcelExporter engines and column sizing.")
+    parser.add_argument("--rows", type=int, default=500_000, help="Rows in the synthetic sheet.")
+    parser.add_argument(
+        "--engines", nargs="+", default=["openpyxl", "xlsxwriter"], help="Excel engines to time (default: both)."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    return parser.parse_args()
+
+
+def build_frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    runs: list[str] = [
+        f"Model_{aep}_{dur:05d}m_TP{tp:02d}"
+        for aep in ("01p", "02p", "05p")
+        for dur in (60, 120)
+        for tp in range(1, 11)
+    ]
+    run_codes: np.ndarray = rng.choice(runs, rows)
+    return pd.DataFrame(
+        {
+            "internalName": pd.Categorical(run_codes),
+            "Chan ID": pd.Categorical(rng.choice([f"CULV_{i:04d}" for i in range(2_000)], rows)),
+            "Time": np.round(rng.random(rows) * 12.0, 3),
+            "Q": rng.gamma(2.0, 5.0, rows),
+            "V": rng.random(rows) * 3.0,
+            "DS_h": rng.random(rows) + 10.0,
+            "US_h": rng.random(rows) + 11.0,
+            "aep_text": pd.Categorical([code.split("_")[1] for code in run_codes]),
+            "file": pd.Categorical([f"{code}_1d_Q.csv" for code in run_codes]),
+            "path": pd.Categorical([f"C:/models/results/{code}_1d_Q.csv" for code in run_codes]),
+        }
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    logger.remove()
+    from ryan_library.functions.misc_functions import ExcelExporter
+
+    df: pd.DataFrame = build_frame(rows=args.rows, seed=args.seed)
+    exporter = ExcelExporter()
+    print(f"{len(df):,} rows x {len(df.columns)} columns")
+
+    start: float = time.perf_counter()
+    legacy_widths: list[int] = [legacy_max_cell_length(series=df[column]) for column in df.columns]
+    legacy_seconds: float = time.perf_counter() - start
+    start = time.perf_counter()
+    widths: list[int] = [exporter._calculate_max_cell_length(series=df[column]) for column in df.columns]
+    current_seconds: float = time.perf_counter() - start
+    print(f"column widths  legacy={legacy_seconds:6.2f} s  sampled={current_seconds:6.3f} s")
+    print(f"  legacy  {legacy_widths}\n  sampled {widths}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for engine in args.engines:
+            start = time.perf_counter()
+            exporter.save_to_excel(
+                data_frame=df,
+                sheet_name="raw_data",
+                output_directory=Path(temp_dir),
+                file_name=f"bench_{engine}.xlsx",
+                excel_engine=engine,
+            )
+            seconds: float = time.perf_counter() - start
+            size_mb: float = (Path(temp_dir) / f"bench_{engine}.xlsx").stat().st_size / 1e6
+            print(f"{engine:11s} {seconds:7.2f} s  {size_mb:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
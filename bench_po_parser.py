@@ -0,0 +1,172 @@
+"""Benchmark the vectorised PO parser against the previous per-column implementation.
+
+Usage examples (from repo root):
+  python bench_po_parser.py
+  python bench_po_parser.py --locations 5000 --timesteps 500 --repeats 5
+  python bench_po_parser.py --input-glob "path/to/results/**/*_PO.csv"
+
+Every input is parsed with both implementations and checked for identical output before timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+VALUE_COLUMNS: list[str] = ["Time", "Location", "Type", "Value"]
+
+
+def locate_time_column(measurement_row: pd.Series, location_row: pd.Series) -> int | None:
+    for idx, label in enumerate(location_row):
+        if str(label).strip().lower() == "time":
+            return idx
+    for idx, label in enumerate(measurement_row):
+        if str(label).strip().lower() == "time":
+            return idx
+    return None
+
+
+def legacy_parse_point_output(raw_df: pd.DataFrame) -> pd.DataFrame:
+    """Per-column implementation used by POProcessor before the vectorised rewrite."""
+    trimmed: pd.DataFrame = raw_df.drop(columns=0)
+    measurement_row = trimmed.iloc[0].fillna("")
+    location_row = trimmed.iloc[1].fillna("")
+    numeric_data: pd.DataFrame = trimmed.iloc[2:].apply(pd.to_numeric, errors="coerce")
+    numeric_data.reset_index(drop=True, inplace=True)
+
+    time_idx = locate_time_column(measurement_row=measurement_row, location_row=location_row)
+    if time_idx is None:
+        return pd.DataFrame(columns=VALUE_COLUMNS)
+    valid_mask = ~numeric_data.iloc[:, time_idx].isna()
+    numeric_data = numeric_data.loc[valid_mask].reset_index(drop=True)
+    time_values = numeric_data.iloc[:, time_idx].astype("float64")
+
+    tidy_frames: list[pd.DataFrame] = []
+    for idx, (measurement, location) in enumerate(zip(measurement_row, location_row)):
+        measurement = str(measurement).strip()
+        location = str(location).strip()
+        if idx == time_idx or not measurement or not location:
+            continue
+        values = numeric_data.iloc[:, idx].astype("float64")
+        if values.isna().all():
+            continue
+        frame = pd.DataFrame({"Time": time_values, "Location": location, "Type": measurement, "Value": values})
+        frame = frame.dropna(subset=["Value"])
+        if not frame.empty:
+            tidy_frames.append(frame)
+
+    if not tidy_frames:
+        return pd.DataFrame(columns=VALUE_COLUMNS)
+    combined = pd.concat(tidy_frames, ignore_index=True)[VALUE_COLUMNS]
+    combined.sort_values(by=["Location", "Type", "Time"], inplace=True)
+    combined.reset_index(drop=True, inplace=True)
+    return combined
+
+
+def make_raw_po(locations: int, timesteps: int, nan_fraction: float, seed: int) -> pd.DataFrame:
+    """Build a raw PO CSV frame (string cells, two header rows) with ``locations`` x {H, Q} columns."""
+    rng = np.random.default_rng(seed)
+    names: list[str] = [f"PO_{idx:05d}" for idx in rng.permutation(locations)]
+    measurements: list[str] = ["Time"] + [m for _ in names for m in ("H", "Q")]
+    location_row: list[str] = ["Time"] + [name for name in names for _ in ("H", "Q")]
+    values = rng.normal(10.0, 2.0, size=(timesteps, len(measurements) - 1)).round(3)
+    values[rng.random(values.shape) < nan_fraction] = np.nan
+    body = np.column_stack([np.arange(timesteps, dtype="float64") / 60.0, values]).astype(str)
+    body[body == "nan"] = ""
+    rows = [["Plot", *measurements], ["ID", *location_row]] + [["", *row] for row in body.tolist()]
+    return pd.DataFrame(rows, dtype=object)
+
+
+def load_raw_frames(paths: list[Path]) -> list[tuple[str, pd.DataFrame]]:
+    return [(path.name, pd.read_csv(path, header=None, dtype=str)) for path in paths]
+
+
+def make_processor(file_name: str):
+    from unittest.mock import patch
+
+    from ryan_library.processors.tuflow.other_processors.POProcessor import POProcessor
+
+    with patch("ryan_library.processors.tuflow.base_processor.BaseProcessor.__post_init__"):
+        processor = POProcessor(Path(file_name))
+    processor.file_name = file_name
+    return processor
+
+
+def time_call(func, raw_df: pd.DataFrame, repeats: int) -> list[float]:
+    durations: list[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(raw_df)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark POProcessor._parse_point_output.")
+    parser.add_argument("--locations", type=int, default=2000, help="Synthetic PO locations (2 columns each).")
+    parser.add_argument("--timesteps", type=int, default=300, help="Synthetic time steps.")
+    parser.add_argument("--nan-fraction", type=float, default=0.05, help="Fraction of blank synthetic cells.")
+    parser.add_argument("--repeats", type=int, default=3, help="Benchmark repetitions.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    parser.add_argument("--input-glob", action="append", default=[], help="Glob(s) of real *_PO.csv files.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    logger.remove()
+
+    inputs: list[tuple[str, pd.DataFrame]]
+    if args.input_glob:
+        paths = sorted({Path(p) for pattern in args.input_glob for p in glob.glob(pattern, recursive=True)})
+        inputs = load_raw_frames(paths=paths)
+        if not inputs:
+            print("No files matched --input-glob; exiting.", file=sys.stderr)
+            return
+    else:
+        inputs = [
+            (
+                f"synthetic_{args.locations}x{args.timesteps}_PO.csv",
+                make_raw_po(args.locations, args.timesteps, args.nan_fraction, args.seed),
+            )
+        ]
+
+    legacy_total: list[float] = []
+    vectorised_total: list[float] = []
+    for name, raw_df in inputs:
+        processor = make_processor(file_name=name)
+        expected = legacy_parse_point_output(raw_df)
+        actual = processor._parse_point_output(raw_df)
+        pd.testing.assert_frame_equal(
+            actual.astype({"Location": "str", "Type": "str"}),
+            expected.astype({"Location": "str", "Type": "str"}),
+            check_index_type=False,
+        )
+        legacy = time_call(legacy_parse_point_output, raw_df, args.repeats)
+        vectorised = time_call(processor._parse_point_output, raw_df, args.repeats)
+        legacy_total.append(statistics.median(legacy))
+        vectorised_total.append(statistics.median(vectorised))
+        print(
+            f"{name:50s} rows={len(expected):>10,} legacy={1000 * legacy_total[-1]:9.1f} ms "
+            f"vectorised={1000 * vectorised_total[-1]:9.1f} ms x{legacy_total[-1] / vectorised_total[-1]:6.1f}"
+        )
+
+    if len(inputs) > 1:
+        print(
+            f"\nTotal over {len(inputs)} files: legacy={sum(legacy_total):.3f} s "
+            f"vectorised={sum(vectorised_total):.3f} s x{sum(legacy_total) / sum(vectorised_total):.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark RORB closure-duration hydrograph analysis against the previous per-threshold loop.
+
+Usage examples (from repo root):
+  python bench_rorb_closure_durations.py
+  python bench_rorb_closure_durations.py --batches 4 --locations 40 --workers 4
+
+A synthetic ensemble (durations x TPs x AEPs per ``batch.out``) is written to a temporary folder.
+The legacy serial loop and the vectorised ``_process_hydrographs`` (serial and with a process pool)
+are timed, checking that all return identical frames.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DURATIONS: list[int] = [30, 60, 90, 120, 180, 270, 360, 540, 720, 1080]
+AEPS: list[str] = ["50", "20", "10", "5", "2", "1", "0.5", "0.2", "0.1", "0.05", "0.02", "0.01", "0.005", "0.002"]
+
+
+def legacy_analyze_hydrograph(
+    aep: str, duration: str, tp: int, csv_path: Path, out_path: Path, thresholds: list[float]
+) -> pd.DataFrame:
+    """Per-threshold loop used by ``analyze_hydrograph`` before the rewrite."""
+    df = pd.read_csv(csv_path, sep=",", skiprows=2, header=0)
+    df.columns = [c.replace("Calculated hydrograph:  ", "") for c in df.columns]
+    timestep = df["Time (hrs)"].iloc[1] - df["Time (hrs)"].iloc[0]
+    records: list[dict[str, float | str | int]] = []
+    for thresh in thresholds:
+        counts = (df.iloc[:, 1:] > thresh).sum()
+        locations = counts[counts > 0].index.tolist()
+        dur_exc = (counts[counts > 0] * timestep).tolist()
+        for loc, dur_exc_val in zip(locations, dur_exc):
+            records.append(
+                {
+                    "AEP": aep,
+                    "Duration": duration,
+                    "TP": tp,
+                    "Location": loc,
+                    "ThresholdFlow": thresh,
+                    "Duration_Exceeding": dur_exc_val,
+                    "out_path": str(out_path),
+                }
+            )
+    return pd.DataFrame(records)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark RORB closure-duration hydrograph analysis.")
+    parser.add_argument("--batches", type=int, default=2, help="Number of batch.out files.")
+    parser.add_argument("--tps", type=int, default=3, help="Temporal patterns per duration and AEP.")
+    parser.add_argument("--locations", type=int, default=20, help="Hydrograph locations per CSV.")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: automatic).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    return parser.parse_args()
+
+
+def write_ensemble(root: Path, args: argparse.Namespace) -> pd.DataFrame:
+    """Write hydrograph CSVs for every run and return the matching batch frame."""
+    rng = np.random.default_rng(args.seed)
+    runs: list[dict[str, object]] = []
+    for batch in range(args.batches):
+        folder: Path = root / f"model{batch}"
+        folder.mkdir()
+        for aep in AEPS:
+            for duration in DURATIONS:
+                for tp in range(1, args.tps + 1):
+                    steps: int = max(duration // 5 + 100, 50)
+                    shape: np.ndarray = np.sin(np.linspace(0, np.pi, steps)) ** 2
+                    peaks: np.ndarray = rng.gamma(2.0, 100.0 / float(aep) ** 0.3, size=args.locations)
+                    frame = pd.DataFrame(peaks[None, :] * shape[:, None])
+                    frame.columns = [f"Calculated hydrograph:  Loc{i:03d}" for i in range(args.locations)]
+                    frame.insert(0, "Time (hrs)", np.arange(steps) * 5 / 60)
+                    csv_path: Path = folder / f"model {aep}_du{duration}tp{tp}.csv"
+                    with csv_path.open("w") as handle:
+                        handle.write("RORB\nhydrographs\n")
+                        frame.to_csv(handle, index=False, float_format="%.3f")
+                    runs.append(
+                        {
+                            "AEP": f"aep{aep}",
+                            "Duration": str(duration),
+                            "TPat": tp,
+                            "csv": str(csv_path),
+                            "Path": f"model{batch}/batch.out",
+                        }
+                    )
+    return pd.DataFrame(runs)
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    logger.remove()
+    from ryan_library.orchestrators.rorb.closure_durations import _process_hydrographs
+
+    # Default thresholds of run_closure_durations.
+    values: set[int] = set(list(range(1, 10)) + list(range(10, 100, 2)) + list(range(100, 2100, 10)))
+    thresholds: list[float] = [float(v) for v in values]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        batch_df: pd.DataFrame = write_ensemble(root=Path(tmp), args=args)
+        print(f"{len(batch_df):,} hydrograph CSVs x {args.locations} locations, {len(thresholds)} thresholds")
+
+        start: float = time.perf_counter()
+        frames = [
+            legacy_analyze_hydrograph(
+                str(r.AEP), str(r.Duration), int(r.TPat), Path(r.csv), Path(r.Path), thresholds=thresholds
+            )
+            for r in batch_df.itertuples()
+        ]
+        legacy = pd.concat([f for f in frames if not f.empty], ignore_index=True)
+        legacy_seconds: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        serial = _process_hydrographs(batch_df=batch_df, thresholds=thresholds, max_workers=1)
+        serial_seconds: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pooled = _process_hydrographs(batch_df=batch_df, thresholds=thresholds, max_workers=args.workers)
+        pooled_seconds: float = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(serial, legacy)
+    pd.testing.assert_frame_equal(pooled, legacy)
+    print(f"legacy loop        {legacy_seconds:7.2f} s")
+    print(f"vectorised serial  {serial_seconds:7.2f} s")
+    print(f"vectorised pooled  {pooled_seconds:7.2f} s  (outputs match)")
+
+
+if __name__ == "__main__":
+    main()
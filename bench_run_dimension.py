@@ -0,0 +1,88 @@
+"""Benchmark the run dimension (compact metadata) mode of ProcessorCollection.
+
+Usage examples (from repo root):
+  python bench_run_dimension.py
+  python bench_run_dimension.py --root /path/to/results --pattern "*_1d_[HQV].csv" --repeats 3
+
+Files are processed once; the compact collection holds deep copies of the same processors with
+their metadata columns moved into the run dimension. The script reports the memory held by the
+processor frames in both modes and times ``combine_1d_timeseries`` and ``combine_raw``, checking
+that both modes return identical frames.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+DEFAULT_ROOT: Path = Path(__file__).resolve().parent / "tests" / "test_data" / "tuflow"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the run dimension mode of ProcessorCollection.")
+    parser.add_argument("--root", type=Path, default=DEFAULT_ROOT, help="Folder searched recursively for results.")
+    parser.add_argument(
+        "--pattern",
+        action="append",
+        default=None,
+        help="Glob pattern(s) of files to process (default: 1D timeseries CSVs and EOF files).",
+    )
+    parser.add_argument("--repeats", type=int, default=1, help="Benchmark repetitions.")
+    return parser.parse_args()
+
+
+def frame_megabytes(collection) -> float:
+    return sum(processor.df.memory_usage(deep=True).sum() for processor in collection.processors) / 1e6
+
+
+def timed(func, repeats: int) -> tuple[pd.DataFrame, float]:
+    durations: list[float] = []
+    result: pd.DataFrame | None = None
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    assert result is not None
+    return result, statistics.median(durations)
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    logger.remove()
+    from ryan_library.functions.tuflow.tuflow_common import process_file
+    from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
+
+    patterns: list[str] = args.pattern or ["*_1d_[HQV].csv", "*_1d_CF.csv", "*.eof"]
+    files: list[Path] = sorted({path for pattern in patterns for path in args.root.rglob(pattern)})
+    full = ProcessorCollection()
+    compact = ProcessorCollection(use_run_dimension=True)
+    for file_path in files:
+        processor = process_file(file_path=file_path)
+        if processor is not None and processor.processed:
+            full.add_processor(processor)
+            compact.add_processor(copy.deepcopy(processor))
+
+    rows: int = sum(len(processor.df) for processor in full.processors)
+    print(f"{len(full.processors):,} processors, {rows:,} rows")
+    full_mb, compact_mb = frame_megabytes(full), frame_megabytes(compact)
+    print(f"processor frames  full={full_mb:8.1f} MB  compact={compact_mb:8.1f} MB  ({full_mb / compact_mb:.2f}x)")
+    print(f"run dimension     {len(compact.run_dimension_table()):,} rows")
+
+    for method in ("combine_1d_timeseries", "combine_raw"):
+        expected, full_seconds = timed(getattr(full, method), repeats=args.repeats)
+        actual, compact_seconds = timed(getattr(compact, method), repeats=args.repeats)
+        pd.testing.assert_frame_equal(actual, expected)
+        print(f"{method:22s} full={full_seconds:6.2f} s  compact={compact_seconds:6.2f} s  outputs match")
+
+
+if __name__ == "__main__":
+    main()
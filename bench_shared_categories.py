@@ -0,0 +1,173 @@
+"""Benchmark concatenating processor frames with and without the shared category registry.
+
+Usage examples (from repo root):
+  python bench_shared_categories.py
+  python bench_shared_categories.py --frames 5000 --rows 100 --repeats 3
+  python bench_shared_categories.py --method legacy
+  python bench_shared_categories.py --method shared
+
+Each synthetic frame mimics a processed 1D result file: a few value columns plus the categorical
+metadata columns every processor adds (basic info, run-code parts, TP/duration/AEP attributes),
+each holding the single value of its file. The legacy path is the previous batched ``pd.concat``;
+the shared path is ``CategoryRegistry.concat``. Both are followed by ``reset_categorical_ordering``
+and checked for identical values when both run. Run one ``--method`` per process to compare the
+peak resident memory growth of each path (Arrow-backed strings are invisible to ``tracemalloc``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+RUN_CODE_PARTS: int = 6
+BATCH_SIZE: int = 500
+
+
+def make_frames(num_frames: int, rows: int, seed: int) -> list[pd.DataFrame]:
+    """Build ``num_frames`` processor-like frames with single-category metadata columns."""
+    rng = np.random.default_rng(seed)
+    frames: list[pd.DataFrame] = []
+    for idx in range(num_frames):
+        event: int = idx % 40
+        parts: list[str] = [f"EG{idx // 400:02d}", *(f"P{event % (k + 2)}" for k in range(RUN_CODE_PARTS - 1))]
+        run_code: str = "_".join(parts)
+        metadata: dict[str, object] = {
+            "internalName": run_code,
+            "file": f"{run_code}_1d_Cmx.csv",
+            "path": f"/results/{run_code}/{run_code}_1d_Cmx.csv",
+            "directory_path": f"/results/{run_code}",
+            "rel_path": f"{run_code}/{run_code}_1d_Cmx.csv",
+            "rel_directory": run_code,
+            **{f"R{k + 1:02d}": part for k, part in enumerate(parts)},
+            "trim_runcode": "_".join(parts[1:]),
+            "aep_text": f"{event % 8 + 1}p",
+            "duration_text": f"{(event % 5 + 1) * 60:05d}m",
+            "tp_text": f"TP{event % 10 + 1:02d}",
+            "aep_numeric": np.float32(event % 8 + 1),
+            "duration_numeric": (event % 5 + 1) * 60,
+            "tp_numeric": event % 10 + 1,
+        }
+        frame = pd.DataFrame(
+            {
+                "Chan ID": pd.array([f"C{j:04d}" for j in range(rows)], dtype="string"),
+                "Q": rng.random(rows),
+                "V": rng.random(rows),
+                "US_h": rng.random(rows),
+            }
+        )
+        for column, value in metadata.items():
+            frame[column] = pd.Categorical([value] * rows, categories=[value], ordered=True)
+        frames.append(frame)
+    return frames
+
+
+def legacy_concat(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Batched ``pd.concat`` used by ProcessorCollection before the shared registry."""
+    batches: list[pd.DataFrame] = [
+        pd.concat(frames[i : i + BATCH_SIZE], ignore_index=True, sort=False) for i in range(0, len(frames), BATCH_SIZE)
+    ]
+    return batches[0] if len(batches) == 1 else pd.concat(batches, ignore_index=True, sort=False)
+
+
+def shared_concat(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    from ryan_library.processors.tuflow.category_registry import CategoryRegistry
+
+    return CategoryRegistry().concat(frames=frames, batch_size=BATCH_SIZE)
+
+
+def as_values(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` with categoricals decoded so both paths can be compared by value."""
+    decoded: pd.DataFrame = df.copy()
+    for column in decoded.columns:
+        if isinstance(decoded[column].dtype, pd.CategoricalDtype):
+            categories_dtype = decoded[column].cat.categories.dtype
+            numeric: bool = pd.api.types.is_numeric_dtype(categories_dtype)
+            decoded[column] = decoded[column].astype("float64" if numeric else "string")
+        elif pd.api.types.is_numeric_dtype(decoded[column].dtype):
+            decoded[column] = decoded[column].astype("float64")
+        else:
+            decoded[column] = decoded[column].astype("string")
+    return decoded
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MB (0 where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def measure(func: Callable[[list[pd.DataFrame]], pd.DataFrame], frames, repeats: int):
+    from ryan_library.functions.dataframe_helpers import reset_categorical_ordering
+
+    durations: list[float] = []
+    result: pd.DataFrame | None = None
+    for _ in range(repeats):
+        result = None
+        start: float = time.perf_counter()
+        result = reset_categorical_ordering(func(frames))
+        durations.append(time.perf_counter() - start)
+    assert result is not None
+    return result, statistics.median(durations)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark shared categorical dictionaries for concat.")
+    parser.add_argument("--frames", type=int, default=5000, help="Number of processor frames.")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per frame.")
+    parser.add_argument("--repeats", type=int, default=1, help="Benchmark repetitions.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    parser.add_argument(
+        "--method", choices=["both", "legacy", "shared"], default="both", help="Concatenation path(s) to run."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    logger.remove()
+
+    frames: list[pd.DataFrame] = make_frames(num_frames=args.frames, rows=args.rows, seed=args.seed)
+    print(f"{len(frames):,} frames x {args.rows} rows, {len(frames[0].columns)} columns")
+
+    methods: dict[str, Callable[[list[pd.DataFrame]], pd.DataFrame]] = {
+        "legacy": legacy_concat,
+        "shared": shared_concat,
+    }
+    if args.method != "both":
+        methods = {args.method: methods[args.method]}
+
+    results: dict[str, pd.DataFrame] = {}
+    baseline_rss: float = peak_rss_mb()
+    for name, func in methods.items():
+        result, seconds = measure(func, frames, repeats=args.repeats)
+        results[name] = result
+        categorical: int = sum(isinstance(dtype, pd.CategoricalDtype) for dtype in result.dtypes)
+        line: str = (
+            f"{name:7s} time={seconds:8.2f} s  result={result.memory_usage(deep=True).sum() / 1e6:8.1f} MB"
+            f"  categorical columns={categorical}"
+        )
+        if len(methods) == 1:
+            line += f"  peak RSS growth={peak_rss_mb() - baseline_rss:8.1f} MB"
+        print(line)
+
+    if len(results) == 2:
+        pd.testing.assert_frame_equal(as_values(results["shared"]), as_values(results["legacy"]))
+        print("Outputs match.")
+
+
+if __name__ == "__main__":
+    main()
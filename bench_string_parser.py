@@ -0,0 +1,67 @@
+"""Benchmark TuflowStringParser construction with and without the parse cache.
+
+Usage examples (from repo root):
+  python bench_string_parser.py
+  python bench_string_parser.py --names 100000 --unique 2000
+
+Synthetic result paths are generated from the configured suffixes. ``cold`` clears the cache
+before every parse (the behaviour before caching), ``cached`` constructs parsers one by one and
+``parse_many`` parses the whole list in one call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark TuflowStringParser caching.")
+    parser.add_argument("--names", type=int, default=50_000, help="Number of paths to parse.")
+    parser.add_argument("--unique", type=int, default=2_000, help="Number of distinct file names.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    logger.remove()
+    from ryan_library.classes.tuflow_string_classes import TuflowStringParser
+
+    rng = random.Random(args.seed)
+    suffixes: list[str] = list(TuflowStringParser.load_suffixes())
+    unique: list[str] = [
+        f"EG{i % 50:02d}_{i:04d}_TP{rng.randint(1, 10):02d}_{rng.choice([60, 360, 1440]):05d}m_"
+        f"{rng.choice(['01.00', '05', '0.5'])}p{rng.choice(suffixes)}"
+        for i in range(args.unique)
+    ]
+    paths: list[Path] = [Path(f"results/folder{i % 7}") / rng.choice(unique) for i in range(args.names)]
+
+    def cold() -> None:
+        for path in paths:
+            TuflowStringParser.clear_cache()
+            TuflowStringParser(path)
+
+    def cached() -> None:
+        TuflowStringParser.clear_cache()
+        [TuflowStringParser(path) for path in paths]
+
+    def many() -> None:
+        TuflowStringParser.clear_cache()
+        TuflowStringParser.parse_many(paths)
+
+    print(f"{len(paths):,} paths, {len(unique):,} distinct names, {len(suffixes)} suffixes")
+    for label, func in (("cold", cold), ("cached", cached), ("parse_many", many)):
+        start: float = time.perf_counter()
+        func()
+        print(f"{label:10s} {time.perf_counter() - start:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark SuffixIndex lookups against a linear longest-suffix scan.
+
+Usage examples (from repo root):
+  python bench_suffix_index.py
+  python bench_suffix_index.py --repeats 500 --case-sensitive
+
+File names are generated from the configured suffixes (plus one name matching none of them). The
+scan is the per-suffix ``endswith`` loop the index replaced; both are checked to give the same
+data types before timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark SuffixIndex against a linear suffix scan.")
+    parser.add_argument("--repeats", type=int, default=500, help="Times the list of file names is repeated.")
+    parser.add_argument("--case-sensitive", action="store_true", help="Compare case-sensitive lookups.")
+    parser.add_argument("--timings", type=int, default=5, help="Timing repetitions (best is reported).")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from loguru import logger
+
+    logger.remove()
+    from ryan_library.classes.suffixes_and_dtypes import SuffixesConfig, SuffixIndex
+
+    suffix_to_type: dict[str, str] = SuffixesConfig.load().suffix_to_type
+    names: list[str] = [f"EG{i % 97:02d}_{i:05d}_TP01_00360m_01.00p{suffix}" for i, suffix in enumerate(suffix_to_type)]
+    names = (names + ["EG01_001_notes.txt"]) * args.repeats
+    index = SuffixIndex(suffix_to_type, case_sensitive=args.case_sensitive)
+
+    def fold(text: str) -> str:
+        return text if args.case_sensitive else text.lower()
+
+    def scan() -> list[str | None]:
+        found: list[str | None] = []
+        for name in names:
+            matches: list[str] = [suffix for suffix in suffix_to_type if fold(name).endswith(fold(suffix))]
+            found.append(suffix_to_type[max(matches, key=len)] if matches else None)
+        return found
+
+    def indexed() -> list[str | None]:
+        return [index.data_type(name) for name in names]
+
+    if indexed() != scan():
+        raise SystemExit("SuffixIndex and the linear scan disagree")
+
+    print(f"{len(names):,} names, {len(suffix_to_type)} suffixes, case_sensitive={args.case_sensitive}")
+    scan_seconds: float = min(timeit.repeat(scan, number=1, repeat=args.timings))
+    index_seconds: float = min(timeit.repeat(indexed, number=1, repeat=args.timings))
+    print(f"scan    {scan_seconds:7.3f} s")
+    print(f"index   {index_seconds:7.3f} s  ({scan_seconds / index_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,12 @@ WORKING_DIR: Path = Path(__file__).absolute().parent
 USE_LIVE_DASHBOARD = True
 LIVE_REFRESH_PER_SECOND = 2.0
 LIVE_MAX_ROWS = 25
+# Reuse directory listings between runs; only folders that changed are listed again.
+DIRECTORY_INDEX: Path | None = None
+# DIRECTORY_INDEX: Path = WORKING_DIR / ".tlf_directory_index.jsonl"
+# Reuse the summary rows of completed logs that have not changed since the previous run.
+SUMMARY_STORE: Path | None = None
+# SUMMARY_STORE: Path = WORKING_DIR / ".tlf_summary_store.sqlite"
 
 
 def main(
@@ -68,6 +74,8 @@ def main(
         use_live_dashboard=effective_use_live_dashboard,
         live_refresh_per_second=effective_live_refresh_per_second,
         live_max_rows=effective_live_max_rows,
+        directory_index=DIRECTORY_INDEX,
+        summary_store=SUMMARY_STORE,
     )
     print()
     print_library_version()
@@ -17,6 +17,9 @@ EXPORT_MODE: Literal["excel", "parquet", "both"] = "excel"
 WORKING_DIR: Path = Path(__file__).absolute().parent
 # Optional explicit folder roots to scan. If left empty, the wrapper scans WORKING_DIR recursively.
 PATHS_TO_PROCESS: tuple[Path, ...] = ()
+# Optional processor cache folder. Unchanged result files are reused from here instead of re-parsed.
+CACHE_DIR: Path | None = None
+# CACHE_DIR: Path = WORKING_DIR / ".ryan_cache"
 # WORKING_DIR: Path = Path(r"E:\path\to\custom\directory")
 
 import argparse
@@ -70,6 +73,7 @@ def main(
         console_log_level=effective_console_log_level,
         locations_to_include=locations_to_include,
         export_mode=effective_export_mode,
+        cache_dir=CACHE_DIR,
     )
     print()
     print_library_version()
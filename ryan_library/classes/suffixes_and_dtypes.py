@@ -1,6 +1,7 @@
 # ryan_library/classes/suffixes_and_dtypes.py
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
 from loguru import logger
 from dataclasses import dataclass, field
@@ -319,6 +320,60 @@ class Config:
         return cls._instance
 
 
+class SuffixIndex:
+    """Longest-suffix lookup over a suffix -> data type mapping.
+
+    Suffixes are bucketed by their last character and, within a bucket, tried longest first as
+    dictionary lookups on the tail of the file name. When suffixes overlap (``_1d_H.csv`` and
+    ``_H.csv``) the longest one wins, independent of the mapping's order."""
+
+    def __init__(self, suffix_to_type: Mapping[str, str], case_sensitive: bool = True) -> None:
+        self.case_sensitive: bool = case_sensitive
+        # last character -> (suffix lengths, longest first; folded suffix -> (suffix, data type))
+        self._buckets: dict[str, tuple[tuple[int, ...], dict[str, tuple[str, str]]]] = {}
+        entries: dict[str, dict[str, tuple[str, str]]] = {}
+        for suffix, data_type in suffix_to_type.items():
+            if not suffix:
+                raise ValueError(f"Empty suffix configured for data type '{data_type}'.")
+            key: str = self._fold(suffix)
+            bucket: dict[str, tuple[str, str]] = entries.setdefault(key[-1], {})
+            existing: tuple[str, str] | None = bucket.get(key)
+            if existing is None:
+                bucket[key] = (suffix, data_type)
+            elif existing[1] != data_type:
+                logger.warning(
+                    f"Suffix '{suffix}' ({data_type}) collides with '{existing[0]}' ({existing[1]}); "
+                    f"keeping '{existing[0]}'."
+                )
+        for last, bucket in entries.items():
+            lengths: tuple[int, ...] = tuple(sorted({len(key) for key in bucket}, reverse=True))
+            self._buckets[last] = (lengths, bucket)
+        self._max_length: int = max((len(key) for bucket in entries.values() for key in bucket), default=0)
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def match(self, file_name: str) -> tuple[str, str] | None:
+        """Return ``(suffix, data_type)`` for the longest configured suffix ``file_name`` ends with."""
+        if not file_name:
+            return None
+        tail: str = self._fold(file_name[-self._max_length :])
+        bucket = self._buckets.get(tail[-1])
+        if bucket is None:
+            return None
+        lengths, suffixes = bucket
+        for length in lengths:
+            found: tuple[str, str] | None = suffixes.get(tail[-length:])
+            if found is not None:
+                return found
+        return None
+
+    def data_type(self, file_name: str) -> str | None:
+        """Return the data type of the longest configured suffix ``file_name`` ends with."""
+        match: tuple[str, str] | None = self.match(file_name)
+        return None if match is None else match[1]
+
+
 class SuffixesConfig:
     """A lookup dictionary that maps file suffixes to their respective data types."""
 
@@ -331,6 +386,10 @@ class SuffixesConfig:
         logger.debug("Initializing SuffixesConfig instance.")
         self.suffix_to_type: dict[str, str] = suffix_to_type
         self.config: Config = config  # Store the Config instance
+        # Lookup structures derived from suffix_to_type, rebuilt if the attribute is reassigned.
+        self._indexed: dict[str, str] | None = None
+        self._indexes: dict[bool, SuffixIndex] = {}
+        self._inverted: dict[str, tuple[str, ...]] = {}
 
     @classmethod
     def load(cls, config: Config | None = None) -> "SuffixesConfig":
@@ -340,6 +399,11 @@ class SuffixesConfig:
         suffix_to_type: dict[str, str] = {}
         for data_type, data_def in config.data_types.items():
             for suffix in data_def.suffixes:
+                previous: str | None = suffix_to_type.get(suffix)
+                if previous is not None and previous != data_type:
+                    logger.warning(
+                        f"Suffix '{suffix}' is configured for '{previous}' and '{data_type}'; using '{data_type}'."
+                    )
                 suffix_to_type[suffix] = data_type
                 logger.debug("Mapping suffix '{}' to data type '{}'", suffix, data_type)
         logger.debug("SuffixesConfig loaded with {} suffixes.", len(suffix_to_type))
@@ -354,19 +418,35 @@ class SuffixesConfig:
                     cls._instance = cls.load(config=config)
         return cls._instance
 
+    def _refresh(self) -> None:
+        if self._indexed is not self.suffix_to_type:
+            self._indexes = {}
+            inverted: dict[str, list[str]] = {}
+            for suffix, data_type in self.suffix_to_type.items():
+                inverted.setdefault(data_type, []).append(suffix)
+            self._inverted = {data_type: tuple(suffixes) for data_type, suffixes in inverted.items()}
+            self._indexed = self.suffix_to_type
+
+    def suffix_index(self, case_sensitive: bool = True) -> SuffixIndex:
+        """Return the cached longest-suffix index for ``suffix_to_type``.
+
+        The index is rebuilt when ``suffix_to_type`` is reassigned; call :meth:`refresh_index` after
+        mutating the dictionary in place."""
+        self._refresh()
+        index: SuffixIndex | None = self._indexes.get(case_sensitive)
+        if index is None:
+            index = self._indexes[case_sensitive] = SuffixIndex(
+                suffix_to_type=self.suffix_to_type, case_sensitive=case_sensitive
+            )
+        return index
+
+    def refresh_index(self) -> None:
+        """Drop the cached lookup structures so they are rebuilt from ``suffix_to_type``."""
+        self._indexed = None
+
     def get_data_type_for_suffix(self, file_name: str) -> str | None:
-        """Retrieve the data type based on the file's suffix."""
-        for suffix, data_type in self.suffix_to_type.items():
-            if file_name.endswith(suffix):
-                logger.debug(
-                    "File '{}' matches suffix '{}' with data type '{}'",
-                    file_name,
-                    suffix,
-                    data_type,
-                )
-                return data_type
-        logger.debug("File '{}' suffix did not match a data_type, returning None", file_name)
-        return None
+        """Retrieve the data type based on the file's suffix (longest matching suffix wins)."""
+        return self.suffix_index().data_type(file_name)
 
     def get_processor_class_for_data_type(self, data_type: str) -> str | None:
         """Retrieve the processor class name associated with a specific data type."""
@@ -386,11 +466,8 @@ class SuffixesConfig:
 
     def invert_suffix_to_type(self) -> dict[str, list[str]]:
         """Invert the suffix_to_type dictionary to map data types to suffixes."""
-        inverted: dict[str, list[str]] = {}
-        for suffix, data_type in self.suffix_to_type.items():
-            inverted.setdefault(data_type, []).append(suffix)
-        logger.debug("Inverted dictionary created with {} data types.", len(inverted))
-        return inverted
+        self._refresh()
+        return {data_type: list(suffixes) for data_type, suffixes in self._inverted.items()}
 
 
 if __name__ == "__main__":
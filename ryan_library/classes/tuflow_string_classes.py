@@ -1,10 +1,14 @@
 # ryan_library\classes\tuflow_string_classes.py
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 import math
 import re
+import threading
 from pathlib import Path
+from typing import ClassVar
 from loguru import logger
 from dataclasses import dataclass, field
-from ryan_library.classes.suffixes_and_dtypes import SuffixesConfig
+from ryan_library.classes.suffixes_and_dtypes import SuffixesConfig, SuffixIndex
 
 
 @dataclass
@@ -61,8 +65,33 @@ class RunCodeComponent:
         return self.text_repr
 
 
+@dataclass(frozen=True, slots=True)
+class ParsedFileName:
+    """Everything :class:`TuflowStringParser` derives from a file name, cached per name."""
+
+    data_type: str | None
+    raw_run_code: str
+    clean_run_code: str
+    run_code_parts: tuple[tuple[str, str], ...]
+    tp: RunCodeComponent | None
+    duration: RunCodeComponent | None
+    aep: RunCodeComponent | None
+    trim_run_code: str
+
+
 class TuflowStringParser:
-    """A class to parse Tuflow-specific strings and file paths."""
+    """A class to parse Tuflow-specific strings and file paths.
+
+    Parsing only depends on the file name and the configured suffixes, so results are kept in a
+    class-level LRU cache keyed on the file name; constructing a parser for a name seen recently
+    (for example once for the entity filter and again in ``BaseProcessor.from_file``) only copies
+    the cached fields. Use :meth:`parse_many` to parse a large list of paths in one call."""
+
+    CACHE_SIZE: ClassVar[int] = 32_768
+    _cache: ClassVar["OrderedDict[str, ParsedFileName]"] = OrderedDict()
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    _index: ClassVar[SuffixIndex | None] = None
+    _index_source: ClassVar[Mapping[str, str] | None] = None
 
     # Precompile regex patterns for efficiency
     # ``TP_PATTERN`` finds patterns like ``TP01`` that are surrounded by ``_`` or ``+`` (or appear at the edges).
@@ -93,14 +122,125 @@ class TuflowStringParser:
         self.file_path = Path(file_path)
         self.file_name: str = self.file_path.name
         self.suffixes: dict[str, str] = self.load_suffixes()
-        self.data_type: str | None = self.determine_data_type()
-        self.raw_run_code: str = self.extract_raw_run_code()
-        self.clean_run_code: str = self.clean_runcode(run_code=self.raw_run_code)
-        self.run_code_parts: dict[str, str] = self.extract_run_code_parts(clean_run_code=self.clean_run_code)
-        self.tp: RunCodeComponent | None = self.parse_tp(string=self.clean_run_code)
-        self.duration: RunCodeComponent | None = self.parse_duration(string=self.clean_run_code)
-        self.aep: RunCodeComponent | None = self.parse_aep(string=self.clean_run_code)
-        self.trim_run_code: str = self.trim_the_run_code()
+        parsed: ParsedFileName | None = self._cached_parse(file_name=self.file_name, suffixes=self.suffixes)
+        if parsed is None:
+            parsed = self._parse_file_name()
+        elif parsed.data_type is None:
+            logger.warning(f"No matching suffix found for file '{self.file_name}'")
+        self._apply_parsed(parsed=parsed)
+
+    @classmethod
+    def parse_many(cls, file_paths: Iterable[Path | str]) -> list["TuflowStringParser"]:
+        """Parse many paths at once.
+
+        Each distinct file name is parsed once (repeated names, e.g. the same run in several folders,
+        share the result) and the suffix configuration is loaded once for the whole batch.
+
+        Args:
+            file_paths (Iterable[Path | str]): Paths to parse.
+
+        Returns:
+            list[TuflowStringParser]: One parser per path, in input order."""
+        suffixes: dict[str, str] = cls.load_suffixes()
+        batch: dict[str, ParsedFileName] = {}
+        parsers: list[TuflowStringParser] = []
+        for file_path in file_paths:
+            path = Path(file_path)
+            file_name: str = path.name
+            parsed: ParsedFileName | None = batch.get(file_name)
+            if parsed is None:
+                parsed = cls._cached_parse(file_name=file_name, suffixes=suffixes)
+                if parsed is None:
+                    parser = cls(file_path=path)
+                    batch[file_name] = parser._snapshot()
+                    parsers.append(parser)
+                    continue
+                batch[file_name] = parsed
+            parser = cls.__new__(cls)
+            parser.file_path = path
+            parser.file_name = file_name
+            parser.suffixes = suffixes
+            parser._apply_parsed(parsed=parsed)
+            parsers.append(parser)
+        return parsers
+
+    @classmethod
+    def suffix_index(cls, suffixes: Mapping[str, str]) -> SuffixIndex:
+        """Return the case-insensitive suffix index for ``suffixes``, clearing the cache if they changed.
+
+        The configured suffixes reuse the index cached on :class:`SuffixesConfig`."""
+        # The state lives on TuflowStringParser itself so subclasses share one index and cache.
+        state = TuflowStringParser
+        with state._cache_lock:
+            if state._index is None or state._index_source is not suffixes:
+                config: SuffixesConfig = SuffixesConfig.get_instance()
+                if config.suffix_to_type is suffixes:
+                    state._index = config.suffix_index(case_sensitive=False)
+                else:
+                    state._index = SuffixIndex(suffix_to_type=suffixes, case_sensitive=False)
+                state._index_source = suffixes
+                state._cache.clear()
+            return state._index
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached parse results and the suffix index."""
+        state = TuflowStringParser
+        with state._cache_lock:
+            state._cache.clear()
+            state._index = None
+            state._index_source = None
+
+    @classmethod
+    def _cached_parse(cls, file_name: str, suffixes: Mapping[str, str]) -> ParsedFileName | None:
+        cls.suffix_index(suffixes=suffixes)
+        state = TuflowStringParser
+        with state._cache_lock:
+            parsed: ParsedFileName | None = state._cache.get(file_name)
+            if parsed is not None:
+                state._cache.move_to_end(file_name)
+            return parsed
+
+    def _parse_file_name(self) -> ParsedFileName:
+        """Parse ``file_name`` from scratch and remember the result."""
+        self.data_type = self.determine_data_type()
+        self.raw_run_code = self.extract_raw_run_code()
+        self.clean_run_code = self.clean_runcode(run_code=self.raw_run_code)
+        self.run_code_parts = self.extract_run_code_parts(clean_run_code=self.clean_run_code)
+        self.tp = self.parse_tp(string=self.clean_run_code)
+        self.duration = self.parse_duration(string=self.clean_run_code)
+        self.aep = self.parse_aep(string=self.clean_run_code)
+        self.trim_run_code = self.trim_the_run_code()
+        parsed: ParsedFileName = self._snapshot()
+        state = TuflowStringParser
+        with state._cache_lock:
+            if state._index_source is self.suffixes:
+                state._cache[self.file_name] = parsed
+                if len(state._cache) > state.CACHE_SIZE:
+                    state._cache.popitem(last=False)
+        return parsed
+
+    def _snapshot(self) -> ParsedFileName:
+        return ParsedFileName(
+            data_type=self.data_type,
+            raw_run_code=self.raw_run_code,
+            clean_run_code=self.clean_run_code,
+            run_code_parts=tuple(self.run_code_parts.items()),
+            tp=self.tp,
+            duration=self.duration,
+            aep=self.aep,
+            trim_run_code=self.trim_run_code,
+        )
+
+    def _apply_parsed(self, parsed: ParsedFileName) -> None:
+        self.data_type: str | None = parsed.data_type
+        self.raw_run_code: str = parsed.raw_run_code
+        self.clean_run_code: str = parsed.clean_run_code
+        self.run_code_parts: dict[str, str] = dict(parsed.run_code_parts)
+        self.tp: RunCodeComponent | None = parsed.tp
+        self.duration: RunCodeComponent | None = parsed.duration
+        self.aep: RunCodeComponent | None = parsed.aep
+        self.trim_run_code: str = parsed.trim_run_code
 
     @staticmethod
     def _coerce_text(value: object) -> str | None:
@@ -216,7 +356,6 @@ class TuflowStringParser:
             dict[str, str]: Suffix to type mapping."""
         try:
             suffixes: dict[str, str] = SuffixesConfig.get_instance().suffix_to_type
-            logger.debug(f"Loaded suffixes: {suffixes}")
             return suffixes
         except AttributeError as e:
             logger.error(f"Error accessing suffixes from SuffixesConfig: {e}")
@@ -227,10 +366,9 @@ class TuflowStringParser:
 
         Returns:
             Optional[str]: Data type if a matching suffix is found, otherwise None."""
-        for suffix, data_type in self.suffixes.items():
-            if self.file_name.lower().endswith(suffix.lower()):
-                logger.debug(f"Determined data type '{data_type}' for suffix '{suffix}'")
-                return data_type
+        match: tuple[str, str] | None = self.suffix_index(suffixes=self.suffixes).match(self.file_name)
+        if match is not None:
+            return match[1]
         logger.warning(f"No matching suffix found for file '{self.file_name}'")
         return None
 
@@ -241,11 +379,11 @@ class TuflowStringParser:
         Returns:
             str: Extracted run code.
         """
-        for suffix in self.suffixes.keys():
-            if self.file_name.lower().endswith(suffix.lower()):
-                run_code: str = self.file_name[: -len(suffix)]
-                logger.debug(f"Extracted raw run code '{run_code}' from file name '{self.file_name}'")
-                return run_code
+        match: tuple[str, str] | None = self.suffix_index(suffixes=self.suffixes).match(self.file_name)
+        if match is not None:
+            run_code: str = self.file_name[: -len(match[0])]
+            logger.debug(f"Extracted raw run code '{run_code}' from file name '{self.file_name}'")
+            return run_code
         logger.debug(f"No suffix matched; using entire file name '{self.file_name}' as run code")
         return self.file_name
 
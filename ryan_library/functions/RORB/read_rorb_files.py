@@ -1,8 +1,9 @@
 from loguru import logger
 from pathlib import Path
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 import re
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -158,21 +159,44 @@ def analyze_hydrograph(
         return pd.DataFrame()
     timestep = df["Time (hrs)"].iloc[1] - df["Time (hrs)"].iloc[0]
 
-    records: list[dict[str, float | str | int]] = []
-    for thresh in thresholds:
-        counts = (df.iloc[:, 1:] > thresh).sum()
-        locations = counts[counts > 0].index.tolist()
-        dur_exc = (counts[counts > 0] * timestep).tolist()
-        for loc, dur_exc_val in zip(locations, dur_exc):
-            records.append(
-                {
-                    "AEP": aep,
-                    "Duration": duration,
-                    "TP": tp,
-                    "Location": loc,
-                    "ThresholdFlow": thresh,
-                    "Duration_Exceeding": dur_exc_val,
-                    "out_path": str(out_path),
-                }
-            )
-    return pd.DataFrame(records)
+    locations: list[str] = [str(column) for column in df.columns[1:]]
+    counts: np.ndarray = exceedance_counts(values=df.iloc[:, 1:].to_numpy(dtype=float), thresholds=thresholds)
+    # Rows are ordered threshold first, then location, keeping only non-zero counts.
+    threshold_idx, location_idx = np.nonzero(counts)
+    if len(threshold_idx) == 0:
+        return pd.DataFrame()
+    rows: int = len(threshold_idx)
+    return pd.DataFrame(
+        {
+            "AEP": [aep] * rows,
+            "Duration": [duration] * rows,
+            "TP": np.full(rows, tp, dtype=np.int64),
+            "Location": [locations[i] for i in location_idx],
+            "ThresholdFlow": [thresholds[i] for i in threshold_idx],
+            "Duration_Exceeding": counts[threshold_idx, location_idx] * timestep,
+            "out_path": [str(out_path)] * rows,
+        }
+    )
+
+
+def exceedance_counts(values: np.ndarray, thresholds: Sequence[float]) -> np.ndarray:
+    """Count the values above each threshold in every column of ``values``.
+
+    Each column is sorted once and all thresholds are located with a single ``searchsorted``,
+    instead of comparing the whole array against every threshold.
+
+    Args:
+        values (np.ndarray): 2D array with one column per location.
+        thresholds (Sequence[float]): Thresholds to count exceedances for.
+
+    Returns:
+        np.ndarray: Integer counts shaped ``(len(thresholds), values.shape[1])``."""
+    # NaN sorts last, so searching only the first ``valid`` rows leaves NaN values (and NaN
+    # thresholds) uncounted.
+    ordered: np.ndarray = np.sort(values, axis=0)
+    valid: np.ndarray = np.count_nonzero(~np.isnan(ordered), axis=0)
+    targets: np.ndarray = np.asarray(thresholds, dtype=float)
+    counts: np.ndarray = np.empty((len(targets), ordered.shape[1]), dtype=np.int64)
+    for column in range(ordered.shape[1]):
+        counts[:, column] = valid[column] - np.searchsorted(ordered[: valid[column], column], targets, side="right")
+    return counts
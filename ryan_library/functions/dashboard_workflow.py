@@ -21,6 +21,7 @@ from loguru import logger
 
 from ryan_library.functions.live_dashboard import LiveWorkflowDashboard, WorkflowStatus
 from ryan_library.functions.loguru_helpers import LogQueue, worker_initializer
+from ryan_library.functions.work_scheduling import largest_first
 
 TItem = TypeVar("TItem")
 TResult = TypeVar("TResult")
@@ -58,17 +59,24 @@ def run_dashboard_workflow(
     worker_log_level: str = "ERROR",
     max_start_events: int | None = None,
     poll_interval: float = 0.1,
+    item_sizes: Sequence[int] | None = None,
 ) -> list[TResult]:
     """Process items and keep a :class:`LiveWorkflowDashboard` in sync.
 
     The dashboard must already have its task labels and metadata configured with
     one task per item. Results are returned in the same order as *items*.
 
+    ``item_sizes`` (for example file sizes in bytes) makes the pool start the
+    largest items first, so a big item found last does not run on its own after
+    every other worker has finished. Without it items are submitted in order.
+
     ``process_item`` should contain the real work for one item. The status and
     detail adapters keep this runner generic: LogSummary can map empty
     DataFrames to ``SKIP``, while another wrapper could map return codes,
     validation failures, or copied-file counts to different statuses.
     """
+    if item_sizes is not None and len(item_sizes) != len(items):
+        raise ValueError(f"Expected {len(items)} item sizes, got {len(item_sizes)}.")
     indexed_results: dict[int, TResult] = {}
     effective_pool_size: int = max(pool_size, 1)
     with dashboard:
@@ -94,6 +102,7 @@ def run_dashboard_workflow(
                 worker_log_level=worker_log_level,
                 max_start_events=max_start_events,
                 poll_interval=poll_interval,
+                item_sizes=item_sizes,
             )
     return [indexed_results[index] for index in sorted(indexed_results)]
 
@@ -137,6 +146,7 @@ def _run_parallel_dashboard_workflow(
     worker_log_level: str,
     max_start_events: int | None,
     poll_interval: float,
+    item_sizes: Sequence[int] | None = None,
 ) -> None:
     """Run work in a process pool and poll async results for dashboard updates."""
     completed_indexes: set[int] = set()
@@ -154,8 +164,10 @@ def _run_parallel_dashboard_workflow(
         ),
     ) as pool:
         pending_results: dict[int, ApplyResult[TResult]] = {}
-        for index, item in enumerate(items, start=1):
-            request: IndexedWorkflowItem[object] = IndexedWorkflowItem(index=index, item=item)
+        positions: Sequence[int] = range(len(items)) if item_sizes is None else largest_first(sizes=item_sizes)
+        for position in positions:
+            index: int = position + 1
+            request: IndexedWorkflowItem[object] = IndexedWorkflowItem(index=index, item=items[position])
             pending_results[index] = cast(
                 ApplyResult[TResult],
                 pool.apply_async(_process_indexed_workflow_item, args=(request,)),
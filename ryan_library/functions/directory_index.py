@@ -0,0 +1,161 @@
+# ryan_library/functions/directory_index.py
+"""Persistent directory listing cache for :func:`ryan_library.functions.file_utils.find_files_parallel`.
+
+Listing directories is the slow part of walking a results tree on a network share. The index
+records, for every directory it has listed, the directory's mtime and the names of its files and
+sub-directories. A later walk only has to ``stat`` each directory: if the mtime is unchanged the
+stored listing is reused, otherwise the directory is listed again. Creating, deleting or renaming
+an entry updates the mtime of its parent, so changed folders are always re-listed. Edits to
+existing files do not matter because only names are stored.
+
+The index is a JSON-lines file (a version header, then one directory per line)."""
+
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path, PurePath
+import threading
+import time
+from typing import Any
+
+from loguru import logger
+
+INDEX_VERSION: int = 1
+# Directory mtimes can be coarse (2 s on FAT, ~1 s on some SMB servers). A directory modified
+# within this window before it was listed could change again without a visible mtime change,
+# so such listings are re-read on the next walk instead of being trusted.
+MTIME_SAFETY_NS: int = 2_000_000_000
+
+
+@dataclass(slots=True)
+class DirectoryListing:
+    """Names found in one directory and the directory mtime they belong to."""
+
+    mtime_ns: int
+    listed_ns: int
+    files: list[str]
+    dirs: list[str]
+
+
+class DirectoryIndex:
+    """Thread-safe, file-backed cache of directory listings keyed on directory mtime."""
+
+    def __init__(self, index_path: Path | str) -> None:
+        self.index_path: Path = Path(index_path).expanduser()
+        self._entries: dict[str, DirectoryListing] = {}
+        self._visited: set[str] = set()
+        self._lock = threading.Lock()
+        self._dirty: bool = False
+        self.hits: int = 0
+        self.misses: int = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def scan(self, directory: Path) -> tuple[list[str], list[str]]:
+        """Return the file and sub-directory names in ``directory``, listing it only if it changed.
+
+        Args:
+            directory (Path): Absolute directory path.
+
+        Returns:
+            tuple[list[str], list[str]]: File names and sub-directory names.
+
+        Raises:
+            OSError: If the directory cannot be stat'ed or listed."""
+        key: str = str(directory)
+        try:
+            mtime_ns: int = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.forget(directory=directory)
+            raise
+
+        with self._lock:
+            self._visited.add(key)
+            cached: DirectoryListing | None = self._entries.get(key)
+            if cached is not None and cached.mtime_ns == mtime_ns and cached.listed_ns - mtime_ns > MTIME_SAFETY_NS:
+                self.hits += 1
+                return cached.files, cached.dirs
+
+        listed_ns: int = time.time_ns()
+        files: list[str] = []
+        dirs: list[str] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir: bool = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                (dirs if is_dir else files).append(entry.name)
+
+        listing = DirectoryListing(mtime_ns=mtime_ns, listed_ns=listed_ns, files=sorted(files), dirs=sorted(dirs))
+        with self._lock:
+            self._entries[key] = listing
+            self._dirty = True
+            self.misses += 1
+        return listing.files, listing.dirs
+
+    def forget(self, directory: Path) -> None:
+        """Drop the stored listing for ``directory``."""
+        with self._lock:
+            if self._entries.pop(str(directory), None) is not None:
+                self._dirty = True
+
+    def save(self, prune_under: Iterable[Path] = ()) -> None:
+        """Write the index to disk if it changed.
+
+        Args:
+            prune_under (Iterable[Path]): Roots that were walked completely. Stored directories below
+                them that were not visited in this walk no longer exist and are removed."""
+        roots: list[PurePath] = [PurePath(root) for root in prune_under]
+        with self._lock:
+            if roots:
+                stale: list[str] = [
+                    key
+                    for key in self._entries
+                    if key not in self._visited and any(PurePath(key).is_relative_to(root) for root in roots)
+                ]
+                for key in stale:
+                    del self._entries[key]
+                self._dirty = self._dirty or bool(stale)
+            if not self._dirty:
+                return
+            lines: list[str] = [json.dumps({"version": INDEX_VERSION})]
+            lines.extend(json.dumps({"path": key, **asdict(entry)}) for key, entry in self._entries.items())
+            self._dirty = False
+
+        temp_path: Path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            os.replace(temp_path, self.index_path)
+        except OSError as exc:
+            logger.warning(f"Unable to write directory index {self.index_path}: {exc}")
+            temp_path.unlink(missing_ok=True)
+            return
+        logger.debug(f"Saved directory index with {len(lines) - 1} directories to {self.index_path}")
+
+    def _load(self) -> None:
+        """Populate the index from ``index_path``; unreadable or outdated files start empty."""
+        if not self.index_path.is_file():
+            return
+        entries: dict[str, DirectoryListing] = {}
+        try:
+            with self.index_path.open(encoding="utf-8") as handle:
+                header: Any = json.loads(handle.readline() or "{}")
+                if header.get("version") != INDEX_VERSION:
+                    logger.info(f"Ignoring directory index {self.index_path} written by another version.")
+                    return
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    record: dict[str, Any] = json.loads(line)
+                    key: str = record.pop("path")
+                    entries[key] = DirectoryListing(**record)
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.warning(f"Ignoring unreadable directory index {self.index_path}: {exc}")
+            return
+        self._entries = entries
+        logger.debug(f"Loaded directory index with {len(entries)} directories from {self.index_path}")
@@ -9,6 +9,8 @@ from loguru import logger
 import threading
 from queue import Empty, Queue
 
+from ryan_library.functions.directory_index import DirectoryIndex
+
 
 def find_files_parallel(
     root_dirs: list[Path],
@@ -17,6 +19,7 @@ def find_files_parallel(
     report_level: int | None = 2,
     print_found_folder: bool = True,
     recursive_search: bool = True,
+    directory_index: DirectoryIndex | Path | str | None = None,
 ) -> list[Path]:
     """
     Search for files matching specific patterns across multiple directories in parallel.
@@ -38,6 +41,10 @@ def find_files_parallel(
             matched files. Defaults to True.
         recursive_search (bool, optional): If True, searches directories recursively.
             Defaults to True.
+        directory_index (DirectoryIndex | Path | str | None, optional): Persistent directory
+            listing cache, or the path of its file. When given, directories whose mtime has not
+            changed since the previous search are not listed again, and the index is saved once
+            the search finishes. Defaults to None (list every directory).
 
     Returns:
         list[Path]: A list of file paths that match the specified patterns and do not
@@ -89,6 +96,15 @@ def find_files_parallel(
     visited_lock = threading.Lock()
     visited_dirs: set[Path] = set()
 
+    index: DirectoryIndex | None = (
+        directory_index
+        if directory_index is None or isinstance(directory_index, DirectoryIndex)
+        else DirectoryIndex(index_path=directory_index)
+    )
+    if index is not None:
+        logger.info(f"Using directory index: {index.index_path}")
+    searched_roots: list[Path] = []
+
     # Queue for directories to process; the stop event lets workers exit once traversal finishes.
     dir_queue: Queue[tuple[Path, Path]] = Queue()
     stop_event = threading.Event()
@@ -104,11 +120,55 @@ def find_files_parallel(
                 if abs_root not in visited_dirs:
                     visited_dirs.add(abs_root)
                     dir_queue.put((abs_root, abs_root))  # (current_path, root_dir)
+                    searched_roots.append(abs_root)
         except FileNotFoundError:
             logger.error(f"Root directory does not exist: {root_dir}")
         except Exception as exc:
             logger.error(f"Error resolving root directory {root_dir}: {exc}")
 
+    def _log_search_depth(subpath: Path, root_dir: Path) -> None:
+        """Log directories at every ``report_level`` depth below their root."""
+        try:
+            relative_path = subpath.relative_to(root_dir)
+            depth = len(relative_path.parts)
+        except ValueError:
+            depth = 0
+
+        if depth % report_level == 0:
+            try:
+                display_path: Path = subpath.relative_to(current_dir)
+            except ValueError:
+                display_path = subpath.absolute()
+            logger.debug(f"Searching (depth {depth}): {display_path}")
+
+    def _enqueue_directory(path: Path, root_dir: Path) -> None:
+        """Queue ``path`` for processing unless it was already seen.
+
+        Overlapping roots or symlinks pointing back to an ancestor would otherwise be processed twice."""
+        with visited_lock:
+            if path in visited_dirs:
+                return
+            visited_dirs.add(path)
+        dir_queue.put((path, root_dir))
+
+    def _scan_indexed(index: DirectoryIndex, current_path: Path, root_dir: Path, local_matched: list[Path]) -> None:
+        """Match files in ``current_path`` from the names held by ``index``.
+
+        The listing already separates files from directories, so no per-entry ``stat`` is needed."""
+        file_names, dir_names = index.scan(directory=current_path)
+        if recursive_search:
+            for dir_name in dir_names:
+                subpath: Path = current_path / dir_name
+                if report_level:
+                    _log_search_depth(subpath=subpath, root_dir=root_dir)
+                _enqueue_directory(path=subpath, root_dir=root_dir)
+        for filename in file_names:
+            if not _matches_any(name=filename, compiled=compiled_includes):
+                continue
+            if compiled_excludes and _matches_any(name=filename, compiled=compiled_excludes):
+                continue
+            local_matched.append(current_path / filename)
+
     def worker() -> None:
         """Continuously pull directories off the queue, scanning files and enqueueing child folders."""
         while not stop_event.is_set():
@@ -121,82 +181,83 @@ def find_files_parallel(
                 local_matched: list[Path] = []
                 local_folders_with_matches: set[Path] = set()
 
-                try:
-                    iterator: Generator[Path, None, None] = current_path.iterdir()
-                except PermissionError:
-                    logger.error(f"Permission denied accessing directory: {current_path}")
-                    continue
-                except Exception as exc:
-                    logger.error(f"Error accessing directory {current_path}: {exc}")
-                    continue
-
-                for subpath in iterator:
-                    if subpath.is_dir():
-                        if recursive_search and report_level:
-                            try:
-                                relative_path = subpath.relative_to(root_dir)
-                                depth = len(relative_path.parts)
-                            except ValueError:
-                                depth = 0
+                if index is not None:
+                    try:
+                        _scan_indexed(
+                            index=index, current_path=current_path, root_dir=root_dir, local_matched=local_matched
+                        )
+                    except PermissionError:
+                        logger.error(f"Permission denied accessing directory: {current_path}")
+                        continue
+                    except FileNotFoundError:
+                        logger.warning(f"Directory does not exist (might have been moved): {current_path}")
+                        continue
+                    except Exception as exc:
+                        logger.error(f"Error accessing directory {current_path}: {exc}")
+                        continue
+                    for matched_file in local_matched:
+                        logger.debug(f"Matched file: {matched_file}")
+                    if local_matched:
+                        local_folders_with_matches.add(current_path)
+                else:
+                    try:
+                        iterator: Generator[Path, None, None] = current_path.iterdir()
+                    except PermissionError:
+                        logger.error(f"Permission denied accessing directory: {current_path}")
+                        continue
+                    except Exception as exc:
+                        logger.error(f"Error accessing directory {current_path}: {exc}")
+                        continue
 
-                            if depth % report_level == 0:
-                                try:
-                                    display_path: Path = subpath.relative_to(current_dir)
-                                except ValueError:
-                                    display_path = subpath.absolute()
-                                logger.debug(f"Searching (depth {depth}): {display_path}")
+                    for subpath in iterator:
+                        if subpath.is_dir():
+                            if recursive_search and report_level:
+                                _log_search_depth(subpath=subpath, root_dir=root_dir)
 
-                        if recursive_search:
-                            try:
-                                resolved_subpath: Path = subpath.absolute()
-                                if not resolved_subpath.exists():
-                                    logger.warning(
-                                        f"Subdirectory does not exist (might be a broken symlink): {subpath}"
-                                    )
+                            if recursive_search:
+                                try:
+                                    resolved_subpath: Path = subpath.absolute()
+                                    if not resolved_subpath.exists():
+                                        logger.warning(
+                                            f"Subdirectory does not exist (might be a broken symlink): {subpath}"
+                                        )
+                                        continue
+                                except PermissionError:
+                                    logger.error(f"Permission denied accessing subdirectory: {subpath}")
                                     continue
-                            except PermissionError:
-                                logger.error(f"Permission denied accessing subdirectory: {subpath}")
-                                continue
-                            except Exception as exc:
-                                logger.error(f"Error resolving subdirectory {subpath}: {exc}")
-                                continue
-
-                            # Record directories we've seen so we do not process the same path twice
-                            # when multiple roots overlap or symlinks point back to an ancestor.
-                            with visited_lock:
-                                if resolved_subpath in visited_dirs:
+                                except Exception as exc:
+                                    logger.error(f"Error resolving subdirectory {subpath}: {exc}")
                                     continue
-                                visited_dirs.add(resolved_subpath)
-                            # Enqueue the resolved subdirectory for processing
-                            dir_queue.put((resolved_subpath, root_dir))
-                        continue
 
-                    filename: str = subpath.name
+                                _enqueue_directory(path=resolved_subpath, root_dir=root_dir)
+                            continue
 
-                    if not _matches_any(name=filename, compiled=compiled_includes):
-                        continue
+                        filename: str = subpath.name
 
-                    if compiled_excludes and _matches_any(name=filename, compiled=compiled_excludes):
-                        continue
+                        if not _matches_any(name=filename, compiled=compiled_includes):
+                            continue
+
+                        if compiled_excludes and _matches_any(name=filename, compiled=compiled_excludes):
+                            continue
 
-                    try:
-                        matched_file: Path = subpath.absolute()
-                        display_path = matched_file
                         try:
-                            display_path = matched_file.relative_to(current_dir)
-                        except ValueError:
-                            pass
-                        logger.debug(f"Matched file: {display_path}")
-                        if not matched_file.exists():
-                            raise FileNotFoundError
-                        local_matched.append(matched_file)
-                        local_folders_with_matches.add(matched_file.parent)
-                    except FileNotFoundError:
-                        logger.warning(f"File does not exist (might have been moved): {subpath}")
-                    except PermissionError:
-                        logger.error(f"Permission denied accessing file: {subpath}")
-                    except Exception as exc:
-                        logger.error(f"Error resolving file {subpath}: {exc}")
+                            matched_file: Path = subpath.absolute()
+                            display_path = matched_file
+                            try:
+                                display_path = matched_file.relative_to(current_dir)
+                            except ValueError:
+                                pass
+                            logger.debug(f"Matched file: {display_path}")
+                            if not matched_file.exists():
+                                raise FileNotFoundError
+                            local_matched.append(matched_file)
+                            local_folders_with_matches.add(matched_file.parent)
+                        except FileNotFoundError:
+                            logger.warning(f"File does not exist (might have been moved): {subpath}")
+                        except PermissionError:
+                            logger.error(f"Permission denied accessing file: {subpath}")
+                        except Exception as exc:
+                            logger.error(f"Error resolving file {subpath}: {exc}")
 
                 # Safely update the global matched_files list
                 if local_matched:
@@ -229,6 +290,11 @@ def find_files_parallel(
     for thread in threads:
         thread.join()
 
+    if index is not None:
+        logger.info(f"Directory index: {index.hits} directories unchanged, {index.misses} listed.")
+        # Only a recursive search visits every directory below its roots, so only then are unvisited entries stale.
+        index.save(prune_under=searched_roots if recursive_search else ())
+
     # Log folders with matched files
     if print_found_folder:
         for folder in folders_with_matches:
@@ -0,0 +1,210 @@
+# ryan_library/functions/log_summary_store.py
+"""Persistent store of LogSummary rows for completed TUFLOW log files.
+
+A completed ``.tlf`` never changes, so once it has been summarised its row can be reused on the
+next run instead of parsing the log again. Rows are keyed on the log path and valid only while the
+file's size and mtime are unchanged; a rerun that rewrites the log is parsed again. Only completed
+logs are stored, so logs of runs that are still going (or failed) are always parsed.
+
+The store is a SQLite database (one table, one row per log). Each summary row is kept as JSON
+together with its column dtypes so it is rebuilt exactly as :func:`finalise_data` produced it."""
+
+from collections.abc import Iterable, Mapping
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+from loguru import logger
+import pandas as pd
+
+STORE_VERSION: int = 1
+_DATETIME_KEY: str = "$datetime"
+
+
+@dataclass(frozen=True, slots=True)
+class FileSignature:
+    """Size and mtime of a log file when its row was stored."""
+
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: Path) -> "FileSignature":
+        stat = path.stat()
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+class LogSummaryStore:
+    """SQLite-backed cache of LogSummary rows keyed on log path, size and mtime."""
+
+    def __init__(self, store_path: Path | str) -> None:
+        self.store_path: Path = Path(store_path).expanduser()
+        self._entries: dict[str, tuple[FileSignature, str]] = {}
+        self._changed: dict[str, tuple[FileSignature, str]] = {}
+        self._removed: set[str] = set()
+        self.hits: int = 0
+        self.misses: int = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def partition(self, files: Iterable[Path]) -> tuple[dict[Path, pd.DataFrame], list[Path]]:
+        """Split ``files`` into logs with a valid stored row and logs that must be parsed.
+
+        Args:
+            files (Iterable[Path]): Log files found in this run.
+
+        Returns:
+            tuple[dict[Path, pd.DataFrame], list[Path]]: The stored rows of unchanged logs and the
+                logs to parse, in the order given."""
+        cached: dict[Path, pd.DataFrame] = {}
+        to_parse: list[Path] = []
+        for path in files:
+            entry: tuple[FileSignature, str] | None = self._entries.get(str(path))
+            frame: pd.DataFrame | None = None
+            if entry is not None:
+                try:
+                    if FileSignature.of(path) == entry[0]:
+                        frame = _decode_row(payload=entry[1])
+                except (OSError, ValueError, TypeError, KeyError) as exc:
+                    logger.debug(f"Ignoring stored summary for {path}: {exc}")
+            if frame is None:
+                to_parse.append(path)
+            else:
+                cached[path] = frame
+        self.hits += len(cached)
+        self.misses += len(to_parse)
+        return cached, to_parse
+
+    def put(self, path: Path, data_frame: pd.DataFrame) -> None:
+        """Store the summary row of a completed log."""
+        try:
+            entry: tuple[FileSignature, str] = (FileSignature.of(path), _encode_row(data_frame=data_frame))
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug(f"Not storing summary for {path}: {exc}")
+            return
+        key: str = str(path)
+        self._entries[key] = entry
+        self._changed[key] = entry
+        self._removed.discard(key)
+
+    def save(self, keep: Iterable[Path] | None = None) -> None:
+        """Write changes to disk.
+
+        Args:
+            keep (Iterable[Path] | None): Logs found in this run. Stored rows for any other path are
+                removed, so deleted logs do not accumulate. None keeps every row."""
+        if keep is not None:
+            wanted: set[str] = {str(path) for path in keep}
+            stale: list[str] = [key for key in self._entries if key not in wanted]
+            for key in stale:
+                del self._entries[key]
+                self._changed.pop(key, None)
+            self._removed.update(stale)
+        if not self._changed and not self._removed:
+            return
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            # The connection's own context manager only commits or rolls back; closing() releases the file.
+            with closing(self._connect()) as connection, connection:
+                connection.executemany("DELETE FROM logs WHERE path = ?", [(key,) for key in self._removed])
+                connection.executemany(
+                    "INSERT OR REPLACE INTO logs (path, size, mtime_ns, row) VALUES (?, ?, ?, ?)",
+                    [
+                        (key, signature.size, signature.mtime_ns, payload)
+                        for key, (signature, payload) in self._changed.items()
+                    ],
+                )
+        except sqlite3.Error as exc:
+            logger.warning(f"Unable to write log summary store {self.store_path}: {exc}")
+            return
+        logger.debug(
+            f"Saved log summary store {self.store_path}: {len(self._changed)} updated, {len(self._removed)} removed"
+        )
+        self._changed.clear()
+        self._removed.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection = sqlite3.connect(self.store_path)
+        try:
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            version: tuple[str] | None = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if version is None or version[0] != str(STORE_VERSION):
+                connection.execute("DROP TABLE IF EXISTS logs")
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(STORE_VERSION),)
+                )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS logs (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, row TEXT)"
+            )
+            connection.commit()
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def _load(self) -> None:
+        """Populate the store from ``store_path``; unreadable or outdated files start empty."""
+        if not self.store_path.is_file():
+            return
+        try:
+            with closing(sqlite3.connect(self.store_path)) as connection:
+                version: tuple[str] | None = connection.execute(
+                    "SELECT value FROM meta WHERE key = 'version'"
+                ).fetchone()
+                if version is None or version[0] != str(STORE_VERSION):
+                    logger.info(f"Ignoring log summary store {self.store_path} written by another version.")
+                    return
+                rows: list[tuple[str, int, int, str]] = connection.execute(
+                    "SELECT path, size, mtime_ns, row FROM logs"
+                ).fetchall()
+        except sqlite3.Error as exc:
+            logger.warning(f"Ignoring unreadable log summary store {self.store_path}: {exc}")
+            return
+        self._entries = {
+            path: (FileSignature(size=size, mtime_ns=mtime_ns), payload) for path, size, mtime_ns, payload in rows
+        }
+        logger.debug(f"Loaded log summary store with {len(self._entries)} logs from {self.store_path}")
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_KEY: None if pd.isna(value) else value.isoformat()}
+    return value
+
+
+def _encode_row(data_frame: pd.DataFrame) -> str:
+    """Serialise a one-row summary frame, keeping its column order and dtypes."""
+    if len(data_frame) != 1:
+        raise ValueError(f"expected one summary row, got {len(data_frame)}")
+    record: Mapping[str, Any] = data_frame.iloc[0].to_dict()
+    payload: dict[str, Any] = {
+        "columns": [str(column) for column in data_frame.columns],
+        "dtypes": {str(column): str(dtype) for column, dtype in data_frame.dtypes.items()},
+        "values": [_encode_value(value=record[column]) for column in data_frame.columns],
+    }
+    return json.dumps(payload)
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and _DATETIME_KEY in value:
+        text: str | None = value[_DATETIME_KEY]
+        return pd.NaT if text is None else pd.Timestamp(text)
+    return value
+
+
+def _decode_row(payload: str) -> pd.DataFrame:
+    """Rebuild the one-row frame written by :func:`_encode_row`."""
+    data: dict[str, Any] = json.loads(payload)
+    columns: list[str] = data["columns"]
+    values: list[Any] = [_decode_value(value=value) for value in data["values"]]
+    frame = pd.DataFrame([dict(zip(columns, values))], columns=columns)
+    # Most columns already infer to their stored dtype; only cast the ones that do not.
+    inferred: dict[str, str] = {str(column): str(dtype) for column, dtype in frame.dtypes.items()}
+    casts: dict[str, str] = {column: dtype for column, dtype in data["dtypes"].items() if inferred[column] != dtype}
+    return frame.astype(casts) if casts else frame
@@ -1,7 +1,9 @@
 # ryan_library/functions/misc_functions.py
 
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 import multiprocessing
+from numbers import Number
+import numpy as np
 import pandas as pd
 import logging
 from loguru import logger
@@ -13,6 +15,7 @@ from openpyxl.utils import get_column_letter
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.utils.exceptions import InvalidFileException
+import xlsxwriter
 from ryan_library.functions.logging_helpers import setup_logging as new_setup_logging
 
 
@@ -93,6 +96,12 @@ class ExportContent(TypedDict):
     sheets: list[str]
 
 
+ExcelEngine = Literal["auto", "openpyxl", "xlsxwriter"]
+
+# Cell values the streaming xlsxwriter backend writes as-is; anything else is written as text.
+_EXCEL_NATIVE_TYPES: tuple[type, ...] = (str, Number, date, time, timedelta)
+
+
 class ExcelExporter:
     """A utility class for exporting pandas DataFrames to Excel files.
 
@@ -105,8 +114,14 @@ class ExcelExporter:
 
     MAX_EXCEL_ROWS: int = 1_048_576
     MAX_EXCEL_COLUMNS: int = 16_384
+    # Workbooks with at least this many data rows are streamed through xlsxwriter when excel_engine="auto".
+    FAST_ENGINE_MIN_ROWS: int = 50_000
+    # Non-text columns longer than this are sized from evenly spaced sample rows.
+    WIDTH_SAMPLE_ROWS: int = 10_000
     DEFAULT_NARROW_WIDTH: float = 8.43  # ~64px (Excel default width)
     DEFAULT_NARROW_COLUMNS: tuple[str, ...] = ("file", "rel_directory", "rel_path", "directory_path", "path")
+    # openpyxl's default column width; auto_adjust_column_widths only ever widens columns beyond it.
+    OPENPYXL_DEFAULT_WIDTH: float = 13.0
 
     def export_dataframes(
         self,
@@ -118,6 +133,8 @@ class ExcelExporter:
         *,
         export_mode: Literal["excel", "parquet", "both"] = "excel",
         parquet_compression: str = "gzip",
+        excel_engine: ExcelEngine = "auto",
+        max_excel_rows: int | None = None,
     ) -> None:
         """Export multiple DataFrames to Excel files with optional column widths.
         Args:
@@ -155,6 +172,17 @@ class ExcelExporter:
             parquet_compression (str, optional):
                 Compression codec passed to pandas whenever Parquet files are written.
                 Defaults to ``"gzip"``.
+            excel_engine (Literal["auto", "openpyxl", "xlsxwriter"], optional):
+                Backend used to write workbooks:
+                  * "openpyxl" writes through ``pandas.DataFrame.to_excel``.
+                  * "xlsxwriter" streams rows into a constant-memory xlsxwriter workbook,
+                    which is several times faster and keeps memory flat for large sheets.
+                  * "auto" (default) uses xlsxwriter for workbooks with at least
+                    ``FAST_ENGINE_MIN_ROWS`` data rows and openpyxl otherwise.
+            max_excel_rows (int | None, optional):
+                Export a workbook to Parquet and CSV instead of Excel when any of its
+                DataFrames has more data rows than this. None (default) only falls back
+                when Excel's own limits are exceeded.
         Raises:
             ValueError: If the number of DataFrames doesn't match the number of sheets.
             InvalidFileException: If there's an issue with writing the Excel file.
@@ -176,6 +204,9 @@ class ExcelExporter:
         valid_modes: set[str] = {"excel", "parquet", "both"}
         if normalized_mode not in valid_modes:
             raise ValueError(f"Invalid export_mode '{export_mode}'. Expected one of {sorted(valid_modes)}.")
+        valid_engines: set[str] = {"auto", "openpyxl", "xlsxwriter"}
+        if excel_engine not in valid_engines:
+            raise ValueError(f"Invalid excel_engine '{excel_engine}'. Expected one of {sorted(valid_engines)}.")
 
         if file_name is not None and len(export_dict) != 1:
             raise ValueError("'file_name' can only be provided when exporting a single workbook.")
@@ -207,7 +238,7 @@ class ExcelExporter:
                 )
                 continue
 
-            if self._exceeds_excel_limits(dataframes=dataframes):
+            if self._exceeds_excel_limits(dataframes=dataframes, max_rows=max_excel_rows):
                 logger.warning(
                     f"Data for '{export_stem}' exceeds Excel size limits. Exporting to Parquet and CSV instead."
                 )
@@ -233,46 +264,28 @@ class ExcelExporter:
             if output_directory:
                 export_path.parent.mkdir(parents=True, exist_ok=True)
 
+            engine: Literal["openpyxl", "xlsxwriter"] = self._resolve_excel_engine(
+                excel_engine=excel_engine, dataframes=dataframes
+            )
             logger.info(f"Exporting to {export_path}")
 
             try:
-                with pd.ExcelWriter(path=export_path, engine="openpyxl") as writer:
-                    writer.book.properties.creator = f"ryan-tools {get_tools_version()}"
-                    for df, sheet in zip(dataframes, sheets):
-                        # Check for unique column names
-                        if not df.columns.is_unique:
-                            logger.error(
-                                "Duplicate column names in DataFrame for sheet '{}'. "
-                                "Ensure all column names are unique.",
-                                sheet,
-                            )
-                            raise ValueError(f"Duplicate column names found in sheet '{sheet}'.")
-
-                        df.to_excel(
-                            excel_writer=writer,
-                            sheet_name=sheet,
-                            merge_cells=False,
-                            index=False,
-                        )
-
-                        # Access the worksheet
-                        workbook: Workbook = writer.book
-                        worksheet: Worksheet = writer.sheets[sheet]
-
-                        # Automatically adjust column widths if enabled
-                        if auto_adjust_width:
-                            dynamic_widths: dict[str, float] = self.calculate_column_widths(df=df)
-                            self.auto_adjust_column_widths(worksheet=worksheet, dynamic_widths=dynamic_widths)
-                            self._apply_default_column_widths(worksheet=worksheet, df=df, sheet_name=sheet)
-
-                        # Apply specific column widths if provided
-                        if column_widths and sheet in column_widths:
-                            self.set_column_widths(
-                                worksheet=worksheet,
-                                df=df,
-                                sheet_name=sheet,
-                                column_widths=column_widths[sheet],
-                            )
+                if engine == "xlsxwriter":
+                    self._write_workbook_xlsxwriter(
+                        export_path=export_path,
+                        dataframes=dataframes,
+                        sheets=sheets,
+                        auto_adjust_width=auto_adjust_width,
+                        column_widths=column_widths,
+                    )
+                else:
+                    self._write_workbook_openpyxl(
+                        export_path=export_path,
+                        dataframes=dataframes,
+                        sheets=sheets,
+                        auto_adjust_width=auto_adjust_width,
+                        column_widths=column_widths,
+                    )
 
                 logger.success(f"Finished exporting '{export_filename}' to '{export_path}'")
             except InvalidFileException as e:
@@ -288,8 +301,135 @@ class ExcelExporter:
                     compression=parquet_compression,
                 )
 
-    def _exceeds_excel_limits(self, dataframes: list[pd.DataFrame]) -> bool:
-        """Return True if any dataframe exceeds Excel's size limits."""
+    def _write_workbook_openpyxl(
+        self,
+        *,
+        export_path: Path,
+        dataframes: list[pd.DataFrame],
+        sheets: list[str],
+        auto_adjust_width: bool,
+        column_widths: dict[str, dict[str, float]] | None,
+    ) -> None:
+        """Write the sheets of one workbook through pandas and openpyxl."""
+
+        with pd.ExcelWriter(path=export_path, engine="openpyxl") as writer:
+            writer.book.properties.creator = f"ryan-tools {get_tools_version()}"
+            for df, sheet in zip(dataframes, sheets):
+                self._check_unique_columns(df=df, sheet=sheet)
+
+                df.to_excel(
+                    excel_writer=writer,
+                    sheet_name=sheet,
+                    merge_cells=False,
+                    index=False,
+                )
+
+                # Access the worksheet
+                workbook: Workbook = writer.book
+                worksheet: Worksheet = writer.sheets[sheet]
+
+                # Automatically adjust column widths if enabled
+                if auto_adjust_width:
+                    dynamic_widths: dict[str, float] = self.calculate_column_widths(df=df)
+                    self.auto_adjust_column_widths(worksheet=worksheet, dynamic_widths=dynamic_widths)
+                    self._apply_default_column_widths(worksheet=worksheet, df=df, sheet_name=sheet)
+
+                # Apply specific column widths if provided
+                if column_widths and sheet in column_widths:
+                    self.set_column_widths(
+                        worksheet=worksheet,
+                        df=df,
+                        sheet_name=sheet,
+                        column_widths=column_widths[sheet],
+                    )
+
+    def _write_workbook_xlsxwriter(
+        self,
+        *,
+        export_path: Path,
+        dataframes: list[pd.DataFrame],
+        sheets: list[str],
+        auto_adjust_width: bool,
+        column_widths: dict[str, dict[str, float]] | None,
+    ) -> None:
+        """Stream the sheets of one workbook row by row into a constant-memory xlsxwriter workbook.
+
+        The layout matches the openpyxl backend: one header row, no index, missing values left blank
+        and the same column widths."""
+
+        workbook = xlsxwriter.Workbook(
+            str(export_path),
+            {
+                "constant_memory": True,
+                "strings_to_urls": False,
+                "nan_inf_to_errors": True,
+                "default_date_format": "YYYY-MM-DD HH:MM:SS",
+            },
+        )
+        workbook.set_properties({"author": f"ryan-tools {get_tools_version()}"})
+        try:
+            for df, sheet in zip(dataframes, sheets):
+                self._check_unique_columns(df=df, sheet=sheet)
+                worksheet = workbook.add_worksheet(name=sheet)
+
+                widths: dict[int, float] = self._resolve_column_widths(
+                    df=df,
+                    sheet_name=sheet,
+                    auto_adjust_width=auto_adjust_width,
+                    column_widths=column_widths.get(sheet) if column_widths else None,
+                )
+                for col_idx, width in widths.items():
+                    worksheet.set_column(col_idx, col_idx, width)
+
+                worksheet.write_row(0, 0, self._excel_cell_values(series=pd.Series(df.columns)))
+                columns: list[list[object]] = [
+                    self._excel_cell_values(series=df.iloc[:, col_idx]) for col_idx in range(df.shape[1])
+                ]
+                # constant_memory mode flushes each row once the next one starts, so rows go in order.
+                for row_idx, row_values in enumerate(zip(*columns), start=1):
+                    worksheet.write_row(row_idx, 0, row_values)
+        finally:
+            workbook.close()
+
+    def _resolve_excel_engine(
+        self, excel_engine: ExcelEngine, dataframes: list[pd.DataFrame]
+    ) -> Literal["openpyxl", "xlsxwriter"]:
+        """Return the backend used to write a workbook holding ``dataframes``."""
+
+        if excel_engine != "auto":
+            return excel_engine
+        total_rows: int = sum(len(df.index) for df in dataframes)
+        return "xlsxwriter" if total_rows >= self.FAST_ENGINE_MIN_ROWS else "openpyxl"
+
+    def _check_unique_columns(self, df: pd.DataFrame, sheet: str) -> None:
+        """Raise ValueError if ``df`` has duplicate column names."""
+
+        if not df.columns.is_unique:
+            logger.error(
+                "Duplicate column names in DataFrame for sheet '{}'. Ensure all column names are unique.",
+                sheet,
+            )
+            raise ValueError(f"Duplicate column names found in sheet '{sheet}'.")
+
+    def _excel_cell_values(self, series: pd.Series) -> list[object]:
+        """Return ``series`` as Python values for xlsxwriter, with missing values as None."""
+
+        values: list[object] = series.astype(object).where(series.notna(), None).tolist()
+        # Numeric, boolean and datetime dtypes already yield native values; any other dtype (object,
+        # Period, Interval, ...) may hold values xlsxwriter cannot write, which Excel stores as text.
+        if not (
+            pd.api.types.is_numeric_dtype(series.dtype)
+            or pd.api.types.is_bool_dtype(series.dtype)
+            or pd.api.types.is_datetime64_any_dtype(series.dtype)
+            or pd.api.types.is_timedelta64_dtype(series.dtype)
+        ):
+            values = [
+                value if value is None or isinstance(value, _EXCEL_NATIVE_TYPES) else str(value) for value in values
+            ]
+        return values
+
+    def _exceeds_excel_limits(self, dataframes: list[pd.DataFrame], max_rows: int | None = None) -> bool:
+        """Return True if any dataframe exceeds Excel's size limits or has more than ``max_rows`` data rows."""
 
         for df in dataframes:
             num_data_rows: int = len(df.index)
@@ -297,6 +437,9 @@ class ExcelExporter:
             header_rows: int = df.columns.nlevels if num_columns > 0 else 0
             total_rows: int = num_data_rows + header_rows
 
+            if max_rows is not None and num_data_rows > max_rows:
+                logger.debug(f"Dataframe has {num_data_rows} rows, more than the export threshold of {max_rows}.")
+                return True
             if total_rows > self.MAX_EXCEL_ROWS or num_columns > self.MAX_EXCEL_COLUMNS:
                 logger.debug(
                     (
@@ -450,6 +593,8 @@ class ExcelExporter:
         *,
         export_mode: Literal["excel", "parquet", "both"] = "excel",
         parquet_compression: str = "gzip",
+        excel_engine: ExcelEngine = "auto",
+        max_excel_rows: int | None = None,
     ) -> None:
         """Export a single DataFrame to an Excel file with a single sheet and optional column widths.
 
@@ -475,7 +620,11 @@ class ExcelExporter:
                 See :meth:`export_dataframes` for details.
             parquet_compression (str, optional):
                 Compression codec to use when Parquet outputs are requested. Defaults to
-                ``"gzip"``."""
+                ``"gzip"``.
+            excel_engine (Literal["auto", "openpyxl", "xlsxwriter"], optional):
+                See :meth:`export_dataframes` for details.
+            max_excel_rows (int | None, optional):
+                See :meth:`export_dataframes` for details."""
         export_dict: dict[str, ExportContent] = {file_name_prefix: {"dataframes": [data_frame], "sheets": [sheet_name]}}
 
         # Prepare column_widths in the required format
@@ -491,6 +640,8 @@ class ExcelExporter:
             file_name=file_name,
             export_mode=export_mode,
             parquet_compression=parquet_compression,
+            excel_engine=excel_engine,
+            max_excel_rows=max_excel_rows,
         )
 
     def calculate_column_widths(self, df: pd.DataFrame) -> dict[str, float]:
@@ -515,18 +666,49 @@ class ExcelExporter:
         return column_widths
 
     def _calculate_max_cell_length(self, series: pd.Series) -> int:
-        """Return the longest display length for a Series when exporting to Excel."""
+        """Return the longest display length for a Series when exporting to Excel.
+
+        Text and categorical columns are measured exactly. Other columns longer than
+        ``WIDTH_SAMPLE_ROWS`` are measured on evenly spaced rows, which is enough to size a column."""
 
-        if series.empty:
+        values: pd.Series = series.dropna()
+        if values.empty:
             return 0
 
-        max_length: int = 0
-        for value in series.to_numpy(dtype=object, copy=False):
-            value_length: int = len("" if pd.isna(value) else str(value))
-            if value_length > max_length:
-                max_length = value_length
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.cat.remove_unused_categories().cat.categories.to_series()
+        elif not pd.api.types.is_string_dtype(values.dtype) and len(values) > self.WIDTH_SAMPLE_ROWS:
+            positions: np.ndarray = np.linspace(0, len(values) - 1, num=self.WIDTH_SAMPLE_ROWS).astype(np.int64)
+            values = values.iloc[positions]
 
-        return max_length
+        return int(values.astype(str).str.len().max())
+
+    def _resolve_column_widths(
+        self,
+        df: pd.DataFrame,
+        sheet_name: str,
+        auto_adjust_width: bool,
+        column_widths: dict[str, float] | None,
+    ) -> dict[int, float]:
+        """Return the final width of each column position, as the openpyxl backend applies them.
+
+        Auto-sized widths come first, then the narrow defaults, then any explicit ``column_widths``."""
+
+        widths: dict[int, float] = {}
+        if auto_adjust_width:
+            widths.update(
+                (col_idx, max(width, self.OPENPYXL_DEFAULT_WIDTH))
+                for col_idx, width in enumerate(self.calculate_column_widths(df=df).values())
+            )
+            for column_name in self.DEFAULT_NARROW_COLUMNS:
+                if column_name in df.columns:
+                    widths[df.columns.get_loc(column_name)] = self.DEFAULT_NARROW_WIDTH
+        for col_name, width in (column_widths or {}).items():
+            if col_name not in df.columns:
+                logger.warning(f"Column '{col_name}' not found in sheet '{sheet_name}'. Skipping width setting.")
+                continue
+            widths[df.columns.get_loc(col_name)] = width
+        return widths
 
     def set_column_widths(
         self,
@@ -2,8 +2,9 @@
 """Utilities for summarising grouped statistics for POMM reports."""
 
 from typing import Any
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -121,6 +122,159 @@ def calculate_median_statistics(
     return max_stats_dict, bin_stats_list
 
 
+def sorted_group_positions(codes: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sort rows by group and value in one pass, as ``sort_values(na_position="first")`` would per group.
+
+    Args:
+        codes (np.ndarray): Group code of every row (``0..n-1``); rows coded -1 are left out.
+        values (np.ndarray): Float values to sort by within each group. Missing values sort first
+            and ties keep their row order.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The row positions in sorted order, and the start
+            offset and size of every group within them."""
+
+    rows: np.ndarray = np.flatnonzero(codes >= 0)
+    row_codes: np.ndarray = codes[rows]
+    row_values: np.ndarray = values[rows]
+    missing: np.ndarray = np.isnan(row_values)
+    sorted_rows: np.ndarray = rows[np.lexsort((np.where(missing, 0.0, row_values), ~missing, row_codes))]
+    sizes: np.ndarray = np.bincount(row_codes, minlength=int(row_codes.max()) + 1 if len(rows) else 0)
+    starts: np.ndarray = np.cumsum(sizes) - sizes
+    return sorted_rows, starts, sizes
+
+
+def grouped_median_statistics(
+    df: pd.DataFrame, group_cols: Sequence[str], stat_col: str, tp_col: str, dur_col: str
+) -> pd.DataFrame:
+    """Return :func:`calculate_median_statistics` for every group of ``df`` in one sorted pass.
+
+    Rows are sorted once by group, duration and ``stat_col`` (see :func:`sorted_group_positions`).
+    The upper-middle and closest-to-mean records of every duration bin are then read by position,
+    and each group keeps the first duration with the largest median, as
+    ``calculate_median_statistics`` does when called group by group.
+
+    Args:
+        df (pd.DataFrame): Records of all groups.
+        group_cols (Sequence[str]): Columns identifying a group. Rows with a missing key are dropped.
+        stat_col (str): Numeric statistic to rank by.
+        tp_col (str): Temporal pattern column.
+        dur_col (str): Duration column.
+
+    Returns:
+        pd.DataFrame: One row per group in sorted key order with the group columns followed by
+            ``median``, ``median_duration``, ``median_TP``, ``mean_Duration``, ``mean_TP``,
+            ``mean_PeakFlow``, ``low``, ``high``, ``mean_including_zeroes``,
+            ``mean_excluding_zeroes``, ``count_TP``, ``count_TP_aep`` and ``count_duration``.
+            ``low``/``high``/``count_TP_aep``/``count_duration`` span the whole group; the other
+            statistics come from the critical duration and are missing when no duration has a
+            numeric median. Categorical columns are returned as their plain values."""
+
+    keys: list[str] = list(group_cols)
+    grouper = df.groupby(by=keys, sort=True, dropna=True, observed=True)
+    key_frame: DataFrame = grouper.size().index.to_frame(index=False)
+    group_count: int = len(key_frame)
+    result = DataFrame({key: take_values(series=key_frame[key]) for key in keys})
+    group_codes: np.ndarray = grouper.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    values: np.ndarray = pd.to_numeric(df[stat_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+    # Duration bins are numbered in group order, then duration order within each group.
+    bin_codes: np.ndarray = (
+        df.groupby(by=[*keys, dur_col], sort=True, dropna=True, observed=True)
+        .ngroup()
+        .fillna(-1)
+        .to_numpy(dtype=np.int64)
+    )
+    sorted_rows, starts, sizes = sorted_group_positions(codes=bin_codes, values=values)
+    bin_count: int = len(sizes)
+    median_rows: np.ndarray = sorted_rows[starts + sizes // 2]
+    medians: np.ndarray = values[median_rows]
+    bin_groups: np.ndarray = group_codes[sorted_rows[starts]]
+
+    sorted_bins: np.ndarray = bin_codes[sorted_rows]
+    sorted_values: np.ndarray = values[sorted_rows]
+    present: np.ndarray = ~np.isnan(sorted_values)
+    bin_index = range(bin_count)
+    mean_including: np.ndarray = (
+        pd.Series(sorted_values[present]).groupby(sorted_bins[present]).mean().reindex(bin_index).to_numpy()
+    )
+    non_zero: np.ndarray = present & (sorted_values != 0)
+    mean_excluding: np.ndarray = (
+        pd.Series(sorted_values[non_zero]).groupby(sorted_bins[non_zero]).mean().reindex(bin_index).to_numpy()
+    )
+
+    # The record closest to the mean is the first one in sorted order with the smallest distance.
+    distance: np.ndarray = np.abs(sorted_values - mean_including[sorted_bins])
+    measured: np.ndarray = np.flatnonzero(~np.isnan(distance))
+    nearest: np.ndarray = measured[np.lexsort((measured, distance[measured], sorted_bins[measured]))]
+    nearest_bins, first_nearest = np.unique(sorted_bins[nearest], return_index=True)
+    closest_rows: np.ndarray = np.full(bin_count, -1, dtype=np.int64)
+    closest_rows[nearest_bins] = sorted_rows[nearest[first_nearest]]
+
+    # The critical bin of a group is its first bin with the largest median; NaN medians never win.
+    candidates: np.ndarray = np.flatnonzero(medians > -np.inf)
+    ranked: np.ndarray = candidates[np.lexsort((candidates, -medians[candidates], bin_groups[candidates]))]
+    winning_groups, first = np.unique(bin_groups[ranked], return_index=True)
+    critical_bin: np.ndarray = np.full(group_count, -1, dtype=np.int64)
+    critical_bin[winning_groups] = ranked[first]
+    has_bin: np.ndarray = critical_bin >= 0
+    median_row: np.ndarray = np.full(group_count, -1, dtype=np.int64)
+    median_row[has_bin] = median_rows[critical_bin[has_bin]]
+    closest_row: np.ndarray = np.full(group_count, -1, dtype=np.int64)
+    closest_row[has_bin] = closest_rows[critical_bin[has_bin]]
+
+    result["median"] = _take_or_nan(values=medians, positions=critical_bin)
+    result["median_duration"] = take_values(series=df[dur_col], positions=median_row)
+    result["median_TP"] = take_values(series=df[tp_col], positions=median_row)
+    result["mean_Duration"] = take_values(series=df[dur_col], positions=closest_row)
+    result["mean_TP"] = take_values(series=df[tp_col], positions=closest_row)
+    result["mean_PeakFlow"] = _take_or_nan(values=values, positions=closest_row)
+    in_group: np.ndarray = group_codes >= 0
+    value_series = pd.Series(values[in_group])
+    result["low"] = value_series.groupby(group_codes[in_group]).min().reindex(range(group_count)).to_numpy()
+    result["high"] = value_series.groupby(group_codes[in_group]).max().reindex(range(group_count)).to_numpy()
+    result["mean_including_zeroes"] = _take_or_nan(values=mean_including, positions=critical_bin)
+    result["mean_excluding_zeroes"] = _take_or_nan(values=mean_excluding, positions=critical_bin)
+    # Counts stay integers; groups without a critical duration get <NA>.
+    count_tp: np.ndarray = np.zeros(group_count, dtype=np.int64)
+    count_tp[has_bin] = sizes[critical_bin[has_bin]]
+    result["count_TP"] = count_tp if has_bin.all() else pd.arrays.IntegerArray(count_tp, mask=~has_bin)
+    result["count_TP_aep"] = np.bincount(bin_groups, weights=sizes, minlength=group_count).astype(np.int64)
+    result["count_duration"] = np.bincount(bin_groups, minlength=group_count)
+    return result
+
+
+def _take_or_nan(values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Return ``values[positions]`` as floats, with NaN where ``positions`` is -1."""
+
+    taken: np.ndarray = np.full(len(positions), np.nan)
+    found: np.ndarray = positions >= 0
+    taken[found] = values[positions[found]]
+    return taken
+
+
+def take_values(series: pd.Series, positions: np.ndarray | None = None) -> Any:
+    """Return the values of ``series`` at row ``positions`` with categoricals decoded to plain values.
+
+    Args:
+        series (pd.Series): Column to read.
+        positions (np.ndarray | None): Row positions to take; -1 gives a missing value. None takes
+            every row.
+
+    Returns:
+        Any: An array of the selected values."""
+
+    values: Any = series.array
+    if isinstance(values, pd.Categorical):
+        codes: np.ndarray = values.codes if positions is None else values.codes[positions]
+        if positions is not None:
+            codes = np.where(positions >= 0, codes, -1)
+        return values.categories.array.take(codes, allow_fill=True)
+    if positions is None:
+        return values
+    return values.take(positions, allow_fill=True)
+
+
 def median_calc(
     thinned_df: pd.DataFrame, statcol: str, tpcol: str, durcol: str
 ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
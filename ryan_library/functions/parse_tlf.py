@@ -1,8 +1,10 @@
 # ryan_library/functions/parse_tlf.py
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 from datetime import datetime
+import os
 import re
 from loguru import logger
 import pandas as pd
@@ -73,6 +75,13 @@ SET_VARIABLE_PATTERN: re.Pattern[str] = re.compile(
 # ``SET_VARIABLE_PATTERN`` recognises configuration lines such as ``Set Variable ~E1~ == inflow.csv``
 # and stores the variable name (``~E1~``) plus the assigned value (``inflow.csv``).
 
+# Number of lines at the end of a log searched for the completion summary.
+TAIL_LINES: int = 100
+# Header scanning stops once all four header items are found and at least this many lines were read.
+HEAD_SCAN_MIN_LINES: int = 4000
+# Size of the blocks read backwards from the end of a log by ``read_log_tail``.
+TAIL_BLOCK_SIZE: int = 64 * 1024
+
 
 def _normalise_bcdbase_variable(variable: str) -> str:
     """Normalise the BC Database variable name for consistent column naming."""
@@ -335,9 +344,61 @@ def read_log_file(logfile_path: Path, is_large_file: bool) -> list[str]:
         return []
 
 
+def read_log_tail(logfile_path: Path, max_lines: int = TAIL_LINES, block_size: int = TAIL_BLOCK_SIZE) -> list[str]:
+    """
+    Reads the last ``max_lines`` lines of a log file without reading the rest of it.
+
+    Blocks are read backwards from the end of the file until they hold more than ``max_lines``
+    line breaks, so the cost depends on the length of the tail, not the size of the log.
+
+    Args:
+        logfile_path (Path): Path to the log file.
+        max_lines (int): Number of lines to return.
+        block_size (int): Number of bytes read per seek.
+
+    Returns:
+        list[str]: The last ``max_lines`` lines, as ``read_log_file`` would split them.
+    """
+    try:
+        with logfile_path.open("rb") as lfile:
+            position: int = lfile.seek(0, os.SEEK_END)
+            blocks: list[bytes] = []
+            newlines: int = 0
+            while position > 0 and newlines <= max_lines:
+                step: int = min(block_size, position)
+                position -= step
+                lfile.seek(position)
+                block: bytes = lfile.read(step)
+                blocks.append(block)
+                newlines += block.count(b"\n")
+        data: bytes = b"".join(reversed(blocks))
+        if position > 0:
+            # Drop the partial line the first block started in.
+            data = data[data.find(b"\n") + 1 :]
+        return data.decode("utf-8").splitlines()[-max_lines:]
+    except Exception as e:
+        logger.error(f"Error reading {logfile_path}: {e}")
+        return []
+
+
+def iter_log_lines(logfile_path: Path) -> Iterator[str]:
+    """
+    Streams the lines of a log file from the top, without line terminators.
+
+    Args:
+        logfile_path (Path): Path to the log file.
+
+    Yields:
+        str: One line of the log file at a time.
+    """
+    with logfile_path.open("r", encoding="utf-8") as lfile:
+        for line in lfile:
+            yield line.rstrip("\n")
+
+
 def process_top_lines(
     logfile_path: Path,
-    lines: list[str],
+    lines: Iterable[str] | None,
     data_dict: dict[str, Any],
     success: int,
     spec_events: bool,
@@ -350,9 +411,12 @@ def process_top_lines(
     """
     Processes the top lines of the log file to extract relevant data.
 
+    Lines are consumed lazily and scanning stops once the header items are found, so with
+    ``lines=None`` (or ``is_large_file``) only the head of the file is read from disk.
+
     Args:
         logfile_path (Path): Path to the log file.
-        lines (list[str]): Lines to process.
+        lines (Iterable[str] | None): Lines to process, or None to stream them from ``logfile_path``.
         data_dict (dict[str, Any]): Dictionary to store extracted data.
         success (int): Success counter.
         spec_events (bool): Spec events flag.
@@ -366,35 +430,20 @@ def process_top_lines(
         tuple[dict[str, Any], int, bool, bool, bool]: Updated data dictionary and status flags.
     """
     try:
-        if is_large_file:
-            with logfile_path.open("r", encoding="utf-8") as lfile:
-                for counter, line in enumerate(lfile, 1):
-                    result: tuple[dict[str, Any], int, bool, bool, bool] = search_from_top(
-                        line=line,
-                        data_dict=data_dict,
-                        success=success,
-                        spec_events=spec_events,
-                        spec_scen=spec_scen,
-                        spec_var=spec_var,
-                    )
-                    data_dict, success, spec_events, spec_scen, spec_var = result
-                    if success == 4 and counter > 4000:
-                        logger.debug(f"Early termination after {counter} lines for {runcode}")
-                        break
-        else:
-            for counter, line in enumerate(lines, 1):
-                result = search_from_top(
-                    line=line,
-                    data_dict=data_dict,
-                    success=success,
-                    spec_events=spec_events,
-                    spec_scen=spec_scen,
-                    spec_var=spec_var,
-                )
-                data_dict, success, spec_events, spec_scen, spec_var = result
-                if success == 4 and counter > 4000:
-                    logger.debug(f"Early termination after {counter} lines for {runcode}")
-                    break
+        source: Iterable[str] = iter_log_lines(logfile_path) if lines is None or is_large_file else lines
+        for counter, line in enumerate(source, 1):
+            result: tuple[dict[str, Any], int, bool, bool, bool] = search_from_top(
+                line=line,
+                data_dict=data_dict,
+                success=success,
+                spec_events=spec_events,
+                spec_scen=spec_scen,
+                spec_var=spec_var,
+            )
+            data_dict, success, spec_events, spec_scen, spec_var = result
+            if success == 4 and counter > HEAD_SCAN_MIN_LINES:
+                logger.debug(f"Early termination after {counter} lines for {runcode}")
+                break
         return data_dict, success, spec_events, spec_scen, spec_var
     except Exception as e:
         logger.error(f"Error processing top lines in {relative_logfile_path}: {e}")
@@ -458,13 +507,8 @@ class TLFProcessor(BaseProcessor):
         data_dict: dict[str, Any] = {}
         current_section = None
 
-        file_size: int = self.file_path.stat().st_size
-        is_large_file: bool = file_size > 10 * 1024 * 1024  # 10 MB
-
-        lines: list[str] = read_log_file(
-            logfile_path=self.file_path,
-            is_large_file=is_large_file,
-        )
+        # Only the tail (completion summary) and the head (build info, variables) are read.
+        lines: list[str] = read_log_tail(logfile_path=self.file_path)
 
         if not lines:
             self.processed = False
@@ -474,7 +518,7 @@ class TLFProcessor(BaseProcessor):
         relative_logfile_path: Path = convert_to_relative_path(user_path=self.file_path)
 
         # Search for completion in the last 100 lines
-        for line in lines[-100:]:
+        for line in lines:
             data_dict, sim_complete, current_section = search_for_completion(
                 line=line,
                 data_dict=data_dict,
@@ -488,13 +532,13 @@ class TLFProcessor(BaseProcessor):
         if is_complete_tlf(data_dict=data_dict, sim_complete=sim_complete):
             data_dict, success, spec_events, spec_scen, spec_var = process_top_lines(
                 logfile_path=self.file_path,
-                lines=lines,
+                lines=None,
                 data_dict=data_dict,
                 success=success,
                 spec_events=spec_events,
                 spec_scen=spec_scen,
                 spec_var=spec_var,
-                is_large_file=is_large_file,
+                is_large_file=True,
                 runcode=runcode,
                 relative_logfile_path=relative_logfile_path,
             )
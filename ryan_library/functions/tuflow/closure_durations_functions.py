@@ -6,6 +6,7 @@ processors. They are intentionally logic-only (no I/O) so they can be reused and
 unit-tested independently of the orchestration layer.
 """
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from loguru import logger
@@ -34,7 +35,9 @@ def timestep_from_series(time_values: pd.Series) -> float | None:
 
 def collect_po_data(collection: ProcessorCollection) -> DataFrame:
     """Concatenate PO processor DataFrames into a single DataFrame."""
-    frames: list[DataFrame] = [processor.df for processor in collection.processors if processor.data_type == "PO"]
+    frames: list[DataFrame] = [
+        processor.expanded_df() for processor in collection.processors if processor.data_type == "PO"
+    ]
     return pd.concat(frames, ignore_index=True) if frames else DataFrame()
 
 
@@ -72,60 +75,91 @@ def calculate_threshold_durations(
         logger.warning("PO data is missing a 'Location' column. Skipping duration calculation.")
         return DataFrame()
 
-    records: list[dict[str, object]] = []
-    for _, group in filtered.groupby(available_keys, dropna=False, observed=False):
-        timestep: float | None = timestep_from_series(time_values=group["Time"])
-        if timestep is None:
-            location_label: str = first_value(group["Location"])
-            logger.warning(f"Unable to determine timestep for group with Location '{location_label}'. Skipping.")
-            continue
+    return _threshold_exceedances(filtered=filtered, keys=available_keys, thresholds=thresholds)
+
 
-        out_path: str = first_value(series=group["directory_path"]) if "directory_path" in group.columns else ""
-        trim_runcode: str = first_value(series=group["trim_runcode"]) if "trim_runcode" in group.columns else ""
-        aep: str = first_value(series=group["aep_text"]) if "aep_text" in group.columns else ""
-        duration: str = first_value(series=group["duration_text"]) if "duration_text" in group.columns else ""
-        tp: str = first_value(series=group["tp_text"]) if "tp_text" in group.columns else ""
-        location: str = first_value(series=group["Location"])
-
-        for threshold in thresholds:
-            exceed_count: int = int((group["Value"] > threshold).sum())
-            if exceed_count == 0:
-                continue
-            records.append(
-                {
-                    "AEP": aep,
-                    "Duration": duration,
-                    "TP": tp,
-                    "Location": location,
-                    "ThresholdFlow": float(threshold),
-                    "Duration_Exceeding": float(exceed_count) * timestep,
-                    "out_path": out_path,
-                    "trim_runcode": trim_runcode,
-                }
+def _threshold_exceedances(filtered: DataFrame, keys: list[str], thresholds: list[float]) -> DataFrame:
+    """Count, for every group and threshold, the timesteps whose value exceeds the threshold.
+
+    Each group's values are sorted once, so the counts for all thresholds come from a single
+    ``np.searchsorted`` call per group instead of one comparison over the group per threshold."""
+    grouped = filtered.groupby(keys, dropna=False, observed=True, sort=True)
+    codes: np.ndarray = grouped.ngroup().to_numpy(dtype=np.int64)
+    group_count: int = int(codes.max()) + 1 if len(codes) else 0
+    if group_count == 0:
+        return DataFrame()
+    times: np.ndarray = filtered["Time"].to_numpy(dtype=np.float64)
+    values: np.ndarray = filtered["Value"].to_numpy(dtype=np.float64)
+    threshold_values: np.ndarray = np.asarray(thresholds, dtype=np.float64)
+
+    # Timestep per group: gap between the two smallest distinct times.
+    by_time: np.ndarray = np.lexsort((times, codes))
+    time_codes: np.ndarray = codes[by_time]
+    sorted_times: np.ndarray = times[by_time]
+    distinct: np.ndarray = np.ones(len(by_time), dtype=bool)
+    distinct[1:] = (time_codes[1:] != time_codes[:-1]) | (sorted_times[1:] != sorted_times[:-1])
+    distinct_codes: np.ndarray = time_codes[distinct]
+    distinct_times: np.ndarray = sorted_times[distinct]
+    first: np.ndarray = np.searchsorted(distinct_codes, np.arange(group_count))
+    second: np.ndarray = np.minimum(first + 1, len(distinct_codes) - 1)
+    has_timestep: np.ndarray = distinct_codes[second] == np.arange(group_count)
+    has_timestep &= second > first
+    timesteps: np.ndarray = np.where(has_timestep, distinct_times[second] - distinct_times[first], np.nan)
+
+    # Rows of each group in ascending value order.
+    by_value: np.ndarray = np.lexsort((values, codes))
+    sorted_values: np.ndarray = values[by_value]
+    bounds: np.ndarray = np.searchsorted(codes[by_value], np.arange(group_count + 1))
+
+    row_of_group: np.ndarray = by_value[bounds[:-1]]
+    labels: dict[str, np.ndarray] = {}
+    for column in ("directory_path", "trim_runcode", "aep_text", "duration_text", "tp_text", "Location"):
+        if column in filtered.columns:
+            labels[column] = np.array(
+                [_label(value) for value in filtered[column].to_numpy()[row_of_group]], dtype=object
             )
+        else:
+            labels[column] = np.full(group_count, "", dtype=object)
+
+    counts: np.ndarray = np.zeros((group_count, len(threshold_values)), dtype=np.int64)
+    for group in range(group_count):
+        if not has_timestep[group]:
+            logger.warning(
+                f"Unable to determine timestep for group with Location '{labels['Location'][group]}'. Skipping."
+            )
+            continue
+        group_values: np.ndarray = sorted_values[bounds[group] : bounds[group + 1]]
+        counts[group] = len(group_values) - np.searchsorted(group_values, threshold_values, side="right")
 
-    return DataFrame(data=records)
+    group_index, threshold_index = np.nonzero(counts)
+    if len(group_index) == 0:
+        return DataFrame()
+    return DataFrame(
+        data={
+            "AEP": labels["aep_text"][group_index],
+            "Duration": labels["duration_text"][group_index],
+            "TP": labels["tp_text"][group_index],
+            "Location": labels["Location"][group_index],
+            "ThresholdFlow": threshold_values[threshold_index],
+            "Duration_Exceeding": counts[group_index, threshold_index].astype(np.float64) * timesteps[group_index],
+            "out_path": labels["directory_path"][group_index],
+            "trim_runcode": labels["trim_runcode"][group_index],
+        }
+    )
+
+
+def _label(value: object) -> str:
+    """Return ``value`` as the stripped text ``first_value`` would report for a single-valued group."""
+    if pd.isna(value):
+        return ""
+    return str(value).strip()
 
 
 def summarise_results(df: DataFrame) -> DataFrame:
     """Summarise closure duration results."""
-    from ..pandas.median_calc import median_stats as median_stats_func
+    from ..pandas.median_calc import grouped_median_statistics
 
-    final_columns: list[str] = [
-        "Path",
-        "Location",
-        "ThresholdFlow",
-        "AEP",
-        "Central_Value",
-        "Critical_Duration",
-        "Critical_Tp",
-        "Low_Value",
-        "High_Value",
-        "Average_Value",
-        "Closest_Tpcrit",
-        "Closest_Value",
-    ]
-    finaldb = pd.DataFrame(columns=final_columns)
+    group_keys: list[str] = ["out_path", "Location", "ThresholdFlow", "AEP"]
     # Capture the full set of (Duration, TP) combinations for each location/AEP so that
     # thresholds which do not exceed for a given combination can still contribute zeros
     # to the summary statistics.  Without this we would discard zeros entirely and the
@@ -133,35 +167,32 @@ def summarise_results(df: DataFrame) -> DataFrame:
     scenario_keys: list[str] = ["Duration", "TP"]
     if "trim_runcode" in df.columns:
         scenario_keys.insert(0, "trim_runcode")
-    combo_columns: list[str] = ["out_path", "Location", "AEP", *scenario_keys]
-    combo_lookup = {
-        key: grp.loc[:, scenario_keys].drop_duplicates().reset_index(drop=True)
-        for key, grp in df.loc[:, combo_columns].drop_duplicates().groupby(["out_path", "Location", "AEP"])
-    }
-
-    grouped = df.groupby(["out_path", "Location", "ThresholdFlow", "AEP"])
-    for name, group in grouped:
-        path, location, threshold, aep = name
-        combos: DataFrame | None = combo_lookup.get((path, location, aep))
-        if combos is not None:
-            group = combos.merge(right=group, on=scenario_keys, how="left")
-            group["AEP"] = group["AEP"].fillna(aep)
-            group["out_path"] = group["out_path"].fillna(path)
-            group["Location"] = group["Location"].fillna(location)
-            group["ThresholdFlow"] = group["ThresholdFlow"].fillna(threshold)
-            group["Duration_Exceeding"] = group["Duration_Exceeding"].fillna(0.0)
-
-        stats, _ = median_stats_func(group, "Duration_Exceeding", "TP", "Duration")
-        row = list(name) + [
-            stats.get("median"),
-            stats.get("median_duration"),
-            stats.get("median_TP"),
-            stats.get("low"),
-            stats.get("high"),
-            stats.get("mean_including_zeroes"),
-            stats.get("median_TP"),
-            stats.get("median"),
-        ]
-        finaldb.loc[len(finaldb)] = row
-    finaldb.columns = final_columns
-    return finaldb
+    site_keys: list[str] = ["out_path", "Location", "AEP"]
+    combos: DataFrame = df.loc[:, [*site_keys, *scenario_keys]].drop_duplicates()
+    thresholds: DataFrame = df.loc[:, group_keys].drop_duplicates().dropna()
+    expanded: DataFrame = thresholds.merge(right=combos, on=site_keys, how="inner").merge(
+        right=df.loc[:, [*group_keys, *scenario_keys, "Duration_Exceeding"]],
+        on=[*group_keys, *scenario_keys],
+        how="left",
+    )
+    expanded["Duration_Exceeding"] = expanded["Duration_Exceeding"].fillna(0.0)
+
+    stats: DataFrame = grouped_median_statistics(
+        df=expanded, group_cols=group_keys, stat_col="Duration_Exceeding", tp_col="TP", dur_col="Duration"
+    )
+    return DataFrame(
+        {
+            "Path": stats["out_path"],
+            "Location": stats["Location"],
+            "ThresholdFlow": stats["ThresholdFlow"],
+            "AEP": stats["AEP"],
+            "Central_Value": stats["median"],
+            "Critical_Duration": stats["median_duration"],
+            "Critical_Tp": stats["median_TP"],
+            "Low_Value": stats["low"],
+            "High_Value": stats["high"],
+            "Average_Value": stats["mean_including_zeroes"],
+            "Closest_Tpcrit": stats["median_TP"],
+            "Closest_Value": stats["median"],
+        }
+    )
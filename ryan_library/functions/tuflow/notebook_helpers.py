@@ -13,6 +13,7 @@ from ryan_library.processors.tuflow.base_processor import BaseProcessor
 from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
 from ryan_library.orchestrators.tuflow.tuflow_culverts_mean import find_culvert_aep_dur_mean, find_culvert_aep_mean_max
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
@@ -163,53 +164,78 @@ def _extract_critical_timeseries(
         return {}
 
     # Valid numeric rows
-    valid_df = max_df.dropna(subset=[metric]).copy()
+    valid_df = max_df.dropna(subset=[metric])
+    # observed/sort pinned: group numbers must match the rows of ``means`` whatever the pandas defaults
+    grouped = valid_df.groupby(dur_group_cols, observed=True, sort=True)
 
     # Mean per duration
-    means = valid_df.groupby(dur_group_cols)[metric].mean().reset_index(name="mean_metric")
+    means = grouped[metric].mean().reset_index(name="mean_metric")
 
     # Find max mean per AEP/Chan (Critical Duration)
     # idxmax returns the index of the max value
-    crit_idx = means.groupby(group_cols)["mean_metric"].idxmax()
+    crit_idx = means.groupby(group_cols, observed=True, sort=True)["mean_metric"].idxmax()
     critical_events = means.loc[crit_idx]
     # critical_events has [aep_text, duration_text, Chan ID, mean_metric] representing the critical duration
 
-    # Now, for each critical event, go back to valid_df and find the specific run closest to mean
-    for _, row in critical_events.iterrows():
-        aep = row["aep_text"]
-        dur = row["duration_text"]
-        chan = row["Chan ID"]
-        target_mean = row["mean_metric"]
-
-        # Filter raw max rows for this specific bucket
-        subset = valid_df[
-            (valid_df["aep_text"] == aep) & (valid_df["duration_text"] == dur) & (valid_df["Chan ID"] == chan)
-        ]
-
-        if subset.empty:
-            continue
-
-        # Find row with metric closest to target_mean
-        subset = subset.copy()
-        subset["diff"] = (subset[metric] - target_mean).abs()
-        closest_row = subset.loc[subset["diff"].idxmin()]
+    # For every duration group, find the position in valid_df of the run closest to the mean.
+    # ``means`` has one row per group in group-number order, so its index is the group number.
+    closest_rows = _closest_rows(
+        group_codes=grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64),
+        values=valid_df[metric].to_numpy(dtype=float),
+        targets=means["mean_metric"].to_numpy(dtype=float),
+    )
+    run_codes = valid_df["internalName"].to_numpy(dtype=object)
 
-        run_code = closest_row["internalName"]
+    # Rows of each channel in the timeseries of a run, built once per run
+    channel_rows: dict[str, tuple[pd.DataFrame, dict[object, np.ndarray]]] = {}
+    for group_code, aep, chan in zip(
+        crit_idx.to_numpy(), critical_events["aep_text"], critical_events["Chan ID"], strict=True
+    ):
+        run_code = run_codes[closest_rows[group_code]]
 
         # Get timeseries
         proc = ts_processors.get(run_code)
         if proc:
-            # We filter the big timeseries DF for just this channel
-            # Optimisation: The processor DF contains all channels for that run.
-            ts_df = proc.df
-            if "Chan ID" in ts_df.columns:
-                chan_ts = ts_df[ts_df["Chan ID"] == chan].copy()
-                if not chan_ts.empty:
-                    results[(aep, chan)] = chan_ts
+            if run_code not in channel_rows:
+                ts_df = proc.expanded_df()
+                channel_rows[run_code] = (ts_df, _rows_by_channel(ts_df) if "Chan ID" in ts_df.columns else {})
+            ts_df, rows_by_channel = channel_rows[run_code]
+            rows = rows_by_channel.get(chan)
+            if rows is not None:
+                results[(aep, chan)] = ts_df.iloc[rows]
 
     return results
 
 
+def _closest_rows(group_codes: np.ndarray, values: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Return, per group, the first row (in row order) whose value is closest to the group target.
+
+    Args:
+        group_codes: Group number of every row; rows coded -1 are ignored.
+        values: Value of every row.
+        targets: Target value of every group, indexed by group number.
+
+    Returns:
+        np.ndarray: Row position per group, or -1 for groups without rows.
+    """
+    rows = np.flatnonzero(group_codes >= 0)
+    codes = group_codes[rows]
+    distance = np.abs(values[rows] - targets[codes])
+    ordered = rows[np.lexsort((rows, distance, codes))]
+    groups, first = np.unique(group_codes[ordered], return_index=True)
+    closest = np.full(len(targets), -1, dtype=np.int64)
+    closest[groups] = ordered[first]
+    return closest
+
+
+def _rows_by_channel(ts_df: pd.DataFrame) -> dict[object, np.ndarray]:
+    """Map each ``Chan ID`` of a timeseries frame to its row positions, keeping row order."""
+    codes, channels = pd.factorize(ts_df["Chan ID"])
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(channels) + 1))
+    return {channel: order[bounds[i] : bounds[i + 1]] for i, channel in enumerate(channels)}
+
+
 def plot_hydrographs(hydrographs: dict[tuple[str, str], pd.DataFrame], title: str = "Hydrographs"):
     """
     Plot the provided hydrographs.
@@ -9,12 +9,17 @@ from collections.abc import Collection, Mapping, Sequence
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Callable, cast
 
+import numpy as np
 import pandas as pd
 from loguru import logger
-from pandas import DataFrame, Index, Series
+from pandas import DataFrame, Series
 
 from ryan_library.classes.column_definitions import ColumnDefinition, ColumnMetadataRegistry
-from ryan_library.functions.pandas.median_calc import median_calc
+from ryan_library.functions.pandas.median_calc import (
+    grouped_median_statistics,
+    sorted_group_positions,
+    take_values,
+)
 from ryan_library.functions.misc_functions import ExcelExporter, get_tools_version
 from ryan_library.processors.tuflow.base_processor import BaseProcessor
 from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
@@ -53,28 +58,31 @@ def _ordered_columns(
     return ordered
 
 
-def _select_internal_names_for_group(group: DataFrameAny) -> tuple[object, object]:
-    """Return (median_internal_name, mean_internal_name) for a grouped DataFrame."""
+def _select_internal_names(df: DataFrameAny, group_cols: list[str]) -> tuple[Any, Any]:
+    """Return the median and mean ``internalName`` of every group, in sorted group order.
 
-    if "internalName" not in group.columns or "AbsMax" not in group.columns:
-        return pd.NA, pd.NA
+    The median name belongs to the upper-middle ``AbsMax`` record and the mean name to the first
+    record closest to the group mean. Groups without a numeric ``AbsMax`` get missing names."""
 
-    stat_series: Series = pd.to_numeric(group["AbsMax"], errors="coerce")
-    if not stat_series.notna().any():
-        return pd.NA, pd.NA
+    grouper = df.groupby(group_cols, sort=True, dropna=True, observed=True)
+    codes: np.ndarray = grouper.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    group_count: int = int(grouper.ngroups)
+    stat: np.ndarray = pd.to_numeric(df["AbsMax"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    measured: np.ndarray = np.flatnonzero((codes >= 0) & ~np.isnan(stat))
+    has_value: np.ndarray = np.bincount(codes[measured], minlength=group_count) > 0
 
-    sorted_idx: Index[Any] = stat_series.sort_values(ascending=True, na_position="first").index
-    median_pos = int(len(sorted_idx) / 2)
-    median_internal_name = group.loc[sorted_idx[median_pos], "internalName"]
+    sorted_rows, starts, sizes = sorted_group_positions(codes=codes, values=stat)
+    median_rows: np.ndarray = np.where(has_value, sorted_rows[starts + sizes // 2], -1)
 
-    mean_value = float(stat_series.mean())
-    if pd.isna(mean_value):
-        mean_internal_name = pd.NA
-    else:
-        closest_idx: int | str = (stat_series - mean_value).abs().idxmin()
-        mean_internal_name = group.loc[closest_idx, "internalName"]
+    means: np.ndarray = pd.Series(stat[measured]).groupby(codes[measured]).mean().reindex(range(group_count)).to_numpy()
+    distance: np.ndarray = np.abs(stat[measured] - means[codes[measured]])
+    nearest: np.ndarray = measured[np.lexsort((measured, distance, codes[measured]))]
+    nearest_groups, first = np.unique(codes[nearest], return_index=True)
+    mean_rows: np.ndarray = np.full(group_count, -1, dtype=np.int64)
+    mean_rows[nearest_groups] = nearest[first]
 
-    return median_internal_name, mean_internal_name
+    names: Series = df["internalName"]
+    return take_values(series=names, positions=median_rows), take_values(series=names, positions=mean_rows)
 
 
 def combine_processors_from_paths(
@@ -429,33 +437,21 @@ def find_aep_dur_median(aggregated_df: DataFrameAny) -> DataFrameAny:
         "Type",
         "trim_runcode",
     ]
-    rows: list[dict[str, Any]] = []
     median_df: DataFrameAny = DataFrame()
     try:
-        df: DataFrameAny = aggregated_df.copy()
-        df["count_TP"] = df.groupby(group_cols, observed=True)["AbsMax"].transform("size")
-        for _, grp in df.groupby(group_cols, observed=True):
-            stats_dict, _ = median_calc(
-                thinned_df=grp,
-                statcol="AbsMax",
-                tpcol="tp_text",
-                durcol="duration_text",
-            )
-            median_internal_name, mean_internal_name = _select_internal_names_for_group(grp)
-            row = {
-                "aep_text": grp["aep_text"].iloc[0],
-                "duration_text": grp["duration_text"].iloc[0],
-                "Location": grp["Location"].iloc[0],
-                "Type": grp["Type"].iloc[0],
-                "trim_runcode": grp["trim_runcode"].iloc[0],
-            }
-            if "internalName" in grp.columns:
-                row["internalName"] = median_internal_name
-                row["mean_internalName"] = mean_internal_name
-            row.update(stats_dict)
-            row["MedianAbsMax"] = row.pop("median")
-            rows.append(row)
-            median_df = DataFrame(rows)
+        stats: DataFrameAny = grouped_median_statistics(
+            df=aggregated_df,
+            group_cols=group_cols,
+            stat_col="AbsMax",
+            tp_col="tp_text",
+            dur_col="duration_text",
+        )
+        if not stats.empty:
+            median_df = stats.rename(columns={"median": "MedianAbsMax"})
+            if "internalName" in aggregated_df.columns:
+                median_names, mean_names = _select_internal_names(df=aggregated_df, group_cols=group_cols)
+                median_df.insert(len(group_cols), "internalName", median_names)
+                median_df.insert(len(group_cols) + 1, "mean_internalName", mean_names)
         if not median_df.empty:
             # Normalise TP / duration text so the "mean storm equals median storm" flag is stable.
             def _normalize_tp(value: object) -> object:
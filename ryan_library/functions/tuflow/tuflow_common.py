@@ -2,20 +2,31 @@
 from __future__ import annotations
 from pathlib import Path
 from multiprocessing import Pool
-from multiprocessing.pool import MaybeEncodingError
-from collections.abc import Iterable, Mapping, Collection
+from multiprocessing.pool import MaybeEncodingError, Pool as PoolType
+from collections.abc import Callable, Iterable, Iterator, Mapping, Collection, Sequence
+from queue import SimpleQueue
 from typing import Any
 from loguru import logger
 
+from ryan_library.functions.directory_index import DirectoryIndex
 from ryan_library.functions.file_utils import (
     find_files_parallel,
     is_non_zero_file,
 )
-from ryan_library.functions.misc_functions import calculate_pool_size
 from ryan_library.functions.loguru_helpers import LoguruMultiprocessingLogger, worker_initializer
+from ryan_library.functions.work_scheduling import file_sizes, plan_batches, size_aware_pool_size
 from ryan_library.processors.tuflow.base_processor import BaseProcessor
+from ryan_library.processors.tuflow.processor_cache import CacheSignature, ProcessorResultCache
 from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
-from ryan_library.classes.suffixes_and_dtypes import SuffixesConfig
+from ryan_library.processors.tuflow.processor_transport import (
+    TRANSPORT_MODES,
+    ProcessorPayload,
+    TransportMode,
+    arrow_available,
+    from_payload,
+    to_payload,
+)
+from ryan_library.classes.suffixes_and_dtypes import SuffixesConfig, SuffixIndex
 from ryan_library.classes.tuflow_string_classes import TuflowStringParser
 
 
@@ -23,8 +34,11 @@ def collect_files(
     paths_to_process: Iterable[Path],
     include_data_types: Iterable[str],
     suffixes_config: SuffixesConfig,
+    directory_index: DirectoryIndex | Path | str | None = None,
 ) -> list[Path]:
-    """Return all non-empty files matching ``include_data_types`` underneath ``paths_to_process``."""
+    """Return all non-empty files matching ``include_data_types`` underneath ``paths_to_process``.
+
+    ``directory_index`` is passed to :func:`find_files_parallel` so unchanged directories are not listed again."""
 
     normalized_roots: list[Path] = []
     seen_roots: set[Path] = set()
@@ -53,12 +67,14 @@ def collect_files(
 
     data_map: dict[str, list[str]] = suffixes_config.invert_suffix_to_type()
     suffixes: list[str] = []
+    requested_types: set[str] = set()
     for data_type in deduped_types:
         dt_suffixes: list[str] | None = data_map.get(data_type)
         if not dt_suffixes:
             logger.error(f"No suffixes for data type '{data_type}'. Skipping.")
             continue
         suffixes.extend(dt_suffixes)
+        requested_types.add(data_type)
 
     suffixes = list(dict.fromkeys(suffixes))
     if not suffixes:
@@ -77,30 +93,35 @@ def collect_files(
         logger.warning("No valid directories were supplied for file collection.")
         return []
 
-    files: list[Path] = find_files_parallel(root_dirs=roots, patterns=patterns)
+    files: list[Path] = find_files_parallel(root_dirs=roots, patterns=patterns, directory_index=directory_index)
     logger.debug("find_files_parallel found {} files.", len(files))
+    # A pattern such as "*_H.csv" also matches files whose longest suffix belongs to another data type.
+    suffix_index: SuffixIndex = suffixes_config.suffix_index(case_sensitive=False)
     filtered_files: list[Path] = []
     seen_files: set[Path] = set()
     for file_path in files:
         if file_path in seen_files:
             continue
         seen_files.add(file_path)
+        if suffix_index.data_type(file_path.name) not in requested_types:
+            logger.debug(f"Skipping {file_path}: its longest suffix belongs to another data type")
+            continue
         if not is_non_zero_file(file_path):
             continue
         filtered_files.append(file_path)
     return filtered_files
 
 
-def _summarize_file_batch(file_list: list[Path]) -> tuple[int, int, Path | None, int]:
-    """Return count, total bytes, largest path, largest size for ``file_list``."""
+def _summarize_file_batch(
+    file_list: list[Path], sizes: Sequence[int] | None = None
+) -> tuple[int, int, Path | None, int]:
+    """Return count, total bytes, largest path, largest size for ``file_list``.
+
+    ``sizes`` supplies the file sizes when they are already known; otherwise each file is stat'ed."""
     total_bytes: int = 0
     largest_file: Path | None = None
     largest_bytes: int = 0
-    for path in file_list:
-        try:
-            size = path.stat().st_size
-        except OSError:
-            size = 0
+    for path, size in zip(file_list, file_sizes(paths=file_list) if sizes is None else sizes, strict=True):
         total_bytes += size
         if size > largest_bytes:
             largest_bytes = size
@@ -171,6 +192,22 @@ def process_file(
         return None
 
 
+def process_file_to_payload(
+    file_path: Path,
+    entity_filters: Mapping[str, Collection[str]] | Collection[str] | None = None,
+    include_path_columns: bool = True,
+) -> ProcessorPayload | None:
+    """Worker entry point for the ``"arrow"`` transport: process ``file_path`` and return only its frame."""
+    proc: BaseProcessor | None = process_file(
+        file_path=file_path,
+        entity_filters=entity_filters,
+        include_path_columns=include_path_columns,
+    )
+    if proc is None or not proc.processed:
+        return None
+    return to_payload(processor=proc)
+
+
 def process_files_in_parallel(
     file_list: list[Path],
     log_queue: Any,
@@ -178,10 +215,117 @@ def process_files_in_parallel(
     entity_filters: Mapping[str, Collection[str]] | Collection[str] | None = None,
     *,
     include_path_columns: bool = True,
+    cache_dir: Path | None = None,
+    max_in_flight: int | None = None,
+    transport: TransportMode = "processor",
+    use_run_dimension: bool = False,
+) -> ProcessorCollection:
+    """Process ``file_list`` into a :class:`ProcessorCollection` using a worker pool.
+
+    Results are streamed back as workers finish and added to the collection straight away;
+    ``max_in_flight`` caps the number of submitted-but-uncollected tasks (default: twice the
+    pool size) so parent memory scales with that window rather than the whole project.
+
+    Work is scheduled by file size (see :mod:`ryan_library.functions.work_scheduling`): the pool
+    is sized from the total bytes to process and available memory, files are submitted largest
+    first, and small files travel to workers in batches. The collection keeps discovery order.
+
+    When ``cache_dir`` is supplied, files whose processed output is already cached (same
+    path, size, mtime, processor and configuration) are loaded from the cache and only the
+    remaining files are dispatched to workers. Newly processed files are written back.
+
+    ``transport`` selects what workers send back: ``"processor"`` pickles the whole processor,
+    ``"arrow"`` sends only the processed DataFrame as an Arrow IPC buffer and rebuilds the
+    processor in the parent, which keeps large results well under the pickling limits.
+
+    ``use_run_dimension`` compacts each processor into a fact table as it is collected, moving its
+    metadata columns into the collection's run dimension (see :class:`ProcessorCollection`)."""
+    if transport not in TRANSPORT_MODES:
+        raise ValueError(f"Unknown transport '{transport}'. Expected one of {TRANSPORT_MODES}.")
+    if transport == "arrow" and not arrow_available():
+        logger.warning("pyarrow is not installed; falling back to the 'processor' transport.")
+        transport = "processor"
+
+    if cache_dir is None:
+        return _process_files_with_pool(
+            file_list=file_list,
+            log_queue=log_queue,
+            log_level=log_level,
+            entity_filters=entity_filters,
+            include_path_columns=include_path_columns,
+            max_in_flight=max_in_flight,
+            transport=transport,
+            use_run_dimension=use_run_dimension,
+        )
+
+    result_cache = ProcessorResultCache(cache_dir=cache_dir)
+    cached_processors: list[BaseProcessor] = []
+    signatures: dict[Path, CacheSignature] = {}
+    pending_files: list[Path] = []
+    for file_path in file_list:
+        signature: CacheSignature | None = result_cache.build_signature(
+            file_path=file_path,
+            entity_filter=_resolve_entity_filter_for_file(file_path=file_path, entity_filters=entity_filters),
+            include_path_columns=include_path_columns,
+        )
+        if signature is None:
+            pending_files.append(file_path)
+            continue
+        cached: BaseProcessor | None = result_cache.load(file_path=file_path, signature=signature)
+        if cached is None:
+            signatures[file_path] = signature
+            pending_files.append(file_path)
+        else:
+            cached_processors.append(cached)
+
+    logger.info(
+        "Processor cache {cache_dir}: reused {hits} of {total} files; {pending} to process.",
+        cache_dir=result_cache.cache_dir,
+        hits=len(cached_processors),
+        total=len(file_list),
+        pending=len(pending_files),
+    )
+
+    coll = ProcessorCollection(use_run_dimension=use_run_dimension)
+    if pending_files:
+        coll = _process_files_with_pool(
+            file_list=pending_files,
+            log_queue=log_queue,
+            log_level=log_level,
+            entity_filters=entity_filters,
+            include_path_columns=include_path_columns,
+            result_cache=result_cache,
+            signatures=signatures,
+            max_in_flight=max_in_flight,
+            transport=transport,
+            use_run_dimension=use_run_dimension,
+        )
+    for proc in cached_processors:
+        coll.add_processor(processor=proc)
+
+    # Keep discovery order so cached and uncached runs combine into identical frames.
+    _sort_by_file_order(coll=coll, file_list=file_list)
+    logger.debug(f"Processor cache wrote {result_cache.writes} new entries.")
+    return coll
+
+
+def _process_files_with_pool(
+    file_list: list[Path],
+    log_queue: Any,
+    log_level: str = "INFO",
+    entity_filters: Mapping[str, Collection[str]] | Collection[str] | None = None,
+    *,
+    include_path_columns: bool = True,
+    result_cache: ProcessorResultCache | None = None,
+    signatures: Mapping[Path, CacheSignature] | None = None,
+    max_in_flight: int | None = None,
+    transport: TransportMode = "processor",
+    use_run_dimension: bool = False,
 ) -> ProcessorCollection:
-    size: int = calculate_pool_size(num_files=len(file_list))
+    sizes: list[int] = file_sizes(paths=file_list)
+    size: int = size_aware_pool_size(sizes=sizes)
     logger.info(f"Spawning pool with {size} workers")
-    file_count, total_bytes, largest_file, largest_bytes = _summarize_file_batch(file_list=file_list)
+    file_count, total_bytes, largest_file, largest_bytes = _summarize_file_batch(file_list=file_list, sizes=sizes)
     largest_desc: str = f"{largest_file.name} ({_format_bytes(largest_bytes)})" if largest_file else "n/a"
     logger.info(
         "Preparing to process {count} files (~{total} on disk; largest {largest}).",
@@ -196,35 +340,146 @@ def process_files_in_parallel(
             file_list=file_list,
             entity_filters=entity_filters,
             include_path_columns=include_path_columns,
+            result_cache=result_cache,
+            signatures=signatures,
+            use_run_dimension=use_run_dimension,
         )
 
+    window: int = max_in_flight if max_in_flight is not None else size * 2
+    tasks: list[list[Path]] = [
+        [file_list[position] for position in batch] for batch in plan_batches(sizes=sizes, workers=size)
+    ]
+    logger.debug(f"Scheduling {file_count} files as {len(tasks)} tasks, largest first.")
+    coll = ProcessorCollection(use_run_dimension=use_run_dimension)
+    completed: set[Path] = set()
     try:
         with Pool(processes=size, initializer=worker_initializer, initargs=(log_queue, log_level)) as pool:
-            task_args: list[tuple[Path, Mapping[str, Collection[str]] | Collection[str] | None, bool]] = [
-                (file_path, entity_filters, include_path_columns) for file_path in file_list
-            ]
-            coll = ProcessorCollection()
-            for proc in pool.starmap(func=process_file, iterable=task_args):
-                if proc and proc.processed:
-                    coll.add_processor(processor=proc)
-            return coll
-    except MaybeEncodingError as exc:
-        logger.warning(
-            "Multiprocessing failed to return processor results ({}). Falling back to sequential execution. Dataset footprint: {}",
-            exc,
-            dataset_summary,
-        )
+            for file_path, result, error in _stream_pool_results(
+                pool=pool,
+                tasks=tasks,
+                entity_filters=entity_filters,
+                include_path_columns=include_path_columns,
+                max_in_flight=window,
+                worker=process_file_to_payload if transport == "arrow" else process_file,
+            ):
+                proc: BaseProcessor | None = None
+                if isinstance(result, ProcessorPayload):
+                    try:
+                        proc = from_payload(payload=result)
+                    except Exception as exc:
+                        # Treat an unreadable payload like an unpicklable result and redo the file here.
+                        error = MaybeEncodingError(exc, file_path)
+                else:
+                    proc = result
+                if isinstance(error, MaybeEncodingError):
+                    logger.warning(
+                        "Worker could not return the result for {} ({}). Reprocessing it in the main process.",
+                        file_path.name,
+                        error,
+                    )
+                    proc = process_file(
+                        file_path=file_path,
+                        entity_filters=entity_filters,
+                        include_path_columns=include_path_columns,
+                    )
+                elif error is not None:
+                    logger.error(f"Error processing {file_path}: {error}")
+                completed.add(file_path)
+                _collect_processor(coll=coll, proc=proc, result_cache=result_cache, signatures=signatures)
+        _sort_by_file_order(coll=coll, file_list=file_list)
+        return coll
     except OSError as exc:
         logger.warning(
             "Multiprocessing encountered an OSError ({}). Falling back to sequential execution. Dataset footprint: {}",
             exc,
             dataset_summary,
         )
-    return _process_files_serially(
-        file_list=file_list,
+    remaining: ProcessorCollection = _process_files_serially(
+        file_list=[file_path for file_path in file_list if file_path not in completed],
         entity_filters=entity_filters,
         include_path_columns=include_path_columns,
+        result_cache=result_cache,
+        signatures=signatures,
+        use_run_dimension=use_run_dimension,
     )
+    for processor in remaining.processors:
+        coll.add_processor(processor=processor)
+    _sort_by_file_order(coll=coll, file_list=file_list)
+    return coll
+
+
+def _process_file_batch(
+    file_paths: Sequence[Path],
+    entity_filters: Mapping[str, Collection[str]] | Collection[str] | None,
+    include_path_columns: bool,
+    worker: Callable[..., BaseProcessor | ProcessorPayload | None] = process_file,
+) -> list[tuple[BaseProcessor | ProcessorPayload | None, BaseException | None]]:
+    """Worker entry point: run ``worker`` on each file of a task, returning ``(result, error)`` per file."""
+    results: list[tuple[BaseProcessor | ProcessorPayload | None, BaseException | None]] = []
+    for file_path in file_paths:
+        try:
+            results.append((worker(file_path, entity_filters, include_path_columns), None))
+        except Exception as exc:
+            results.append((None, exc))
+    return results
+
+
+def _stream_pool_results(
+    pool: PoolType,
+    tasks: Iterable[Sequence[Path]],
+    entity_filters: Mapping[str, Collection[str]] | Collection[str] | None,
+    include_path_columns: bool,
+    max_in_flight: int,
+    worker: Callable[..., BaseProcessor | ProcessorPayload | None] = process_file,
+) -> Iterator[tuple[Path, BaseProcessor | ProcessorPayload | None, BaseException | None]]:
+    """Yield ``(file_path, processor, error)`` as workers finish, keeping at most ``max_in_flight`` tasks queued.
+
+    Each task is a batch of files processed by one worker call. Tasks are submitted lazily so
+    neither the task list nor the finished results for the whole project are held in the parent
+    at once; peak memory is bounded by the window instead. If a whole task fails (for example its
+    results cannot be pickled), every file of the task is yielded with that error."""
+    finished: SimpleQueue[list[tuple[Path, BaseProcessor | ProcessorPayload | None, BaseException | None]]] = (
+        SimpleQueue()
+    )
+    window: int = max(max_in_flight, 1)
+    in_flight: int = 0
+    for task in tasks:
+        while in_flight >= window:
+            yield from finished.get()
+            in_flight -= 1
+        pool.apply_async(
+            _process_file_batch,
+            args=(task, entity_filters, include_path_columns, worker),
+            callback=lambda results, paths=task: finished.put(
+                [(path, result, error) for path, (result, error) in zip(paths, results)]
+            ),
+            error_callback=lambda exc, paths=task: finished.put([(path, None, exc) for path in paths]),
+        )
+        in_flight += 1
+    while in_flight:
+        yield from finished.get()
+        in_flight -= 1
+
+
+def _sort_by_file_order(coll: ProcessorCollection, file_list: list[Path]) -> None:
+    """Restore discovery order so combined frames do not depend on worker completion order."""
+    file_order: dict[Path, int] = {file_path: idx for idx, file_path in enumerate(file_list)}
+    coll.processors.sort(key=lambda proc: file_order.get(proc.file_path, len(file_order)))
+
+
+def _collect_processor(
+    coll: ProcessorCollection,
+    proc: BaseProcessor | None,
+    result_cache: ProcessorResultCache | None = None,
+    signatures: Mapping[Path, CacheSignature] | None = None,
+) -> None:
+    """Add a finished processor to ``coll`` and write it to the result cache when enabled."""
+    if not proc or not proc.processed:
+        return
+    if result_cache is not None:
+        signature: CacheSignature | None = signatures.get(proc.file_path) if signatures else None
+        result_cache.store(processor=proc, signature=signature)
+    coll.add_processor(processor=proc)
 
 
 def _process_files_serially(
@@ -232,17 +487,19 @@ def _process_files_serially(
     entity_filters: Mapping[str, Collection[str]] | Collection[str] | None = None,
     *,
     include_path_columns: bool = True,
+    result_cache: ProcessorResultCache | None = None,
+    signatures: Mapping[Path, CacheSignature] | None = None,
+    use_run_dimension: bool = False,
 ) -> ProcessorCollection:
     logger.info("Processing {} files sequentially.", len(file_list))
-    coll = ProcessorCollection()
+    coll = ProcessorCollection(use_run_dimension=use_run_dimension)
     for file_path in file_list:
         proc: BaseProcessor | None = process_file(
             file_path=file_path,
             entity_filters=entity_filters,
             include_path_columns=include_path_columns,
         )
-        if proc and proc.processed:
-            coll.add_processor(processor=proc)
+        _collect_processor(coll=coll, proc=proc, result_cache=result_cache, signatures=signatures)
     return coll
 
 
@@ -254,12 +511,16 @@ def bulk_read_and_merge_tuflow_csv(
     entity_filters: Mapping[str, Collection[str]] | Collection[str] | None = None,
     *,
     include_path_columns: bool = True,
+    cache_dir: Path | None = None,
+    transport: TransportMode = "processor",
+    directory_index: Path | None = None,
 ) -> ProcessorCollection:
     logger.info("Starting TUFLOW culvert processing")
     files: list[Path] = collect_files(
         paths_to_process=paths_to_process,
         include_data_types=include_data_types,
         suffixes_config=SuffixesConfig.get_instance(),
+        directory_index=directory_index,
     )
     if not files:
         logger.error("No files found")
@@ -271,6 +532,8 @@ def bulk_read_and_merge_tuflow_csv(
         log_level=console_log_level,
         entity_filters=entity_filters,
         include_path_columns=include_path_columns,
+        cache_dir=cache_dir,
+        transport=transport,
     )
     # tell the queue “no more data” and wait for its feeder thread to finish
     return results
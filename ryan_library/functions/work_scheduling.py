@@ -0,0 +1,127 @@
+# ryan_library/functions/work_scheduling.py
+"""Size-aware scheduling of file work across a process pool.
+
+Files are submitted largest first (longest-processing-time first), so one huge result file found
+late in discovery order no longer starts after everything else and leaves the other workers idle.
+The pool is sized from the amount of input rather than only the file count, and capped so the
+first wave of workers, which gets the largest files, fits in available memory. Small files are
+grouped into batches so each task carries enough work to be worth its inter-process round trip."""
+
+from collections.abc import Iterable, Sequence
+import math
+import multiprocessing
+from pathlib import Path
+
+from loguru import logger
+
+# Same ceiling as calculate_pool_size; one core is always left for the parent process.
+MAX_POOL_WORKERS: int = 20
+# Input below this many bytes per worker does not justify starting another process.
+BYTES_PER_WORKER: int = 32 * 1024**2
+# Rough peak memory of a worker per byte of input file (text parsed into a DataFrame).
+MEMORY_PER_INPUT_BYTE: float = 4.0
+# Files smaller than this are grouped into batches.
+SMALL_FILE_BYTES: int = 4 * 1024**2
+BATCH_MAX_BYTES: int = 16 * 1024**2
+BATCH_MAX_FILES: int = 32
+# Batching never leaves fewer than this many tasks per worker.
+MIN_TASKS_PER_WORKER: int = 4
+
+
+def file_sizes(paths: Iterable[Path]) -> list[int]:
+    """Return the size in bytes of each path; files that cannot be read count as 0."""
+    sizes: list[int] = []
+    for path in paths:
+        try:
+            sizes.append(path.stat().st_size)
+        except OSError:
+            sizes.append(0)
+    return sizes
+
+
+def largest_first(sizes: Sequence[int]) -> list[int]:
+    """Return item positions ordered by size, largest first; equal sizes keep their order."""
+    return sorted(range(len(sizes)), key=lambda position: -sizes[position])
+
+
+def available_memory() -> int | None:
+    """Return the memory available to new processes in bytes, or None when psutil is not installed."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return int(psutil.virtual_memory().available)
+
+
+def size_aware_pool_size(sizes: Sequence[int], memory: int | None = None) -> int:
+    """Return the number of workers for items of the given ``sizes``.
+
+    The pool is the smallest of:
+      * the CPU cores less one (at most ``MAX_POOL_WORKERS``);
+      * the number of items;
+      * the larger of a third of the items and one worker per ``BYTES_PER_WORKER`` of input;
+      * the number of the largest items whose combined working set fits in ``memory``.
+
+    Args:
+        sizes (Sequence[int]): Size in bytes of each item.
+        memory (int | None): Bytes available to the workers. Defaults to :func:`available_memory`;
+            no memory limit is applied when that is unknown.
+
+    Returns:
+        int: The pool size, at least 1."""
+    if not sizes:
+        return 1
+    available_cores: int = min(multiprocessing.cpu_count(), MAX_POOL_WORKERS)
+    workers: int = min(available_cores - 1, len(sizes)) if available_cores > 1 else 1
+    total_bytes: int = sum(sizes)
+    workers = min(workers, max(len(sizes) // 3, math.ceil(total_bytes / BYTES_PER_WORKER)))
+
+    memory = available_memory() if memory is None else memory
+    if memory is not None:
+        # Items start largest first, so the first wave of workers holds the largest items together.
+        working_set: float = 0.0
+        fitting: int = 0
+        for position in largest_first(sizes)[:workers]:
+            working_set += sizes[position] * MEMORY_PER_INPUT_BYTE
+            if fitting and working_set > memory:
+                break
+            fitting += 1
+        if fitting < workers:
+            logger.info(f"Limiting the pool to {fitting} workers to fit the largest files in available memory.")
+        workers = fitting
+    return max(workers, 1)
+
+
+def plan_batches(sizes: Sequence[int], workers: int) -> list[list[int]]:
+    """Group item positions into tasks, largest first.
+
+    Items of ``SMALL_FILE_BYTES`` or more get a task each. Smaller items are packed in order into
+    batches of up to ``BATCH_MAX_BYTES`` and ``BATCH_MAX_FILES`` items. Batches shrink so there are
+    still at least ``MIN_TASKS_PER_WORKER`` tasks per worker to balance the load at the end.
+
+    Args:
+        sizes (Sequence[int]): Size in bytes of each item.
+        workers (int): Number of pool workers.
+
+    Returns:
+        list[list[int]]: The item positions of each task, in submission order."""
+    order: list[int] = largest_first(sizes)
+    small_count: int = sum(1 for size in sizes if size < SMALL_FILE_BYTES)
+    max_files: int = max(1, min(BATCH_MAX_FILES, small_count // (max(workers, 1) * MIN_TASKS_PER_WORKER)))
+
+    tasks: list[list[int]] = []
+    batch: list[int] = []
+    batch_bytes: int = 0
+    for position in order:
+        size: int = sizes[position]
+        if size >= SMALL_FILE_BYTES:
+            tasks.append([position])
+            continue
+        batch.append(position)
+        batch_bytes += size
+        if len(batch) >= max_files or batch_bytes >= BATCH_MAX_BYTES:
+            tasks.append(batch)
+            batch, batch_bytes = [], 0
+    if batch:
+        tasks.append(batch)
+    return tasks
@@ -1,5 +1,6 @@
 # ryan_library\scripts\RORB\closure_durations.py
 
+import concurrent.futures as cf
 from datetime import datetime
 from pathlib import Path
 from collections.abc import Iterable
@@ -15,7 +16,8 @@ from ryan_library.functions.RORB.read_rorb_files import (
     analyze_hydrograph,
 )
 from ryan_library.functions.loguru_helpers import setup_logger
-from ryan_library.functions.pandas.median_calc import median_stats as median_stats_func
+from ryan_library.functions.misc_functions import calculate_pool_size
+from ryan_library.functions.pandas.median_calc import grouped_median_statistics
 
 
 def _collect_batch_data(paths: Iterable[Path]) -> pd.DataFrame:
@@ -25,66 +27,97 @@ def _collect_batch_data(paths: Iterable[Path]) -> pd.DataFrame:
     return pd.concat(objs=dfs, ignore_index=True) if dfs else pd.DataFrame()
 
 
-def _process_hydrographs(batch_df: pd.DataFrame, thresholds: list[float]) -> pd.DataFrame:
-    records: list[pd.DataFrame] = []
-    for _, row in batch_df.iterrows():
-        rec: DataFrame = analyze_hydrograph(
-            aep=str(row["AEP"]),
-            duration=str(row["Duration"]),
-            tp=int(row["TPat"]),
-            csv_path=Path(row["csv"]),
-            out_path=Path(row["Path"]),
-            thresholds=thresholds,
+def _hydrograph_tasks(batch_df: pd.DataFrame) -> list[tuple[str, str, int, Path, Path]]:
+    """Return the ``analyze_hydrograph`` arguments for every run in ``batch_df``."""
+    return [
+        (str(aep), str(duration), int(tp), Path(csv), Path(out_path))
+        for aep, duration, tp, csv, out_path in zip(
+            batch_df["AEP"], batch_df["Duration"], batch_df["TPat"], batch_df["csv"], batch_df["Path"]
         )
-        if not rec.empty:
-            records.append(rec)
+    ]
+
+
+def _analyze_hydrograph_worker(task: tuple[str, str, int, Path, Path], thresholds: list[float]) -> pd.DataFrame:
+    aep, duration, tp, csv_path, out_path = task
+    return analyze_hydrograph(
+        aep=aep, duration=duration, tp=tp, csv_path=csv_path, out_path=out_path, thresholds=thresholds
+    )
+
+
+def _process_hydrographs(
+    batch_df: pd.DataFrame,
+    thresholds: list[float],
+    max_workers: int | None = None,
+    chunksize: int = 8,
+) -> pd.DataFrame:
+    """Analyse every hydrograph CSV referenced by ``batch_df``.
+
+    Args:
+        batch_df (pd.DataFrame): Runs parsed from the ``batch.out`` files.
+        thresholds (list[float]): Flow thresholds.
+        max_workers (int | None): Process pool size. None sizes the pool from the number of CSVs and
+            CPU cores; 1 (or a single CSV) analyses the files in this process.
+        chunksize (int): Task chunk size for the process pool.
+
+    Returns:
+        pd.DataFrame: Exceedance records of all hydrographs, in ``batch_df`` order."""
+    tasks: list[tuple[str, str, int, Path, Path]] = _hydrograph_tasks(batch_df=batch_df)
+    workers: int = calculate_pool_size(num_files=len(tasks)) if max_workers is None else max_workers
+    if workers <= 1 or len(tasks) <= 1:
+        results: Iterable[DataFrame] = (_analyze_hydrograph_worker(task, thresholds) for task in tasks)
+        records: list[pd.DataFrame] = [rec for rec in results if not rec.empty]
+    else:
+        logger.info(f"Analysing {len(tasks)} hydrograph CSV file(s) with {workers} processes.")
+        with cf.ProcessPoolExecutor(max_workers=workers) as executor:
+            records = [
+                rec
+                for rec in executor.map(
+                    _analyze_hydrograph_worker, tasks, (thresholds for _ in tasks), chunksize=chunksize
+                )
+                if not rec.empty
+            ]
     return pd.concat(records, ignore_index=True) if records else pd.DataFrame()
 
 
 def _summarise_results(df: pd.DataFrame) -> pd.DataFrame:
-    final_columns: list[str] = [
-        "Path",
-        "Location",
-        "ThresholdFlow",
-        "AEP",
-        "Central_Value",
-        "Critical_Duration",
-        "Critical_Tp",
-        "Low_Value",
-        "High_Value",
-        "Average_Value",
-        "Closest_Tpcrit",
-        "Closest_Value",
-    ]
-    finaldb = pd.DataFrame(columns=final_columns)
-    grouped = df.groupby(["out_path", "Location", "ThresholdFlow", "AEP"])
-    for name, group in grouped:
-        stats, _ = median_stats_func(group, "Duration_Exceeding", "TP", "Duration")
-        row = list(name) + [
-            stats.get("median"),
-            stats.get("median_duration"),
-            stats.get("median_TP"),
-            stats.get("low"),
-            stats.get("high"),
-            stats.get("mean_including_zeroes"),
-            stats.get("median_TP"),
-            stats.get("median"),
-        ]
-        finaldb.loc[len(finaldb)] = row
-    finaldb.columns = final_columns
-    return finaldb
+    stats: DataFrame = grouped_median_statistics(
+        df=df,
+        group_cols=["out_path", "Location", "ThresholdFlow", "AEP"],
+        stat_col="Duration_Exceeding",
+        tp_col="TP",
+        dur_col="Duration",
+    )
+    return pd.DataFrame(
+        {
+            "Path": stats["out_path"],
+            "Location": stats["Location"],
+            "ThresholdFlow": stats["ThresholdFlow"],
+            "AEP": stats["AEP"],
+            "Central_Value": stats["median"],
+            "Critical_Duration": stats["median_duration"],
+            "Critical_Tp": stats["median_TP"],
+            "Low_Value": stats["low"],
+            "High_Value": stats["high"],
+            "Average_Value": stats["mean_including_zeroes"],
+            "Closest_Tpcrit": stats["median_TP"],
+            "Closest_Value": stats["median"],
+        }
+    )
 
 
 def run_closure_durations(
     paths: Iterable[Path] | None = None,
     thresholds: list[float] | None = None,
     log_level: str = "INFO",
+    max_workers: int | None = None,
 ) -> None:
     """Process ``batch.out`` files under ``paths`` and report closure durations.
 
     Parameters can be overridden to specify custom folders or flow thresholds.
     ``paths`` defaults to the current working directory when ``None``.
     ``thresholds`` defaults to a wide range of increasing flow values.
+    ``max_workers`` sets the process pool used for the hydrograph CSVs; ``None`` sizes it
+    automatically and ``1`` processes them serially.
     """
     if paths is None:
         paths = [Path.cwd()]
@@ -98,7 +131,9 @@ def run_closure_durations(
         if batch_df.empty:
             logger.warning("No batch.out data found.")
             return
-        result_df: DataFrame = _process_hydrographs(batch_df=batch_df, thresholds=threshold_values)
+        result_df: DataFrame = _process_hydrographs(
+            batch_df=batch_df, thresholds=threshold_values, max_workers=max_workers
+        )
         if result_df.empty:
             logger.warning("No hydrograph data processed.")
             return
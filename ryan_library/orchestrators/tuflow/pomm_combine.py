@@ -16,6 +16,7 @@ from loguru import logger
 from ryan_library.functions.tuflow.tuflow_common import collect_files, process_files_in_parallel
 from ryan_library.processors.tuflow.base_processor import BaseProcessor
 from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
+from ryan_library.processors.tuflow.processor_transport import TransportMode
 from ryan_library.functions.file_utils import ensure_output_directory
 from ryan_library.functions.misc_functions import ExcelExporter
 from ryan_library.classes.suffixes_and_dtypes import SuffixesConfig
@@ -32,6 +33,8 @@ def main_processing(
     console_log_level: str = "INFO",
     locations_to_include: Collection[str] | None = None,
     export_mode: Literal["excel", "parquet", "both"] = "excel",
+    cache_dir: Path | None = None,
+    transport: TransportMode = "processor",
 ) -> None:
     """
     Generate merged culvert data and export the results.
@@ -48,6 +51,9 @@ def main_processing(
         console_log_level: Logging verbosity ("INFO", "DEBUG", etc.).
         locations_to_include: Specific location strings to filter for.
         export_mode: Output format ("excel", "parquet", "both").
+        cache_dir: Optional processor cache folder; unchanged result files are reused instead of re-parsed.
+        transport: How workers return results. ``"arrow"`` ships only the processed DataFrame as an Arrow
+            buffer, which is faster and lighter for large result sets.
     """
 
     requested_types, invalid_types = normalize_data_types(
@@ -84,6 +90,8 @@ def main_processing(
             log_queue=log_queue,
             log_level=console_log_level,
             entity_filters=normalized_locations if normalized_locations else None,
+            cache_dir=cache_dir,
+            transport=transport,
         )
 
         export_results(results=results_set, export_mode=export_mode)
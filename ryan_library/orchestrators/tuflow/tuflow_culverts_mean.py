@@ -13,13 +13,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 from pandas.api.types import is_numeric_dtype
 
 from ryan_library.functions.loguru_helpers import setup_logger
 from ryan_library.functions.misc_functions import ExcelExporter
-from ryan_library.functions.pandas.median_calc import upper_middle_row, upper_middle_value
+from ryan_library.functions.pandas.median_calc import sorted_group_positions, take_values
 from ryan_library.functions.tuflow.tuflow_common import bulk_read_and_merge_tuflow_csv
 from ryan_library.functions.tuflow.wrapper_helpers import normalize_data_types, warn_on_invalid_types
 from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
@@ -256,24 +257,23 @@ def _find_culvert_aep_dur_statistic(aggregated_df: pd.DataFrame, statistic: Stat
         return pd.DataFrame()
 
     grouped = aggregated_df.groupby(group_columns, observed=True)
+    # Group number of every row (in the sorted group order of ``count_df``); -1 for rows with a missing key.
+    group_codes: np.ndarray = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+
+    count_df: pd.DataFrame = grouped.size().rename("count").reset_index()
+    count_df["count"] = count_df["count"].astype("Int64")
 
     # Calculate statistic values for all numeric columns.
     if statistic == "mean":
         statistic_df: pd.DataFrame = grouped[numeric_columns].mean(numeric_only=True).reset_index()
     else:
-        statistic_rows: list[dict[str, object]] = []
-        for key, group in grouped:
-            statistic_entry: dict[str, object] = _group_key_values(group_columns=group_columns, key=key)
-            for column in numeric_columns:
-                statistic_entry[column] = upper_middle_value(group=group, value_column=column)
-            statistic_rows.append(statistic_entry)
-        statistic_df = pd.DataFrame(data=statistic_rows)
+        statistic_df = _group_key_frame(count_df=count_df, group_columns=group_columns)
+        for column in numeric_columns:
+            median_rows: np.ndarray = _upper_middle_rows(values=aggregated_df[column], group_codes=group_codes)
+            statistic_df[column] = take_values(series=aggregated_df[column], positions=median_rows)
     rename_map: dict[str, str] = {column: f"{statistic}_{column}" for column in numeric_columns}
     statistic_df = statistic_df.rename(columns=rename_map)
 
-    count_df: pd.DataFrame = grouped.size().rename("count").reset_index()
-    count_df["count"] = count_df["count"].astype("Int64")
-
     # Determine min/max values for key columns
     range_columns: list[str] = [column for column in ADOPTED_SOURCE_COLUMNS if column in aggregated_df.columns]
     min_df: pd.DataFrame = pd.DataFrame()
@@ -286,35 +286,15 @@ def _find_culvert_aep_dur_statistic(aggregated_df: pd.DataFrame, statistic: Stat
         max_df = max_df.rename(columns={column: f"max_{column}" for column in range_columns})
 
     # "Adopt" values from the run closest to the target Q statistic.
-    adopted_rows: list[dict[str, object]] = []
+    adopted_df: pd.DataFrame = pd.DataFrame()
     if range_columns:
-        for key, group in grouped:
-            adopted_entry: dict[str, object] = _group_key_values(group_columns=group_columns, key=key)
-
-            q_series = pd.to_numeric(group.get("Q"), errors="coerce") if "Q" in group.columns else None
-            if q_series is not None and q_series.notna().any():
-                if statistic == "mean":
-                    target_q = float(q_series.mean())
-                    # Find index of value closest to the statistic.
-                    idx = (q_series - target_q).abs().idxmin()
-                    closest_row = group.loc[idx]
-                else:
-                    closest_row = upper_middle_row(group=group, value_column="Q")
-                for column in range_columns:
-                    adopted_entry[f"adopted_{column}"] = closest_row.get(column, pd.NA)
-                for column in ADOPTED_CONTEXT_COLUMNS:
-                    if column in group.columns:
-                        adopted_entry[f"adopted_{column}"] = closest_row.get(column, pd.NA)
-            else:
-                for column in range_columns:
-                    adopted_entry[f"adopted_{column}"] = pd.NA
-                for column in ADOPTED_CONTEXT_COLUMNS:
-                    if column in group.columns:
-                        adopted_entry[f"adopted_{column}"] = pd.NA
-
-            adopted_rows.append(adopted_entry)
-
-    adopted_df: pd.DataFrame = pd.DataFrame(data=adopted_rows) if adopted_rows else pd.DataFrame()
+        adopted_rows: np.ndarray = _adopted_rows(
+            aggregated_df=aggregated_df, group_codes=group_codes, group_count=len(count_df), statistic=statistic
+        )
+        adopted_df = _group_key_frame(count_df=count_df, group_columns=group_columns)
+        context_columns: list[str] = [column for column in ADOPTED_CONTEXT_COLUMNS if column in aggregated_df.columns]
+        for column in range_columns + context_columns:
+            adopted_df[f"adopted_{column}"] = take_values(series=aggregated_df[column], positions=adopted_rows)
 
     # Merge everything together
     merged: pd.DataFrame = count_df.copy()
@@ -398,12 +378,49 @@ def _find_culvert_aep_statistic_max(aep_dur_stat: pd.DataFrame, statistic: Stati
     return result.loc[:, ordered_columns]
 
 
-def _group_key_values(group_columns: list[str], key: object) -> dict[str, object]:
-    """Return grouping column values for a pandas groupby key."""
+def _group_key_frame(count_df: pd.DataFrame, group_columns: list[str]) -> pd.DataFrame:
+    """Return the grouping columns of ``count_df`` with categoricals decoded to plain values."""
+
+    return pd.DataFrame({column: take_values(series=count_df[column]) for column in group_columns})
+
 
-    if isinstance(key, tuple):
-        return dict(zip(group_columns, key, strict=False))
-    return {group_columns[0]: key}
+def _upper_middle_rows(values: pd.Series, group_codes: np.ndarray) -> np.ndarray:
+    """Return the row position of the upper-middle value of every group, as ``upper_middle_row`` picks it."""
+
+    numeric: np.ndarray = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    sorted_rows, starts, sizes = sorted_group_positions(codes=group_codes, values=numeric)
+    return sorted_rows[starts + sizes // 2]
+
+
+def _adopted_rows(
+    aggregated_df: pd.DataFrame, group_codes: np.ndarray, group_count: int, statistic: StatisticName
+) -> np.ndarray:
+    """Return the row position of the run adopted for every group, or -1 when the group has no numeric Q.
+
+    For the median this is the upper-middle Q record; for the mean it is the first record (in row order)
+    whose Q is closest to the group mean."""
+
+    adopted: np.ndarray = np.full(group_count, -1, dtype=np.int64)
+    if "Q" not in aggregated_df.columns:
+        return adopted
+    q_values: np.ndarray = pd.to_numeric(aggregated_df["Q"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    measured: np.ndarray = np.flatnonzero((group_codes >= 0) & ~np.isnan(q_values))
+    measured_codes: np.ndarray = group_codes[measured]
+    has_q: np.ndarray = np.bincount(measured_codes, minlength=group_count) > 0
+
+    if statistic == "median":
+        median_rows: np.ndarray = _upper_middle_rows(values=aggregated_df["Q"], group_codes=group_codes)
+        adopted[has_q] = median_rows[has_q]
+        return adopted
+
+    target_q: np.ndarray = (
+        pd.Series(q_values[measured]).groupby(measured_codes).mean().reindex(range(group_count)).to_numpy()
+    )
+    distance: np.ndarray = np.abs(q_values[measured] - target_q[measured_codes])
+    nearest: np.ndarray = measured[np.lexsort((measured, distance, measured_codes))]
+    nearest_groups, first = np.unique(group_codes[nearest], return_index=True)
+    adopted[nearest_groups] = nearest[first]
+    return adopted
 
 
 def _preferred_metric_column(aep_dur_stat: pd.DataFrame, statistic: StatisticName) -> str | None:
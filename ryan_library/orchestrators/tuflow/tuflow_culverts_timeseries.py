@@ -20,6 +20,7 @@ from ryan_library.functions.tuflow.tuflow_common import bulk_read_and_merge_tufl
 from ryan_library.functions.tuflow.wrapper_helpers import normalize_data_types, warn_on_invalid_types
 from ryan_library.processors.tuflow.base_processor import BaseProcessor
 from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
+from ryan_library.processors.tuflow.processor_transport import TransportMode
 
 DEFAULT_DATA_TYPES: tuple[str, ...] = ("Q", "V", "H", "CF", "Chan", "EOF")
 ACCEPTED_DATA_TYPES: frozenset[str] = frozenset(DEFAULT_DATA_TYPES)
@@ -32,6 +33,8 @@ def main_processing(
     locations_to_include: Collection[str] | None = None,
     output_dir: Path | None = None,
     export_mode: Literal["excel", "parquet", "both"] = "excel",
+    cache_dir: Path | None = None,
+    transport: TransportMode = "processor",
 ) -> None:
     """
     Driver for culvert-timeseries exports.
@@ -45,6 +48,9 @@ def main_processing(
         locations_to_include: Specific location IDs to filter for.
         output_dir: Destination directory for the export.
         export_mode: "excel", "parquet", or "both".
+        cache_dir: Optional processor cache folder; unchanged result files are reused instead of re-parsed.
+        transport: How workers return results. ``"arrow"`` ships only the processed DataFrame as an Arrow
+            buffer, which is faster and lighter for large result sets.
     """
     requested_types, invalid_types = normalize_data_types(
         requested=include_data_types,
@@ -67,6 +73,8 @@ def main_processing(
             include_data_types=requested_types,
             log_queue=log_queue,
             console_log_level=console_log_level,
+            cache_dir=cache_dir,
+            transport=transport,
         )
 
         if normalized_locations:
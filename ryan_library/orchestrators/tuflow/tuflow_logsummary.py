@@ -14,13 +14,16 @@ import pandas as pd
 from loguru import logger
 from ryan_library.functions.dashboard_workflow import run_dashboard_workflow
 from ryan_library.functions.file_utils import find_files_parallel
-from ryan_library.functions.misc_functions import calculate_pool_size, save_to_excel
+from ryan_library.functions.misc_functions import save_to_excel
 from ryan_library.functions.path_stuff import convert_to_relative_path
 from ryan_library.functions.live_dashboard import LiveWorkflowDashboard, WorkflowColumn, WorkflowStatus
+from ryan_library.functions.log_summary_store import LogSummaryStore
 from ryan_library.functions.loguru_helpers import setup_logger
+from ryan_library.functions.work_scheduling import file_sizes, size_aware_pool_size
 from ryan_library.functions.parse_tlf import (
     search_for_completion,
-    read_log_file,
+    read_log_file,  # noqa: F401 - re-exported by ryan_library.scripts.tuflow.tuflow_logsummary
+    read_log_tail,
     process_top_lines,
     finalise_data,
     is_complete_tlf,
@@ -55,9 +58,9 @@ def process_log_file(logfile: Path) -> pd.DataFrame:
     Processes a single log file and returns a DataFrame with the extracted data.
 
     This function attempts to:
-      1. Read the log file.
-      2. Check for simulation completion status (by looking at the end of the file/last 100 lines).
-      3. If complete, parse the header lines using `process_top_lines` to extract variables and settings.
+      1. Read the last 100 lines of the log file (seeking from the end, not reading the whole file).
+      2. Check for simulation completion status in those lines.
+      3. If complete, stream the header lines through `process_top_lines` to extract variables and settings.
       4. Finalize the data dict into a single-row DataFrame.
 
     Args:
@@ -108,16 +111,9 @@ def _process_log_file_dataframe(logfile: Path) -> pd.DataFrame:
     data_dict: dict[str, str | float] = {}
     current_section = None
 
-    file_size: int = logfile_path.stat().st_size
-    is_large_file: bool = file_size > 10 * 1024 * 1024  # 10 MB
-
-    lines: list[str] = read_log_file(
-        logfile_path=logfile_path,
-        is_large_file=is_large_file,
-    )
-    # large file currently does nothing - can be a problem if there are lots of errors logged in the file
-
-    # lines_reversed = list(reversed(lines))
+    # Only the tail (completion summary) and the head (build info, variables) are read, so memory and
+    # I/O do not grow with the size of the log.
+    lines: list[str] = read_log_tail(logfile_path=logfile_path)
 
     if not lines:
         return pd.DataFrame()
@@ -127,7 +123,7 @@ def _process_log_file_dataframe(logfile: Path) -> pd.DataFrame:
     logger.info(f"Processing {runcode} : {relative_logfile_path}")
 
     logger.debug(f"search_for_completion: {runcode}")
-    for line in lines[-100:]:
+    for line in lines:
         data_dict, sim_complete, current_section = search_for_completion(
             line=line,
             data_dict=data_dict,
@@ -142,13 +138,13 @@ def _process_log_file_dataframe(logfile: Path) -> pd.DataFrame:
     if is_complete_tlf(data_dict=data_dict, sim_complete=sim_complete):
         data_dict, success, spec_events, spec_scen, spec_var = process_top_lines(
             logfile_path=logfile_path,
-            lines=lines,  # if not is_large_file else [],
+            lines=None,
             data_dict=data_dict,
             success=success,
             spec_events=spec_events,
             spec_scen=spec_scen,
             spec_var=spec_var,
-            is_large_file=is_large_file,
+            is_large_file=True,
             runcode=runcode,
             relative_logfile_path=relative_logfile_path,
         )
@@ -180,12 +176,18 @@ def main_processing(
     use_live_dashboard: bool = True,
     live_refresh_per_second: float = 2.0,
     live_max_rows: int = 25,
+    directory_index: Path | None = None,
+    summary_store: Path | None = None,
 ) -> None:
     """
     Main function to process log files using multiprocessing.
 
     Finds all *.tlf files in the current working directory (excluding hpc/gpu logs recursively),
     distributes processing across a process pool, and aggregates the results into an Excel report.
+    When ``directory_index`` is given, the directory listings stored there are reused for folders
+    that have not changed since the previous run.
+    When ``summary_store`` is given, completed logs whose size and mtime match a row stored there by
+    a previous run are not parsed again; their stored rows are merged with the newly parsed ones.
     """
     # log_dir = Path.home() / "Documents" / "MyAppLogs"
     # log_file = "tuflow_logsummary.log"
@@ -204,16 +206,28 @@ def main_processing(
                 root_dirs=[root_dir],
                 patterns="*.tlf",
                 excludes=["*.hpc.tlf", "*.gpu.tlf"],
+                directory_index=directory_index,
             )
         )
 
         logger.info(f"Found {len(files)} log files.")
 
+        store: LogSummaryStore | None = LogSummaryStore(store_path=summary_store) if summary_store else None
+        to_parse: list[Path] = files
+        if store is not None:
+            cached_rows, to_parse = store.partition(files=files)
+            processing_results.extend(
+                LogFileProcessingResult(logfile=logfile, data_frame=data_frame, status="OK", detail="cached")
+                for logfile, data_frame in cached_rows.items()
+            )
+            logger.info(f"Reusing {len(cached_rows)} stored summaries; {len(to_parse)} log files to parse.")
+
         if not files:
             logger.warning("No log files found to process.")
-        else:
-            pool_size = calculate_pool_size(num_files=len(files))
-            logger.info(f"Processing {len(files)} files using {pool_size} processes.")
+        elif to_parse:
+            sizes: list[int] = file_sizes(paths=to_parse)
+            pool_size = size_aware_pool_size(sizes=sizes)
+            logger.info(f"Processing {len(to_parse)} files using {pool_size} processes.")
 
             dashboard = LiveWorkflowDashboard(
                 title="TUFLOW Log Summary",
@@ -224,27 +238,37 @@ def main_processing(
                 columns=LOG_SUMMARY_DASHBOARD_COLUMNS,
             )
             dashboard.set_tasks(
-                labels=[_format_dashboard_label(logfile=file) for file in files],
-                metadata=[{"size": _format_bytes(file.stat().st_size)} for file in files],
+                labels=[_format_dashboard_label(logfile=file) for file in to_parse],
+                metadata=[{"size": _format_bytes(size)} for size in sizes],
             )
-            dashboard.set_extra_metrics(metrics={"workers": pool_size})
+            metrics: dict[str, object] = {"workers": pool_size}
+            if store is not None:
+                metrics.update(cached=len(files) - len(to_parse), parsed=len(to_parse))
+            dashboard.set_extra_metrics(metrics=metrics)
 
             # LogSummary owns TLF parsing and result shaping; the shared helper
             # owns serial/process-pool execution and dashboard state updates.
-            processing_results.extend(
-                run_dashboard_workflow(
-                    items=files,
-                    process_item=process_log_file_for_dashboard,
-                    dashboard=dashboard,
-                    pool_size=pool_size,
-                    status_for_result=_dashboard_status,
-                    detail_for_result=_dashboard_detail,
-                    log_queue=log_queue,
-                    worker_log_level="ERROR" if use_live_dashboard else console_log_level,
-                    max_start_events=max(pool_size * 2, live_max_rows),
-                )
+            parsed_results: list[LogFileProcessingResult] = run_dashboard_workflow(
+                items=to_parse,
+                process_item=process_log_file_for_dashboard,
+                dashboard=dashboard,
+                pool_size=pool_size,
+                status_for_result=_dashboard_status,
+                detail_for_result=_dashboard_detail,
+                log_queue=log_queue,
+                worker_log_level="ERROR" if use_live_dashboard else console_log_level,
+                max_start_events=max(pool_size * 2, live_max_rows),
+                item_sizes=sizes,
             )
-            _log_processing_results(processing_results=processing_results)
+            processing_results.extend(parsed_results)
+            _log_processing_results(processing_results=parsed_results)
+            if store is not None:
+                for result in parsed_results:
+                    if result.status == "OK":
+                        store.put(path=result.logfile, data_frame=result.data_frame)
+
+        if store is not None:
+            store.save(keep=files)
 
         # Keep output rows aligned with the original file discovery order.
         if files:
@@ -20,6 +20,7 @@ from ryan_library.classes.suffixes_and_dtypes import (
 )
 from ryan_library.classes.tuflow_string_classes import TuflowStringParser
 from ryan_library.functions.dataframe_helpers import reorder_long_columns
+from .run_dimension import RunMetadata, compact_frame, expand_frame
 
 
 # Custom Exceptions
@@ -73,6 +74,8 @@ class BaseProcessor(ABC):
     applied_location_filter: frozenset[str] | None = field(default=None, init=False, repr=False)
     applied_entity_filter: frozenset[str] | None = field(default=None, init=False, repr=False)
     entity_filter: frozenset[str] | None = field(default=None, repr=False)
+    # Metadata columns moved out of ``df`` by :meth:`compact_run_metadata`.
+    run_metadata: RunMetadata | None = field(default=None, init=False, repr=False)
 
     # Define _processor_cache as a ClassVar to make it a class variable
     _processor_cache: ClassVar[dict[tuple[str, str], type["BaseProcessor"]]] = {}
@@ -446,6 +449,38 @@ class BaseProcessor(ABC):
         self.additional_attributes_to_df()
         self.reorder_long_text_columns()
 
+    def run_metadata_columns(self) -> list[str]:
+        """Return the names of the per-file metadata columns added by :meth:`add_common_columns`."""
+        return [
+            "internalName",
+            *self.PATH_INFO_COLUMNS,
+            *self.name_parser.run_code_parts,
+            "trim_runcode",
+            *(f"{attr}_{kind}" for kind in ("text", "numeric") for attr in ("tp", "duration", "aep")),
+        ]
+
+    def compact_run_metadata(self) -> bool:
+        """Move the single-valued metadata columns out of ``df`` into :attr:`run_metadata`.
+
+        ``df`` becomes a fact table of the measured values; :meth:`expanded_df` rebuilds the full frame.
+
+        Returns:
+            bool: True if ``df`` is (now) compact."""
+        if self.run_metadata is not None:
+            return True
+        compacted: tuple[DataFrame, RunMetadata] | None = compact_frame(df=self.df, columns=self.run_metadata_columns())
+        if compacted is None:
+            return False
+        self.df, self.run_metadata = compacted
+        logger.debug(f"{self.file_name}: Moved {len(self.run_metadata.dtypes)} metadata columns to the run dimension.")
+        return True
+
+    def expanded_df(self) -> DataFrame:
+        """Return ``df`` with any compacted metadata columns restored in their original positions."""
+        if self.run_metadata is None:
+            return self.df
+        return expand_frame(df=self.df, metadata=self.run_metadata)
+
     def build_basic_info_payload(self) -> dict[str, str | NAType]:
         """Build the core metadata payload derived from the source file."""
         resolved_path: Path = self.resolved_file_path
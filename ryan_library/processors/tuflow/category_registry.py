@@ -0,0 +1,173 @@
+# ryan_library/processors/tuflow/category_registry.py
+"""Collection-wide category dictionaries for the categorical metadata columns.
+
+Every processor stores ``internalName``, ``trim_runcode``, ``R01``..``Rnn``, ``aep_text``, the path
+columns and so on as ordered categoricals holding a single category - its own value. Processors are
+built independently (often in worker processes) so their dtypes never match, and ``pd.concat``
+falls back to materialising every row as a Python string before ``reset_categorical_ordering``
+rebuilds the categoricals.
+
+:class:`CategoryRegistry` keeps one sorted dictionary per column for a whole collection.
+:meth:`CategoryRegistry.concat` translates each frame's few categories into registry codes, appends
+the integer codes, and concatenates only the remaining columns with pandas, so the categorical
+columns come out alphabetically ordered, holding only the categories that occur in the result."""
+
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from loguru import logger
+import numpy as np
+import pandas as pd
+from pandas import CategoricalDtype, DataFrame
+
+
+class CategoryRegistry:
+    """Sorted, append-only category dictionaries keyed by column name."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, set[Any]] = {}
+        self._category_dtypes: dict[str, Any] = {}
+        self._dtypes: dict[str, CategoricalDtype] = {}
+        self._lookups: dict[str, dict[Any, int]] = {}
+        self._conflicts: set[str] = set()
+        # Processor dtypes are reused across combine calls, so work done per dtype is kept by identity.
+        self._seen: dict[tuple[str, int], CategoricalDtype] = {}
+        self._mappings: dict[str, dict[int, tuple[CategoricalDtype, np.ndarray]]] = {}
+
+    def __contains__(self, column: object) -> bool:
+        return column in self._values and column not in self._conflicts
+
+    def register(self, df: DataFrame) -> list[str]:
+        """Add the categories of every categorical column in ``df``.
+
+        Returns:
+            list[str]: The categorical columns of ``df`` that can share a dictionary. A column whose
+                categories change type between frames (for example text in one and numbers in
+                another) is left to pandas."""
+        shared: list[str] = []
+        for column, dtype in df.dtypes.items():
+            if not isinstance(dtype, CategoricalDtype) or not isinstance(column, str) or column in self._conflicts:
+                continue
+            if self._seen.get((column, id(dtype))) is dtype:
+                shared.append(column)
+                continue
+            categories: pd.Index = dtype.categories
+            known_dtype: Any = self._category_dtypes.setdefault(column, categories.dtype)
+            if known_dtype != categories.dtype:
+                logger.debug(f"Column '{column}' mixes {known_dtype} and {categories.dtype} categories; not shared.")
+                self._conflicts.add(column)
+                continue
+            values: set[Any] = self._values.setdefault(column, set())
+            new_values: list[Any] = list(categories)
+            if not values.issuperset(new_values):
+                values.update(new_values)
+                self._dtypes.pop(column, None)
+                self._lookups.pop(column, None)
+                self._mappings.pop(column, None)
+            self._seen[(column, id(dtype))] = dtype
+            shared.append(column)
+        return shared
+
+    def dtype(self, column: str) -> CategoricalDtype:
+        """Return the ordered dtype holding every registered category of ``column``."""
+        dtype: CategoricalDtype | None = self._dtypes.get(column)
+        if dtype is None:
+            categories = pd.Index(sorted(self._values[column]), dtype=self._category_dtypes[column])
+            dtype = CategoricalDtype(categories=categories, ordered=True)
+            self._dtypes[column] = dtype
+            self._lookups[column] = {value: code for code, value in enumerate(categories)}
+        return dtype
+
+    def codes(self, column: str, values: pd.Categorical) -> np.ndarray:
+        """Return ``values`` re-encoded as codes of :meth:`dtype` (``-1`` for missing values)."""
+        self.dtype(column)
+        mappings: dict[int, tuple[CategoricalDtype, np.ndarray]] = self._mappings.setdefault(column, {})
+        cached: tuple[CategoricalDtype, np.ndarray] | None = mappings.get(id(values.dtype))
+        if cached is not None and cached[0] is values.dtype:
+            return cached[1][values.codes]
+        lookup: dict[Any, int] = self._lookups[column]
+        # The trailing -1 keeps missing values (code -1) missing.
+        mapping: np.ndarray = np.array([*(lookup[value] for value in values.categories), -1], dtype=np.int32)
+        mappings[id(values.dtype)] = (values.dtype, mapping)
+        return mapping[values.codes]
+
+    def concat(self, frames: list[DataFrame], batch_size: int = 500) -> DataFrame:
+        """Concatenate ``frames`` like ``pd.concat(frames, ignore_index=True, sort=False)``.
+
+        Categorical columns are encoded against the registry and appended as integer codes, then
+        reduced to the categories that occur in ``frames``; the other columns are concatenated by
+        pandas in batches of ``batch_size`` frames to limit peak memory.
+
+        Args:
+            frames (list[DataFrame]): Frames to stack.
+            batch_size (int): Number of frames per pandas concatenation.
+
+        Returns:
+            DataFrame: The stacked frames with their columns in order of first appearance."""
+        if not frames:
+            return DataFrame()
+
+        columns: list[Hashable] = list(dict.fromkeys(column for frame in frames for column in frame.columns))
+        frame_categoricals: list[list[str]] = [self.register(df=frame) for frame in frames]
+        # Only share columns that are categorical in every frame that has them.
+        candidates: set[str] = {column for shared in frame_categoricals for column in shared}
+        for frame, shared in zip(frames, frame_categoricals):
+            candidates.difference_update(set(frame.columns).intersection(candidates).difference(shared))
+        shared_columns: list[str] = [column for column in columns if column in candidates and column in self]
+
+        codes: dict[str, list[np.ndarray]] = {column: [] for column in shared_columns}
+        remainders: list[DataFrame] = []
+        shared_set: set[str] = set(shared_columns)
+        for frame in frames:
+            arrays: dict[str, Any] = {}
+            keep: list[int] = []
+            for position, (column, series) in enumerate(frame.items()):
+                if column in shared_set:
+                    arrays[column] = series.array
+                else:
+                    keep.append(position)
+            for column in shared_columns:
+                values: Any = arrays.get(column)
+                if values is None:
+                    codes[column].append(np.full(len(frame), -1, dtype=np.int32))
+                else:
+                    codes[column].append(self.codes(column=column, values=values))
+            # Positional selection is noticeably cheaper than ``drop`` for thousands of small frames.
+            remainders.append(frame.iloc[:, keep] if arrays else frame)
+
+        combined: DataFrame = _concat_batches(frames=remainders, batch_size=batch_size)
+        if len(combined.columns) == 0:
+            combined = DataFrame(index=pd.RangeIndex(sum(len(frame) for frame in frames)))
+        categoricals: dict[str, pd.Categorical] = {
+            column: _used_categories(codes=np.concatenate(column_codes), dtype=self.dtype(column=column))
+            for column, column_codes in codes.items()
+        }
+        if categoricals:
+            combined = combined.assign(**categoricals)
+        return combined[columns] if list(combined.columns) != columns else combined
+
+
+def _used_categories(codes: np.ndarray, dtype: CategoricalDtype) -> pd.Categorical:
+    """Build a categorical from registry ``codes``, keeping only the categories that occur.
+
+    The registry holds the categories of every processor in the collection, so a combined output
+    would otherwise carry values of unrelated processors into groupbys and pivots."""
+    present: np.ndarray = np.zeros(len(dtype.categories) + 1, dtype=bool)
+    present[codes] = True  # code -1 marks the trailing slot, which is ignored below
+    used: np.ndarray = present[:-1]
+    if used.all():
+        return pd.Categorical.from_codes(codes, dtype=dtype, validate=False)
+    remap: np.ndarray = np.append(np.cumsum(used, dtype=np.int32) - 1, np.int32(-1))
+    compact = CategoricalDtype(categories=dtype.categories[used], ordered=dtype.ordered)
+    return pd.Categorical.from_codes(remap[codes], dtype=compact, validate=False)
+
+
+def _concat_batches(frames: Iterable[DataFrame], batch_size: int) -> DataFrame:
+    frame_list: list[DataFrame] = list(frames)
+    batches: list[DataFrame] = [
+        pd.concat(frame_list[i : i + batch_size], ignore_index=True, sort=False)
+        for i in range(0, len(frame_list), batch_size)
+    ]
+    if len(batches) == 1:
+        return batches[0]
+    return pd.concat(batches, ignore_index=True, sort=False)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 from pandas import DataFrame, Series
@@ -59,78 +60,78 @@ class POProcessor(BaseProcessor):
         trimmed: DataFrame = raw_df.drop(columns=0)
         measurement_row = trimmed.iloc[0].fillna("")  # type: ignore
         location_row = trimmed.iloc[1].fillna("")  # type: ignore
-        data_rows: DataFrame = trimmed.iloc[2:]
 
         if measurement_row.empty or location_row.empty:
             logger.error(f"{self.file_name}: Missing measurement or location headers.")
             return pd.DataFrame(columns=self.VALUE_COLUMNS)
 
-        numeric_data: DataFrame = data_rows.apply(pd.to_numeric, errors="coerce")  # type: ignore
-        numeric_data.reset_index(drop=True, inplace=True)
-
         time_idx: int | None = self._locate_time_column(measurement_row=measurement_row, location_row=location_row)
         if time_idx is None:
             logger.error(f"{self.file_name}: Unable to locate a time column in the CSV header.")
             return pd.DataFrame(columns=self.VALUE_COLUMNS)
 
-        time_values = numeric_data.iloc[:, time_idx]
-        valid_mask: Series[bool] = ~time_values.isna()
-        if not valid_mask.any():
+        # Convert the whole data block in a single pass rather than column by column.
+        data_block: np.ndarray = trimmed.iloc[2:].to_numpy(dtype=object)
+        numeric: np.ndarray = (
+            pd.to_numeric(Series(data_block.ravel()), errors="coerce")  # type: ignore
+            .to_numpy(dtype="float64", na_value=np.nan)
+            .reshape(data_block.shape)
+        )
+
+        time_values: np.ndarray = numeric[:, time_idx]
+        valid_rows: np.ndarray = ~np.isnan(time_values)
+        if not valid_rows.any():
             logger.error(f"{self.file_name}: Time column does not contain any numeric values.")
             return pd.DataFrame(columns=self.VALUE_COLUMNS)
-
-        numeric_data = numeric_data.loc[valid_mask].reset_index(drop=True)
-        time_values = numeric_data.iloc[:, time_idx].astype("float64")
-
-        tidy_frames: list[pd.DataFrame] = []
-        for idx, (measurement, location) in enumerate(zip(measurement_row, location_row)):
-            measurement: str = str(measurement).strip()
-            location: str = str(location).strip()
-
-            if idx == time_idx:
-                continue
-            if not measurement or not location:
-                continue
-
-            values: Series[float] = numeric_data.iloc[:, idx].astype("float64")
-            if values.isna().all():
-                logger.debug(
-                    "Skipping column '%s'/'%s' because it contains only NaN values.",
-                    measurement,
-                    location,
-                )
-                continue
-
-            frame: DataFrame = pd.DataFrame(
-                {
-                    "Time": time_values,
-                    "Location": location,
-                    "Type": measurement,
-                    "Value": values,
-                }
-            ).dropna(  # type: ignore
-                subset=["Value"]
-            )  # type: ignore
-
-            if frame.empty:
-                logger.debug(
-                    "Skipping column '%s'/'%s' because it produced no valid rows after cleaning.",
-                    measurement,
-                    location,
-                )
-                continue
-
-            tidy_frames.append(frame)
-
-        if not tidy_frames:
+        numeric = numeric[valid_rows]
+        time_values = time_values[valid_rows]
+
+        measurements: np.ndarray = measurement_row.astype(str).str.strip().to_numpy(dtype=object)
+        locations: np.ndarray = location_row.astype(str).str.strip().to_numpy(dtype=object)
+        value_columns: np.ndarray = (measurements != "") & (locations != "")
+        value_columns[time_idx] = False
+        has_values: np.ndarray = ~np.isnan(numeric).all(axis=0)
+        skipped_empty: int = int((value_columns & ~has_values).sum())
+        if skipped_empty:
+            logger.debug(
+                f"{self.file_name}: Skipping {skipped_empty} measurement columns that contain only NaN values."
+            )
+        value_columns &= has_values
+
+        column_positions: np.ndarray = np.flatnonzero(value_columns)
+        if column_positions.size == 0:
             logger.warning(f"{self.file_name}: No measurement columns were parsed from the CSV.")
             return pd.DataFrame(columns=self.VALUE_COLUMNS)
 
-        combined: DataFrame = pd.concat(tidy_frames, ignore_index=True)
-        combined = combined[self.VALUE_COLUMNS]
-        combined.sort_values(by=["Location", "Type", "Time"], inplace=True)
-        combined.reset_index(drop=True, inplace=True)
-        return combined
+        # Long form, one block of time steps per measurement column.
+        row_count: int = time_values.size
+        values: np.ndarray = numeric[:, column_positions].ravel(order="F")
+        times: np.ndarray = np.tile(time_values, column_positions.size)
+        column_of_row: np.ndarray = np.repeat(np.arange(column_positions.size), row_count)
+        keep: np.ndarray = ~np.isnan(values)
+
+        location_categories, location_codes = self._sorted_categories(labels=locations[column_positions])
+        type_categories, type_codes = self._sorted_categories(labels=measurements[column_positions])
+        row_location_codes: np.ndarray = location_codes[column_of_row[keep]]
+        row_type_codes: np.ndarray = type_codes[column_of_row[keep]]
+        times = times[keep]
+        values = values[keep]
+
+        order: np.ndarray = np.lexsort((times, row_type_codes, row_location_codes))
+        return pd.DataFrame(
+            {
+                "Time": times[order],
+                "Location": pd.Categorical.from_codes(row_location_codes[order], categories=location_categories),
+                "Type": pd.Categorical.from_codes(row_type_codes[order], categories=type_categories),
+                "Value": values[order],
+            }
+        )
+
+    @staticmethod
+    def _sorted_categories(labels: np.ndarray) -> tuple[pd.Index, np.ndarray]:
+        """Return alphabetically sorted unique ``labels`` and the code of each label within them."""
+        categories, codes = np.unique(labels.astype(str), return_inverse=True)
+        return pd.Index(categories, dtype="str"), codes.astype("int32")
 
     @staticmethod
     def _locate_time_column(measurement_row: pd.Series, location_row: pd.Series) -> int | None:
@@ -0,0 +1,123 @@
+# ryan_library/processors/tuflow/polars_engine.py
+"""Optional Polars backend for the ``ProcessorCollection`` combine methods.
+
+Processor frames are handed to Polars as lazy frames so concatenation, grouping, sorting and
+the HW/D ratio run in one optimised query; the result is only converted back to pandas when it
+is collected. Polars knows nothing about the pandas categorical/string dtypes the rest of the
+pipeline relies on, so :func:`collect_like` casts the collected frame to a template produced by
+the pandas path, keeping Excel exports identical whichever engine built the frame."""
+
+from collections.abc import Iterable, Sequence
+import importlib.util
+from typing import Any, Literal
+
+from loguru import logger
+from pandas import DataFrame
+
+CombineEngine = Literal["pandas", "polars"]
+COMBINE_ENGINES: tuple[CombineEngine, ...] = ("pandas", "polars")
+
+
+def polars_available() -> bool:
+    """Return True when polars can be imported."""
+    return importlib.util.find_spec("polars") is not None
+
+
+def resolve_combine_engine(engine: str) -> CombineEngine:
+    """Validate ``engine``, falling back to pandas when polars is not installed."""
+    if engine not in COMBINE_ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Expected one of {COMBINE_ENGINES}.")
+    if engine == "polars" and not polars_available():
+        logger.warning("polars is not installed; falling back to the 'pandas' engine.")
+        return "pandas"
+    return engine
+
+
+def to_lazy(df: DataFrame) -> Any:
+    """Return ``df`` as a Polars LazyFrame with categoricals as plain strings.
+
+    Categories differ between processors, and the pandas path compares the values anyway."""
+    import polars as pl
+
+    frame: Any = pl.from_pandas(df)
+    categorical_columns: list[str] = [name for name, dtype in frame.schema.items() if dtype == pl.Categorical]
+    if categorical_columns:
+        frame = frame.with_columns(pl.col(categorical_columns).cast(pl.String))
+    return frame.lazy()
+
+
+def concat_lazy(frames: Iterable[Any]) -> Any:
+    """Stack LazyFrames by column name, null-filling columns missing from some frames."""
+    import polars as pl
+
+    return pl.concat(list(frames), how="diagonal_relaxed")
+
+
+def drop_existing(frame: Any, columns: Sequence[str]) -> Any:
+    """Drop the ``columns`` present in ``frame``."""
+    present: set[str] = set(frame.collect_schema().names())
+    return frame.drop([column for column in columns if column in present])
+
+
+def group_max(frame: Any, keys: Sequence[str]) -> Any:
+    """Polars equivalent of ``groupby(keys, observed=True).agg("max").reset_index()``.
+
+    pandas drops rows with a missing key and sorts the groups, so the same is done here."""
+    import polars as pl
+
+    key_list: list[str] = list(keys)
+    return (
+        frame.filter(pl.all_horizontal(pl.col(key_list).is_not_null()))
+        .group_by(key_list)
+        .agg(pl.all().max())
+        .sort(key_list)
+    )
+
+
+def with_hw_d_ratio(frame: Any) -> Any:
+    """Add ``HW_D = (US_h - US Invert) / Height``, mirroring ``ProcessorCollection._calculate_hw_d_ratio``."""
+    import polars as pl
+
+    columns: list[str] = frame.collect_schema().names()
+    us_h_col: str = "US_h" if "US_h" in columns else "US_H"
+    missing_columns: set[str] = {us_h_col, "US Invert", "Height"} - set(columns)
+    if missing_columns:
+        logger.debug(f"Skipping HW_D calculation; missing columns: {sorted(missing_columns)}")
+        return frame
+
+    us_h: Any = pl.col(us_h_col).cast(pl.Float64, strict=False)
+    us_invert: Any = pl.col("US Invert").cast(pl.Float64, strict=False)
+    height: Any = pl.col("Height").cast(pl.Float64, strict=False)
+    valid: Any = us_h.is_not_null() & us_invert.is_not_null() & height.is_not_null() & (height != 0)
+    return frame.with_columns(pl.when(valid).then((us_h - us_invert) / height).otherwise(None).alias("HW_D"))
+
+
+def collect_like(frame: Any, template: DataFrame) -> DataFrame:
+    """Collect ``frame`` into pandas with the column order and dtypes of ``template``.
+
+    Args:
+        frame: LazyFrame holding the combined data.
+        template: Output of the pandas path for the same columns (usually on a small sample).
+
+    Returns:
+        DataFrame: The collected data, aligned to ``template``."""
+    result: DataFrame = frame.collect().to_pandas()
+    if set(result.columns) != set(template.columns):
+        logger.warning(
+            "Polars result columns differ from the pandas layout: "
+            f"missing {sorted(set(template.columns) - set(result.columns))}, "
+            f"extra {sorted(set(result.columns) - set(template.columns))}."
+        )
+    ordered_columns: list[str] = [col for col in template.columns if col in result.columns]
+    result = result[ordered_columns + [col for col in result.columns if col not in template.columns]]
+
+    for col in ordered_columns:
+        target: Any = template[col].dtype
+        if result[col].dtype == target:
+            continue
+        try:
+            result[col] = result[col].astype(target)
+        except (TypeError, ValueError) as exc:
+            logger.debug(f"Keeping Polars dtype {result[col].dtype} for '{col}' (cannot cast to {target}: {exc})")
+    result.columns.name = template.columns.name
+    return result
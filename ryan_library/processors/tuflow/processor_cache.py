@@ -0,0 +1,188 @@
+# ryan_library/processors/tuflow/processor_cache.py
+"""Persistent on-disk cache of processed TUFLOW result files.
+
+Each entry holds the final ``BaseProcessor.df`` for one source file together with the
+signature it was produced from: resolved path, size, mtime, processor class, the options
+that change the output (entity filter, path columns) and a hash of the datatype
+configuration. A lookup only succeeds when the whole signature still matches, so edited
+result files, different filters or configuration changes are re-parsed automatically.
+"""
+
+from collections.abc import Collection
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+from typing import Any, ClassVar
+
+from loguru import logger
+from pandas import DataFrame
+
+from ryan_library.classes.suffixes_and_dtypes import Config, DataTypeDefinition
+from ryan_library.classes.tuflow_string_classes import TuflowStringParser
+from .base_processor import BaseProcessor
+from .processor_transport import rehydrate_processor
+
+CACHE_VERSION: int = 1
+
+
+@dataclass(slots=True, frozen=True)
+class CacheSignature:
+    """Everything that determines the processed output of a single source file."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    processor: str
+    config_hash: str
+    entity_filter: tuple[str, ...]
+    include_path_columns: bool
+    cwd: str | None
+    version: int = CACHE_VERSION
+
+    @property
+    def entry_name(self) -> str:
+        """Stable file name for the cache slot of this path/option combination.
+
+        Size, mtime and configuration are deliberately left out so a changed source file
+        overwrites its previous entry instead of leaving stale files behind."""
+        location: str = "|".join(
+            [self.path, ",".join(self.entity_filter), str(self.include_path_columns), self.cwd or ""]
+        )
+        return hashlib.sha1(location.encode("utf-8")).hexdigest()
+
+
+class ProcessorResultCache:
+    """Directory of pickled processor outputs keyed on :class:`CacheSignature`.
+
+    Entries are written as two consecutive pickles (signature, then DataFrame) so a
+    lookup only has to unpickle the small signature to decide whether the entry is
+    still valid."""
+
+    ENTRY_SUFFIX: ClassVar[str] = ".pkl"
+
+    def __init__(self, cache_dir: Path | str) -> None:
+        self.cache_dir: Path = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.config_hash: str = self.hash_configuration()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.writes: int = 0
+
+    @staticmethod
+    def hash_configuration(config: Config | None = None) -> str:
+        """Return a digest of the loaded datatype configuration."""
+        if config is None:
+            config = Config.get_instance()
+        payload: dict[str, Any] = {name: definition.to_dict() for name, definition in config.data_types.items()}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def build_signature(
+        self,
+        file_path: Path,
+        entity_filter: Collection[str] | None = None,
+        include_path_columns: bool = True,
+    ) -> CacheSignature | None:
+        """Return the signature for ``file_path`` or ``None`` if the file cannot be cached."""
+        try:
+            resolved_path: Path = file_path.resolve()
+            stat_result: os.stat_result = resolved_path.stat()
+        except OSError as exc:
+            logger.debug(f"Cannot stat {file_path} for the processor cache: {exc}")
+            return None
+
+        data_type: str | None = TuflowStringParser(file_path=resolved_path).data_type
+        if not data_type:
+            return None
+        definition: DataTypeDefinition | None = Config.get_instance().data_types.get(data_type)
+        if definition is None:
+            return None
+
+        # rel_path / rel_directory are relative to the CWD, so they only matter when path columns are kept.
+        cwd: str | None = str(Path.cwd().resolve()) if include_path_columns else None
+        return CacheSignature(
+            path=str(resolved_path),
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            processor=definition.processor,
+            config_hash=self.config_hash,
+            entity_filter=tuple(sorted(BaseProcessor.normalize_locations(locations=entity_filter))),
+            include_path_columns=include_path_columns,
+            cwd=cwd,
+        )
+
+    def entry_path(self, signature: CacheSignature) -> Path:
+        """Return the on-disk location of the entry for ``signature``."""
+        return self.cache_dir / f"{signature.entry_name}{self.ENTRY_SUFFIX}"
+
+    def load(self, file_path: Path, signature: CacheSignature) -> BaseProcessor | None:
+        """Rehydrate a processed processor for ``file_path`` if a matching entry exists."""
+        df: DataFrame | None = self._read_entry(entry_path=self.entry_path(signature=signature), signature=signature)
+        if df is None:
+            self.misses += 1
+            return None
+
+        try:
+            processor: BaseProcessor = rehydrate_processor(
+                file_path=file_path,
+                df=df,
+                entity_filter=signature.entity_filter,
+                include_path_columns=signature.include_path_columns,
+            )
+        except Exception as exc:
+            logger.warning(f"Discarding cached result for {file_path}: {exc}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug(f"Loaded cached result for {processor.log_path}")
+        return processor
+
+    def store(self, processor: BaseProcessor, signature: CacheSignature | None = None) -> bool:
+        """Persist ``processor.df``; ``signature`` should be captured before processing started.
+
+        Returns:
+            bool: True if an entry was written."""
+        if not processor.processed:
+            return False
+        if signature is None:
+            signature = self.build_signature(
+                file_path=processor.file_path,
+                entity_filter=processor.entity_filter,
+                include_path_columns=processor.include_path_columns,
+            )
+            if signature is None:
+                return False
+
+        entry_path: Path = self.entry_path(signature=signature)
+        temp_path: Path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            with temp_path.open("wb") as handle:
+                pickle.dump(asdict(signature), handle, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(processor.df, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, entry_path)
+        except (OSError, pickle.PicklingError) as exc:
+            logger.warning(f"Unable to cache result for {processor.log_path}: {exc}")
+            temp_path.unlink(missing_ok=True)
+            return False
+        self.writes += 1
+        return True
+
+    def _read_entry(self, entry_path: Path, signature: CacheSignature) -> DataFrame | None:
+        """Return the cached DataFrame when the stored signature matches ``signature``."""
+        if not entry_path.is_file():
+            return None
+        try:
+            with entry_path.open("rb") as handle:
+                stored_signature: Any = pickle.load(handle)
+                if stored_signature != asdict(signature):
+                    return None
+                df: Any = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError) as exc:
+            logger.debug(f"Ignoring unreadable cache entry {entry_path}: {exc}")
+            return None
+        if not isinstance(df, DataFrame):
+            return None
+        return df
@@ -1,12 +1,15 @@
 # ryan_library/processors/tuflow/processor_collection.py
 
-from collections.abc import Collection
+from collections.abc import Collection, Hashable, Iterable
 import copy
+import hashlib
 import json
 from pathlib import Path
 import re
 from typing import Any
+from urllib.parse import quote, unquote
 from loguru import logger
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 from ryan_library.functions.dataframe_helpers import (
@@ -15,6 +18,9 @@ from ryan_library.functions.dataframe_helpers import (
     reset_categorical_ordering,
 )
 from .base_processor import BaseProcessor
+from .category_registry import CategoryRegistry
+from .run_dimension import RUN_ID_COLUMN, RunMetadata, attach_run_dimension, build_run_dimension
+from .polars_engine import CombineEngine, resolve_combine_engine
 
 
 class ProcessorCollection:
@@ -25,15 +31,36 @@ class ProcessorCollection:
 
     _BATCH_SIZE: int = 500
     BASIC_INFO_COLUMNS: tuple[str, ...] = ("file", "rel_path", "path", "directory_path", "rel_directory")
+    _TIMESERIES_DROP_COLUMNS: tuple[str, ...] = (
+        "file",
+        "rel_path",
+        "path",
+        "directory_path",
+        "rel_directory",
+        "processor_id",
+    )
+
+    def __init__(self, use_run_dimension: bool = False) -> None:
+        """Initialize an empty ProcessorCollection.
 
-    def __init__(self) -> None:
-        """Initialize an empty ProcessorCollection."""
+        Args:
+            use_run_dimension: Compact each added processor into a fact table, moving its single-valued
+                metadata columns (internalName, paths, run-code parts, TP/duration/AEP) into a run dimension
+                that is joined back when frames are combined or exported."""
         self.processors: list[BaseProcessor] = []
+        self.use_run_dimension: bool = use_run_dimension
         self.basic_info_lookup: DataFrame | None = None
+        # Shared dictionaries for the categorical metadata columns of every processor.
+        self.category_registry: CategoryRegistry = CategoryRegistry()
+        # Memoised EOF channel alignment state: unique IDs per result column, match keys per ID, and the
+        # Chan ID arrays of the collection as they were after the last alignment.
+        self._channel_id_cache: dict[int, tuple[BaseProcessor, Any, list[str]]] = {}
+        self._channel_key_memo: dict[str, str | None] = {}
+        self._aligned_channel_signature: list[tuple[BaseProcessor, Any]] | None = None
 
     def copy(self) -> "ProcessorCollection":
         """Return a deep copy of the collection."""
-        new_collection = ProcessorCollection()
+        new_collection = ProcessorCollection(use_run_dimension=self.use_run_dimension)
         # Deep copy processors to ensure isolation
         new_collection.processors = [copy.deepcopy(p) for p in self.processors]
         if self.basic_info_lookup is not None:
@@ -46,7 +73,10 @@ class ProcessorCollection:
         Args:
             processor (BaseProcessor): A processed BaseProcessor instance."""
         if processor.processed and not processor.df.empty:
+            if self.use_run_dimension:
+                processor.compact_run_metadata()
             self.processors.append(processor)
+            self.category_registry.register(df=processor.df)
             logger.debug(f"Added processor: {processor.file_name}")
         elif processor.processed:
             logger.info(
@@ -115,78 +145,134 @@ class ProcessorCollection:
         outputs retain the full model ID, so we use those result IDs as the
         authoritative labels and only use the truncated EOF label as a lookup
         key. This prevents duplicate short-ID rows in combined culvert summaries.
+
+        Match keys are computed once per unique channel ID, the key tables of
+        each result processor are reused across calls, and the whole pass is
+        skipped when no ``Chan ID`` column changed since the last alignment.
         """
 
-        source_maps: dict[str, dict[str, str]] = {}
-        ambiguous_keys: dict[str, set[str]] = {}
+        signature: list[tuple[BaseProcessor, Any]] = self._channel_id_signature()
+        if self._aligned_channel_signature is not None and self._same_channel_signature(
+            signature, self._aligned_channel_signature
+        ):
+            logger.debug("EOF channel IDs unchanged since the last alignment; skipping.")
+            return 0
+
+        result_ids: dict[str, list[list[str]]] = {}
+        eof_factors: list[tuple[BaseProcessor, np.ndarray, list[str]]] = []
+        for processor in self.processors:
+            if "Chan ID" not in processor.df.columns:
+                continue
+            if processor.data_type == "EOF":
+                codes, uniques = pd.factorize(processor.df["Chan ID"].astype("string"))
+                eof_factors.append((processor, codes, [str(value).strip() for value in uniques]))
+            else:
+                result_ids.setdefault(processor.name_parser.raw_run_code, []).append(
+                    self._unique_channel_ids(processor=processor)
+                )
+        if not result_ids or not eof_factors:
+            self._aligned_channel_signature = signature
+            return 0
+
+        match_keys: dict[str, str | None] = self._channel_match_keys_for(
+            values=[value for id_lists in result_ids.values() for ids in id_lists for value in ids]
+            + [value for _, _, values in eof_factors for value in values]
+        )
 
         # First pass: build a per-run lookup from "what the EOF report would
         # print" to the full channel ID seen in non-EOF result files. If two
         # different full IDs collapse to the same printed key, leave that key
         # unresolved rather than guessing.
-        for processor in self.processors:
-            if processor.data_type == "EOF" or "Chan ID" not in processor.df.columns:
-                continue
-
-            run_code: str = processor.name_parser.raw_run_code
+        source_maps: dict[str, dict[str, str]] = {}
+        for run_code, id_lists in result_ids.items():
             run_map: dict[str, str] = source_maps.setdefault(run_code, {})
-            run_ambiguous: set[str] = ambiguous_keys.setdefault(run_code, set())
-
-            seen_values: set[str] = set()
-            for raw_value in processor.df["Chan ID"].to_numpy(dtype=object):
-                if raw_value is None or raw_value is pd.NA:
-                    continue
-                value = str(raw_value).strip()
-                if not value or value in seen_values:
-                    continue
-                seen_values.add(value)
-
-                key: str | None = self._channel_match_key(value=value)
+            run_ambiguous: set[str] = set()
+            for value in dict.fromkeys(value for ids in id_lists for value in ids):
+                key: str | None = match_keys[value]
                 if key is None or key in run_ambiguous:
                     continue
-
-                existing_value: str | None = run_map.get(key)
-                if existing_value is None:
-                    run_map[key] = value
-                elif existing_value != value:
-                    run_map.pop(key, None)
+                if key in run_map:
+                    run_map.pop(key)
                     run_ambiguous.add(key)
+                else:
+                    run_map[key] = value
 
         # Second pass: rewrite only EOF processor IDs. Non-EOF processors already
-        # contain the full model labels and remain unchanged.
+        # contain the full model labels and remain unchanged. Each distinct ID
+        # is resolved once and the result is broadcast through its codes.
         changed_count = 0
-        for processor in self.processors:
-            if processor.data_type != "EOF" or "Chan ID" not in processor.df.columns:
-                continue
-
-            run_code = processor.name_parser.raw_run_code
-            run_map = source_maps.get(run_code, {})
+        for processor, codes, text_values in eof_factors:
+            run_map = source_maps.get(processor.name_parser.raw_run_code, {})
             if not run_map:
                 continue
 
-            aligned_values: list[object] = []
-            processor_changed_count = 0
-            for value in processor.df["Chan ID"].astype("string").to_numpy(dtype=object):
-                if value is None or value is pd.NA:
-                    aligned_values.append(pd.NA)
-                    continue
-
-                text_value = str(value).strip()
-                key = self._channel_match_key(value=text_value)
-                aligned_value: str = run_map.get(key, text_value) if key is not None else text_value
-                if aligned_value != text_value:
-                    processor_changed_count += 1
-                aligned_values.append(aligned_value)
+            aligned_values: list[str] = [
+                run_map.get(key, text_value) if (key := match_keys[text_value]) is not None else text_value
+                for text_value in text_values
+            ]
+            changed_uniques = np.fromiter(
+                (aligned != text for aligned, text in zip(aligned_values, text_values)),
+                dtype=bool,
+                count=len(text_values),
+            )
+            processor_changed_count = int(changed_uniques[codes[codes >= 0]].sum())
 
             if processor_changed_count:
-                processor.df["Chan ID"] = pd.Series(data=aligned_values, index=processor.df.index, dtype="string")
+                aligned_array = pd.array(aligned_values, dtype="string")
+                processor.df["Chan ID"] = pd.Series(
+                    data=aligned_array.take(codes, allow_fill=True), index=processor.df.index, dtype="string"
+                )
                 changed_count += processor_changed_count
                 logger.info(
                     f"{processor.file_name}: Aligned {processor_changed_count} EOF channel IDs to full result IDs."
                 )
 
+        self._aligned_channel_signature = self._channel_id_signature()
         return changed_count
 
+    def _channel_id_signature(self) -> list[tuple[BaseProcessor, Any]]:
+        """Return each processor with the array backing its ``Chan ID`` column.
+
+        Extension arrays (string and categorical columns) keep their identity until the column is
+        replaced, so comparing them by identity detects a changed column without reading it."""
+        return [
+            (processor, processor.df["Chan ID"].array)
+            for processor in self.processors
+            if "Chan ID" in processor.df.columns
+        ]
+
+    @staticmethod
+    def _same_channel_signature(
+        current: list[tuple[BaseProcessor, Any]], previous: list[tuple[BaseProcessor, Any]]
+    ) -> bool:
+        """Return True when both signatures hold the same processors and ``Chan ID`` arrays."""
+        return len(current) == len(previous) and all(
+            current_processor is previous_processor and current_array is previous_array
+            for (current_processor, current_array), (previous_processor, previous_array) in zip(current, previous)
+        )
+
+    def _unique_channel_ids(self, processor: BaseProcessor) -> list[str]:
+        """Return the distinct, stripped, non-empty ``Chan ID`` values of ``processor``, memoised per column."""
+        column: Series = processor.df["Chan ID"]
+        cached: tuple[BaseProcessor, Any, list[str]] | None = self._channel_id_cache.get(id(processor))
+        if cached is not None and cached[0] is processor and cached[1] is column.array:
+            return cached[2]
+
+        stripped = (str(value).strip() for value in column.unique() if value is not None and value is not pd.NA)
+        unique_ids: list[str] = [value for value in dict.fromkeys(stripped) if value]
+        self._channel_id_cache[id(processor)] = (processor, column.array, unique_ids)
+        return unique_ids
+
+    def _channel_match_keys_for(self, values: list[str]) -> dict[str, str | None]:
+        """Return the match key of every value, computing unseen values in one vectorised pass."""
+        missing: list[str] = [value for value in dict.fromkeys(values) if value not in self._channel_key_memo]
+        if missing:
+            keys: Series = self._channel_match_keys(values=pd.Series(missing, dtype=object))
+            self._channel_key_memo.update(
+                (value, None if key is pd.NA else key) for value, key in zip(missing, keys.tolist())
+            )
+        return self._channel_key_memo
+
     def attach_basic_info(
         self,
         df: DataFrame,
@@ -262,23 +348,24 @@ class ProcessorCollection:
         return normalized_locations
 
     def _concat_in_batches(self, frames: list[DataFrame]) -> DataFrame:
-        """Concatenate frames in smaller batches to reduce peak memory."""
-        if not frames:
-            return DataFrame()
-        batches: list[DataFrame] = []
-        for i in range(0, len(frames), self._BATCH_SIZE):
-            batch: list[DataFrame] = frames[i : i + self._BATCH_SIZE]
-            batches.append(pd.concat(batch, ignore_index=True, copy=False, sort=False))
-        if len(batches) == 1:
-            return batches[0]
-        return pd.concat(batches, ignore_index=True, copy=False, sort=False)
-
-    def combine_1d_timeseries(self, reset_categoricals: bool = True) -> pd.DataFrame:
+        """Concatenate frames in smaller batches to reduce peak memory.
+
+        Categorical columns are encoded against ``category_registry`` so they are appended as integer
+        codes and keep one shared dtype instead of falling back to strings."""
+        return self.category_registry.concat(frames=frames, batch_size=self._BATCH_SIZE)
+
+    def combine_1d_timeseries(
+        self, reset_categoricals: bool = True, reduce_per_run: bool = True, engine: CombineEngine = "pandas"
+    ) -> pd.DataFrame:
         """Combine DataFrames where dataformat is 'Timeseries'.
         Group data based on 'internalName', 'Chan ID', and 'Time'.
 
         Args:
             reset_categoricals: Whether to normalize categorical ordering before grouping.
+            reduce_per_run: Align each run's timeseries frames on ('Chan ID', 'Time') and join the static
+                EOF/Chan data once per run instead of concatenating everything and grouping the result.
+                The output is identical; runs that cannot be aligned safely fall back to the grouped path.
+            engine: "polars" runs the static join, concatenation, grouping and HW_D calculation in Polars.
 
         Returns:
             pd.DataFrame: Combined and grouped DataFrame."""
@@ -294,27 +381,28 @@ class ProcessorCollection:
             logger.warning("No processors with dataformat 'Timeseries' found.")
             return pd.DataFrame()
 
-        # Concatenate DataFrames
         # Prepare static data (EOF + Chan)
         eof_processors: list[BaseProcessor] = [p for p in self.processors if p.data_type == "EOF"]
         chan_processors: list[BaseProcessor] = [p for p in self.processors if p.data_type == "Chan"]
 
         # Map run_code -> processor/df
-        eof_map: dict[str, DataFrame] = {p.name_parser.raw_run_code: p.df for p in eof_processors}
-        chan_map: dict[str, DataFrame] = {p.name_parser.raw_run_code: p.df for p in chan_processors}
-
-        dfs_to_concat: list[DataFrame] = []
-        for p in timeseries_processors:
-            df: DataFrame = p.df
-            if df.empty:
-                continue
+        eof_map: dict[str, DataFrame] = {p.name_parser.raw_run_code: self._processor_frame(p) for p in eof_processors}
+        chan_map: dict[str, DataFrame] = {p.name_parser.raw_run_code: self._processor_frame(p) for p in chan_processors}
 
-            run_code: str = p.name_parser.raw_run_code
+        run_frames: list[tuple[str, DataFrame]] = [
+            (p.name_parser.raw_run_code, self._processor_frame(p)) for p in timeseries_processors if not p.df.empty
+        ]
+        if not run_frames:
+            logger.warning("No Timeseries data to concatenate.")
+            return pd.DataFrame()
 
-            # Get static data
+        # The static frame only depends on the run, so build it once rather than once per processor
+        static_frames: dict[str, DataFrame | None] = {}
+        for run_code, _ in run_frames:
+            if run_code in static_frames:
+                continue
             eof_df: DataFrame | None = eof_map.get(run_code)
             chan_df: DataFrame | None = chan_map.get(run_code)
-
             static_df: DataFrame | None = None
             if eof_df is not None and chan_df is not None:
                 static_df = self._merge_chan_and_eof(chan_df=chan_df, eof_df=eof_df)
@@ -322,56 +410,91 @@ class ProcessorCollection:
                 static_df = eof_df
             elif chan_df is not None:
                 static_df = chan_df
+            static_frames[run_code] = static_df
 
-            if static_df is not None and "Chan ID" in static_df.columns and "Chan ID" in df.columns:
-                # Merge static data into timeseries
-                # Use left join to keep all timeseries rows
-                # We drop columns from static that are already in timeseries (except join key) to avoid suffixes
-                cols_to_use = [c for c in static_df.columns if c not in df.columns or c == "Chan ID"]
-                df = df.merge(right=static_df[cols_to_use], on="Chan ID", how="left")
-
-            dfs_to_concat.append(df)
-
-        if not dfs_to_concat:
-            logger.warning("No Timeseries data to concatenate.")
-            return pd.DataFrame()
-
-        combined_df: pd.DataFrame = self._concat_in_batches(frames=dfs_to_concat)
-        logger.debug(f"Combined Timeseries DataFrame with {len(combined_df)} rows.")
-
-        # Columns to drop
-        columns_to_drop: list[str] = [
-            "file",
-            "rel_path",
-            "path",
-            "directory_path",
-            "rel_directory",
-            "processor_id",
-        ]
+        group_keys: list[str] = ["internalName", "Chan ID", "Time"]
+        if resolve_combine_engine(engine=engine) == "polars":
+            return self._combine_1d_timeseries_polars(
+                run_frames=run_frames,
+                static_frames=static_frames,
+                group_keys=group_keys,
+                reset_categoricals=reset_categoricals,
+            )
 
-        # Check for existing columns and drop them
-        existing_columns_to_drop: list[str] = [col for col in columns_to_drop if col in combined_df.columns]
-        if existing_columns_to_drop:
-            combined_df.drop(columns=existing_columns_to_drop, inplace=True)
-            logger.debug(f"Dropped columns {existing_columns_to_drop} from DataFrame.")
+        return self._group_timeseries(
+            run_frames=run_frames,
+            static_frames=static_frames,
+            group_keys=group_keys,
+            reset_categoricals=reset_categoricals,
+            reduce_per_run=reduce_per_run,
+        )
 
-        if reset_categoricals:
-            combined_df = reset_categorical_ordering(df=combined_df)
-        # Reset categorical ordering
-        # Group by 'internalName', 'Chan ID', and 'Time'
-        group_keys: list[str] = ["internalName", "Chan ID", "Time"]
-        missing_keys: list[str] = [key for key in group_keys if key not in combined_df.columns]
-        if missing_keys:
-            logger.error(f"Missing group keys {missing_keys} in Timeseries data.")
-            return pd.DataFrame()
+    def _group_timeseries(
+        self,
+        run_frames: list[tuple[str, DataFrame]],
+        static_frames: dict[str, DataFrame | None],
+        group_keys: list[str],
+        reset_categoricals: bool,
+        reduce_per_run: bool,
+    ) -> DataFrame:
+        """pandas implementation of :meth:`combine_1d_timeseries` once the inputs have been gathered.
 
-        combined_df = reorder_long_columns(df=combined_df)
+        Args:
+            run_frames: (run code, timeseries frame) pairs in processor order.
+            static_frames: Merged EOF/Chan frame for each run code, if any.
+            group_keys: Run, channel and time key columns.
+            reset_categoricals: Whether to normalize categorical ordering before grouping.
+            reduce_per_run: Try the per-run aligned path before the collection-wide groupby.
 
-        grouped_df: DataFrame = (
-            combined_df.groupby(by=group_keys, observed=True)  # pyright: ignore[reportUnknownMemberType]
-            .agg(func="max")
-            .reset_index()
-        )
+        Returns:
+            DataFrame: Combined and grouped DataFrame."""
+        grouped_df: DataFrame | None = None
+        if reduce_per_run:
+            grouped_df = self._combine_timeseries_per_run(
+                run_frames=run_frames, static_frames=static_frames, group_keys=group_keys
+            )
+            if grouped_df is not None and reset_categoricals:
+                grouped_df = reset_categorical_ordering(df=grouped_df)
+
+        if grouped_df is None:
+            dfs_to_concat: list[DataFrame] = []
+            for run_code, df in run_frames:
+                static_df = static_frames[run_code]
+                if static_df is not None and "Chan ID" in static_df.columns and "Chan ID" in df.columns:
+                    # Merge static data into timeseries
+                    # Use left join to keep all timeseries rows
+                    # We drop columns from static that are already in timeseries (except join key) to avoid suffixes
+                    cols_to_use = [c for c in static_df.columns if c not in df.columns or c == "Chan ID"]
+                    df = df.merge(right=static_df[cols_to_use], on="Chan ID", how="left")
+                dfs_to_concat.append(df)
+
+            combined_df: pd.DataFrame = self._concat_in_batches(frames=dfs_to_concat)
+            logger.debug(f"Combined Timeseries DataFrame with {len(combined_df)} rows.")
+
+            # Check for existing columns and drop them
+            existing_columns_to_drop: list[str] = [
+                col for col in self._TIMESERIES_DROP_COLUMNS if col in combined_df.columns
+            ]
+            if existing_columns_to_drop:
+                combined_df.drop(columns=existing_columns_to_drop, inplace=True)
+                logger.debug(f"Dropped columns {existing_columns_to_drop} from DataFrame.")
+
+            # Reset categorical ordering
+            if reset_categoricals:
+                combined_df = reset_categorical_ordering(df=combined_df)
+            # Group by 'internalName', 'Chan ID', and 'Time'
+            missing_keys: list[str] = [key for key in group_keys if key not in combined_df.columns]
+            if missing_keys:
+                logger.error(f"Missing group keys {missing_keys} in Timeseries data.")
+                return pd.DataFrame()
+
+            combined_df = reorder_long_columns(df=combined_df)
+
+            grouped_df = (
+                combined_df.groupby(by=group_keys, observed=True)  # pyright: ignore[reportUnknownMemberType]
+                .agg(func="max")
+                .reset_index()
+            )
 
         grouped_df = self._calculate_hw_d_ratio(df=grouped_df)
 
@@ -412,17 +535,141 @@ class ProcessorCollection:
             second_priority_columns=p2_col,
         )
 
-        logger.debug(f"Grouped {len(timeseries_processors)} Timeseries DataFrame with {len(grouped_df)} rows.")
+        logger.debug(f"Grouped {len(run_frames)} Timeseries DataFrame with {len(grouped_df)} rows.")
 
         return grouped_df
 
-    def combine_1d_maximums(self, reset_categoricals: bool = True) -> pd.DataFrame:
+    def _combine_timeseries_per_run(
+        self,
+        run_frames: list[tuple[str, DataFrame]],
+        static_frames: dict[str, DataFrame | None],
+        group_keys: list[str],
+    ) -> DataFrame | None:
+        """Group timeseries frames run by run instead of over the whole concatenated collection.
+
+        Within a run each processor reports a different measure (Q, V, H, ...) for the same channels and
+        times, and its metadata columns hold a single value. Aligning the measure columns on
+        ('Chan ID', 'Time') then yields exactly the rows of ``groupby(group_keys).agg("max")``.
+
+        Args:
+            run_frames: (run code, timeseries frame) pairs in processor order.
+            static_frames: Merged EOF/Chan frame for each run code, if any.
+            group_keys: Run, channel and time key columns.
+
+        Returns:
+            DataFrame | None: The grouped frame, or None if a run does not fit this layout."""
+        frames_by_run: dict[str, list[DataFrame]] = {}
+        for run_code, df in run_frames:
+            frames_by_run.setdefault(run_code, []).append(df)
+
+        # Column order of the concatenated frame the grouped path would build
+        column_order: dict[str, None] = dict.fromkeys(group_keys)
+        for run_code, df in run_frames:
+            column_order.update(dict.fromkeys(df.columns))
+            static_df: DataFrame | None = static_frames.get(run_code)
+            if static_df is not None and "Chan ID" in static_df.columns and "Chan ID" in df.columns:
+                column_order.update(dict.fromkeys(static_df.columns))
+
+        run_results: dict[str, DataFrame] = {}
+        for run_code, frames in frames_by_run.items():
+            aligned: tuple[str, DataFrame] | None = self._align_run_timeseries(
+                frames=frames, static_df=static_frames.get(run_code), group_keys=group_keys
+            )
+            if aligned is None or aligned[0] in run_results:
+                logger.debug(f"Run {run_code}: timeseries frames cannot be aligned; grouping the combined data.")
+                return None
+            run_results[aligned[0]] = aligned[1]
+
+        grouped_df: DataFrame = self._concat_in_batches(frames=[run_results[name] for name in sorted(run_results)])
+        ordered_columns: list[str] = [
+            col for col in column_order if col in grouped_df.columns and col not in self._TIMESERIES_DROP_COLUMNS
+        ]
+        logger.debug(f"Aligned {len(run_frames)} Timeseries DataFrames into {len(grouped_df)} rows.")
+        return grouped_df[ordered_columns]
+
+    def _align_run_timeseries(
+        self, frames: list[DataFrame], static_df: DataFrame | None, group_keys: list[str]
+    ) -> tuple[str, DataFrame] | None:
+        """Outer-join the measure columns of one run's frames on ('Chan ID', 'Time').
+
+        Static EOF/Chan columns are looked up once per distinct channel and broadcast through the
+        factorised channel codes instead of merging them into every processor frame.
+
+        Returns:
+            tuple[str, DataFrame] | None: The run's internalName and its grouped rows, or None when the frames
+            share measure columns, disagree on metadata or need the static columns differently."""
+        run_key, chan_key, time_key = group_keys
+        constants: dict[str, pd.CategoricalDtype] | None = None
+        static_columns: list[str] | None = None
+        seen_measures: set[str] = set()
+        measure_frames: list[DataFrame] = []
+        for df in frames:
+            if any(key not in df.columns for key in group_keys):
+                return None
+            frame_constants: dict[str, pd.CategoricalDtype] = {}
+            measures: list[str] = []
+            for col in df.columns:
+                if col in self._TIMESERIES_DROP_COLUMNS or col in (chan_key, time_key):
+                    continue
+                series: Series = df[col]
+                if isinstance(series.dtype, pd.CategoricalDtype) and len(series.dtype.categories) == 1:
+                    if not series.hasnans:
+                        frame_constants[col] = series.dtype
+                        continue
+                measures.append(col)
+            if run_key not in frame_constants or (constants is not None and frame_constants != constants):
+                return None
+            if seen_measures.intersection(measures):
+                return None
+            constants = frame_constants
+            seen_measures.update(measures)
+
+            if static_df is not None and chan_key in static_df.columns:
+                frame_static: list[str] = [col for col in static_df.columns if col not in df.columns]
+                if static_columns is not None and frame_static != static_columns:
+                    return None
+                static_columns = frame_static
+
+            # groupby drops rows with missing keys
+            measure_df: DataFrame = df[[chan_key, time_key, *measures]]
+            valid_keys: Series = measure_df[chan_key].notna() & measure_df[time_key].notna()
+            if not valid_keys.all():
+                measure_df = measure_df.loc[valid_keys]
+            measure_df = measure_df.set_index(keys=[chan_key, time_key])
+            if not measure_df.index.is_unique:
+                measure_df = measure_df.groupby(level=[0, 1], observed=True).max()
+            measure_frames.append(measure_df)
+
+        if constants is None:
+            return None
+        aligned: DataFrame = measure_frames[0] if len(measure_frames) == 1 else pd.concat(measure_frames, axis=1)
+        result: DataFrame = aligned.sort_index().reset_index()
+
+        constant_codes: np.ndarray = np.zeros(len(result), dtype=np.int8)
+        for col, dtype in constants.items():
+            result[col] = pd.Categorical.from_codes(codes=constant_codes, dtype=dtype)
+
+        if static_df is not None and static_columns:
+            lookup: DataFrame = static_df[[chan_key, *static_columns]]
+            if lookup[chan_key].duplicated().any():
+                lookup = lookup.groupby(by=chan_key, observed=True).max()
+            else:
+                lookup = lookup.set_index(keys=chan_key)
+            chan_codes, channels = pd.factorize(result[chan_key])
+            static_part: DataFrame = lookup.reindex(channels).take(chan_codes)
+            static_part.index = result.index
+            result = pd.concat([result, static_part], axis=1)
+
+        return str(constants[run_key].categories[0]), result
+
+    def combine_1d_maximums(self, reset_categoricals: bool = True, engine: CombineEngine = "pandas") -> pd.DataFrame:
         """Combine DataFrames where dataformat is 'Maximums' or 'ccA'.
         Drop the 'Time' column.
         Group data based on 'internalName' and 'Chan ID'.
 
         Args:
             reset_categoricals: Whether to normalize categorical ordering before grouping.
+            engine: "polars" runs the concatenation, grouping and HW_D calculation in Polars.
 
         Returns:
             pd.DataFrame: Combined and grouped DataFrame."""
@@ -440,7 +687,7 @@ class ProcessorCollection:
 
         # Identify EOF processors for merging
         eof_processors: list[BaseProcessor] = [p for p in self.processors if p.dataformat.lower() == "eof"]
-        eof_map: dict[str, DataFrame] = {p.name_parser.raw_run_code: p.df for p in eof_processors}
+        eof_map: dict[str, DataFrame] = {p.name_parser.raw_run_code: self._processor_frame(p) for p in eof_processors}
         merged_run_codes: set[str] = set()
 
         columns_to_drop: list[str] = [
@@ -454,9 +701,9 @@ class ProcessorCollection:
         ]
         dfs_to_concat: list[DataFrame] = []
         for processor in maximums_processors:
-            df: DataFrame = processor.df
-            if df.empty:
+            if processor.df.empty:
                 continue
+            df: DataFrame = self._processor_frame(processor)
 
             run_code: str = processor.name_parser.raw_run_code
             eof_df: DataFrame | None = eof_map.get(run_code)
@@ -489,9 +736,15 @@ class ProcessorCollection:
             logger.warning("No data to concatenate after filtering.")
             return pd.DataFrame()
 
+        if resolve_combine_engine(engine=engine) == "polars":
+            return self._combine_1d_maximums_polars(frames=dfs_to_concat, reset_categoricals=reset_categoricals)
+        return self._group_maximums(frames=dfs_to_concat, reset_categoricals=reset_categoricals)
+
+    def _group_maximums(self, frames: list[DataFrame], reset_categoricals: bool) -> DataFrame:
+        """pandas implementation of :meth:`combine_1d_maximums` for the EOF-merged ``frames``."""
         # Concatenate DataFrames (with EOF geometry merged in above when available)
         # TODO - there is no geometry? there should only be data columns from the attributes
-        combined_df: DataFrame = self._concat_in_batches(frames=dfs_to_concat)
+        combined_df: DataFrame = self._concat_in_batches(frames=frames)
         logger.debug(f"Combined Maximums/ccA DataFrame with {len(combined_df)} rows.")
 
         combined_df = reorder_long_columns(df=combined_df)
@@ -555,7 +808,7 @@ class ProcessorCollection:
             prefix_order=["R"],
             second_priority_columns=p2_col,
         )
-        logger.debug(f"Grouped {len(maximums_processors)} Maximums/ccA DataFrame with {len(grouped_df)} rows.")
+        logger.debug(f"Grouped {len(frames)} Maximums/ccA DataFrame with {len(grouped_df)} rows.")
         return grouped_df
 
     @staticmethod
@@ -586,6 +839,21 @@ class ProcessorCollection:
         number: str = ProcessorCollection._truncate_decimal_text(value=match.group("number"), decimal_places=2)
         return f"{prefix}|{number}"
 
+    @staticmethod
+    def _channel_match_keys(values: Series) -> Series:
+        """Vectorised :meth:`_channel_match_key` for a Series of channel labels.
+
+        Python string storage keeps the regex and case rules identical to the scalar version.
+
+        Returns:
+            Series: Match keys aligned to ``values``, with ``<NA>`` where no key applies."""
+        text: Series = values.astype(pd.StringDtype(storage="python")).str.strip()
+        text = text.mask(text.str.lower().isin(["", "nan", "nat", "<na>"]))
+        parts: DataFrame = text.str.extract(r"^(?P<prefix>.*?)(?P<integer>-?\d+)(?:\.(?P<fraction>\d+))?$")
+        prefix: Series = parts["prefix"].str.strip().str.replace(r"\s+", " ", regex=True).str.upper()
+        fraction: Series = parts["fraction"].fillna("").str.slice(stop=2).str.ljust(2, "0")
+        return (prefix + "|" + parts["integer"] + "." + fraction).astype("string")
+
     @staticmethod
     def _truncate_decimal_text(value: str, decimal_places: int) -> str:
         """Return ``value`` with its decimal text truncated, not rounded.
@@ -647,18 +915,23 @@ class ProcessorCollection:
         logger.debug(f"Calculated HW_D ratio for {valid_count} of {df['Chan ID'].count()} rows.")
         return df
 
-    def combine_raw(self, reset_categoricals: bool = True) -> pd.DataFrame:
+    def combine_raw(self, reset_categoricals: bool = True, join_run_dimension: bool = True) -> pd.DataFrame:
         """Concatenate all DataFrames together without any grouping.
 
         Args:
             reset_categoricals: Whether to normalize categorical ordering after concatenation.
+            join_run_dimension: For compacted processors, join the run dimension columns onto the result.
+                When False the result keeps a ``run_id`` column referencing :meth:`run_dimension_table`.
 
         Returns:
             pd.DataFrame: Concatenated DataFrame."""
         logger.debug("Combining raw data without grouping.")
 
-        # Concatenate all DataFrames
-        combined_df: DataFrame = self._concat_in_batches(frames=[p.df for p in self.processors if not p.df.empty])
+        processors: list[BaseProcessor] = [p for p in self.processors if not p.df.empty]
+        if any(isinstance(p.run_metadata, RunMetadata) for p in processors):
+            combined_df: DataFrame = self._combine_facts(processors=processors, join_run_dimension=join_run_dimension)
+        else:
+            combined_df = self._concat_in_batches(frames=[p.df for p in processors])
         logger.debug(f"Combined Raw DataFrame with {len(combined_df)} rows.")
 
         combined_df = reorder_long_columns(df=combined_df)
@@ -669,12 +942,62 @@ class ProcessorCollection:
 
         return combined_df
 
-    def pomm_combine(self, reset_categoricals: bool = True) -> pd.DataFrame:
+    def _combine_facts(self, processors: list[BaseProcessor], join_run_dimension: bool) -> DataFrame:
+        """Concatenate the fact tables of ``processors`` and join the run dimension once at the end."""
+        dimension, run_ids = build_run_dimension(records=self._run_metadata(processors=processors))
+        combined_df: DataFrame = self._concat_in_batches(frames=[p.df for p in processors])
+        row_ids: np.ndarray = np.repeat(run_ids, [len(p.df) for p in processors])
+        combined_df[RUN_ID_COLUMN] = pd.arrays.IntegerArray(values=row_ids, mask=row_ids < 0)
+        if not join_run_dimension:
+            return combined_df
+
+        combined_df = attach_run_dimension(df=combined_df, dimension=dimension, drop_id=True)
+        # Restore the column order the expanded frames would have produced.
+        column_order: dict[Hashable, None] = {}
+        for processor in processors:
+            metadata: RunMetadata | None = processor.run_metadata
+            columns: Iterable[Hashable] = (
+                metadata.expanded_columns(processor.df.columns)
+                if isinstance(metadata, RunMetadata)
+                else processor.df.columns
+            )
+            column_order.update(dict.fromkeys(columns))
+        return combined_df[list(column_order)]
+
+    @staticmethod
+    def _processor_frame(processor: BaseProcessor) -> DataFrame:
+        """Return ``processor.df`` with any metadata moved to the run dimension restored."""
+        if isinstance(processor.run_metadata, RunMetadata):
+            return processor.expanded_df()
+        return processor.df
+
+    @staticmethod
+    def _run_metadata(processors: list[BaseProcessor]) -> list[RunMetadata | None]:
+        """Return the run metadata of each processor, None for processors that were not compacted."""
+        return [p.run_metadata if isinstance(p.run_metadata, RunMetadata) else None for p in processors]
+
+    def run_dimension_table(self) -> DataFrame:
+        """Return the run dimension of the compacted processors: ``run_id`` plus one column per metadata field.
+
+        ``run_id`` values match those of :meth:`combine_raw` with ``join_run_dimension=False``."""
+        processors: list[BaseProcessor] = [p for p in self.processors if not p.df.empty]
+        dimension, _ = build_run_dimension(records=self._run_metadata(processors=processors))
+        return dimension
+
+    def attach_run_dimension(self, df: DataFrame, id_column: str = RUN_ID_COLUMN, drop_id: bool = False) -> DataFrame:
+        """Join the run dimension columns onto a DataFrame carrying ``run_id`` values."""
+        if df.empty or id_column not in df.columns:
+            logger.debug(f"Skipping run dimension attach; '{id_column}' column is missing.")
+            return df
+        return attach_run_dimension(df=df, dimension=self.run_dimension_table(), id_column=id_column, drop_id=drop_id)
+
+    def pomm_combine(self, reset_categoricals: bool = True, engine: CombineEngine = "pandas") -> pd.DataFrame:
         """Combine DataFrames where dataformat is 'POMM'.
         No grouping required as DataFrames are already in the correct format.
 
         Args:
             reset_categoricals: Whether to normalize categorical ordering after concatenation.
+            engine: "polars" concatenates the frames in Polars.
 
         Returns:
             pd.DataFrame: Combined DataFrame."""
@@ -687,9 +1010,19 @@ class ProcessorCollection:
             logger.warning("No processors with dataformat 'POMM' found.")
             return pd.DataFrame()
 
+        frames: list[DataFrame] = [self._processor_frame(p) for p in pomm_processors if not p.df.empty]
+        if resolve_combine_engine(engine=engine) == "polars":
+            template: DataFrame = self._concat_pomm(
+                frames=[df.head(1) for df in frames], reset_categoricals=reset_categoricals
+            )
+            return self._concat_polars(frames=frames, template=template)
+        return self._concat_pomm(frames=frames, reset_categoricals=reset_categoricals)
+
+    def _concat_pomm(self, frames: list[DataFrame], reset_categoricals: bool) -> DataFrame:
+        """pandas implementation of :meth:`pomm_combine`."""
         # Concatenate DataFrames
-        combined_df: DataFrame = self._concat_in_batches(frames=[p.df for p in pomm_processors if not p.df.empty])
-        logger.debug(f"Combined {len(pomm_processors)}  POMM DataFrame with {len(combined_df)} rows.")
+        combined_df: DataFrame = self._concat_in_batches(frames=frames)
+        logger.debug(f"Combined {len(frames)}  POMM DataFrame with {len(combined_df)} rows.")
 
         combined_df = reorder_long_columns(df=combined_df)
 
@@ -699,11 +1032,12 @@ class ProcessorCollection:
 
         return combined_df
 
-    def po_combine(self, reset_categoricals: bool = True) -> pd.DataFrame:
+    def po_combine(self, reset_categoricals: bool = True, engine: CombineEngine = "pandas") -> pd.DataFrame:
         """Combine processed PO timeseries files into a single tidy DataFrame.
 
         Args:
             reset_categoricals: Whether to normalize categorical ordering after concatenation.
+            engine: "polars" concatenates and sorts the frames in Polars.
         """
         logger.debug("Combining PO timeseries data.")
 
@@ -714,9 +1048,26 @@ class ProcessorCollection:
             logger.warning("No PO processors available for combination.")
             return pd.DataFrame()
 
+        frames: list[DataFrame] = [self._processor_frame(p) for p in po_processors if not p.df.empty]
+        if resolve_combine_engine(engine=engine) == "polars":
+            template: DataFrame = self._concat_po(
+                frames=[df.head(1) for df in frames], reset_categoricals=reset_categoricals
+            )
+            return self._concat_polars(
+                frames=frames, template=template, sort_keys=self._po_sort_columns(columns=template.columns)
+            )
+        return self._concat_po(frames=frames, reset_categoricals=reset_categoricals)
+
+    @staticmethod
+    def _po_sort_columns(columns: Collection[str]) -> list[str]:
+        """Return the PO sort keys present in ``columns``."""
+        return [column for column in ["internalName", "Location", "Type", "Time"] if column in columns]
+
+    def _concat_po(self, frames: list[DataFrame], reset_categoricals: bool) -> DataFrame:
+        """pandas implementation of :meth:`po_combine`."""
         # Concatenate DataFrames
-        combined_df: DataFrame = self._concat_in_batches(frames=[p.df for p in po_processors if not p.df.empty])
-        logger.debug(f"Combined {len(po_processors)} PO DataFrame with {len(combined_df)} rows.")
+        combined_df: DataFrame = self._concat_in_batches(frames=frames)
+        logger.debug(f"Combined {len(frames)} PO DataFrame with {len(combined_df)} rows.")
 
         if combined_df.empty:
             logger.warning("PO DataFrames are empty after concatenation.")
@@ -726,15 +1077,81 @@ class ProcessorCollection:
             combined_df = reset_categorical_ordering(df=combined_df)
         combined_df = reorder_long_columns(df=combined_df)
 
-        sort_columns: list[str] = [
-            column for column in ["internalName", "Location", "Type", "Time"] if column in combined_df.columns
-        ]
+        sort_columns: list[str] = self._po_sort_columns(columns=combined_df.columns)
         if sort_columns:
             combined_df.sort_values(by=sort_columns, inplace=True)
             combined_df.reset_index(drop=True, inplace=True)
 
         return combined_df
 
+    def _combine_1d_timeseries_polars(
+        self,
+        run_frames: list[tuple[str, DataFrame]],
+        static_frames: dict[str, DataFrame | None],
+        group_keys: list[str],
+        reset_categoricals: bool,
+    ) -> DataFrame:
+        """Polars implementation of :meth:`combine_1d_timeseries` after the inputs have been gathered."""
+        from .polars_engine import collect_like, concat_lazy, drop_existing, group_max, to_lazy, with_hw_d_ratio
+
+        # The pandas path on the first row of every frame gives the exact output layout and dtypes
+        template: DataFrame = self._group_timeseries(
+            run_frames=[(run_code, df.head(1)) for run_code, df in run_frames],
+            static_frames=static_frames,
+            group_keys=group_keys,
+            reset_categoricals=reset_categoricals,
+            reduce_per_run=False,
+        )
+        if template.columns.empty:
+            return template
+
+        frames: list[Any] = []
+        for run_code, df in run_frames:
+            frame: Any = to_lazy(df=df)
+            static_df: DataFrame | None = static_frames[run_code]
+            if static_df is not None and "Chan ID" in static_df.columns and "Chan ID" in df.columns:
+                cols_to_use: list[str] = [c for c in static_df.columns if c not in df.columns or c == "Chan ID"]
+                frame = frame.join(to_lazy(df=static_df[cols_to_use]), on="Chan ID", how="left")
+            frames.append(frame)
+
+        combined: Any = drop_existing(frame=concat_lazy(frames=frames), columns=self._TIMESERIES_DROP_COLUMNS)
+        grouped_df: DataFrame = collect_like(
+            frame=with_hw_d_ratio(frame=group_max(frame=combined, keys=group_keys)), template=template
+        )
+        logger.debug(f"Grouped {len(run_frames)} Timeseries DataFrames with Polars into {len(grouped_df)} rows.")
+        return grouped_df
+
+    def _combine_1d_maximums_polars(self, frames: list[DataFrame], reset_categoricals: bool) -> DataFrame:
+        """Polars implementation of :meth:`combine_1d_maximums` for the EOF-merged ``frames``."""
+        from .polars_engine import collect_like, concat_lazy, group_max, to_lazy, with_hw_d_ratio
+
+        template: DataFrame = self._group_maximums(
+            frames=[df.head(1) for df in frames], reset_categoricals=reset_categoricals
+        )
+        if template.columns.empty:
+            return template
+
+        combined: Any = concat_lazy(frames=[to_lazy(df=df) for df in frames])
+        grouped_df: DataFrame = collect_like(
+            frame=with_hw_d_ratio(frame=group_max(frame=combined, keys=["internalName", "Chan ID"])),
+            template=template,
+        )
+        logger.debug(f"Grouped {len(frames)} Maximums/ccA DataFrames with Polars into {len(grouped_df)} rows.")
+        return grouped_df
+
+    def _concat_polars(
+        self, frames: list[DataFrame], template: DataFrame, sort_keys: list[str] | None = None
+    ) -> DataFrame:
+        """Concatenate (and optionally sort) ``frames`` in Polars, shaped like ``template``."""
+        from .polars_engine import collect_like, concat_lazy, to_lazy
+
+        if not frames or template.columns.empty:
+            return template
+        combined: Any = concat_lazy(frames=[to_lazy(df=df) for df in frames])
+        if sort_keys:
+            combined = combined.sort(sort_keys, nulls_last=True, maintain_order=True)
+        return collect_like(frame=combined, template=template)
+
     def get_processors_by_data_type(self, data_types: list[str] | str) -> "ProcessorCollection":
         """Retrieve processors matching a specific data_type or list of data_types.
 
@@ -749,7 +1166,7 @@ class ProcessorCollection:
         if isinstance(data_types, str):
             data_types = [data_types]
 
-        filtered_collection = ProcessorCollection()
+        filtered_collection = ProcessorCollection(use_run_dimension=self.use_run_dimension)
         for processor in self.processors:
             if processor.data_type in data_types:
                 filtered_collection.add_processor(processor)
@@ -759,59 +1176,83 @@ class ProcessorCollection:
         )
         return filtered_collection
 
-    def to_hdf(self, file_path: Path | str) -> None:
+    HDF_METADATA_KEY: str = "metadata"
+
+    def to_hdf(self, file_path: Path | str, *, append: bool = False) -> None:
         """Save the collection to a single HDF5 file using pandas.HDFStore.
 
+        Each processor is stored under a key derived from its resolved file path, in ``table``
+        format with ``Location`` as a data column so :meth:`from_hdf` can push location filters
+        into the query. With ``append=True`` an existing store is updated in place: processors
+        whose source file size, mtime and filters are unchanged are skipped, changed ones replace
+        their previous entry and entries for other files are kept. HDF5 does not reclaim space
+        from replaced nodes, so run ``ptrepack`` occasionally on caches that are updated often.
+
         Args:
             file_path: Destination HDF5 file path.
+            append: Update an existing store instead of rewriting it.
         """
 
         file_path = Path(file_path)
         # Ensure parent exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
+        append = append and file_path.exists()
 
-        metadata: list[dict[str, Any]] = []
-
+        written: int = 0
         # User requested blosc:zstd level 9
         # complib type hint in pandas can be strict, but 'blosc:zstd' is valid at runtime.
+        mode: str = "a" if append else "w"
         with pd.HDFStore(
-            str(file_path), mode="w", complevel=9, complib="blosc:zstd"  # pyright: ignore[reportArgumentType]
+            str(file_path), mode=mode, complevel=9, complib="blosc:zstd"  # pyright: ignore[reportArgumentType]
         ) as store:
-            for idx, proc in enumerate(self.processors):
-                # We need a unique key for each processor df
-                key = f"proc_{idx:04d}"
-
-                proc_meta = {
-                    "file_path": str(proc.file_path),
-                    "class_name": proc.__class__.__name__,
-                    "processor_module": proc.processor_module,
-                    "dataformat": proc.dataformat,
-                    "hdf_key": key,
-                    "data_type": proc.data_type,
-                    "applied_location_filter": (
-                        list(proc.applied_location_filter) if proc.applied_location_filter else None
-                    ),
-                    "applied_entity_filter": (list(proc.applied_entity_filter) if proc.applied_entity_filter else None),
-                }
-                metadata.append(proc_meta)
-
-                if not proc.df.empty:
-                    # Using fixed format for speed as "cache".
-                    # If querying is needed, 'table' is better but slower/larger.
-                    store.put(key, proc.df, format="fixed")
-
-            meta_df = pd.DataFrame({"json": [json.dumps(metadata)]})
-            store.put("metadata", meta_df)
-
-        logger.info(f"Saved {len(self.processors)} processors to {file_path}")
+            existing: dict[str, dict[str, Any]] = {}
+            if append:
+                existing = {item["file_path"]: item for item in self._read_hdf_metadata(store=store)}
+
+            for proc in self.processors:
+                df: DataFrame = self._processor_frame(proc)
+                proc_meta: dict[str, Any] = self._storage_metadata_for(proc=proc, df=df)
+                key: str = proc_meta["hdf_key"]
+                previous: dict[str, Any] | None = existing.get(proc_meta["file_path"])
+                if previous is not None and previous.get("hdf_key") != key:
+                    # Entry written under an older key scheme; drop it so the file is only stored once.
+                    if previous["hdf_key"] in store:
+                        store.remove(previous["hdf_key"])
+                    previous = None
+                existing[proc_meta["file_path"]] = proc_meta
+
+                if previous is not None and self._stored_entry_is_current(previous=previous, current=proc_meta):
+                    if key in store or df.empty:
+                        continue
+                if key in store:
+                    store.remove(key)
+                if not df.empty:
+                    data_columns: list[str] | None = ["Location"] if "Location" in df.columns else None
+                    store.put(key, df, format="table", data_columns=data_columns)
+                written += 1
+
+            meta_df = pd.DataFrame({"json": [json.dumps(list(existing.values()))]})
+            store.put(self.HDF_METADATA_KEY, meta_df)
+
+        logger.info(f"Saved {written} of {len(self.processors)} processors to {file_path}")
 
     @staticmethod
-    def from_hdf(file_path: Path | str, locations: Collection[str] | None = None) -> "ProcessorCollection":
+    def from_hdf(
+        file_path: Path | str,
+        locations: Collection[str] | None = None,
+        *,
+        data_types: Collection[str] | None = None,
+    ) -> "ProcessorCollection":
         """Load a collection from a single HDF5 file.
 
+        Only the entries whose metadata matches ``data_types`` are read, and for entries stored
+        in ``table`` format the location filter is applied by the HDF query rather than after
+        loading the whole frame.
+
         Args:
             file_path: Source HDF5 file.
             locations: Optional location filter.
+            data_types: Optional data types (e.g. ``["Cmx", "Nmx"]``) to load; others are skipped.
 
         Returns:
             ProcessorCollection: Rehydrated collection.
@@ -822,20 +1263,23 @@ class ProcessorCollection:
             raise FileNotFoundError(f"HDF5 file not found: {file_path}")
 
         collection = ProcessorCollection()
+        normalized_locations: frozenset[str] = BaseProcessor.normalize_locations(locations)
+        wanted_types: set[str] | None = {str(data_type).lower() for data_type in data_types} if data_types else None
 
         with pd.HDFStore(str(file_path), mode="r") as store:
-            if "metadata" not in store:
+            if ProcessorCollection.HDF_METADATA_KEY not in store:
                 raise KeyError("HDF5 file missing 'metadata' key.")
 
-            meta_df = store.get("metadata")
-            metadata: list[dict[str, Any]] = json.loads(
-                meta_df.iloc[0]["json"]
-            )  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+            metadata: list[dict[str, Any]] = ProcessorCollection._read_hdf_metadata(store=store)
+            skipped: int = 0
 
             for item in metadata:
                 file_path_str = item["file_path"]
                 class_name = item["class_name"]
                 hdf_key = item["hdf_key"]
+                if wanted_types is not None and str(item.get("data_type", "")).lower() not in wanted_types:
+                    skipped += 1
+                    continue
 
                 try:
                     proc_cls = BaseProcessor.get_processor_class(
@@ -847,7 +1291,9 @@ class ProcessorCollection:
                     proc = proc_cls(file_path=Path(file_path_str))
 
                     if hdf_key in store:
-                        proc.df = store.get(hdf_key)  # pyright: ignore[reportUnknownMemberType]
+                        proc.df = ProcessorCollection._read_hdf_frame(
+                            store=store, item=item, locations=normalized_locations
+                        )
                         proc.processed = True
                     else:
                         proc.df = pd.DataFrame()
@@ -864,12 +1310,354 @@ class ProcessorCollection:
                     logger.error(f"Failed to rehydrate processor for {file_path_str}: {e}")
                     continue
 
+        if skipped:
+            logger.debug(f"Skipped {skipped} HDF5 entries that do not match data types {sorted(wanted_types or [])}.")
         if locations:
             collection.filter_locations(locations)
 
         logger.info(f"Loaded {len(collection.processors)} processors from HDF5: {file_path}")
         return collection
 
+    @staticmethod
+    def _hdf_key_for(file_path: Path) -> str:
+        """Return the HDF5 node name used for ``file_path``."""
+        try:
+            resolved: str = str(file_path.resolve())
+        except OSError:
+            resolved = str(file_path)
+        return f"proc_{hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:16]}"
+
+    @staticmethod
+    def _storage_metadata_for(proc: BaseProcessor, df: DataFrame | None = None) -> dict[str, Any]:
+        """Return the metadata entry describing ``proc`` in an HDF5 store or Parquet manifest.
+
+        ``df`` is the frame being stored; it defaults to the processor's expanded frame."""
+        if df is None:
+            df = ProcessorCollection._processor_frame(proc)
+        size: int | None = None
+        mtime_ns: int | None = None
+        try:
+            stat_result = Path(proc.file_path).stat()
+            size, mtime_ns = stat_result.st_size, stat_result.st_mtime_ns
+        except OSError:
+            pass
+        return {
+            "file_path": str(proc.file_path),
+            "class_name": proc.__class__.__name__,
+            "processor_module": proc.processor_module,
+            "dataformat": proc.dataformat,
+            "hdf_key": ProcessorCollection._hdf_key_for(file_path=Path(proc.file_path)),
+            "data_type": proc.data_type,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "applied_location_filter": (sorted(proc.applied_location_filter) if proc.applied_location_filter else None),
+            "applied_entity_filter": (sorted(proc.applied_entity_filter) if proc.applied_entity_filter else None),
+            "has_location_column": "Location" in df.columns,
+            "columns": [str(column) for column in df.columns],
+            "dtypes": {str(column): str(dtype) for column, dtype in df.dtypes.items()},
+            "categoricals": {
+                str(column): {"categories_dtype": str(dtype.categories.dtype), "ordered": bool(dtype.ordered)}
+                for column, dtype in df.dtypes.items()
+                if isinstance(dtype, pd.CategoricalDtype)
+            },
+            "columns_name": ProcessorCollection._json_scalar(df.columns.name),
+        }
+
+    @staticmethod
+    def _json_scalar(value: Any) -> str | int | float | bool | None:
+        """Return ``value`` as a JSON-serialisable scalar (numpy scalars unwrapped), or None."""
+        if hasattr(value, "item"):
+            value = value.item()
+        return value if isinstance(value, (str, int, float, bool)) else None
+
+    @staticmethod
+    def _stored_entry_is_current(previous: dict[str, Any], current: dict[str, Any]) -> bool:
+        """Return True when a stored entry was produced from the same source file and filters."""
+        if current.get("mtime_ns") is None:
+            return False
+        compared: tuple[str, ...] = (
+            "class_name",
+            "size",
+            "mtime_ns",
+            "applied_location_filter",
+            "applied_entity_filter",
+            "dtypes",
+            "categoricals",
+        )
+        return all(previous.get(field) == current.get(field) for field in compared)
+
+    @staticmethod
+    def _read_hdf_metadata(store: pd.HDFStore) -> list[dict[str, Any]]:
+        """Return the list of processor metadata entries stored in ``store``."""
+        if ProcessorCollection.HDF_METADATA_KEY not in store:
+            return []
+        meta_df = store.get(ProcessorCollection.HDF_METADATA_KEY)
+        return json.loads(
+            meta_df.iloc[0]["json"]
+        )  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+
+    @staticmethod
+    def _read_hdf_frame(store: pd.HDFStore, item: dict[str, Any], locations: frozenset[str]) -> DataFrame:
+        """Read one processor frame, querying by ``Location`` when the entry supports it."""
+        hdf_key: str = item["hdf_key"]
+        if locations and item.get("has_location_column"):
+            where: str = f"Location in {sorted(locations)!r}"
+            df: DataFrame = store.select(hdf_key, where=where)  # pyright: ignore[reportUnknownMemberType]
+        else:
+            df = store.get(hdf_key)  # pyright: ignore[reportUnknownMemberType]
+
+        # Table format stores strings without their pandas extension dtype; restore what was saved.
+        return ProcessorCollection._restore_stored_dtypes(df=df, item=item)
+
+    PARQUET_MANIFEST_NAME: str = "_manifest.json"
+    PARQUET_PARTITION_COLUMNS: tuple[str, ...] = ("data_type", "aep_text", "duration_text")
+    PARQUET_NULL_PARTITION: str = "__HIVE_DEFAULT_PARTITION__"
+
+    def to_parquet_dataset(self, root: Path | str, *, append: bool = False) -> None:
+        """Write the collection as a Hive-partitioned Parquet dataset.
+
+        Each processor becomes one file under ``data_type=<dt>/aep_text=<aep>/duration_text=<dur>/``.
+        The partition columns are constant per processor, so they are encoded in the directory
+        names rather than the file; categorical columns (the basic-info and run-code columns) are
+        written as dictionary-encoded columns. The layout can be read directly by pyarrow, DuckDB
+        or Polars with Hive partitioning enabled. A ``_manifest.json`` next to the partitions keeps
+        the processor metadata needed by :meth:`from_parquet_dataset`.
+
+        Args:
+            root: Dataset directory.
+            append: Keep existing entries and only rewrite processors whose source file changed.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        existing: dict[str, dict[str, Any]] = {
+            item["file_path"]: item for item in ProcessorCollection._read_parquet_manifest(root=root)
+        }
+        if not append:
+            for item in existing.values():
+                (root / item["part_path"]).unlink(missing_ok=True)
+            existing = {}
+
+        written: int = 0
+        for proc in self.processors:
+            df: DataFrame = self._processor_frame(proc)
+            entry: dict[str, Any] = self._storage_metadata_for(proc=proc, df=df)
+            partition_values: dict[str, str | None] = self._parquet_partition_values(proc=proc)
+            part_dir: Path = Path(
+                *(
+                    f"{column}={quote(value, safe='') if value else self.PARQUET_NULL_PARTITION}"
+                    for column, value in partition_values.items()
+                )
+            )
+            entry["part_path"] = (part_dir / f"part-{entry['hdf_key'].removeprefix('proc_')}.parquet").as_posix()
+            entry["partition_columns"] = {
+                column: {"value": value, "position": int(df.columns.get_loc(column))}
+                for column, value in partition_values.items()
+                if column in df.columns
+            }
+
+            previous: dict[str, Any] | None = existing.get(entry["file_path"])
+            existing[entry["file_path"]] = entry
+            target: Path = root / entry["part_path"]
+            if previous is not None:
+                if self._stored_entry_is_current(previous=previous, current=entry) and target.exists():
+                    continue
+                (root / previous["part_path"]).unlink(missing_ok=True)
+
+            frame: DataFrame = df.drop(columns=list(entry["partition_columns"]))
+            frame.columns.name = None
+            target.parent.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(frame)
+            pq.write_table(table, target, compression="zstd")
+            written += 1
+
+        manifest_path: Path = root / self.PARQUET_MANIFEST_NAME
+        manifest_path.write_text(json.dumps(list(existing.values()), indent=1), encoding="utf-8")
+        logger.info(f"Wrote {written} of {len(self.processors)} processors to Parquet dataset {root}")
+
+    @staticmethod
+    def from_parquet_dataset(
+        root: Path | str,
+        locations: Collection[str] | None = None,
+        *,
+        data_types: Collection[str] | None = None,
+        aep_texts: Collection[str] | None = None,
+        duration_texts: Collection[str] | None = None,
+        columns: Collection[str] | None = None,
+    ) -> "ProcessorCollection":
+        """Load a collection written by :meth:`to_parquet_dataset`.
+
+        Partition filters (``data_types``, ``aep_texts``, ``duration_texts``) are resolved from the
+        manifest so non-matching files are never opened. ``locations`` is pushed down to the
+        Parquet reader as a row filter on ``Location`` and ``columns`` limits the columns read.
+
+        Args:
+            root: Dataset directory.
+            locations: Optional location filter.
+            data_types: Optional data types to load.
+            aep_texts: Optional AEP labels (e.g. ``["01p"]``) to load.
+            duration_texts: Optional duration labels (e.g. ``["00060m"]``) to load.
+            columns: Optional subset of columns to read.
+
+        Returns:
+            ProcessorCollection: Rehydrated collection.
+        """
+        import pyarrow.parquet as pq
+
+        root = Path(root)
+        if not (root / ProcessorCollection.PARQUET_MANIFEST_NAME).exists():
+            raise FileNotFoundError(f"Parquet dataset manifest not found in {root}")
+
+        def wanted(values: Collection[str] | None) -> set[str] | None:
+            return {str(value).lower() for value in values} if values else None
+
+        partition_filters: dict[str, set[str] | None] = {
+            "data_type": wanted(data_types),
+            "aep_text": wanted(aep_texts),
+            "duration_text": wanted(duration_texts),
+        }
+        normalized_locations: frozenset[str] = BaseProcessor.normalize_locations(locations)
+        requested_columns: list[str] | None = list(columns) if columns is not None else None
+
+        collection = ProcessorCollection()
+        for item in ProcessorCollection._read_parquet_manifest(root=root):
+            partition_values: dict[str, str | None] = ProcessorCollection._partition_values_from_path(
+                part_path=item["part_path"]
+            )
+            if any(
+                allowed is not None and (partition_values.get(column) or "").lower() not in allowed
+                for column, allowed in partition_filters.items()
+            ):
+                continue
+
+            file_columns: list[str] = [
+                column for column in item.get("columns", []) if column not in item.get("partition_columns", {})
+            ]
+            read_columns: list[str] | None = None
+            if requested_columns is not None:
+                read_columns = [column for column in file_columns if column in requested_columns]
+            row_filter: list[tuple[str, str, list[str]]] | None = None
+            if normalized_locations and "Location" in file_columns:
+                row_filter = [("Location", "in", sorted(normalized_locations))]
+
+            try:
+                proc: BaseProcessor = ProcessorCollection._processor_from_metadata(item=item)
+                df: DataFrame = pq.read_table(
+                    root / item["part_path"], columns=read_columns, filters=row_filter
+                ).to_pandas()
+                proc.df = ProcessorCollection._restore_partition_columns(
+                    df=df, item=item, requested_columns=requested_columns
+                )
+                proc.processed = True
+                collection.add_processor(proc)
+            except Exception as e:
+                logger.error(f"Failed to rehydrate processor for {item['file_path']}: {e}")
+                continue
+
+        if locations:
+            collection.filter_locations(locations)
+
+        logger.info(f"Loaded {len(collection.processors)} processors from Parquet dataset: {root}")
+        return collection
+
+    @staticmethod
+    def _read_parquet_manifest(root: Path) -> list[dict[str, Any]]:
+        """Return the manifest entries of the dataset at ``root`` (empty if there is none)."""
+        manifest_path: Path = root / ProcessorCollection.PARQUET_MANIFEST_NAME
+        if not manifest_path.exists():
+            return []
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def _parquet_partition_values(proc: BaseProcessor) -> dict[str, str | None]:
+        """Return the Hive partition values for ``proc``."""
+        parser = proc.name_parser
+        return {
+            "data_type": proc.data_type,
+            "aep_text": parser.aep.text_repr if parser.aep is not None else None,
+            "duration_text": parser.duration.text_repr if parser.duration is not None else None,
+        }
+
+    @staticmethod
+    def _partition_values_from_path(part_path: str) -> dict[str, str | None]:
+        """Parse ``column=value`` directory names back into partition values."""
+        values: dict[str, str | None] = {}
+        for segment in Path(part_path).parent.parts:
+            column, _, value = segment.partition("=")
+            values[column] = None if value == ProcessorCollection.PARQUET_NULL_PARTITION else unquote(value)
+        return values
+
+    @staticmethod
+    def _restore_partition_columns(
+        df: DataFrame, item: dict[str, Any], requested_columns: list[str] | None
+    ) -> DataFrame:
+        """Re-insert the constant partition columns at their original positions and dtypes."""
+        specs: dict[str, dict[str, Any]] = item.get("partition_columns", {})
+        categoricals: dict[str, dict[str, Any]] = item.get("categoricals", {})
+        for column, spec in sorted(specs.items(), key=lambda pair: pair[1]["position"]):
+            if requested_columns is not None and column not in requested_columns:
+                continue
+            values: list[Any] = [spec["value"]] * len(df)
+            restored: Any
+            if column in categoricals:
+                categories = pd.Index([spec["value"]], dtype=categoricals[column]["categories_dtype"])
+                restored = pd.Categorical(values, categories=categories, ordered=categoricals[column]["ordered"])
+            else:
+                restored = pd.array(values, dtype=item.get("dtypes", {}).get(column))
+            df.insert(loc=min(spec["position"], len(df.columns)), column=column, value=restored)
+        return ProcessorCollection._restore_stored_dtypes(df=df, item=item)
+
+    @staticmethod
+    def _restore_stored_dtypes(df: DataFrame, item: dict[str, Any]) -> DataFrame:
+        """Cast loaded columns back to the dtypes recorded when the frame was stored.
+
+        Neither HDF5 tables nor Parquet keep every pandas dtype: extension string dtypes come back
+        with a different NA flavour, numeric categoricals come back as plain numbers and HDF5 turns
+        missing values in object columns into NaN. Missing object values are restored as None."""
+        dtypes: dict[str, str] = item.get("dtypes") or {}
+        categoricals: dict[str, dict[str, Any]] = item.get("categoricals") or {}
+        for position, column in enumerate(df.columns):
+            key: str = str(column)
+            values: Series = df.iloc[:, position]
+            if key in categoricals:
+                spec: dict[str, Any] = categoricals[key]
+                restored: Series = values
+                if not isinstance(restored.dtype, pd.CategoricalDtype):
+                    restored = restored.astype("category")
+                if str(restored.cat.categories.dtype) != spec["categories_dtype"]:
+                    restored = restored.cat.set_categories(restored.cat.categories.astype(spec["categories_dtype"]))
+                if restored.cat.ordered != spec["ordered"]:
+                    restored = restored.cat.as_ordered() if spec["ordered"] else restored.cat.as_unordered()
+                if restored is not values:
+                    df.isetitem(position, restored)
+            elif dtypes.get(key) == "object":
+                # HDF5 tables return missing object values as NaN; restore None as Parquet does.
+                missing: Series = values.isna()
+                if values.dtype != object or missing.any():
+                    df.isetitem(position, values.astype(object).where(~missing, None))
+            elif key in dtypes and str(values.dtype) != dtypes[key]:
+                df.isetitem(position, values.astype(dtypes[key]))
+        if item.get("columns_name") is not None:
+            df.columns.name = item["columns_name"]
+        return df
+
+    @staticmethod
+    def _processor_from_metadata(item: dict[str, Any]) -> BaseProcessor:
+        """Instantiate an empty processor described by a stored metadata entry."""
+        proc_cls = BaseProcessor.get_processor_class(
+            class_name=item["class_name"],
+            processor_module=item.get("processor_module"),
+            dataformat=item.get("dataformat"),
+        )
+        proc: BaseProcessor = proc_cls(file_path=Path(item["file_path"]))
+        if item.get("applied_location_filter"):
+            proc.applied_location_filter = frozenset(item["applied_location_filter"])
+        if item.get("applied_entity_filter"):
+            proc.applied_entity_filter = frozenset(item["applied_entity_filter"])
+        return proc
+
     def check_duplicates(self) -> dict[tuple[str, str], list[BaseProcessor]]:
         """Identify processors that share the same run-code (internalName) and data_type.
 
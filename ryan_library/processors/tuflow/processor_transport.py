@@ -0,0 +1,122 @@
+# ryan_library/processors/tuflow/processor_transport.py
+"""Lightweight hand-off of processed results from worker processes.
+
+Pickling a whole :class:`BaseProcessor` also ships its ``TuflowStringParser``, the
+configuration-derived attributes and any leftover state. With the ``"arrow"``
+transport a worker only sends ``proc.df`` as an Arrow IPC stream plus the few
+fields needed to rebuild the processor, and the parent re-creates the processor
+shell from the file name (cheap: no file I/O) before attaching the frame."""
+
+from collections.abc import Collection
+from dataclasses import dataclass
+import importlib.util
+from pathlib import Path
+from typing import Any, Literal
+
+from loguru import logger
+from pandas import DataFrame
+
+from .base_processor import BaseProcessor
+
+TransportMode = Literal["processor", "arrow"]
+TRANSPORT_MODES: tuple[TransportMode, ...] = ("processor", "arrow")
+
+
+@dataclass(slots=True, frozen=True)
+class ProcessorPayload:
+    """Processed output of one file in a compact, cheaply picklable form.
+
+    ``df_ipc`` holds the Arrow IPC stream; ``df`` is only populated when a frame cannot be
+    represented in Arrow (e.g. mixed-type object columns) and is pickled as-is instead."""
+
+    file_path: Path
+    processor: str
+    entity_filter: tuple[str, ...]
+    include_path_columns: bool
+    df_ipc: bytes | None = None
+    df: DataFrame | None = None
+
+
+def arrow_available() -> bool:
+    """Return True when pyarrow can be imported."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def dataframe_to_ipc(df: DataFrame) -> bytes:
+    """Serialise ``df`` (including its index) to an Arrow IPC stream."""
+    import pyarrow as pa
+
+    table: Any = pa.Table.from_pandas(df, preserve_index=True)
+    sink: Any = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def dataframe_from_ipc(buffer: bytes) -> DataFrame:
+    """Inverse of :func:`dataframe_to_ipc`."""
+    import pyarrow as pa
+
+    with pa.ipc.open_stream(pa.py_buffer(buffer)) as reader:
+        table: Any = reader.read_all()
+    return table.to_pandas()
+
+
+def to_payload(processor: BaseProcessor) -> ProcessorPayload:
+    """Pack a processed ``processor`` into a :class:`ProcessorPayload`."""
+    df_ipc: bytes | None = None
+    df: DataFrame | None = None
+    try:
+        df_ipc = dataframe_to_ipc(df=processor.df)
+    except Exception as exc:
+        # Arrow rejects some frames (mixed object columns, non-string column metadata); pickle those.
+        logger.debug(f"{processor.file_name}: Arrow serialisation failed ({exc}); sending pickled DataFrame.")
+        df = processor.df
+    return ProcessorPayload(
+        file_path=processor.file_path,
+        processor=type(processor).__name__,
+        entity_filter=tuple(sorted(processor.entity_filter or ())),
+        include_path_columns=processor.include_path_columns,
+        df_ipc=df_ipc,
+        df=df,
+    )
+
+
+def rehydrate_processor(
+    file_path: Path,
+    df: DataFrame,
+    entity_filter: Collection[str] | None = None,
+    include_path_columns: bool = True,
+) -> BaseProcessor:
+    """Re-create a processed processor for ``file_path`` around an already processed ``df``."""
+    processor: BaseProcessor = BaseProcessor.from_file(
+        file_path=file_path,
+        entity_filter=entity_filter or None,
+        include_path_columns=include_path_columns,
+    )
+    processor.df = df
+    processor.processed = True
+    if processor.entity_filter:
+        processor.applied_entity_filter = processor.entity_filter
+    return processor
+
+
+def from_payload(payload: ProcessorPayload) -> BaseProcessor:
+    """Rebuild the processor described by ``payload`` in the current process."""
+    df: DataFrame | None = payload.df
+    if payload.df_ipc is not None:
+        df = dataframe_from_ipc(buffer=payload.df_ipc)
+    if df is None:
+        raise ValueError(f"Payload for {payload.file_path} carries no DataFrame")
+    processor: BaseProcessor = rehydrate_processor(
+        file_path=payload.file_path,
+        df=df,
+        entity_filter=payload.entity_filter,
+        include_path_columns=payload.include_path_columns,
+    )
+    if type(processor).__name__ != payload.processor:
+        logger.warning(
+            f"{payload.file_path.name}: worker used {payload.processor} but {type(processor).__name__} was resolved "
+            "in the main process."
+        )
+    return processor
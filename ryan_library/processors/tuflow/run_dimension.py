@@ -0,0 +1,151 @@
+# ryan_library/processors/tuflow/run_dimension.py
+"""Run dimension table for the compact metadata mode of :class:`ProcessorCollection`.
+
+Every processed frame carries the metadata of its source file (``internalName``, path columns,
+``R01``..``Rnn``, ``trim_runcode`` and the TP/duration/AEP attributes) broadcast onto each row.
+In compact mode those single-valued columns are moved out of the frame into a small
+:class:`RunMetadata` record, leaving a fact table of measurements. The collection builds one
+run dimension table (one row per distinct metadata record, keyed by an integer ``run_id``) and
+joins it back onto combined results only at the end, as categorical codes."""
+
+from collections.abc import Hashable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas import CategoricalDtype, DataFrame
+
+RUN_ID_COLUMN: str = "run_id"
+
+
+@dataclass(frozen=True, slots=True)
+class RunMetadata:
+    """Metadata columns removed from a processor frame, with the frame's original column order."""
+
+    columns: tuple[Hashable, ...]
+    dtypes: dict[str, CategoricalDtype]
+
+    def key(self) -> tuple[tuple[str, Any], ...]:
+        """Return a hashable identity for the run dimension row of this record."""
+        return tuple((column, dtype.categories[0]) for column, dtype in self.dtypes.items())
+
+    def expanded_columns(self, fact_columns: Iterable[Hashable]) -> list[Hashable]:
+        """Return the column order of the expanded frame for a fact frame with ``fact_columns``.
+
+        Columns keep their original position; columns added after compaction follow at the end."""
+        present: set[Hashable] = set(fact_columns) | set(self.dtypes)
+        ordered: list[Hashable] = [column for column in self.columns if column in present]
+        known: set[Hashable] = set(ordered)
+        ordered.extend(column for column in fact_columns if column not in known)
+        return ordered
+
+
+def compact_frame(df: DataFrame, columns: Iterable[str]) -> tuple[DataFrame, RunMetadata] | None:
+    """Split the single-valued metadata ``columns`` out of ``df``.
+
+    Only categoricals holding exactly one category and no missing values are moved, so
+    :func:`expand_frame` can rebuild them exactly.
+
+    Returns:
+        tuple[DataFrame, RunMetadata] | None: The fact frame and its metadata, or None when none of
+            ``columns`` can be moved."""
+    dtypes: dict[str, CategoricalDtype] = {}
+    for column in columns:
+        if column not in df.columns:
+            continue
+        series: pd.Series = df[column]
+        if isinstance(series.dtype, CategoricalDtype) and len(series.dtype.categories) == 1 and not series.hasnans:
+            dtypes[column] = series.dtype
+    if not dtypes:
+        return None
+    metadata = RunMetadata(columns=tuple(df.columns), dtypes=dtypes)
+    return df.drop(columns=list(dtypes)), metadata
+
+
+def expand_frame(df: DataFrame, metadata: RunMetadata) -> DataFrame:
+    """Rebuild the frame :func:`compact_frame` split, with the metadata columns in their original places."""
+    codes: np.ndarray = np.zeros(len(df), dtype=np.int8)
+    data: dict[Hashable, Any] = {}
+    for column in metadata.expanded_columns(fact_columns=df.columns):
+        dtype: CategoricalDtype | None = metadata.dtypes.get(column)  # type: ignore[arg-type]
+        if dtype is None:
+            data[column] = df[column]
+        else:
+            data[column] = pd.Categorical.from_codes(codes=codes, dtype=dtype, validate=False)
+    expanded = DataFrame(data, index=df.index, copy=False)
+    expanded.columns.name = df.columns.name
+    return expanded
+
+
+def build_run_dimension(records: Sequence[RunMetadata | None]) -> tuple[DataFrame, np.ndarray]:
+    """Build the run dimension table for ``records``.
+
+    Args:
+        records (Sequence[RunMetadata | None]): Metadata of each processor; None for frames that
+            were not compacted.
+
+    Returns:
+        tuple[DataFrame, np.ndarray]: The table, with ``run_id`` followed by one ordered categorical
+            per metadata column, and the ``run_id`` of each record (-1 for None)."""
+    run_ids: np.ndarray = np.full(len(records), -1, dtype=np.int32)
+    ids: dict[tuple[tuple[str, Any], ...], int] = {}
+    rows: list[RunMetadata] = []
+    for position, record in enumerate(records):
+        if record is None:
+            continue
+        run_id: int | None = ids.get(record.key())
+        if run_id is None:
+            run_id = ids[record.key()] = len(rows)
+            rows.append(record)
+        run_ids[position] = run_id
+
+    columns: dict[str, list[CategoricalDtype | None]] = {}
+    for run_id, record in enumerate(rows):
+        for column, dtype in record.dtypes.items():
+            columns.setdefault(column, [None] * len(rows))[run_id] = dtype
+
+    table: dict[str, Any] = {RUN_ID_COLUMN: np.arange(len(rows), dtype=np.int32)}
+    for column, dtypes in columns.items():
+        table[column] = _categorical_from_dtypes(dtypes=dtypes)
+    return DataFrame(table), run_ids
+
+
+def attach_run_dimension(
+    df: DataFrame,
+    dimension: DataFrame,
+    id_column: str = RUN_ID_COLUMN,
+    drop_id: bool = False,
+) -> DataFrame:
+    """Broadcast the dimension columns onto ``df`` through its ``id_column``.
+
+    Each dimension column is rebuilt as categorical codes indexed by run id, so the join never
+    materialises the metadata values row by row."""
+    run_ids: np.ndarray = pd.to_numeric(df[id_column]).fillna(-1).to_numpy(dtype=np.int64)
+    attached: dict[str, Any] = {}
+    for column in dimension.columns:
+        if column == id_column or column in df.columns:
+            continue
+        values: pd.Categorical = dimension[column].array  # type: ignore[assignment]
+        # The extra trailing slot maps run id -1 (processors without metadata) to a missing value.
+        lookup: np.ndarray = np.full(len(dimension) + 1, -1, dtype=values.codes.dtype)
+        lookup[dimension[id_column].to_numpy()] = values.codes
+        attached[column] = pd.Categorical.from_codes(codes=lookup[run_ids], dtype=values.dtype, validate=False)
+    result: DataFrame = df.assign(**attached) if attached else df
+    if drop_id:
+        result = result.drop(columns=[id_column])
+    return result
+
+
+def _categorical_from_dtypes(dtypes: list[CategoricalDtype | None]) -> pd.Categorical:
+    """Return one value per run as an ordered categorical with sorted categories."""
+    present: list[CategoricalDtype] = [dtype for dtype in dtypes if dtype is not None]
+    categories_dtypes: set[Any] = {dtype.categories.dtype for dtype in present}
+    values: list[Any] = [None if dtype is None else dtype.categories[0] for dtype in dtypes]
+    unique: list[Any] = list({value for value in values if value is not None})
+    try:
+        unique.sort()
+    except TypeError:
+        unique.sort(key=str)
+    categories = pd.Index(unique, dtype=categories_dtypes.pop()) if len(categories_dtypes) == 1 else pd.Index(unique)
+    return pd.Categorical(values, categories=categories, ordered=True)
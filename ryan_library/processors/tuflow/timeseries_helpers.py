@@ -1,6 +1,7 @@
 # ryan_library\processors\tuflow\timeseries_helpers.py
 """Utility helpers shared by TUFLOW timeseries processors."""
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -19,71 +20,54 @@ def reshape_h_timeseries(df: pd.DataFrame, category_type: str, file_label: str)
     if not value_cols:
         raise ValueError("No value columns found in the DataFrame.")
 
-    # Melt everything except Time
-    df_long = df.melt(id_vars=["Time"], value_vars=value_cols, var_name="raw_col", value_name="H_val")
-
-    # Extract suffix (.1 or .2) and base channel name
-    # We assume the suffix is the last 2 characters: ".1" or ".2"
-    # If a column doesn't end in .1 or .2, we treat it as ambiguous or ignore it?
-    # Real files seem to consistently use .1/.2 for H data.
-    # Let's use a regex or string slicing.
-
-    # Helper to classify
-    def parse_col(s: str) -> tuple[str, str]:
-        if s.endswith(".1"):
-            return s[:-2], "US_H"
-        elif s.endswith(".2"):
-            return s[:-2], "DS_H"
-        else:
-            # Fallback or specific handling.
-            # Some older files might use different conventions?
-            # For now, assume everything else is US if it doesn't match?
-            # Or log a warning?
-            # Let's assume it's a single point and map to US_H for now, or skip?
-            # Given the strict requirement for US/DS in H files, maybe skip?
-            return s, "Unknown"
-
-    # Apply parsing
-    # This is vectorized-ish
-    df_long["suffix_type"] = df_long["raw_col"].apply(
-        lambda x: ".1" if x.endswith(".1") else (".2" if x.endswith(".2") else "unknown")
-    )
-    df_long[category_type] = df_long["raw_col"].apply(lambda x: x[:-2] if x.endswith((".1", ".2")) else x)
-
-    # Filter out unknowns if necessary, or map them.
-    # Mapping: .1 -> US_H, .2 -> DS_H
-    type_map = {".1": "US_H", ".2": "DS_H"}
-    df_long["col_type"] = df_long["suffix_type"].map(type_map)
-
-    # Drop rows where col_type is NaN (unknown suffix)
-    # df_long = df_long.dropna(subset=["col_type"])
-    # Actually, let's keep them but maybe warn?
-    # For robustness, let's just filter for now as we expect .1/.2
-    df_long = df_long[df_long["col_type"].notna()]
-
-    if df_long.empty:
+    # Classify the header once: "<chan>.1" is upstream, "<chan>.2" downstream, anything else is ignored.
+    us_columns: dict[str, str] = {}
+    ds_columns: dict[str, str] = {}
+    for col in value_cols:
+        label = str(col)
+        if label.endswith(".1"):
+            us_columns.setdefault(label[:-2], col)
+        elif label.endswith(".2"):
+            ds_columns.setdefault(label[:-2], col)
+
+    if not us_columns and not ds_columns:
         raise ValueError("No columns with valid '.1' (US) or '.2' (DS) suffixes found.")
 
-    # Pivot to get US_H and DS_H as columns
-    # index: Time, category_type
-    # columns: col_type
-    # values: H_val
-
-    reshaped = df_long.pivot_table(
-        index=["Time", category_type],
-        columns="col_type",
-        values="H_val",
-        aggfunc="first",  # Should be unique per time/channel
-    ).reset_index()
-
-    # Ensure both columns exist
-    for col in ["US_H", "DS_H"]:
-        if col not in reshaped.columns:
-            reshaped[col] = pd.NA
-
-    # Enforce column order
-    expected_order = ["Time", category_type, "US_H", "DS_H"]
-    reshaped = reshaped[expected_order]
+    used_columns: list[str] = [*us_columns.values(), *ds_columns.values()]
+    block: pd.DataFrame = df[["Time", *used_columns]]
+    block = block[block["Time"].notna()]
+    if block["Time"].duplicated().any():
+        # Repeated time stamps keep the first non-null value per column, as the pivot did.
+        block = block.groupby("Time", sort=True).first().reset_index()
+    else:
+        block = block.sort_values("Time", kind="stable")
+
+    channels: list[str] = sorted(us_columns.keys() | ds_columns.keys())
+    times: np.ndarray = block["Time"].to_numpy()
+    values: np.ndarray = block[used_columns].to_numpy(dtype="float64", na_value=np.nan)
+    positions: dict[str, int] = {col: idx for idx, col in enumerate(used_columns)}
+
+    def side_matrix(columns: dict[str, str]) -> np.ndarray:
+        """Time x channel matrix for one side, NaN where a channel has no column."""
+        matrix: np.ndarray = np.full((len(times), len(channels)), np.nan)
+        for chan_idx, chan in enumerate(channels):
+            if chan in columns:
+                matrix[:, chan_idx] = values[:, positions[columns[chan]]]
+        return matrix
+
+    # Row-major ravel gives every channel for the first time step, then the next, i.e. sorted by (Time, channel).
+    us_values: np.ndarray = side_matrix(columns=us_columns).ravel()
+    ds_values: np.ndarray = side_matrix(columns=ds_columns).ravel()
+    keep: np.ndarray = ~(np.isnan(us_values) & np.isnan(ds_values))
+
+    reshaped = pd.DataFrame(
+        {
+            "Time": np.repeat(times, len(channels))[keep],
+            category_type: np.tile(np.asarray(channels, dtype=object), len(times))[keep],
+            "US_H": us_values[keep],
+            "DS_H": ds_values[keep],
+        }
+    )
 
     logger.debug(f"{file_label}: Reshaped 'H' DataFrame to long format with {len(reshaped)} rows.")
     return reshaped
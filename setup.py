@@ -61,6 +61,9 @@ setup(
             "pandas-stubs",
             "pyright",
         ],
+        "polars": [
+            "polars",
+        ],
     },
     author="Chain Frost",
     author_email="chainfrost@outlook.com",
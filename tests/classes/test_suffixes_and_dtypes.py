@@ -8,6 +8,7 @@ from ryan_library.classes.suffixes_and_dtypes import (
     DataTypeDefinition,
     Config,
     SuffixesConfig,
+    SuffixIndex,
     ConfigLoader,
 )
 
@@ -139,3 +140,69 @@ class TestSuffixesConfig:
 
         assert suffixes_config.get_processor_class_for_data_type("TestType") == "TestProc"
         assert suffixes_config.get_processor_class_for_data_type("Unknown") is None
+
+
+class TestSuffixIndex:
+    """Tests for the longest-suffix index used by SuffixesConfig."""
+
+    @staticmethod
+    def _longest_scan(suffix_to_type: dict[str, str], file_name: str) -> str | None:
+        matches = [suffix for suffix in suffix_to_type if file_name.endswith(suffix)]
+        return suffix_to_type[max(matches, key=len)] if matches else None
+
+    def test_longest_suffix_wins_regardless_of_order(self):
+        for suffix_to_type in ({"_H.csv": "Short", "_1d_H.csv": "H"}, {"_1d_H.csv": "H", "_H.csv": "Short"}):
+            index = SuffixIndex(suffix_to_type)
+            assert index.data_type("run_1d_H.csv") == "H"
+            assert index.data_type("run_2d_H.csv") == "Short"
+            assert index.match("run_1d_H.csv") == ("_1d_H.csv", "H")
+            assert index.data_type("run_H.txt") is None
+
+    def test_case_sensitivity(self):
+        suffix_to_type = {"_1d_H.csv": "H"}
+        assert SuffixIndex(suffix_to_type).data_type("run_1D_h.csv") is None
+        assert SuffixIndex(suffix_to_type, case_sensitive=False).data_type("run_1D_h.csv") == "H"
+
+    def test_empty_suffix_rejected(self):
+        with pytest.raises(ValueError):
+            SuffixIndex({"": "Anything"})
+
+    def test_matches_scan_for_configured_suffixes(self):
+        suffix_to_type = SuffixesConfig.load().suffix_to_type
+        names = [f"EG01_001{suffix}" for suffix in suffix_to_type] + ["EG01_001.txt", "", "_1d_H.csv.bak"]
+        index = SuffixIndex(suffix_to_type)
+        for name in names:
+            assert index.data_type(name) == self._longest_scan(suffix_to_type, name), name
+
+    def test_cached_index_and_inverted_map(self):
+        config = MagicMock(spec=Config)
+        sc = SuffixesConfig({"_a.csv": "A"}, config)
+
+        assert sc.suffix_index() is sc.suffix_index()
+        inverted = sc.invert_suffix_to_type()
+        inverted["A"].append("_mutated.csv")
+        assert sc.invert_suffix_to_type() == {"A": ["_a.csv"]}
+
+        sc.suffix_to_type = {"_b.csv": "B"}
+        assert sc.get_data_type_for_suffix("x_b.csv") == "B"
+        assert sc.invert_suffix_to_type() == {"B": ["_b.csv"]}
+
+        sc.suffix_to_type["_c.csv"] = "C"
+        sc.refresh_index()
+        assert sc.get_data_type_for_suffix("x_c.csv") == "C"
+
+    def test_case_insensitive_lookup_matches_linear_scan(self):
+        """Case-insensitive lookups agree with a per-suffix ``lower().endswith`` longest-match scan.
+
+        Timing against the scan lives in ``bench_suffix_index.py``."""
+        suffix_to_type = SuffixesConfig.load().suffix_to_type
+        names = [f"EG{i % 97:02d}_{i:05d}_TP01_00360m_01.00p{suffix}" for i, suffix in enumerate(suffix_to_type)]
+        names += [name.upper() for name in names] + ["EG01_001_notes.txt"]
+        index = SuffixIndex(suffix_to_type, case_sensitive=False)
+
+        expected = []
+        for name in names:
+            matches = [suffix for suffix in suffix_to_type if name.lower().endswith(suffix.lower())]
+            expected.append(suffix_to_type[max(matches, key=len)] if matches else None)
+
+        assert [index.data_type(name) for name in names] == expected
@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 
 # import sys
@@ -75,3 +76,45 @@ def test_trim_run_code_removes_parsed_components() -> None:
     assert parser.aep and parser.aep.text_repr == "2.0p"
     assert parser.duration and parser.duration.text_repr == "120m"
     assert parser.trim_run_code == "R01"
+
+
+def test_parser_uses_longest_configured_suffix() -> None:
+    TuflowStringParser.clear_cache()
+    overlapping: dict[str, str] = {"_H.csv": "Short", "_1d_H.csv": "H"}
+    with patch.object(TuflowStringParser, "load_suffixes", return_value=overlapping):
+        parser = TuflowStringParser("EG01_001_1D_h.csv")
+    TuflowStringParser.clear_cache()
+
+    assert parser.data_type == "H"
+    assert parser.raw_run_code == "EG01_001"
+
+
+def test_parser_cache_returns_independent_instances() -> None:
+    TuflowStringParser.clear_cache()
+    first = TuflowStringParser("a/EG01_001_TP01_00360m_01.00p_POMM.csv")
+    second = TuflowStringParser("b/EG01_001_TP01_00360m_01.00p_POMM.csv")
+
+    assert len(TuflowStringParser._cache) == 1
+    assert second.file_path == Path("b/EG01_001_TP01_00360m_01.00p_POMM.csv")
+    assert second.run_code_parts == first.run_code_parts
+    second.run_code_parts["R01"] = "changed"
+    assert first.run_code_parts["R01"] == "EG01"
+
+
+def test_parse_many_matches_individual_parsers() -> None:
+    paths: list[str] = [
+        "x/EG01_001_TP01_00360m_01.00p_POMM.csv",
+        "y/EG01_001_TP01_00360m_01.00p_POMM.csv",
+        "EG02_PMP_01440m_1d_Q.csv",
+        "no_suffix.txt",
+    ]
+    TuflowStringParser.clear_cache()
+    parsers: list[TuflowStringParser] = TuflowStringParser.parse_many(paths)
+
+    assert [parser.file_path for parser in parsers] == [Path(path) for path in paths]
+    for parser, path in zip(parsers, paths):
+        expected = TuflowStringParser(path)
+        for attribute in ("data_type", "raw_run_code", "clean_run_code", "run_code_parts", "trim_run_code"):
+            assert getattr(parser, attribute) == getattr(expected, attribute)
+        assert str(parser.aep) == str(expected.aep)
+        assert str(parser.duration) == str(expected.duration)
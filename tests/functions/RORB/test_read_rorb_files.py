@@ -1,5 +1,6 @@
 """Tests for ryan_library.functions.RORB.read_rorb_files."""
 
+import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
@@ -166,3 +167,43 @@ class TestHydrograph:
         assert not res.empty
         assert res.iloc[0]["Location"] == "Loc1"
         assert res.iloc[0]["Duration_Exceeding"] == 1.0 # 1 timestep > 5.0
+
+    def test_analyze_hydrograph_orders_by_threshold_then_location(self, tmp_path):
+        f = tmp_path / "hydro.csv"
+        content = (
+            "H1\n"
+            "H2\n"
+            "Time (hrs),Calculated hydrograph:  Loc1,Calculated hydrograph:  Loc2\n"
+            "0.0,1.0,6.0\n"
+            "0.5,8.0,\n"
+            "1.0,4.0,7.0\n"
+        )
+        f.write_text(content)
+
+        res = read_rorb_files.analyze_hydrograph("1%", "24h", 3, f, tmp_path, [5.0, 2.0, 10.0])
+
+        assert res[["ThresholdFlow", "Location", "Duration_Exceeding"]].values.tolist() == [
+            [5.0, "Loc1", 0.5],
+            [5.0, "Loc2", 1.0],
+            [2.0, "Loc1", 1.0],
+            [2.0, "Loc2", 1.0],
+        ]
+        assert set(res["TP"]) == {3}
+        assert set(res["out_path"]) == {str(tmp_path)}
+
+    def test_analyze_hydrograph_without_exceedances(self, tmp_path):
+        f = tmp_path / "hydro.csv"
+        f.write_text("H1\nH2\nTime (hrs),Calculated hydrograph:  Loc1\n0.0,0.0\n1.0,1.0\n")
+
+        assert read_rorb_files.analyze_hydrograph("1%", "24h", 1, f, tmp_path, [5.0]).empty
+
+    def test_exceedance_counts_matches_comparison(self):
+        rng = np.random.default_rng(0)
+        values = rng.gamma(2.0, 10.0, size=(200, 5))
+        values[::7, 2] = np.nan
+        thresholds = [0.0, 5.0, 12.5, 40.0, 1000.0, float("nan"), 5.0]
+
+        counts = read_rorb_files.exceedance_counts(values, thresholds)
+
+        expected = np.array([(values > threshold).sum(axis=0) for threshold in thresholds])
+        np.testing.assert_array_equal(counts, expected)
@@ -0,0 +1,99 @@
+# tests/functions/test_directory_index.py
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+from ryan_library.functions.directory_index import DirectoryIndex
+from ryan_library.functions.file_utils import find_files_parallel
+
+# Directory mtimes are pushed an hour into the past so listings fall outside the index's safety window.
+OLD_MTIME: float = time.time() - 3600
+
+
+def _age(*paths: Path, mtime: float = OLD_MTIME) -> None:
+    for path in paths:
+        os.utime(path, (mtime, mtime))
+
+
+def _build_tree(root: Path) -> list[Path]:
+    (root / "run_a" / "csv").mkdir(parents=True)
+    (root / "run_b").mkdir()
+    for relative in ("run_a/A_1d_H.csv", "run_a/csv/A_1d_Q.csv", "run_b/B_1d_H.csv", "run_b/notes.txt"):
+        (root / relative).write_text("data")
+    directories: list[Path] = [root, root / "run_a", root / "run_a" / "csv", root / "run_b"]
+    _age(*directories)
+    return directories
+
+
+def _find(root: Path, index: DirectoryIndex | Path | None) -> list[Path]:
+    return sorted(
+        find_files_parallel(root_dirs=[root], patterns="*.csv", print_found_folder=False, directory_index=index)
+    )
+
+
+def test_indexed_search_matches_plain_search_and_reuses_listings(tmp_path: Path) -> None:
+    root: Path = tmp_path / "results"
+    _build_tree(root)
+    index_path: Path = tmp_path / "index.jsonl"
+
+    expected: list[Path] = _find(root=root, index=None)
+    assert _find(root=root, index=index_path) == expected
+    assert index_path.is_file()
+
+    index = DirectoryIndex(index_path=index_path)
+    assert len(index) == 4
+    assert _find(root=root, index=index) == expected
+    assert (index.hits, index.misses) == (4, 0)
+
+
+def test_changed_directory_is_listed_again(tmp_path: Path) -> None:
+    root: Path = tmp_path / "results"
+    _build_tree(root)
+    index_path: Path = tmp_path / "index.jsonl"
+    _find(root=root, index=index_path)
+
+    new_file: Path = root / "run_b" / "B_2d_H.csv"
+    new_file.write_text("data")
+    _age(root / "run_b", mtime=OLD_MTIME + 60)
+
+    index = DirectoryIndex(index_path=index_path)
+    assert new_file in _find(root=root, index=index)
+    assert (index.hits, index.misses) == (3, 1)
+
+
+def test_recently_modified_directory_is_not_trusted(tmp_path: Path) -> None:
+    root: Path = tmp_path / "results"
+    root.mkdir()
+    (root / "a.csv").write_text("data")
+    index_path: Path = tmp_path / "index.jsonl"
+    _find(root=root, index=index_path)
+
+    index = DirectoryIndex(index_path=index_path)
+    _find(root=root, index=index)
+    assert (index.hits, index.misses) == (0, 1)
+
+
+def test_removed_directories_are_pruned(tmp_path: Path) -> None:
+    root: Path = tmp_path / "results"
+    _build_tree(root)
+    index_path: Path = tmp_path / "index.jsonl"
+    _find(root=root, index=index_path)
+
+    shutil.rmtree(root / "run_a")
+    _age(root, mtime=OLD_MTIME + 60)
+
+    assert _find(root=root, index=index_path) == [root / "run_b" / "B_1d_H.csv"]
+    assert len(DirectoryIndex(index_path=index_path)) == 2
+
+
+def test_unreadable_index_is_ignored(tmp_path: Path) -> None:
+    root: Path = tmp_path / "results"
+    _build_tree(root)
+    index_path: Path = tmp_path / "index.jsonl"
+    index_path.write_text("not json\n")
+
+    index = DirectoryIndex(index_path=index_path)
+    assert len(index) == 0
+    assert _find(root=root, index=index) == _find(root=root, index=None)
@@ -29,6 +29,40 @@ class TestExcelExporterHelpers:
         # Create a DF that exceeds column limit
         df = pd.DataFrame({f"Col{i}": [1] for i in range(exporter.MAX_EXCEL_COLUMNS + 1)})
         assert exporter._exceeds_excel_limits([df])
+
+    def test_exceeds_excel_limits_row_threshold(self):
+        """Test the configurable row threshold."""
+        exporter = ExcelExporter()
+        df = pd.DataFrame({"A": range(100)})
+        assert not exporter._exceeds_excel_limits([df], max_rows=100)
+        assert exporter._exceeds_excel_limits([df], max_rows=99)
+
+    def test_resolve_excel_engine_auto(self):
+        """Test that auto picks xlsxwriter only for large workbooks."""
+        exporter = ExcelExporter()
+        exporter.FAST_ENGINE_MIN_ROWS = 10
+        small = pd.DataFrame({"A": range(4)})
+        assert exporter._resolve_excel_engine("auto", [small, small]) == "openpyxl"
+        assert exporter._resolve_excel_engine("auto", [small, small, small]) == "xlsxwriter"
+        assert exporter._resolve_excel_engine("openpyxl", [small] * 3) == "openpyxl"
+
+    def test_calculate_max_cell_length(self):
+        """Test that missing values and unused categories are ignored."""
+        exporter = ExcelExporter()
+        assert exporter._calculate_max_cell_length(pd.Series([1.5, None, 22.25])) == 5
+        assert exporter._calculate_max_cell_length(pd.Series(["a", None, "abc"])) == 3
+        categories = pd.Series(pd.Categorical(["ab", None], categories=["ab", "unused_category"]))
+        assert exporter._calculate_max_cell_length(categories) == 2
+        assert exporter._calculate_max_cell_length(pd.Series([None, None], dtype=object)) == 0
+
+    def test_calculate_max_cell_length_samples_long_columns(self):
+        """Test that long numeric columns are measured on evenly spaced sample rows."""
+        exporter = ExcelExporter()
+        exporter.WIDTH_SAMPLE_ROWS = 3
+        # Rows 0, 2 and 5 are sampled.
+        series = pd.Series([1, 22, 333, 4444, 55555, 6])
+        assert exporter._calculate_max_cell_length(series) == 3
+        assert exporter._calculate_max_cell_length(series.astype(str)) == 5
     
     def test_resolve_export_stem_with_file_name(self):
         """Test stem resolution with explicit filename."""
@@ -169,6 +203,87 @@ class TestExcelExporterExport:
         mock_to_parquet.assert_called_once()
         mock_to_csv.assert_called_once()
     
+    def test_export_dataframes_invalid_engine(self):
+        """Test error with invalid Excel engine."""
+        exporter = ExcelExporter()
+        export_dict = {"Report": {"dataframes": [pd.DataFrame({"A": [1]})], "sheets": ["Sheet1"]}}
+        with pytest.raises(ValueError, match="Invalid excel_engine"):
+            exporter.export_dataframes(export_dict, excel_engine="invalid")
+
+    def test_export_dataframes_row_threshold_falls_back(self, tmp_path):
+        """Test that frames over max_excel_rows are written to Parquet and CSV instead of Excel."""
+        exporter = ExcelExporter()
+        export_dict = {"Report": {"dataframes": [pd.DataFrame({"A": [1, 2, 3]})], "sheets": ["Data"]}}
+
+        exporter.export_dataframes(export_dict, output_directory=tmp_path, file_name="report", max_excel_rows=2)
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["report_Data.csv", "report_Data.parquet.gzip"]
+
+    def test_xlsxwriter_engine_matches_openpyxl(self, tmp_path):
+        """Test that the streaming xlsxwriter backend writes the same cells and widths as openpyxl."""
+        from openpyxl import load_workbook
+
+        exporter = ExcelExporter()
+        df = pd.DataFrame(
+            {
+                "name": ["a", None, "a much longer value"],
+                "category": pd.Categorical(["x", "y", None]),
+                "value": [1.5, float("nan"), 3.0],
+                "count": pd.array([1, None, 3], dtype="Int64"),
+                "flag": [True, False, True],
+                "time": pd.to_datetime(["2024-01-01 00:00", None, "2024-01-02 06:30"]),
+                "path": ["some/long/path/to/a/file.csv"] * 3,
+            }
+        )
+        workbooks = {}
+        for engine in ("openpyxl", "xlsxwriter"):
+            exporter.save_to_excel(
+                data_frame=df,
+                sheet_name="Data",
+                output_directory=tmp_path,
+                file_name=engine,
+                column_widths={"value": 25},
+                excel_engine=engine,
+            )
+            workbooks[engine] = load_workbook(tmp_path / f"{engine}.xlsx")["Data"]
+
+        def cells(worksheet):
+            return [[cell.value for cell in row] for row in worksheet.iter_rows()]
+
+        def widths(worksheet):
+            # xlsxwriter groups adjacent columns of equal width, so only check columns with distinct widths.
+            return [round(worksheet.column_dimensions[letter].width) for letter in "ABCFG"]
+
+        assert cells(workbooks["xlsxwriter"]) == cells(workbooks["openpyxl"])
+        assert widths(workbooks["openpyxl"]) == [21, 13, 25, 21, 8]
+        # xlsxwriter stores widths rounded to whole pixels.
+        assert widths(workbooks["xlsxwriter"]) == [22, 14, 26, 22, 9]
+
+    def test_xlsxwriter_engine_writes_extension_dtypes_as_text(self, tmp_path):
+        """Test that Period and Interval values are written as text by both engines."""
+        from openpyxl import load_workbook
+
+        exporter = ExcelExporter()
+        df = pd.DataFrame(
+            {
+                "month": pd.period_range("2024-01", periods=3, freq="M"),
+                "band": pd.interval_range(start=0, periods=3),
+            }
+        )
+        df.loc[1, "month"] = None
+        workbooks = {}
+        for engine in ("openpyxl", "xlsxwriter"):
+            exporter.save_to_excel(
+                data_frame=df, sheet_name="Data", output_directory=tmp_path, file_name=engine, excel_engine=engine
+            )
+            workbooks[engine] = load_workbook(tmp_path / f"{engine}.xlsx")["Data"]
+
+        def cells(worksheet):
+            return [[cell.value for cell in row] for row in worksheet.iter_rows()]
+
+        assert cells(workbooks["xlsxwriter"]) == cells(workbooks["openpyxl"])
+        assert cells(workbooks["xlsxwriter"])[1] == ["2024-01", "(0, 1]"]
+
     def test_calculate_column_widths(self):
         """Test column width calculation."""
         exporter = ExcelExporter()
@@ -0,0 +1,122 @@
+# tests/functions/test_log_summary_store.py
+
+import os
+import shutil
+from pathlib import Path
+import sqlite3
+from unittest.mock import patch
+
+import pandas as pd
+
+from ryan_library.functions import log_summary_store
+from ryan_library.functions.log_summary_store import LogSummaryStore
+from ryan_library.orchestrators.tuflow import tuflow_logsummary
+
+LOG_DIR: Path = Path(__file__).parents[1] / "test_data" / "tuflow" / "TUFLOW_Example_Model_Dataset" / "log"
+LOG_NAMES: tuple[str, ...] = ("EG00_001.tlf", "EG02_001.tlf", "EG15_008.tlf")
+
+
+def _row(run: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Runcode": [run],
+            "StartDate": [pd.Timestamp("2024-01-02 03:04")],
+            "Final_RunTime": [1.5],
+            "TP": [None],
+        }
+    )
+
+
+def test_rows_round_trip_and_are_invalidated_by_changes(tmp_path: Path) -> None:
+    log_a: Path = tmp_path / "a.tlf"
+    log_b: Path = tmp_path / "b.tlf"
+    log_a.write_text("a")
+    log_b.write_text("b")
+    store_path: Path = tmp_path / "store.sqlite"
+
+    store = LogSummaryStore(store_path=store_path)
+    store.put(path=log_a, data_frame=_row("A"))
+    store.put(path=log_b, data_frame=_row("B"))
+    store.save(keep=[log_a, log_b])
+
+    cached, to_parse = LogSummaryStore(store_path=store_path).partition(files=[log_a, log_b])
+    assert to_parse == []
+    pd.testing.assert_frame_equal(cached[log_a], _row("A"))
+
+    log_b.write_text("b, rerun")
+    reloaded = LogSummaryStore(store_path=store_path)
+    cached, to_parse = reloaded.partition(files=[log_a, log_b])
+    assert list(cached) == [log_a]
+    assert to_parse == [log_b]
+
+    reloaded.save(keep=[log_b])
+    assert len(LogSummaryStore(store_path=store_path)) == 1
+
+
+def test_store_from_another_version_is_ignored(tmp_path: Path) -> None:
+    log: Path = tmp_path / "a.tlf"
+    log.write_text("a")
+    store_path: Path = tmp_path / "store.sqlite"
+    store = LogSummaryStore(store_path=store_path)
+    store.put(path=log, data_frame=_row("A"))
+    store.save()
+
+    with patch.object(log_summary_store, "STORE_VERSION", log_summary_store.STORE_VERSION + 1):
+        assert len(LogSummaryStore(store_path=store_path)) == 0
+
+
+def test_failed_save_closes_the_connection(tmp_path: Path) -> None:
+    closed: list[bool] = []
+
+    class FailingConnection(sqlite3.Connection):
+        def executemany(self, *args, **kwargs):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        def close(self) -> None:
+            closed.append(True)
+            super().close()
+
+    log: Path = tmp_path / "a.tlf"
+    log.write_text("a")
+    store_path: Path = tmp_path / "store.sqlite"
+    store = LogSummaryStore(store_path=store_path)
+    store.put(path=log, data_frame=_row("A"))
+    connect = sqlite3.connect
+    with patch.object(log_summary_store.sqlite3, "connect", lambda path: connect(path, factory=FailingConnection)):
+        store.save()
+
+    assert closed == [True]
+    # The pending row is kept for the next save.
+    store.save()
+    assert len(LogSummaryStore(store_path=store_path)) == 1
+
+
+def test_main_processing_reuses_stored_rows(tmp_path: Path, monkeypatch) -> None:
+    for name in LOG_NAMES:
+        shutil.copy2(LOG_DIR / name, tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+    store_path: Path = tmp_path / ".tlf_summary_store.sqlite"
+
+    def run() -> pd.DataFrame:
+        with (
+            patch.object(tuflow_logsummary, "setup_logger"),
+            patch.object(tuflow_logsummary, "save_to_excel") as mock_save,
+            patch.object(
+                tuflow_logsummary, "run_dashboard_workflow", wraps=tuflow_logsummary.run_dashboard_workflow
+            ) as mock_workflow,
+        ):
+            tuflow_logsummary.main_processing(use_live_dashboard=False, summary_store=store_path)
+        run.parsed = [len(call.kwargs["items"]) for call in mock_workflow.call_args_list]
+        return mock_save.call_args.kwargs["data_frame"]
+
+    first: pd.DataFrame = run()
+    assert run.parsed == [len(LOG_NAMES)]
+    second: pd.DataFrame = run()
+    assert run.parsed == []
+    pd.testing.assert_frame_equal(second, first)
+
+    rerun: Path = tmp_path / LOG_NAMES[0]
+    os.utime(rerun, ns=(rerun.stat().st_atime_ns, rerun.stat().st_mtime_ns + 10**9))
+    third: pd.DataFrame = run()
+    assert run.parsed == [1]
+    pd.testing.assert_frame_equal(third, first)
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 
 from ryan_library.functions.pandas.median_calc import (
+    grouped_median_statistics,
     median_calc,
     summarise_duration_statistics,
 )
@@ -87,3 +88,64 @@ def test_median_calc_single_group() -> None:
     assert max_stats["count_TP_aep"] == 3
     assert max_stats["count_duration"] == 1
     assert len(stats_list) == 1
+
+
+def test_grouped_median_statistics_matches_per_group() -> None:
+    rng = np.random.default_rng(0)
+    rows = [
+        {"site": site, "aep": aep, "dur": dur, "tp": f"TP{tp}", "val": float(rng.permutation(40)[tp])}
+        for site in ("S1", "S2")
+        for aep in ("1%", "5%")
+        for dur in ("060m", "030m", "120m")
+        for tp in range(rng.integers(1, 8))
+    ]
+    df = pd.DataFrame(rows)
+    df.loc[3, "val"] = np.nan
+    df.loc[7, "dur"] = None
+
+    result = grouped_median_statistics(df, ["site", "aep"], "val", "tp", "dur")
+
+    assert result[["site", "aep"]].values.tolist() == [["S1", "1%"], ["S1", "5%"], ["S2", "1%"], ["S2", "5%"]]
+    for row, (_, group) in zip(result.to_dict("records"), df.groupby(["site", "aep"])):
+        expected, _ = median_calc(group, "val", "tp", "dur")
+        for key in (
+            "median",
+            "median_duration",
+            "median_TP",
+            "mean_Duration",
+            "mean_TP",
+            "mean_PeakFlow",
+            "low",
+            "high",
+            "mean_including_zeroes",
+            "mean_excluding_zeroes",
+            "count_TP",
+            "count_TP_aep",
+            "count_duration",
+        ):
+            assert row[key] == expected[key] or (pd.isna(row[key]) and pd.isna(expected[key])), key
+    assert result["count_TP"].dtype == np.int64
+
+
+def test_grouped_median_statistics_without_numeric_median() -> None:
+    df = pd.DataFrame(
+        {
+            "site": ["S1", "S1", "S2"],
+            "dur": ["1", None, "1"],
+            "tp": ["A", "B", "C"],
+            "val": [np.nan, 4.0, 2.0],
+        }
+    )
+
+    result = grouped_median_statistics(df, ["site"], "val", "tp", "dur").set_index("site")
+
+    # S1's only duration has a NaN median, so it has no critical duration but keeps its range.
+    assert pd.isna(result.loc["S1", "median"])
+    assert pd.isna(result.loc["S1", "median_TP"])
+    assert result.loc["S1", "low"] == 4.0
+    assert result.loc["S1", "count_duration"] == 1
+    assert pd.isna(result.loc["S1", "count_TP"])
+    assert result.loc["S2", "median"] == 2.0
+    assert result.loc["S2", "median_TP"] == "C"
+    assert result["count_TP"].dtype == "Int64"
+    assert result.loc["S2", "count_TP"] == 1
@@ -9,6 +9,7 @@ from ryan_library.functions.parse_tlf import (
     search_for_completion,
     process_top_lines,
     finalise_data,
+    read_log_tail,
 )
 
 
@@ -63,3 +64,49 @@ class TestParseTlf:
         assert not df.empty
         assert df.iloc[0]["Runcode"] == "Run_001"
         assert df.iloc[0]["SomeKey"] == "Value"
+
+
+class TestReadLogTail:
+    """Tests for the seek-based tail reader."""
+
+    @pytest.mark.parametrize("text", ["a\nb\nc\nd\n", "a\r\nbb\r\nccc\r\nd", "\n\nx\n", "only line", ""])
+    @pytest.mark.parametrize("block_size", [1, 3, 64])
+    def test_matches_full_read(self, tmp_path, text, block_size):
+        log = tmp_path / "run.tlf"
+        log.write_bytes(text.encode("utf-8"))
+        for max_lines in (1, 2, 10):
+            expected = text.splitlines()[-max_lines:]
+            assert read_log_tail(log, max_lines=max_lines, block_size=block_size) == expected
+
+    def test_reads_only_the_tail(self, tmp_path):
+        """Bytes before the tail block are never decoded."""
+        log = tmp_path / "run.tlf"
+        log.write_bytes(b"\xff\xfe not utf-8\n" + b"line\n" * 500 + b"Simulation FINISHED\n")
+        lines = read_log_tail(log, max_lines=3, block_size=64)
+        assert lines == ["line", "line", "Simulation FINISHED"]
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert read_log_tail(tmp_path / "missing.tlf") == []
+
+
+def test_process_top_lines_streams_head_only(tmp_path):
+    """With ``lines=None`` the header is streamed and scanning stops before the rest of the file."""
+    log = tmp_path / "run.tlf"
+    head = "Computer Name: PC1\nSimulation Started : 2023-Jan-01 12:00\nNo Specified Scenarios.\nNo Specified Events.\n"
+    log.write_bytes(head.encode("utf-8") + b"filler\n" * 4100 + b"\xff\xfe not utf-8\n")
+
+    data_dict, success, _, _, _ = process_top_lines(
+        logfile_path=log,
+        lines=None,
+        data_dict={},
+        success=0,
+        spec_events=False,
+        spec_scen=False,
+        spec_var=False,
+        is_large_file=False,
+        runcode="run",
+        relative_logfile_path=Path("run.tlf"),
+    )
+
+    assert success == 4
+    assert data_dict["ComputerName"] == "PC1"
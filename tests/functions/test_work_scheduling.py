@@ -0,0 +1,115 @@
+"""Tests for ryan_library.functions.work_scheduling."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ryan_library.functions import dashboard_workflow, work_scheduling
+from ryan_library.functions.work_scheduling import file_sizes, largest_first, plan_batches, size_aware_pool_size
+
+MB: int = 1024**2
+
+
+@pytest.fixture
+def sixteen_cores(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(work_scheduling.multiprocessing, "cpu_count", lambda: 16)
+
+
+def test_file_sizes_counts_missing_files_as_zero(tmp_path: Path) -> None:
+    present = tmp_path / "run_1d_H.csv"
+    present.write_bytes(b"x" * 10)
+    assert file_sizes([present, tmp_path / "missing.csv"]) == [10, 0]
+
+
+def test_largest_first_keeps_order_of_equal_sizes() -> None:
+    assert largest_first([5, 20, 5, 30, 20]) == [3, 1, 4, 0, 2]
+
+
+def test_pool_size_follows_bytes_not_only_file_count(sixteen_cores: None) -> None:
+    # Three huge files: the file-count heuristic alone would run them one after another.
+    assert size_aware_pool_size([2_000 * MB] * 3, memory=10**15) == 3
+    # Many tiny files: a third of the file count, as before.
+    assert size_aware_pool_size([1_000] * 30, memory=10**15) == 10
+    # Never more workers than cores less one.
+    assert size_aware_pool_size([1_000 * MB] * 100, memory=10**15) == 15
+
+
+def test_pool_size_fits_largest_files_in_memory(sixteen_cores: None) -> None:
+    sizes = [1_000 * MB] * 8
+    memory = int(work_scheduling.MEMORY_PER_INPUT_BYTE * 1_000 * MB * 3.5)
+    assert size_aware_pool_size(sizes, memory=memory) == 3
+    # A single file that does not fit still gets one worker.
+    assert size_aware_pool_size(sizes, memory=1) == 1
+
+
+def test_pool_size_single_core(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(work_scheduling.multiprocessing, "cpu_count", lambda: 1)
+    assert size_aware_pool_size([1_000 * MB] * 10, memory=10**15) == 1
+    assert size_aware_pool_size([], memory=10**15) == 1
+
+
+def test_plan_batches_large_files_first_small_files_batched(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(work_scheduling, "BATCH_MAX_FILES", 3)
+    monkeypatch.setattr(work_scheduling, "MIN_TASKS_PER_WORKER", 1)
+    sizes = [10, 50 * MB, 20, 30, 10 * MB, 40, 50]
+    assert plan_batches(sizes, workers=1) == [[1], [4], [6, 5, 3], [2, 0]]
+
+
+def test_plan_batches_keeps_enough_tasks_per_worker() -> None:
+    sizes = [1_000] * 80
+    tasks = plan_batches(sizes, workers=4)
+    assert len(tasks) >= 4 * work_scheduling.MIN_TASKS_PER_WORKER
+    assert sorted(position for task in tasks for position in task) == list(range(80))
+
+
+def test_dashboard_workflow_submits_largest_items_first() -> None:
+    submitted: list[int] = []
+
+    class FakePool:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def __enter__(self) -> "FakePool":
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            return None
+
+        def apply_async(self, func, args):
+            request = args[0]
+            submitted.append(request.index)
+            result = MagicMock()
+            result.ready.return_value = True
+            result.get.return_value = request.item.upper()
+            return result
+
+    dashboard = MagicMock()
+    dashboard.max_rows = 10
+    with patch.object(dashboard_workflow, "Pool", FakePool):
+        results = dashboard_workflow.run_dashboard_workflow(
+            items=["a", "b", "c"],
+            process_item=str.upper,
+            dashboard=dashboard,
+            pool_size=2,
+            status_for_result=lambda result: "OK",
+            detail_for_result=str,
+            poll_interval=0,
+            item_sizes=[10, 30, 20],
+        )
+
+    assert submitted == [2, 3, 1]
+    assert results == ["A", "B", "C"]
+
+
+def test_dashboard_workflow_rejects_mismatched_sizes() -> None:
+    with pytest.raises(ValueError, match="item sizes"):
+        dashboard_workflow.run_dashboard_workflow(
+            items=["a", "b"],
+            process_item=str.upper,
+            dashboard=MagicMock(),
+            pool_size=2,
+            status_for_result=lambda result: "OK",
+            detail_for_result=str,
+            item_sizes=[1],
+        )
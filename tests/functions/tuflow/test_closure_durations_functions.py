@@ -1,10 +1,12 @@
 """Unit tests for ryan_library.functions.tuflow.closure_durations_functions."""
 
-from unittest.mock import patch
 import pandas as pd
 from pandas import DataFrame
 
-from ryan_library.functions.tuflow.closure_durations_functions import summarise_results
+from ryan_library.functions.tuflow.closure_durations_functions import (
+    calculate_threshold_durations,
+    summarise_results,
+)
 
 
 def test_summarise_results() -> None:
@@ -21,22 +23,94 @@ def test_summarise_results() -> None:
         }
     )
 
-    # Mock median_stats to return dummy dict
-    with patch("ryan_library.functions.pandas.median_calc.median_stats") as mock_stats:
-        mock_stats.return_value = (
-            {
-                "median": 15.0,
-                "median_duration": "1.5hr",
-                "median_TP": "tp1",
-                "low": 10.0,
-                "high": 20.0,
-                "mean_including_zeroes": 15.0,
-            },
-            None,
-        )
-
-        result: DataFrame = summarise_results(df)
+    result: DataFrame = summarise_results(df)
 
     assert not result.empty
     assert "Central_Value" in result.columns
-    assert result.iloc[0]["Central_Value"] == 15.0
+    # The 2hr duration has the larger median; low/high/average span both durations.
+    assert result.iloc[0]["Central_Value"] == 20.0
+    assert result.iloc[0]["Critical_Duration"] == "2hr"
+    assert result.iloc[0]["Critical_Tp"] == "tp1"
+    assert result.iloc[0]["Low_Value"] == 10.0
+    assert result.iloc[0]["High_Value"] == 20.0
+    assert result.iloc[0]["Average_Value"] == 20.0
+
+
+def test_summarise_results_fills_missing_scenarios_with_zero() -> None:
+    """Scenarios that do not exceed a threshold count as zero duration."""
+    df = pd.DataFrame(
+        data={
+            "out_path": ["p1"] * 4,
+            "Location": ["L1"] * 4,
+            "ThresholdFlow": [1.0, 1.0, 1.0, 5.0],
+            "AEP": ["1%"] * 4,
+            "Duration": ["1hr"] * 4,
+            "TP": ["tp1", "tp2", "tp3", "tp3"],
+            "Duration_Exceeding": [10.0, 20.0, 30.0, 6.0],
+        }
+    )
+
+    result: DataFrame = summarise_results(df)
+
+    assert result["ThresholdFlow"].tolist() == [1.0, 5.0]
+    assert result["Central_Value"].tolist() == [20.0, 0.0]
+    assert result["Low_Value"].tolist() == [10.0, 0.0]
+    assert result["Average_Value"].tolist() == [20.0, 2.0]
+
+
+def _po_frame(location: str, times: list[float], values: list[float], tp: str = "TP01") -> DataFrame:
+    return pd.DataFrame(
+        data={
+            "Time": times,
+            "Location": location,
+            "Type": "Flow",
+            "Value": values,
+            "directory_path": "p1",
+            "trim_runcode": "EG01",
+            "aep_text": "1p",
+            "duration_text": "00060m",
+            "tp_text": tp,
+        }
+    )
+
+
+def test_calculate_threshold_durations_counts_exceedances_per_threshold() -> None:
+    """Each threshold reports the number of exceeding timesteps times the timestep."""
+    po_df: DataFrame = pd.concat(
+        [
+            # Unsorted times and a NaN value; timestep is 0.5.
+            _po_frame(location="L1", times=[1.0, 0.0, 0.5, 1.5], values=[5.0, 1.0, 3.0, float("nan")]),
+            _po_frame(location="L2", times=[0.0, 0.25, 0.5], values=[2.0, 2.0, 0.5], tp="TP02"),
+            # A single timestep cannot give a duration and is skipped.
+            _po_frame(location="L3", times=[0.0], values=[100.0]),
+        ],
+        ignore_index=True,
+    )
+
+    result: DataFrame = calculate_threshold_durations(po_df=po_df, thresholds=[4.0, 1.0], measurement_type="flow")
+
+    assert list(result.columns) == [
+        "AEP",
+        "Duration",
+        "TP",
+        "Location",
+        "ThresholdFlow",
+        "Duration_Exceeding",
+        "out_path",
+        "trim_runcode",
+    ]
+    # Groups are ordered by their keys, thresholds keep the requested order and zero counts are dropped.
+    assert result[["Location", "TP", "ThresholdFlow", "Duration_Exceeding"]].values.tolist() == [
+        ["L1", "TP01", 4.0, 0.5],
+        ["L1", "TP01", 1.0, 1.0],
+        ["L2", "TP02", 1.0, 0.5],
+    ]
+    assert set(result["out_path"]) == {"p1"}
+
+
+def test_calculate_threshold_durations_without_exceedances_is_empty() -> None:
+    po_df: DataFrame = _po_frame(location="L1", times=[0.0, 1.0], values=[1.0, 2.0])
+
+    result: DataFrame = calculate_threshold_durations(po_df=po_df, thresholds=[10.0], measurement_type="Flow")
+
+    assert result.empty
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
-from ryan_library.functions.tuflow.notebook_helpers import load_tuflow_data
+from ryan_library.functions.tuflow.notebook_helpers import get_critical_hydrographs, load_tuflow_data
 from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
 
 
@@ -98,3 +98,74 @@ class TestLoadTuflowData:
 
         # Verify filter_locations was called
         mock_collection.filter_locations.assert_called_with(["LocA"])
+
+
+class TestGetCriticalHydrographs:
+    @staticmethod
+    def _timeseries_processor(run_code: str, peaks: dict[str, float]) -> MagicMock:
+        proc = MagicMock()
+        proc.dataformat = "Timeseries"
+        proc.name_parser.raw_run_code = run_code
+        proc.expanded_df.return_value = pd.DataFrame(
+            {
+                "Time": [0.0, 0.0, 1.0, 1.0],
+                "Chan ID": pd.Categorical(list(peaks) * 2),
+                "Q": [0.0, 0.0, *peaks.values()],
+            }
+        )
+        return proc
+
+    def test_extracts_run_closest_to_critical_mean(self):
+        """Each AEP/channel gets the hydrograph of the run closest to the mean of its critical duration."""
+        max_df = pd.DataFrame(
+            {
+                "aep_text": ["1%"] * 6,
+                "duration_text": ["1h", "1h", "2h", "2h", "1h", "2h"],
+                "Chan ID": ["C1", "C1", "C1", "C1", "C2", "C2"],
+                "internalName": ["r1h_a", "r1h_b", "r2h_a", "r2h_b", "r1h_a", "r2h_a"],
+                "Q": [10.0, 12.0, 8.0, 20.0, 5.0, None],
+            }
+        )
+        collection = MagicMock(spec=ProcessorCollection)
+        collection.combine_1d_maximums.return_value = max_df
+        collection.processors = [
+            self._timeseries_processor("r1h_a", {"C1": 10.0, "C2": 5.0}),
+            self._timeseries_processor("r1h_b", {"C1": 12.0, "C2": 6.0}),
+            self._timeseries_processor("r2h_a", {"C1": 8.0, "C2": 7.0}),
+            self._timeseries_processor("r2h_b", {"C1": 20.0, "C2": 9.0}),
+        ]
+
+        result = get_critical_hydrographs(collection)
+
+        assert list(result) == [("1%", "C1"), ("1%", "C2")]
+        # C1: the 2h mean (14) is critical and both runs are 6 away, so the first one is taken.
+        assert result[("1%", "C1")]["Q"].tolist() == [0.0, 8.0]
+        assert result[("1%", "C1")].index.tolist() == [0, 2]
+        # C2: only the 1h duration has a value.
+        assert result[("1%", "C2")]["Q"].tolist() == [0.0, 5.0]
+        collection.processors[2].expanded_df.assert_called_once()
+
+    def test_categorical_keys_with_unused_categories(self):
+        """Unobserved category combinations do not shift the closest-run lookup."""
+        max_df = pd.DataFrame(
+            {
+                "aep_text": pd.Categorical(["1%", "1%", "1%"], categories=["0.5%", "1%"]),
+                "duration_text": pd.Categorical(["2h", "2h", "1h"], categories=["0.5h", "1h", "2h"]),
+                "Chan ID": pd.Categorical(["C2", "C2", "C2"], categories=["C1", "C2"]),
+                "internalName": ["r2h_a", "r2h_b", "r1h_a"],
+                "Q": [7.0, 9.0, 5.0],
+            }
+        )
+        collection = MagicMock(spec=ProcessorCollection)
+        collection.combine_1d_maximums.return_value = max_df
+        collection.processors = [
+            self._timeseries_processor("r1h_a", {"C1": 10.0, "C2": 5.0}),
+            self._timeseries_processor("r2h_a", {"C1": 8.0, "C2": 7.0}),
+            self._timeseries_processor("r2h_b", {"C1": 20.0, "C2": 9.0}),
+        ]
+
+        result = get_critical_hydrographs(collection)
+
+        assert list(result) == [("1%", "C2")]
+        # The 2h mean (8) is critical; both runs are 1 away, so the first one is taken.
+        assert result[("1%", "C2")]["Q"].tolist() == [0.0, 7.0]
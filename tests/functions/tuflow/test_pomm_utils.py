@@ -1,10 +1,13 @@
 """Tests for ryan_library.functions.tuflow.pomm_utils."""
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
+from ryan_library.classes.tuflow_string_classes import TuflowStringParser
+from ryan_library.functions.pandas.median_calc import median_calc
 from ryan_library.functions.tuflow import pomm_utils
 
 
@@ -51,22 +54,30 @@ class TestAggregation:
         assert row1["AbsMax"].iloc[0] == 20.0
         assert row1["count_TP_aep"].iloc[0] == 2  # 2 durations in 1% group
 
-    @patch("ryan_library.functions.tuflow.pomm_utils.median_calc")
-    def test_find_aep_dur_median(self, mock_median, sample_df):
+    def test_find_aep_dur_median(self, sample_df):
         """Test finding median per AEP/Duration group."""
-        # Mock median_calc return
-        # It returns (stats_dict, thinned_df)
-        # We only care about stats_dict
-        mock_median.return_value = ({"median": 100.0, "mean_PeakFlow": 100.0}, None)
-
         res: DataFrame = pomm_utils.find_aep_dur_median(aggregated_df=sample_df)
         assert not res.empty
         assert "MedianAbsMax" in res.columns
-        assert res["MedianAbsMax"].iloc[0] == 100.0
+        # Groups: 1%/1h (10, 20), 1%/2h (15), 2%/1h (5); the upper-middle record is the median.
+        assert res["MedianAbsMax"].tolist() == [20.0, 15.0, 5.0]
+        assert res["median_TP"].tolist() == ["TP02", "TP01", "TP01"]
+        # 10 and 20 are equally close to the 1%/1h mean; the lower (first sorted) record wins.
+        assert res["mean_TP"].tolist() == ["TP01", "TP01", "TP01"]
+        assert res["mean_including_zeroes"].tolist() == [15.0, 15.0, 5.0]
+        assert res["count_TP"].tolist() == [2, 1, 1]
+        assert res["count_TP_aep"].tolist() == [3, 3, 1]
+
+    def test_find_aep_dur_median_keeps_groups_without_values(self, sample_df):
+        """A group without numeric AbsMax values does not discard the other groups."""
+        sample_df.loc[3, "AbsMax"] = float("nan")
 
-        # Check if median_calc was called for each group
-        # Groups: 1%/1h, 1%/2h, 2%/1h -> 3 calls
-        assert mock_median.call_count == 3
+        res: DataFrame = pomm_utils.find_aep_dur_median(aggregated_df=sample_df)
+
+        assert len(res) == 3
+        assert res["MedianAbsMax"].iloc[:2].tolist() == [20.0, 15.0]
+        assert pd.isna(res["MedianAbsMax"].iloc[2])
+        assert pd.isna(res["count_TP"].iloc[2])
 
     def test_find_aep_median_max(self, sample_df: DataFrame) -> None:
         """Test finding max of medians."""
@@ -264,3 +275,87 @@ class TestRLLQmxNormalization:
         assert res["Location"].tolist() == ["Loc1", "Loc2"]
         assert res["AbsMax"].tolist() == [10.0, 20.0]
         assert res["Type"].tolist() == ["V", "Q"]
+
+
+class TestGroupedStatisticsParity:
+    """find_aep_dur_median must match median_calc and the internal-name rules applied group by group."""
+
+    GROUP_COLS: list[str] = ["aep_text", "duration_text", "Location", "Type", "trim_runcode"]
+
+    @pytest.fixture
+    def aggregated_df(self) -> DataFrame:
+        rng = np.random.default_rng(42)
+        index = pd.MultiIndex.from_product(
+            [["1p", "5p", "0.1p"], ["00060m", "00120m", "00030m"], ["L1", "L2", "L3"], ["Flow"], ["EG01", "EG02"]],
+            names=self.GROUP_COLS,
+        )
+        frames: list[DataFrame] = []
+        for key in index:
+            tps: int = int(rng.integers(1, 12))
+            frames.append(
+                pd.DataFrame(
+                    {
+                        **dict(zip(self.GROUP_COLS, key)),
+                        "tp_text": [f"TP{tp:02d}" for tp in rng.permutation(11)[:tps] + 1],
+                        "AbsMax": rng.gamma(2.0, 5.0, size=tps).round(6),
+                    }
+                )
+            )
+        df: DataFrame = pd.concat(frames, ignore_index=True)
+        df.loc[rng.random(len(df)) < 0.05, "AbsMax"] = 0.0
+        df.loc[[4, 40, 41], "AbsMax"] = np.nan
+        df["internalName"] = df["trim_runcode"] + "_" + df["aep_text"] + "_" + df["duration_text"] + "_" + df["tp_text"]
+        for column in [*self.GROUP_COLS, "tp_text", "internalName"]:
+            df[column] = df[column].astype("category")
+        return df
+
+    @staticmethod
+    def _reference(df: DataFrame, group_cols: list[str]) -> DataFrame:
+        rows: list[dict[str, object]] = []
+        for key, grp in df.groupby(group_cols, observed=True):
+            stats, _ = median_calc(thinned_df=grp, statcol="AbsMax", tpcol="tp_text", durcol="duration_text")
+            values = pd.to_numeric(grp["AbsMax"], errors="coerce")
+            ordered = values.sort_values(ascending=True, na_position="first", kind="stable")
+            median_name = grp.loc[ordered.index[len(ordered) // 2], "internalName"]
+            mean_name = grp.loc[(values - values.mean()).abs().idxmin(), "internalName"]
+            rows.append(
+                {**dict(zip(group_cols, key)), "internalName": median_name, "mean_internalName": mean_name, **stats}
+            )
+        return pd.DataFrame(rows)
+
+    def test_matches_per_group_median_calc(self, aggregated_df: DataFrame) -> None:
+        res: DataFrame = pomm_utils.find_aep_dur_median(aggregated_df=aggregated_df)
+        expected: DataFrame = self._reference(df=aggregated_df, group_cols=self.GROUP_COLS)
+
+        assert len(res) == len(expected)
+        for column in self.GROUP_COLS + ["internalName", "mean_internalName", "median_duration", "mean_Duration"]:
+            assert res[column].astype(str).tolist() == expected[column].astype(str).tolist(), column
+        for column in ("median_TP", "mean_TP"):
+            normalised = expected[column].map(TuflowStringParser.normalize_tp_label)
+            assert res[column].astype(str).tolist() == normalised.astype(str).tolist(), column
+        pairs = {
+            "MedianAbsMax": "median",
+            "mean_PeakFlow": "mean_PeakFlow",
+            "mean_including_zeroes": "mean_including_zeroes",
+            "mean_excluding_zeroes": "mean_excluding_zeroes",
+            "low": "low",
+            "high": "high",
+            "count_TP": "count_TP",
+        }
+        for column, reference in pairs.items():
+            np.testing.assert_allclose(
+                res[column].to_numpy(dtype=float), expected[reference].to_numpy(dtype=float), err_msg=column
+            )
+
+    def test_max_tables_follow_duration_statistics(self, aggregated_df: DataFrame) -> None:
+        median_df: DataFrame = pomm_utils.find_aep_dur_median(aggregated_df=aggregated_df)
+        median_max: DataFrame = pomm_utils.find_aep_median_max(aep_dur_median=median_df)
+        mean_max: DataFrame = pomm_utils.find_aep_mean_max(pomm_utils.find_aep_dur_mean(aggregated_df=aggregated_df))
+
+        critical = median_df.loc[
+            median_df.groupby(["aep_text", "Location", "Type", "trim_runcode"])["MedianAbsMax"].idxmax()
+        ]
+        assert median_max["MedianAbsMax"].tolist() == critical["MedianAbsMax"].tolist()
+        assert median_max["duration_text"].tolist() == critical["duration_text"].tolist()
+        best_mean = median_df.groupby(["aep_text", "Location", "Type", "trim_runcode"])["mean_PeakFlow"].max()
+        assert mean_max["mean_PeakFlow"].tolist() == best_mean.tolist()
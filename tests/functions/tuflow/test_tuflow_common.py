@@ -10,7 +10,7 @@ from ryan_library.functions.tuflow.tuflow_common import (
     process_files_in_parallel,
     bulk_read_and_merge_tuflow_csv,
 )
-from ryan_library.classes.suffixes_and_dtypes import SuffixesConfig
+from ryan_library.classes.suffixes_and_dtypes import Config, SuffixesConfig
 from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
 
 
@@ -24,20 +24,44 @@ class TestTuflowCommon:
         mock_find.return_value = [Path("test_1d_H.csv")]
         mock_is_non_zero.return_value = True
         
-        mock_suffixes = MagicMock(spec=SuffixesConfig)
-        mock_suffixes.invert_suffix_to_type.return_value = {"H": ["_1d_H.csv"]}
+        suffixes = SuffixesConfig({"_1d_H.csv": "H"}, MagicMock(spec=Config))
         
         files = []
         with patch.object(Path, "is_dir", return_value=True):
             files = collect_files(
                 paths_to_process=[Path("root")],
                 include_data_types=["H"],
-                suffixes_config=mock_suffixes
+                suffixes_config=suffixes
             )
         
         assert len(files) == 1
         assert files[0] == Path("test_1d_H.csv")
 
+    @patch("ryan_library.functions.tuflow.tuflow_common.find_files_parallel")
+    @patch("ryan_library.functions.tuflow.tuflow_common.is_non_zero_file")
+    def test_collect_files_uses_longest_suffix(self, mock_is_non_zero, mock_find):
+        """A shorter suffix pattern must not pick up files of a longer, overlapping suffix."""
+        mock_find.return_value = [Path("run_1d_H.csv"), Path("run_2d_H.csv")]
+        mock_is_non_zero.return_value = True
+
+        suffixes = SuffixesConfig({"_1d_H.csv": "H", "_H.csv": "Short"}, MagicMock(spec=Config))
+        cached_index = suffixes.suffix_index(case_sensitive=False)
+
+        with (
+            patch.object(Path, "is_dir", return_value=True),
+            patch.object(suffixes, "suffix_index", wraps=suffixes.suffix_index) as suffix_index,
+        ):
+            files = collect_files(
+                paths_to_process=[Path("root")],
+                include_data_types=["Short"],
+                suffixes_config=suffixes,
+            )
+
+        assert files == [Path("run_2d_H.csv")]
+        # The configuration's cached case-insensitive index is reused rather than rebuilt.
+        suffix_index.assert_called_once_with(case_sensitive=False)
+        assert suffixes.suffix_index(case_sensitive=False) is cached_index
+
     @patch("ryan_library.processors.tuflow.base_processor.BaseProcessor.from_file")
     def test_process_file_success(self, mock_from_file):
         """Test successful file processing."""
@@ -51,7 +75,7 @@ class TestTuflowCommon:
         mock_proc.process.assert_called_once()
 
     @patch("ryan_library.functions.tuflow.tuflow_common.Pool")
-    @patch("ryan_library.functions.tuflow.tuflow_common.calculate_pool_size")
+    @patch("ryan_library.functions.tuflow.tuflow_common.size_aware_pool_size")
     def test_process_files_in_parallel(self, mock_calc_size, mock_pool_cls):
         """Test parallel processing orchestration."""
         mock_calc_size.return_value = 1
@@ -86,3 +110,78 @@ class TestTuflowCommon:
         assert isinstance(result, ProcessorCollection)
         mock_collect.assert_called_once()
         mock_process.assert_called_once()
+
+    @patch("ryan_library.functions.tuflow.tuflow_common.process_file")
+    @patch("ryan_library.functions.tuflow.tuflow_common.Pool")
+    @patch("ryan_library.functions.tuflow.tuflow_common.size_aware_pool_size")
+    def test_process_files_in_parallel_streams_results(self, mock_calc_size, mock_pool_cls, mock_process_file):
+        """Results are collected as they arrive, unpicklable ones are redone locally and order is kept."""
+        from multiprocessing.pool import MaybeEncodingError
+
+        mock_calc_size.return_value = 2
+        files = [Path(f"run_{idx}.csv") for idx in range(5)]
+        pending: list[tuple] = []
+        peak_in_flight: list[int] = [0]
+
+        class FakePool:
+            def apply_async(self, func, args, callback, error_callback):
+                # Each task is a batch of files; these empty files are small, so they go one per task.
+                (path,) = args[0]
+                pending.append((path, callback, error_callback))
+                peak_in_flight[0] = max(peak_in_flight[0], len(pending))
+                if len(pending) == 2 or path == files[-1]:
+                    # Finish queued tasks newest-first to mimic out-of-order completion.
+                    while pending:
+                        path, done, failed = pending.pop()
+                        if path.name == "run_1.csv":
+                            failed(MaybeEncodingError(ValueError("too big"), path))
+                        else:
+                            proc = MagicMock()
+                            proc.file_path = path
+                            proc.processed = True
+                            proc.df = pd.DataFrame({"A": [1]})
+                            done([(proc, None)])
+
+        mock_pool_cls.return_value.__enter__.return_value = FakePool()
+
+        def parent_process(file_path, entity_filters=None, include_path_columns=True):
+            proc = MagicMock()
+            proc.file_path = file_path
+            proc.processed = True
+            proc.df = pd.DataFrame({"A": [1]})
+            return proc
+
+        mock_process_file.side_effect = parent_process
+
+        coll = process_files_in_parallel(files, log_queue=MagicMock(), max_in_flight=2)
+
+        assert [proc.file_path for proc in coll.processors] == files
+        assert peak_in_flight[0] <= 2
+        mock_process_file.assert_called_once_with(
+            file_path=files[1], entity_filters=None, include_path_columns=True
+        )
+
+    @patch("ryan_library.functions.tuflow.tuflow_common.process_file")
+    @patch("ryan_library.functions.tuflow.tuflow_common.Pool")
+    @patch("ryan_library.functions.tuflow.tuflow_common.size_aware_pool_size")
+    def test_process_files_in_parallel_serial_fallback_adds_processors(
+        self, mock_calc_size, mock_pool_cls, mock_process_file
+    ):
+        """Files redone serially after a pool OSError are added through add_processor."""
+        mock_calc_size.return_value = 2
+        mock_pool_cls.side_effect = OSError("no more processes")
+        files = [Path(f"run_{idx}.csv") for idx in range(2)]
+
+        def serial_process(file_path, entity_filters=None, include_path_columns=True):
+            proc = MagicMock()
+            proc.file_path = file_path
+            proc.processed = True
+            proc.df = pd.DataFrame({"internalName": pd.Categorical([file_path.stem])})
+            return proc
+
+        mock_process_file.side_effect = serial_process
+
+        coll = process_files_in_parallel(files, log_queue=MagicMock())
+
+        assert [proc.file_path for proc in coll.processors] == files
+        assert "internalName" in coll.category_registry
@@ -94,3 +94,26 @@ class TestPOProcessor:
         mock_add.assert_called_once()
         mock_apply.assert_called_once()
         assert not mock_processor.df.empty
+
+    def test_parse_point_output_reshapes_sorts_and_drops_blanks(self, mock_processor):
+        """Blank cells, untitled columns and rows without a time are dropped; output is sorted and categorical."""
+        data = [
+            ["Dummy", "Time", "Q", "H", "", "H"],
+            ["Dummy", "Time", "Loc2", "Loc2", "Loc3", "Loc1"],
+            ["Dummy", "0.0", "5.0", "", "7.0", "not a number"],
+            ["Dummy", "", "6.0", "2.0", "8.0", "1.0"],
+            ["Dummy", "1.0", "", "2.5", "9.0", "1.5"],
+        ]
+        tidy_df = mock_processor._parse_point_output(pd.DataFrame(data))
+
+        expected = pd.DataFrame(
+            {
+                "Time": [1.0, 1.0, 0.0],
+                "Location": ["Loc1", "Loc2", "Loc2"],
+                "Type": ["H", "H", "Q"],
+                "Value": [1.5, 2.5, 5.0],
+            }
+        )
+        assert isinstance(tidy_df["Location"].dtype, pd.CategoricalDtype)
+        assert isinstance(tidy_df["Type"].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(tidy_df.astype({"Location": "str", "Type": "str"}), expected)
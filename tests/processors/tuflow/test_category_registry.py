@@ -0,0 +1,88 @@
+"""Tests for the collection-wide category dictionaries used when concatenating processors."""
+
+import numpy as np
+import pandas as pd
+
+from ryan_library.processors.tuflow.category_registry import CategoryRegistry
+
+
+def _frame(run_code: str, values: list[float], **extra: object) -> pd.DataFrame:
+    frame = pd.DataFrame({"Q": values})
+    frame["internalName"] = pd.Categorical([run_code] * len(values), categories=[run_code], ordered=True)
+    for column, value in extra.items():
+        frame[column] = pd.Categorical([value] * len(values), categories=[value], ordered=True)
+    return frame
+
+
+def test_concat_shares_one_sorted_dictionary() -> None:
+    frames: list[pd.DataFrame] = [
+        _frame("RUN_B", [1.0, 2.0], aep_text="1p"),
+        _frame("RUN_A", [3.0], aep_text="5p"),
+        _frame("RUN_B", [4.0], aep_text="1p"),
+    ]
+    registry = CategoryRegistry()
+
+    combined: pd.DataFrame = registry.concat(frames=frames, batch_size=2)
+
+    expected: pd.DataFrame = pd.concat(frames, ignore_index=True, sort=False)
+    assert list(combined.columns) == list(expected.columns)
+    assert combined["Q"].tolist() == expected["Q"].tolist()
+    assert combined["internalName"].tolist() == ["RUN_B", "RUN_B", "RUN_A", "RUN_B"]
+    assert combined["internalName"].cat.categories.tolist() == ["RUN_A", "RUN_B"]
+    assert combined["internalName"].cat.ordered
+    assert combined["aep_text"].cat.codes.tolist() == [0, 0, 1, 0]
+
+
+def test_missing_columns_and_values_stay_missing() -> None:
+    with_nan = _frame("RUN_A", [1.0, 2.0])
+    with_nan["internalName"] = with_nan["internalName"].cat.set_categories(["RUN_A"])
+    with_nan.loc[1, "internalName"] = np.nan
+    without_tp = _frame("RUN_B", [3.0], tp_text="TP01")
+
+    combined: pd.DataFrame = CategoryRegistry().concat(frames=[with_nan, without_tp])
+
+    assert list(combined.columns) == ["Q", "internalName", "tp_text"]
+    assert combined["internalName"].isna().tolist() == [False, True, False]
+    assert combined["tp_text"].isna().tolist() == [True, True, False]
+    assert combined["tp_text"].cat.categories.tolist() == ["TP01"]
+
+
+def test_mixed_category_types_fall_back_to_pandas() -> None:
+    text = _frame("RUN_A", [1.0], tp_text="TP01")
+    numbers = _frame("RUN_B", [2.0])
+    numbers["tp_text"] = pd.Categorical([1])
+    registry = CategoryRegistry()
+
+    combined: pd.DataFrame = registry.concat(frames=[text, numbers])
+
+    assert "tp_text" not in registry
+    assert combined["tp_text"].tolist() == ["TP01", 1]
+    assert isinstance(combined["internalName"].dtype, pd.CategoricalDtype)
+
+
+def test_registry_grows_between_concatenations() -> None:
+    registry = CategoryRegistry()
+    first: pd.DataFrame = registry.concat(frames=[_frame("RUN_B", [1.0])])
+    second: pd.DataFrame = registry.concat(frames=[_frame("RUN_B", [1.0]), _frame("RUN_A", [2.0])])
+
+    assert first["internalName"].cat.categories.tolist() == ["RUN_B"]
+    assert second["internalName"].tolist() == ["RUN_B", "RUN_A"]
+    assert second["internalName"].cat.categories.tolist() == ["RUN_A", "RUN_B"]
+
+
+def test_concat_keeps_only_categories_of_the_concatenated_frames() -> None:
+    registry = CategoryRegistry()
+    # Categories of other processors in the collection, e.g. EOF or maximums results.
+    registry.register(df=_frame("RUN_C", [0.0], aep_text="10p"))
+    registry.register(df=_frame("RUN_A", [0.0], aep_text="5p"))
+    with_nan = _frame("RUN_D", [1.0, 2.0], aep_text="1p")
+    with_nan.loc[1, "internalName"] = np.nan
+
+    combined: pd.DataFrame = registry.concat(frames=[with_nan, _frame("RUN_B", [3.0], aep_text="1p")])
+
+    assert combined["internalName"].cat.categories.tolist() == ["RUN_B", "RUN_D"]
+    assert combined["internalName"].tolist()[::2] == ["RUN_D", "RUN_B"]
+    assert combined["internalName"].isna().tolist() == [False, True, False]
+    assert combined["internalName"].cat.ordered
+    assert combined["aep_text"].cat.categories.tolist() == ["1p"]
+    assert combined.groupby("internalName", observed=False)["Q"].size().index.tolist() == ["RUN_B", "RUN_D"]
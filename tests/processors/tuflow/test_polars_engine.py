@@ -0,0 +1,65 @@
+"""Tests for the optional Polars engine of the ProcessorCollection combine methods."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ryan_library.functions.tuflow.tuflow_common import process_file
+from ryan_library.processors.tuflow import polars_engine
+from ryan_library.processors.tuflow.polars_engine import resolve_combine_engine
+from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
+
+DATA_DIR: Path = Path(__file__).parents[2] / "test_data" / "tuflow" / "TUFLOW_Example_Model_Dataset"
+
+
+def _collection(*patterns: str) -> ProcessorCollection:
+    files: list[Path] = sorted({path for pattern in patterns for path in DATA_DIR.glob(pattern)})
+    if not files:
+        pytest.skip(f"Test data not found: {DATA_DIR}")
+    collection = ProcessorCollection()
+    for file_path in files:
+        processor = process_file(file_path=file_path)
+        if processor is not None and processor.processed:
+            collection.add_processor(processor)
+    return collection
+
+
+def test_resolve_combine_engine_validates_and_falls_back(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert resolve_combine_engine(engine="pandas") == "pandas"
+    with pytest.raises(ValueError):
+        resolve_combine_engine(engine="spark")
+
+    monkeypatch.setattr(polars_engine, "polars_available", lambda: False)
+    assert resolve_combine_engine(engine="polars") == "pandas"
+
+
+@pytest.mark.parametrize(
+    ("method", "patterns"),
+    [
+        (
+            "combine_1d_timeseries",
+            ("EG12/plot/csv/EG12_00[12]_1d_[CHQV]*.csv", "EG12/EG12_00[12].eof"),
+        ),
+        (
+            "combine_1d_maximums",
+            (
+                "EG12/plot/csv/EG12_00[12]_1d_[CN]mx.csv",
+                "EG12/plot/csv/EG12_00[12]_1d_Chan.csv",
+                "EG12/EG12_00[12].eof",
+            ),
+        ),
+        ("pomm_combine", ("EG05/EG05_01[67]_POMM.csv",)),
+        ("po_combine", ("EG05/EG05_01[67]_PO.csv",)),
+    ],
+)
+@pytest.mark.parametrize("reset_categoricals", [True, False])
+def test_polars_engine_matches_pandas(method: str, patterns: tuple[str, ...], reset_categoricals: bool) -> None:
+    pytest.importorskip("polars")
+    collection = _collection(*patterns)
+
+    expected: pd.DataFrame = getattr(collection.copy(), method)(reset_categoricals=reset_categoricals)
+    actual: pd.DataFrame = getattr(collection.copy(), method)(reset_categoricals=reset_categoricals, engine="polars")
+
+    assert not expected.empty
+    pd.testing.assert_frame_equal(actual, expected)
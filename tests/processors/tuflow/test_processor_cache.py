@@ -0,0 +1,76 @@
+"""Tests for the persistent processor result cache."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ryan_library.functions.tuflow.tuflow_common import process_file, process_files_in_parallel
+from ryan_library.processors.tuflow.processor_cache import CacheSignature, ProcessorResultCache
+
+DATA_DIR: Path = Path(__file__).parents[2] / "test_data" / "tuflow" / "TUFLOW_Example_Model_Dataset"
+CMX_SOURCE: Path = DATA_DIR / "EG12" / "plot" / "csv" / "EG12_006_1d_Cmx.csv"
+
+
+@pytest.fixture
+def cmx_file(tmp_path: Path) -> Path:
+    if not CMX_SOURCE.exists():
+        pytest.skip(f"Test data not found: {CMX_SOURCE}")
+    target: Path = tmp_path / "results" / CMX_SOURCE.name
+    target.parent.mkdir()
+    shutil.copy(CMX_SOURCE, target)
+    return target
+
+
+def test_store_and_load_roundtrip(cmx_file: Path, tmp_path: Path) -> None:
+    cache = ProcessorResultCache(cache_dir=tmp_path / "cache")
+    proc = process_file(file_path=cmx_file)
+    assert proc is not None and proc.processed
+
+    signature: CacheSignature | None = cache.build_signature(file_path=cmx_file)
+    assert signature is not None
+    assert cache.store(processor=proc, signature=signature)
+
+    loaded = cache.load(file_path=cmx_file, signature=signature)
+    assert loaded is not None
+    assert loaded.processed
+    assert type(loaded) is type(proc)
+    pd.testing.assert_frame_equal(loaded.df, proc.df)
+    assert cache.hits == 1
+
+
+def test_signature_changes_invalidate_entry(cmx_file: Path, tmp_path: Path) -> None:
+    cache = ProcessorResultCache(cache_dir=tmp_path / "cache")
+    proc = process_file(file_path=cmx_file)
+    assert proc is not None
+    cache.store(processor=proc)
+
+    filtered = cache.build_signature(file_path=cmx_file, entity_filter=["FC01.1_R"])
+    assert filtered is not None
+    assert cache.load(file_path=cmx_file, signature=filtered) is None
+
+    stat_result: os.stat_result = cmx_file.stat()
+    os.utime(cmx_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 5_000_000_000))
+    touched = cache.build_signature(file_path=cmx_file)
+    assert touched is not None
+    assert cache.load(file_path=cmx_file, signature=touched) is None
+    assert cache.misses == 2
+
+
+def test_process_files_in_parallel_reuses_cache(
+    cmx_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir: Path = tmp_path / "cache"
+    first = process_files_in_parallel(file_list=[cmx_file], log_queue=None, cache_dir=cache_dir)
+    assert len(first.processors) == 1
+    assert len(list(cache_dir.glob(f"*{ProcessorResultCache.ENTRY_SUFFIX}"))) == 1
+
+    def fail_process_file(*args: object, **kwargs: object) -> None:
+        raise AssertionError("cached files should not be re-processed")
+
+    monkeypatch.setattr("ryan_library.functions.tuflow.tuflow_common.process_file", fail_process_file)
+    second = process_files_in_parallel(file_list=[cmx_file], log_queue=None, cache_dir=cache_dir)
+    assert len(second.processors) == 1
+    pd.testing.assert_frame_equal(second.processors[0].df, first.processors[0].df)
@@ -1,6 +1,8 @@
 
 """Unit tests for ryan_library.processors.tuflow.processor_collection."""
 
+from pathlib import Path
+
 import pytest
 from unittest.mock import MagicMock, patch
 import pandas as pd
@@ -395,3 +397,160 @@ class TestProcessorCollection:
         res_invalid = collection._calculate_hw_d_ratio(df_invalid)
         assert "HW_D" in res_invalid.columns
         assert pd.isna(res_invalid.iloc[0]["HW_D"])
+
+
+DATA_DIR: Path = Path(__file__).parents[2] / "test_data" / "tuflow" / "TUFLOW_Example_Model_Dataset" / "EG12"
+
+
+def _timeseries_processor(run: str, data_type: str, frame: dict[str, list[object]]) -> MagicMock:
+    """Mock a processed timeseries processor whose metadata columns are single-category categoricals."""
+    processor = MagicMock()
+    processor.processed = True
+    processor.data_type = data_type
+    processor.dataformat = "Timeseries"
+    processor.name_parser.raw_run_code = run
+    df = pd.DataFrame(frame)
+    size = len(df)
+    for column, value in {"internalName": run, "trim_runcode": run, "file": f"{run}_1d_{data_type}.csv"}.items():
+        df[column] = pd.Categorical([value] * size, categories=[value], ordered=True)
+    processor.df = df
+    return processor
+
+
+class TestCombineTimeseriesPerRun:
+    """The per-run aligned combine must match the collection-wide groupby."""
+
+    @staticmethod
+    def _assert_paths_match(collection: ProcessorCollection) -> pd.DataFrame:
+        aligned = collection.copy().combine_1d_timeseries()
+        grouped = collection.copy().combine_1d_timeseries(reduce_per_run=False)
+        pd.testing.assert_frame_equal(aligned, grouped)
+        return aligned
+
+    def test_measures_align_and_static_joined_once(self):
+        collection = ProcessorCollection()
+        for run in ("Run2", "Run1"):
+            collection.add_processor(
+                _timeseries_processor(
+                    run, "Q", {"Chan ID": ["C2", "C1", "C1", "C2"], "Time": [0.0, 0.0, 1.0, 1.0], "Q": [1.0, 2, 3, 4]}
+                )
+            )
+            collection.add_processor(
+                _timeseries_processor(
+                    run, "H", {"Chan ID": ["C1", "C1", "C3"], "Time": [0.0, 2.0, 0.0], "US_H": [5.0, 6, 7]}
+                )
+            )
+            eof = MagicMock()
+            eof.processed = True
+            eof.data_type = "EOF"
+            eof.dataformat = "EOF"
+            eof.name_parser.raw_run_code = run
+            eof.df = pd.DataFrame(
+                {"Chan ID": ["C1", "C2", "C1"], "US Invert": [1.0, 2.0, 1.5], "Height": [2.0, 1.0, 2.0]}
+            )
+            collection.add_processor(eof)
+
+        with patch.object(ProcessorCollection, "_concat_in_batches", wraps=collection._concat_in_batches) as concat:
+            combined = collection.combine_1d_timeseries()
+        # Only the per-run results are concatenated; no merged copy of every processor frame
+        assert [len(call.kwargs["frames"]) for call in concat.call_args_list] == [2]
+
+        assert combined["internalName"].astype(str).tolist() == ["Run1"] * 6 + ["Run2"] * 6
+        assert combined["Chan ID"].tolist()[:6] == ["C1", "C1", "C1", "C2", "C2", "C3"]
+        assert combined["US Invert"].iloc[:5].tolist() == [1.5, 1.5, 1.5, 2.0, 2.0]
+        assert pd.isna(combined["US Invert"].iloc[5])
+        self._assert_paths_match(collection)
+
+    def test_duplicate_measures_fall_back_to_groupby(self):
+        collection = ProcessorCollection()
+        collection.add_processor(_timeseries_processor("Run1", "Q", {"Chan ID": ["C1"], "Time": [0.0], "Q": [1.0]}))
+        collection.add_processor(_timeseries_processor("Run1", "Q", {"Chan ID": ["C1"], "Time": [0.0], "Q": [3.0]}))
+
+        combined = self._assert_paths_match(collection)
+        assert combined["Q"].tolist() == [3.0]
+
+    def test_real_results_match_grouped_path(self):
+        from ryan_library.functions.tuflow.tuflow_common import process_file
+
+        files: list[Path] = [
+            *sorted((DATA_DIR / "plot" / "csv").glob("EG12_00[12]_1d_[CHQV]*.csv")),
+            *sorted(DATA_DIR.glob("EG12_00[12].eof")),
+        ]
+        if not files:
+            pytest.skip(f"Test data not found: {DATA_DIR}")
+        collection = ProcessorCollection()
+        for file_path in files:
+            processor = process_file(file_path=file_path)
+            if processor is not None and processor.processed:
+                collection.add_processor(processor)
+
+        combined = self._assert_paths_match(collection)
+        assert not combined.empty
+        assert combined.duplicated(subset=["internalName", "Chan ID", "Time"]).sum() == 0
+
+
+def _eof_processor(run: str, chan_ids: list[object]) -> MagicMock:
+    processor = MagicMock()
+    processor.processed = True
+    processor.data_type = "EOF"
+    processor.dataformat = "EOF"
+    processor.file_name = f"{run}.eof"
+    processor.name_parser.raw_run_code = run
+    processor.df = pd.DataFrame({"Chan ID": pd.array(chan_ids, dtype="string"), "Height": 1.0})
+    return processor
+
+
+class TestAlignEofChannelIds:
+    """EOF channel IDs truncated by the text report are mapped back to the full result IDs."""
+
+    @staticmethod
+    def _collection() -> ProcessorCollection:
+        collection = ProcessorCollection()
+        collection.add_processor(
+            _timeseries_processor(
+                "Run1",
+                "Q",
+                {"Chan ID": ["MLETP 159.975", "MLETP 202.231", "AMB 1.234", "AMB 1.236"] * 2, "Time": [0.0] * 8},
+            )
+        )
+        collection.add_processor(
+            _eof_processor("Run1", ["MLETP 159.97", "AMB 1.23", None, " mletp  202.23 ", "MLETP 159.97"])
+        )
+        collection.add_processor(_eof_processor("Run2", ["MLETP 159.97"]))
+        return collection
+
+    @pytest.mark.parametrize(
+        "value",
+        ["MLETP 159.975", " mletp  159.97 ", "A-1.5", "X12.34.56", "C_01", "12", "Road\tW 3.1", "abc", "", "nan", None],
+    )
+    def test_vectorised_match_keys_match_scalar(self, value):
+        key = ProcessorCollection._channel_match_keys(values=pd.Series([value], dtype=object)).iloc[0]
+        expected = ProcessorCollection._channel_match_key(value=value)
+        assert (None if pd.isna(key) else key) == expected
+
+    def test_truncated_ids_replaced_per_run(self):
+        collection = self._collection()
+
+        assert collection.align_eof_channel_ids() == 3
+
+        run1, run2 = (p.df["Chan ID"] for p in collection.processors[1:])
+        # "AMB 1.23" is ambiguous (two full IDs truncate to it) and stays as printed
+        assert run1.tolist()[:2] == ["MLETP 159.975", "AMB 1.23"]
+        assert pd.isna(run1.iloc[2])
+        assert run1.tolist()[3:] == ["MLETP 202.231", "MLETP 159.975"]
+        assert run1.dtype == "string"
+        assert run2.tolist() == ["MLETP 159.97"]
+
+    def test_repeat_alignment_skipped_until_ids_change(self):
+        collection = self._collection()
+        collection.align_eof_channel_ids()
+
+        with patch.object(ProcessorCollection, "_channel_match_keys") as match_keys:
+            assert collection.align_eof_channel_ids() == 0
+        match_keys.assert_not_called()
+
+        eof = collection.processors[2]
+        eof.name_parser.raw_run_code = "Run1"
+        eof.df["Chan ID"] = pd.array(["MLETP 202.23"], dtype="string")
+        assert collection.align_eof_channel_ids() == 1
+        assert eof.df["Chan ID"].tolist() == ["MLETP 202.231"]
@@ -0,0 +1,96 @@
+"""Tests for the Hive-partitioned Parquet dataset backend of ProcessorCollection."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ryan_library.functions.tuflow.tuflow_common import process_file
+from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
+
+pytest.importorskip("pyarrow")
+
+DATA_DIR = Path(__file__).parents[2] / "test_data" / "tuflow" / "TUFLOW_Example_Model_Dataset"
+SOURCES: dict[str, Path] = {
+    "Proj_01p_00060m_TP01_1d_Cmx.csv": DATA_DIR / "EG12" / "plot" / "csv" / "EG12_006_1d_Cmx.csv",
+    "Proj_05p_00120m_TP01_PO.csv": DATA_DIR / "EG05" / "EG05_016_PO.csv",
+    "EG05_017_POMM.csv": DATA_DIR / "EG05" / "EG05_017_POMM.csv",
+}
+
+
+@pytest.fixture
+def collection(tmp_path: Path) -> ProcessorCollection:
+    if not all(source.exists() for source in SOURCES.values()):
+        pytest.skip("TUFLOW example test data not available")
+    source_dir = tmp_path / "results"
+    source_dir.mkdir()
+    coll = ProcessorCollection()
+    for name, source in SOURCES.items():
+        target = source_dir / name
+        shutil.copy(source, target)
+        coll.add_processor(process_file(file_path=target))
+    assert len(coll.processors) == len(SOURCES)
+    return coll
+
+
+def test_roundtrip_restores_frames(collection: ProcessorCollection, tmp_path: Path) -> None:
+    root = tmp_path / "dataset"
+    collection.to_parquet_dataset(root)
+
+    assert (root / "data_type=Cmx" / "aep_text=01p" / "duration_text=00060m").is_dir()
+    assert (root / "data_type=POMM" / "aep_text=__HIVE_DEFAULT_PARTITION__").is_dir()
+
+    loaded = ProcessorCollection.from_parquet_dataset(root)
+    assert [type(p) for p in loaded.processors] == [type(p) for p in collection.processors]
+    for original, restored in zip(collection.processors, loaded.processors):
+        pd.testing.assert_frame_equal(restored.df, original.df)
+
+
+def test_partition_and_predicate_pushdown(collection: ProcessorCollection, tmp_path: Path) -> None:
+    root = tmp_path / "dataset"
+    collection.to_parquet_dataset(root)
+
+    assert [p.data_type for p in ProcessorCollection.from_parquet_dataset(root, aep_texts=["05p"]).processors] == ["PO"]
+    assert (
+        ProcessorCollection.from_parquet_dataset(root, data_types=["Cmx"], duration_texts=["00120m"]).processors == []
+    )
+
+    po_df = collection.processors[1].df
+    location = str(po_df["Location"].iloc[0])
+    loaded = ProcessorCollection.from_parquet_dataset(
+        root, locations=[location], data_types=["PO"], columns=["Location", "aep_text"]
+    )
+    assert len(loaded.processors) == 1
+    df = loaded.processors[0].df
+    assert list(df.columns) == ["Location", "aep_text"]
+    assert set(df["Location"].astype(str)) == {location}
+    assert set(df["aep_text"].astype(str)) == {"05p"}
+
+
+def test_append_only_rewrites_changed_files(collection: ProcessorCollection, tmp_path: Path) -> None:
+    root = tmp_path / "dataset"
+    collection.to_parquet_dataset(root)
+    parts = sorted(root.rglob("*.parquet"))
+    mtimes = {part: part.stat().st_mtime_ns for part in parts}
+
+    changed = collection.processors[0].file_path
+    stat_result = changed.stat()
+    os.utime(changed, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 5_000_000_000))
+
+    collection.to_parquet_dataset(root, append=True)
+    rewritten = [part for part in parts if part.stat().st_mtime_ns != mtimes[part]]
+    assert len(rewritten) == 1
+    assert "data_type=Cmx" in rewritten[0].as_posix()
+    assert len(ProcessorCollection.from_parquet_dataset(root).processors) == len(SOURCES)
+
+
+def test_dataset_is_readable_without_the_manifest(collection: ProcessorCollection, tmp_path: Path) -> None:
+    import pyarrow.dataset as ds
+
+    root = tmp_path / "dataset"
+    collection.to_parquet_dataset(root)
+    dataset = ds.dataset(root, format="parquet", partitioning="hive", exclude_invalid_files=True)
+    table = dataset.to_table(filter=ds.field("data_type") == "Cmx", columns=["Chan ID", "aep_text"])
+    assert table.num_rows == len(collection.processors[0].df)
@@ -103,7 +103,7 @@ class TestProcessorCollectionPersistence:
                 coll.to_hdf(hdf_path)
 
                 assert "metadata" in store_data
-                assert "proc_0000" in store_data
+                assert ProcessorCollection._hdf_key_for(p1.file_path) in store_data
 
                 # Check compression kwargs were passed
                 pd.HDFStore.assert_called_with(str(hdf_path), mode="w", complevel=9, complib="blosc:zstd")
@@ -128,3 +128,102 @@ class TestProcessorCollectionPersistence:
                 loaded = ProcessorCollection.from_hdf(hdf_path)
                 assert len(loaded.processors) == 1
                 pd.testing.assert_frame_equal(loaded.processors[0].df, p1.df)
+
+
+DATA_DIR = Path(__file__).parents[2] / "test_data" / "tuflow" / "TUFLOW_Example_Model_Dataset"
+
+
+class TestIncrementalHdfCache:
+    @pytest.fixture
+    def result_files(self, tmp_path: Path) -> list[Path]:
+        pytest.importorskip("tables")
+        sources = [DATA_DIR / "EG12" / "plot" / "csv" / "EG12_006_1d_Cmx.csv", DATA_DIR / "EG05" / "EG05_016_PO.csv"]
+        if not all(source.exists() for source in sources):
+            pytest.skip("TUFLOW example test data not available")
+        targets: list[Path] = []
+        for source in sources:
+            target = tmp_path / source.name
+            shutil.copy(source, target)
+            targets.append(target)
+        return targets
+
+    @staticmethod
+    def _collection(files: list[Path]) -> ProcessorCollection:
+        from ryan_library.functions.tuflow.tuflow_common import process_file
+
+        coll = ProcessorCollection()
+        for file_path in files:
+            coll.add_processor(process_file(file_path=file_path))
+        return coll
+
+    def test_roundtrip_restores_frames(self, result_files, tmp_path):
+        coll = self._collection(result_files)
+        hdf_path = tmp_path / "cache.h5"
+        coll.to_hdf(hdf_path)
+
+        loaded = ProcessorCollection.from_hdf(hdf_path)
+        assert [p.file_path for p in loaded.processors] == [p.file_path for p in coll.processors]
+        for original, restored in zip(coll.processors, loaded.processors):
+            pd.testing.assert_frame_equal(restored.df, original.df)
+
+    def test_append_only_rewrites_changed_files(self, result_files, tmp_path, monkeypatch):
+        import os
+
+        hdf_path = tmp_path / "cache.h5"
+        self._collection(result_files[:1]).to_hdf(hdf_path)
+
+        puts: list[str] = []
+        original_put = pd.HDFStore.put
+
+        def tracking_put(store, key, value, *args, **kwargs):
+            if not key.startswith("/"):  # pandas stores categorical metadata under nested nodes
+                puts.append(key)
+            return original_put(store, key, value, *args, **kwargs)
+
+        monkeypatch.setattr(pd.HDFStore, "put", tracking_put)
+        self._collection(result_files).to_hdf(hdf_path, append=True)
+        assert puts == [ProcessorCollection._hdf_key_for(result_files[1]), "metadata"]
+
+        stat_result = result_files[0].stat()
+        os.utime(result_files[0], ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 5_000_000_000))
+        puts.clear()
+        self._collection(result_files).to_hdf(hdf_path, append=True)
+        assert puts == [ProcessorCollection._hdf_key_for(result_files[0]), "metadata"]
+
+        assert len(ProcessorCollection.from_hdf(hdf_path).processors) == 2
+
+    def test_lazy_load_by_data_type_and_location(self, result_files, tmp_path):
+        coll = self._collection(result_files)
+        hdf_path = tmp_path / "cache.h5"
+        coll.to_hdf(hdf_path)
+
+        cmx_only = ProcessorCollection.from_hdf(hdf_path, data_types=["Cmx"])
+        assert [p.data_type for p in cmx_only.processors] == ["Cmx"]
+
+        location = str(coll.processors[1].df["Location"].iloc[0])
+        filtered = ProcessorCollection.from_hdf(hdf_path, locations=[location], data_types=["PO"])
+        assert len(filtered.processors) == 1
+        assert set(filtered.processors[0].df["Location"].astype(str)) == {location}
+
+    def test_roundtrip_restores_missing_object_values(self, tmp_path):
+        """Missing values in object columns (e.g. TP of a TLF summary) come back as None, as in Parquet."""
+        pytest.importorskip("tables")
+        log_dir = DATA_DIR / "log"
+        logs: list[Path] = []
+        for name in ("EG15_008.tlf", "EG16_Exg_5m_Q100_2hr_006.tlf"):
+            if not (log_dir / name).exists():
+                pytest.skip("TUFLOW example log files not available")
+            logs.append(Path(shutil.copy(log_dir / name, tmp_path / name)))
+        coll = self._collection(logs)
+        assert coll.processors[0].df["TP"].tolist() == [None]
+
+        hdf_path = tmp_path / "cache.h5"
+        coll.to_hdf(hdf_path)
+        coll.to_parquet_dataset(tmp_path / "dataset")
+
+        for loaded in (
+            ProcessorCollection.from_hdf(hdf_path),
+            ProcessorCollection.from_parquet_dataset(tmp_path / "dataset"),
+        ):
+            for original, restored in zip(coll.processors, loaded.processors, strict=True):
+                pd.testing.assert_frame_equal(restored.df, original.df)
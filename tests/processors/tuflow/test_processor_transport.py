@@ -0,0 +1,57 @@
+"""Tests for the Arrow worker-to-parent transport."""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ryan_library.functions.tuflow.tuflow_common import process_file, process_file_to_payload
+from ryan_library.processors.tuflow.processor_transport import (
+    ProcessorPayload,
+    arrow_available,
+    from_payload,
+    to_payload,
+)
+
+DATA_DIR: Path = Path(__file__).parents[2] / "test_data" / "tuflow" / "TUFLOW_Example_Model_Dataset"
+CMX_SOURCE: Path = DATA_DIR / "EG12" / "plot" / "csv" / "EG12_006_1d_Cmx.csv"
+
+pytestmark = pytest.mark.skipif(not arrow_available(), reason="pyarrow is not installed")
+
+
+@pytest.fixture
+def cmx_file(tmp_path: Path) -> Path:
+    if not CMX_SOURCE.exists():
+        pytest.skip(f"Test data not found: {CMX_SOURCE}")
+    target: Path = tmp_path / CMX_SOURCE.name
+    shutil.copy(CMX_SOURCE, target)
+    return target
+
+
+def test_payload_roundtrip_matches_processor(cmx_file: Path) -> None:
+    proc = process_file(file_path=cmx_file, entity_filters=["FC01.1_R"])
+    assert proc is not None and proc.processed
+
+    payload: ProcessorPayload | None = process_file_to_payload(file_path=cmx_file, entity_filters=["FC01.1_R"])
+    assert payload is not None
+    assert payload.df_ipc is not None and payload.df is None
+    assert payload.entity_filter == ("FC01.1_R",)
+
+    rebuilt = from_payload(payload=payload)
+    assert type(rebuilt) is type(proc)
+    assert rebuilt.processed
+    assert rebuilt.applied_entity_filter == frozenset({"FC01.1_R"})
+    pd.testing.assert_frame_equal(rebuilt.df, proc.df)
+
+
+def test_payload_falls_back_to_pickled_frame(cmx_file: Path) -> None:
+    proc = process_file(file_path=cmx_file)
+    assert proc is not None
+    proc.df = pd.DataFrame({"mixed": [1, "a", 2.5]}, dtype=object)
+
+    payload: ProcessorPayload = to_payload(processor=proc)
+    assert payload.df_ipc is None
+    assert payload.df is not None
+
+    pd.testing.assert_frame_equal(from_payload(payload=payload).df, proc.df)
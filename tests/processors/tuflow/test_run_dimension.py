@@ -0,0 +1,88 @@
+"""Tests for the run dimension (compact metadata) mode of ProcessorCollection."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ryan_library.functions.tuflow.tuflow_common import process_file
+from ryan_library.processors.tuflow.processor_collection import ProcessorCollection
+from ryan_library.processors.tuflow.run_dimension import RUN_ID_COLUMN, build_run_dimension, compact_frame
+
+DATA_DIR: Path = Path(__file__).parents[2] / "test_data" / "tuflow" / "TUFLOW_Example_Model_Dataset"
+
+
+def _collection(*patterns: str, use_run_dimension: bool) -> ProcessorCollection:
+    files: list[Path] = sorted({path for pattern in patterns for path in DATA_DIR.glob(pattern)})
+    if not files:
+        pytest.skip(f"Test data not found: {DATA_DIR}")
+    collection = ProcessorCollection(use_run_dimension=use_run_dimension)
+    for file_path in files:
+        processor = process_file(file_path=file_path)
+        if processor is not None and processor.processed:
+            collection.add_processor(processor)
+    return collection
+
+
+def test_compact_frame_round_trip() -> None:
+    df = pd.DataFrame({"Q": [1.0, 2.0], "Chan ID": ["A", "B"]})
+    df.insert(0, "internalName", pd.Categorical(["RUN"] * 2, categories=["RUN"], ordered=True))
+    df["aep_text"] = pd.Categorical(["1p", None], categories=["1p"], ordered=True)
+
+    compacted = compact_frame(df=df, columns=["internalName", "aep_text", "tp_text"])
+
+    assert compacted is not None
+    fact, metadata = compacted
+    # aep_text has a missing value, so it stays in the fact frame.
+    assert list(fact.columns) == ["Q", "Chan ID", "aep_text"]
+    assert list(metadata.dtypes) == ["internalName"]
+    assert metadata.expanded_columns(fact_columns=fact.columns) == list(df.columns)
+
+
+def test_build_run_dimension_shares_ids_between_identical_records() -> None:
+    frames: list[pd.DataFrame] = []
+    for run in ("RUN_B", "RUN_A", "RUN_B"):
+        frames.append(pd.DataFrame({"internalName": pd.Categorical([run], categories=[run])}))
+    records = [compact_frame(df=frame, columns=["internalName"])[1] for frame in frames]  # type: ignore[index]
+
+    table, run_ids = build_run_dimension(records=[*records, None])
+
+    assert run_ids.tolist() == [0, 1, 0, -1]
+    assert table[RUN_ID_COLUMN].tolist() == [0, 1]
+    assert table["internalName"].tolist() == ["RUN_B", "RUN_A"]
+    assert table["internalName"].cat.categories.tolist() == ["RUN_A", "RUN_B"]
+
+
+@pytest.mark.parametrize(
+    ("method", "patterns"),
+    [
+        ("combine_1d_timeseries", ("EG12/plot/csv/EG12_00[12]_1d_[CHQV]*.csv", "EG12/EG12_00[12].eof")),
+        ("combine_1d_maximums", ("EG12/plot/csv/EG12_00[12]_1d_[CN]mx.csv", "EG12/EG12_00[12].eof")),
+        ("pomm_combine", ("EG05/EG05_01[67]_POMM.csv",)),
+        ("po_combine", ("EG05/EG05_01[67]_PO.csv",)),
+        ("combine_raw", ("EG05/EG05_01[67]_PO.csv", "EG12/plot/csv/EG12_00[12]_1d_Q.csv")),
+    ],
+)
+def test_compact_collection_matches_full_collection(method: str, patterns: tuple[str, ...]) -> None:
+    full = _collection(*patterns, use_run_dimension=False)
+    compact = _collection(*patterns, use_run_dimension=True)
+
+    assert all(processor.run_metadata is not None for processor in compact.processors)
+    assert all("internalName" not in processor.df.columns for processor in compact.processors)
+
+    expected: pd.DataFrame = getattr(full, method)()
+    assert not expected.empty
+    pd.testing.assert_frame_equal(getattr(compact, method)(), expected)
+
+
+def test_combine_raw_can_defer_the_dimension_join() -> None:
+    compact = _collection("EG05/EG05_01[67]_PO.csv", use_run_dimension=True)
+
+    facts: pd.DataFrame = compact.combine_raw(join_run_dimension=False)
+    dimension: pd.DataFrame = compact.run_dimension_table()
+
+    assert "internalName" not in facts.columns
+    assert set(facts[RUN_ID_COLUMN].unique()) == set(dimension[RUN_ID_COLUMN])
+    joined: pd.DataFrame = compact.attach_run_dimension(df=facts, drop_id=True)
+    expected: pd.DataFrame = compact.combine_raw()
+    pd.testing.assert_frame_equal(joined[expected.columns], expected, check_categorical=False)
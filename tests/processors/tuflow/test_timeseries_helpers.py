@@ -1,6 +1,9 @@
 
 """Unit tests for ryan_library.processors.tuflow.timeseries_helpers."""
 
+from pathlib import Path
+
+import numpy as np
 import pytest
 import pandas as pd
 from ryan_library.processors.tuflow.timeseries_helpers import reshape_h_timeseries
@@ -75,3 +78,74 @@ def test_reshape_h_timeseries_mixed_suffixes():
     assert len(reshaped) == 1
     assert reshaped.iloc[0]["US_H"] == 10.0
     assert pd.isna(reshaped.iloc[0]["DS_H"])
+
+
+def _pivot_reshape_reference(df: pd.DataFrame, category_type: str) -> pd.DataFrame:
+    """The previous melt/apply/pivot_table implementation, kept as the regression baseline."""
+    value_cols = [c for c in df.columns if c != "Time"]
+    df_long = df.melt(id_vars=["Time"], value_vars=value_cols, var_name="raw_col", value_name="H_val")
+    df_long["suffix_type"] = df_long["raw_col"].apply(
+        lambda x: ".1" if x.endswith(".1") else (".2" if x.endswith(".2") else "unknown")
+    )
+    df_long[category_type] = df_long["raw_col"].apply(lambda x: x[:-2] if x.endswith((".1", ".2")) else x)
+    df_long["col_type"] = df_long["suffix_type"].map({".1": "US_H", ".2": "DS_H"})
+    df_long = df_long[df_long["col_type"].notna()]
+    reshaped = df_long.pivot_table(
+        index=["Time", category_type], columns="col_type", values="H_val", aggfunc="first"
+    ).reset_index()
+    for col in ["US_H", "DS_H"]:
+        if col not in reshaped.columns:
+            reshaped[col] = pd.NA
+    return reshaped[["Time", category_type, "US_H", "DS_H"]]
+
+
+def _assert_matches_reference(df: pd.DataFrame) -> None:
+    expected = _pivot_reshape_reference(df, category_type="Chan ID").astype({"US_H": "float64", "DS_H": "float64"})
+    actual = reshape_h_timeseries(df, category_type="Chan ID", file_label="TestFile")
+    pd.testing.assert_frame_equal(actual, expected, check_names=False, check_dtype=False)
+    assert actual["US_H"].dtype == "float64" and actual["DS_H"].dtype == "float64"
+
+
+def test_reshape_h_timeseries_matches_pivot_reference():
+    """Random gaps, unsorted times, one-sided channels and unknown suffixes match the pivot output."""
+    rng = np.random.default_rng(7)
+    times = rng.permutation(np.arange(40, dtype="float64") / 4)
+    columns: dict[str, np.ndarray] = {"Time": times}
+    for idx in rng.permutation(25):
+        for suffix in (".1", ".2"):
+            if rng.random() < 0.85:
+                values = rng.normal(100, 5, size=len(times))
+                values[rng.random(len(times)) < 0.2] = np.nan
+                columns[f"Pipe{idx:03d}{suffix}"] = values
+    columns["Weir.3"] = rng.normal(size=len(times))
+    df = pd.DataFrame(columns)
+    df.loc[3, "Time"] = np.nan
+
+    _assert_matches_reference(df)
+
+
+def test_reshape_h_timeseries_duplicate_times_match_pivot_reference():
+    """Repeated time stamps keep the first non-null value, as aggfunc='first' did."""
+    df = pd.DataFrame(
+        {
+            "Time": [0.0, 1.0, 1.0, 2.0],
+            "C1.1": [1.0, np.nan, 3.0, 4.0],
+            "C1.2": [5.0, 6.0, 7.0, np.nan],
+            "C2.2": [np.nan, np.nan, np.nan, 8.0],
+        }
+    )
+
+    _assert_matches_reference(df)
+
+
+def test_reshape_h_timeseries_matches_pivot_reference_on_real_file():
+    """A bundled 1d_H.csv result produces the same rows as the pivot implementation."""
+    data_dir = Path(__file__).parents[2] / "test_data" / "tuflow"
+    h_file = next(iter(sorted(data_dir.rglob("*_1d_H.csv"))), None)
+    if h_file is None:
+        pytest.skip("No _1d_H.csv test data available")
+    df = pd.read_csv(h_file).iloc[:, 1:]
+    df.columns = ["Time", *(name.removeprefix("H ").split(" [")[0] for name in df.columns[1:])]
+    df = df.apply(pd.to_numeric, errors="coerce")
+
+    _assert_matches_reference(df)
@@ -105,3 +105,22 @@ def test_run_closure_durations_no_data():
             closure_durations.run_closure_durations()
             
             mock_collect.assert_called_once()
+
+def test_process_hydrographs_pool_matches_serial(tmp_path):
+    from ryan_library.orchestrators.rorb import closure_durations as rorb_closure_durations
+
+    rows = []
+    for tp in range(1, 4):
+        csv_path = tmp_path / f"run aep1_du24hourtp{tp}.csv"
+        csv_path.write_text(
+            "H1\nH2\nTime (hrs),Calculated hydrograph:  Loc1,Calculated hydrograph:  Loc2\n"
+            f"0.0,0.0,{tp}.0\n0.5,{10 * tp}.0,4.0\n1.0,5.0,1.0\n"
+        )
+        rows.append({"AEP": "aep1", "Duration": "24", "TPat": tp, "csv": str(csv_path), "Path": "batch.out"})
+    batch_df = pd.DataFrame(rows)
+
+    serial = rorb_closure_durations._process_hydrographs(batch_df, [2.0, 8.0], max_workers=1)
+    pooled = rorb_closure_durations._process_hydrographs(batch_df, [2.0, 8.0], max_workers=2, chunksize=1)
+
+    pd.testing.assert_frame_equal(pooled, serial)
+    assert serial["TP"].tolist() == [1, 1, 1, 2, 2, 2, 3, 3, 3]
@@ -50,6 +50,40 @@ def test_find_culvert_aep_dur_mean_empty():
     assert result.empty
 
 
+def test_find_culvert_aep_dur_median_adopts_upper_middle_run(mock_aggregated_df):
+    result = tuflow_culverts_mean.find_culvert_aep_dur_median(mock_aggregated_df)
+
+    row_1h = result[result["duration_text"] == "1h"].iloc[0]
+    assert row_1h["median_Q"] == 12.0
+    assert row_1h["median_V"] == 1.2
+    assert row_1h["adopted_Q"] == 12.0
+    assert row_1h["adopted_DS_h"] == 5.1
+    assert row_1h["adopted_tp_text"] == "tp2"
+
+
+def test_find_culvert_aep_dur_mean_adopts_first_closest_run(mock_aggregated_df):
+    # Both runs of each duration are equally close to the mean; the first one is adopted.
+    result = tuflow_culverts_mean.find_culvert_aep_dur_mean(mock_aggregated_df)
+
+    assert result["adopted_Q"].tolist() == [10.0, 14.0]
+    assert result["adopted_US_h"].tolist() == [6.0, 6.2]
+    assert result["adopted_tp_text"].tolist() == ["tp1", "tp1"]
+
+
+@pytest.mark.parametrize("statistic", ["mean", "median"])
+def test_find_culvert_aep_dur_statistic_without_q_values(mock_aggregated_df, statistic):
+    df = mock_aggregated_df.assign(
+        **{"Chan ID": pd.Categorical(["C1", "C1", "C2", "C2"]), "Q": [10.0, None, None, None]}
+    )
+    result = getattr(tuflow_culverts_mean, f"find_culvert_aep_dur_{statistic}")(df)
+
+    assert result["Chan ID"].tolist() == ["C1", "C2"]
+    assert result["count"].tolist() == [2, 2]
+    assert result["adopted_Q"].isna().tolist() == [False, True]
+    assert result.loc[0, "adopted_tp_text"] == "tp1"
+    assert pd.isna(result.loc[1, "adopted_tp_text"])
+
+
 def test_find_culvert_aep_mean_max_success(mock_aggregated_df):
     # First get the means
     dur_mean = tuflow_culverts_mean.find_culvert_aep_dur_mean(mock_aggregated_df)